@@ -0,0 +1,69 @@
+"""
+Import time of a module whose jitted functions, with explicit
+signatures, are loaded from the on-disk cache.
+"""
+
+from __future__ import absolute_import, print_function, division
+
+import os
+import sys
+import tempfile
+import time
+
+
+N = 100
+
+source_template = """
+import numpy as np
+%(import_jit)s
+
+"""
+
+function_template = """
+%(decorator)s
+def f%(i)d(a, x):
+    s = 0.0
+    for v in a:
+        s += np.cos(v * %(i)d + x)
+    return s
+"""
+
+
+def write_module(dirname, modname, jitted):
+    decorator = ('@jit("float64(float64[:], float64)", cache=True, '
+                 'nopython=True)' if jitted else '')
+    import_jit = 'from numba import jit' if jitted else ''
+    parts = [source_template % dict(import_jit=import_jit)]
+    for i in range(N):
+        parts.append(function_template % dict(decorator=decorator, i=i))
+    with open(os.path.join(dirname, modname + '.py'), 'w') as f:
+        f.write(''.join(parts))
+
+
+def import_fresh(modname):
+    sys.modules.pop(modname, None)
+    return __import__(modname)
+
+
+tempdir = tempfile.mkdtemp(prefix='bm_cache_load')
+sys.path.insert(0, tempdir)
+write_module(tempdir, 'bm_cache_load_jitted', True)
+write_module(tempdir, 'bm_cache_load_python', False)
+# Populate the cache
+import_fresh('bm_cache_load_jitted')
+
+
+def python_main():
+    # Baseline: the module without @jit
+    import_fresh('bm_cache_load_python')
+
+
+def numba_main():
+    import_fresh('bm_cache_load_jitted')
+
+
+if __name__ == '__main__':
+    for main in (python_main, numba_main):
+        t = time.time()
+        main()
+        print("%s: %.3f s" % (main.__name__, time.time() - t))
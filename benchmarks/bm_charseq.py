@@ -0,0 +1,41 @@
+from __future__ import absolute_import, print_function, division
+
+import numpy as np
+from numba import njit
+from numba.utils import benchmark
+
+
+N = 10 ** 5
+
+
+def count_tokens(tokens):
+    counts = dict()
+    for tok in tokens:
+        if tok in counts:
+            counts[tok] += 1
+        else:
+            counts[tok] = 1
+    return len(counts)
+
+
+numba_count_tokens = njit(count_tokens)
+
+np.random.seed(42)
+words = np.array(['GET', 'POST', 'PUT', 'DELETE', 'HEAD', 'OPTIONS'])
+tokens = words[np.random.randint(0, len(words), N)].astype('U8')
+
+
+def python_main():
+    count_tokens(tokens.tolist())
+
+
+def numba_main():
+    numba_count_tokens(tokens)
+
+
+if __name__ == '__main__':
+    # Exclude compilation from the timings
+    python_main()
+    numba_main()
+    print('python', benchmark(python_main))
+    print('numba', benchmark(numba_main))
@@ -0,0 +1,53 @@
+from __future__ import absolute_import, print_function, division
+
+import numpy as np
+import numba
+from numba import njit
+from numba.utils import benchmark
+
+
+N = 10 ** 6
+CHUNK = 65536
+
+
+@njit
+def parse_values(data):
+    # A toy streaming parser: yield the values of the runs of digits
+    value = 0
+    in_number = False
+    for c in data:
+        if 48 <= c <= 57:
+            value = value * 10 + (c - 48)
+            in_number = True
+        elif in_number:
+            yield value
+            value = 0
+            in_number = False
+    if in_number:
+        yield value
+
+
+np.random.seed(42)
+data = np.frombuffer(' '.join(str(v) for v in np.random.randint(0, 10 ** 6, N))
+                     .encode('ascii'), dtype=np.uint8)
+
+
+def python_main():
+    total = 0
+    for v in parse_values(data):
+        total += v
+    return total
+
+
+def numba_main():
+    total = 0
+    for chunk in numba.chunked(parse_values(data), CHUNK):
+        total += chunk.sum()
+    return total
+
+
+if __name__ == '__main__':
+    # Exclude compilation from the timings
+    assert python_main() == numba_main()
+    print('item by item', benchmark(python_main))
+    print('chunked', benchmark(numba_main))
@@ -0,0 +1,51 @@
+"""
+Compilation time of a Numpy-heavy function in a fresh process, without
+and with the on-disk cache of internal helpers (the implementations of
+array reductions etc.).
+"""
+
+from __future__ import absolute_import, print_function, division
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from numba.utils import benchmark
+
+
+CODE = """if 1:
+    import numpy as np
+    from numba import njit
+
+    @njit
+    def f(a):
+        return (a.sum() + a.prod() + a.min() + a.max() + a.mean() + a.var()
+                + a.std() + np.argmin(a) + np.argmax(a) + np.cumsum(a)[-1])
+
+    f(np.arange(10.0))
+    """
+
+cache_dir = tempfile.mkdtemp(prefix='numba-bm-')
+
+
+def run_process(cache_subroutines):
+    env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir,
+               NUMBA_CACHE_SUBROUTINES=str(cache_subroutines))
+    subprocess.check_call([sys.executable, "-c", CODE], env=env)
+
+
+def python_main():
+    # Baseline: compile every helper again
+    run_process(0)
+
+
+def numba_main():
+    run_process(1)
+
+
+if __name__ == '__main__':
+    # Populate the cache
+    run_process(1)
+    print("without cache", benchmark(python_main))
+    print("with cache", benchmark(numba_main))
@@ -0,0 +1,60 @@
+from __future__ import absolute_import, print_function, division
+
+import numpy as np
+from numba import njit, float64
+from numba.jitclass import jitclass, columnar
+from numba.utils import benchmark
+
+
+N = 10 ** 5
+
+
+@jitclass([('x', float64), ('y', float64), ('vx', float64), ('vy', float64)])
+class Particle(object):
+
+    def __init__(self, x, y, vx, vy):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+
+    def move(self, dt):
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+
+
+Particles = columnar(Particle)
+
+
+def step(particles, dt):
+    for p in particles:
+        p.move(dt)
+
+
+numba_step = njit(step)
+
+np.random.seed(42)
+vx = np.random.random(N)
+vy = np.random.random(N)
+
+# Lists of jitclass instances can't be passed to compiled functions,
+# so they are iterated over from the interpreter
+instances = [Particle(0.0, 0.0, vx[i], vy[i]) for i in range(N)]
+particles = Particles.from_arrays(x=np.zeros(N), y=np.zeros(N),
+                                  vx=vx, vy=vy)
+
+
+def python_main():
+    step(instances, 0.1)
+
+
+def numba_main():
+    numba_step(particles, 0.1)
+
+
+if __name__ == '__main__':
+    # Exclude compilation from the timings
+    python_main()
+    numba_main()
+    print('list of instances', benchmark(python_main))
+    print('columnar', benchmark(numba_main))
@@ -0,0 +1,68 @@
+"""
+Compile time of a corpus of small scalar functions, which have no
+closures, lists, arrays or prange() loops for the inline, array
+expression and parfor passes to work on.
+"""
+
+from __future__ import absolute_import, print_function, division
+
+import time
+
+from numba import njit
+
+
+sources = ["""
+def f(x, y):
+    return x * y + %(i)d
+""", """
+def f(x, y):
+    if x > y:
+        z = x - y
+    else:
+        z = y - x
+    return z * %(i)d
+""", """
+def f(x, y):
+    z = 0.0
+    for i in range(%(i)d):
+        z += i * x - y
+    return z
+""", """
+def f(x, y):
+    while x < y:
+        x += %(i)d + 1
+    return x
+""", """
+def f(x, y):
+    return abs(x - y) + max(x, y) - min(x, y) * %(i)d
+"""]
+
+N = 10
+
+
+def make_functions():
+    funcs = []
+    for i in range(N):
+        for src in sources:
+            ns = {}
+            exec(src % dict(i=i), ns)
+            funcs.append(ns['f'])
+    return funcs
+
+
+def python_main():
+    # Baseline: run the functions' Python code
+    for f in make_functions():
+        f(1.0, 2.0)
+
+
+def numba_main():
+    for f in make_functions():
+        njit(f)(1.0, 2.0)
+
+
+if __name__ == '__main__':
+    numba_main()
+    t = time.time()
+    numba_main()
+    print("%d functions: %.3f s" % (N * len(sources), time.time() - t))
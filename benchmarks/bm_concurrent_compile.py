@@ -0,0 +1,70 @@
+"""
+Warming up many independent functions, serially or from a pool of
+threads.  Threads can overlap the machine code generation of a function
+with the type inference of others, if several cores are available.
+"""
+
+from __future__ import absolute_import, print_function, division
+
+import threading
+import time
+
+import numpy as np
+
+from numba import njit
+from numba.six.moves import queue
+
+
+N = 40
+NTHREADS = 4
+
+a = np.linspace(0.0, 1.0, 100)
+
+
+def make_function(i):
+    ns = {'np': np}
+    exec("def f(a):\n"
+         "    s = 0.0\n"
+         "    for x in a:\n"
+         "        s += np.cos(x * %d) + x ** 2\n"
+         "    return s\n" % i, ns)
+    return njit(ns['f'])
+
+
+def warm_up(funcs, nthreads):
+    work = queue.Queue()
+    for f in funcs:
+        work.put(f)
+
+    def worker():
+        while True:
+            try:
+                f = work.get_nowait()
+            except queue.Empty:
+                return
+            f(a)
+
+    threads = [threading.Thread(target=worker) for i in range(nthreads)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+
+
+def python_main():
+    # Baseline: compile serially
+    warm_up([make_function(i) for i in range(N)], 1)
+
+
+def numba_main():
+    warm_up([make_function(i) for i in range(N)], NTHREADS)
+
+
+if __name__ == '__main__':
+    warm_up([make_function(-1)], 1)
+    for nthreads in (1, NTHREADS):
+        funcs = [make_function(i) for i in range(N)]
+        t = time.time()
+        warm_up(funcs, nthreads)
+        print("%d functions with %d thread(s): %.2f s"
+              % (N, nthreads, time.time() - t))
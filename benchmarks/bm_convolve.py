@@ -0,0 +1,44 @@
+from __future__ import absolute_import, print_function, division
+
+import numpy as np
+from numba import njit
+from numba.utils import benchmark
+
+
+def convolve(a, v):
+    return np.convolve(a, v)
+
+
+numba_convolve = njit(convolve)
+
+np.random.seed(42)
+arr = np.random.random(10 ** 5)
+small_kernel = np.random.random(16)
+large_kernel = np.random.random(10 ** 4)
+
+
+def python_main():
+    convolve(arr, small_kernel)
+    convolve(arr, large_kernel)
+
+
+def numba_main():
+    numba_convolve(arr, small_kernel)
+    numba_convolve(arr, large_kernel)
+
+
+def scipy_main():
+    from scipy.signal import fftconvolve
+    fftconvolve(arr, small_kernel)
+    fftconvolve(arr, large_kernel)
+
+
+if __name__ == '__main__':
+    # Exclude compilation from the timings
+    numba_main()
+    print('numpy', benchmark(python_main))
+    print('numba', benchmark(numba_main))
+    try:
+        print('scipy fftconvolve', benchmark(scipy_main))
+    except ImportError:
+        pass
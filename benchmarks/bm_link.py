@@ -0,0 +1,42 @@
+"""
+Compile time of a small function once many internal helpers (e.g.
+Numpy function implementations) have been compiled in the process.
+"""
+
+from __future__ import absolute_import, print_function, division
+
+import numpy as np
+
+from numba import njit
+from numba.targets.registry import cpu_target
+from numba.utils import benchmark
+
+
+def compile_helpers():
+    a = np.linspace(0.0, 1.0, 100)
+    for dtype in (np.float64, np.float32, np.int64, np.int32):
+        arr = (a * 100).astype(dtype)
+        for name in ("sort", "argsort", "median", "unique", "cumsum"):
+            njit(eval("lambda x: np.%s(x)" % name))(arr)
+
+
+def compile_small():
+    njit(lambda x: x + 1)(1.0)
+
+
+def python_main():
+    # Baseline: the function's Python code
+    (lambda x: x + 1)(1.0)
+
+
+def numba_main():
+    compile_small()
+
+
+compile_helpers()
+
+
+if __name__ == '__main__':
+    print("%d libraries registered with the codegen"
+          % len(cpu_target.target_context.codegen()._libraries))
+    print(benchmark(compile_small))
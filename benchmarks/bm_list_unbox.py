@@ -0,0 +1,36 @@
+from __future__ import absolute_import, print_function, division
+
+from numba import njit
+from numba.utils import benchmark
+
+
+N = 10 ** 5
+
+
+def list_sum(l):
+    res = 0.0
+    for x in l:
+        res += x
+    return res
+
+
+numba_sum = njit(list_sum)
+
+# Exact Python floats are unboxed by a C loop
+floats = [float(i) for i in range(N)]
+
+
+def python_main():
+    list_sum(floats)
+
+
+def numba_main():
+    numba_sum(floats)
+
+
+if __name__ == '__main__':
+    # Exclude compilation from the timings
+    python_main()
+    numba_main()
+    print('python', benchmark(python_main))
+    print('numba', benchmark(numba_main))
@@ -0,0 +1,63 @@
+from __future__ import absolute_import, print_function, division
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+from numba import njit
+from numba.utils import benchmark
+
+
+def sort_copy(a):
+    return np.sort(a)
+
+
+numba_serial_sort = njit(sort_copy)
+numba_parallel_sort = njit(parallel=True)(sort_copy)
+
+N = 10 ** 7
+
+np.random.seed(42)
+arr = np.random.random(N)
+
+
+def python_main():
+    sort_copy(arr)
+
+
+def numba_main():
+    numba_parallel_sort(arr)
+
+
+def serial_main():
+    numba_serial_sort(arr)
+
+
+def scaling(max_threads=None):
+    """
+    Time the parallel sort with an increasing thread pool size.  Each
+    timing runs in a fresh process, as the pool size is fixed at startup.
+    """
+    if max_threads is None:
+        import multiprocessing
+        max_threads = multiprocessing.cpu_count()
+    nthreads = 1
+    while nthreads <= max_threads:
+        env = dict(os.environ, NUMBA_NUM_THREADS=str(nthreads))
+        out = subprocess.check_output(
+            [sys.executable, __file__, '--single'], env=env)
+        print('%3d threads: %s' % (nthreads, out.decode().strip()))
+        nthreads *= 2
+
+
+if __name__ == '__main__':
+    # Exclude compilation from the timings
+    numba_main()
+    if '--single' in sys.argv:
+        print(benchmark(numba_main))
+    else:
+        serial_main()
+        print('numpy', benchmark(python_main))
+        print('numba serial', benchmark(serial_main))
+        scaling()
@@ -0,0 +1,36 @@
+from __future__ import absolute_import, print_function, division
+
+from numba import njit
+from numba.utils import benchmark
+
+
+N = 10 ** 5
+
+
+def append_one(l):
+    l.append(l[-1] + 1.0)
+
+
+numba_append_one = njit(append_one)
+
+python_list = [float(i) for i in range(N)]
+numba_list = list(python_list)
+
+
+def python_main():
+    append_one(python_list)
+    python_list.pop()
+
+
+def numba_main():
+    # Only the appended item is boxed back into the Python list
+    numba_append_one(numba_list)
+    numba_list.pop()
+
+
+if __name__ == '__main__':
+    # Exclude compilation from the timings
+    python_main()
+    numba_main()
+    print('python', benchmark(python_main))
+    print('numba', benchmark(numba_main))
@@ -0,0 +1,50 @@
+from __future__ import absolute_import, print_function, division
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from numba.numpy_extensions import rolling_mean, rolling_min, rolling_max
+from numba.utils import benchmark
+
+
+N = 10 ** 6
+WINDOW = 100
+
+np.random.seed(42)
+arr = np.random.random(N)
+
+
+def windows(a, window):
+    n = len(a) - window + 1
+    return as_strided(a, (n, window), a.strides * 2)
+
+
+def python_main():
+    np.convolve(arr, np.ones(WINDOW) / WINDOW, 'valid')
+    w = windows(arr, WINDOW)
+    w.min(axis=1)
+    w.max(axis=1)
+
+
+def numba_main():
+    rolling_mean(arr, WINDOW)
+    rolling_min(arr, WINDOW)
+    rolling_max(arr, WINDOW)
+
+
+def scipy_main():
+    from scipy.ndimage import (uniform_filter1d, minimum_filter1d,
+                               maximum_filter1d)
+    uniform_filter1d(arr, WINDOW)
+    minimum_filter1d(arr, WINDOW)
+    maximum_filter1d(arr, WINDOW)
+
+
+if __name__ == '__main__':
+    # Exclude compilation from the timings
+    numba_main()
+    print('numpy', benchmark(python_main))
+    print('numba', benchmark(numba_main))
+    try:
+        print('scipy.ndimage', benchmark(scipy_main))
+    except ImportError:
+        pass
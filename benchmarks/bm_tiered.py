@@ -0,0 +1,60 @@
+"""
+First-call latency of a freshly jitted function, with and without
+tiered compilation.
+"""
+
+from __future__ import absolute_import, print_function, division
+
+import time
+
+import numpy as np
+
+from numba import jit, dispatcher
+
+
+def kernel(a):
+    s = 0.0
+    for i in range(a.shape[0]):
+        for j in range(a.shape[1]):
+            s += np.sin(a[i, j]) * a[i, j] ** 2
+    return s
+
+
+a = np.linspace(0.0, 1.0, 10000).reshape((100, 100))
+
+
+def first_call(tiered):
+    # A new dispatcher each time, so that the function is compiled again
+    func = jit(nopython=True, tiered=tiered)(kernel)
+    func(a)
+    return func
+
+
+def python_main():
+    # Baseline: compile with full optimizations
+    first_call(False)
+
+
+def numba_main():
+    first_call(True)
+    dispatcher._tier_up_worker.join()
+
+
+if __name__ == '__main__':
+    # Warm up the compiler
+    first_call(False)
+    big = np.linspace(0.0, 1.0, 4000000).reshape((2000, 2000))
+    for tiered in (False, True):
+        t = time.time()
+        func = first_call(tiered)
+        latency = time.time() - t
+        t = time.time()
+        func(big)
+        first_tier = time.time() - t
+        dispatcher._tier_up_worker.join()
+        t = time.time()
+        func(big)
+        final_tier = time.time() - t
+        print("tiered=%s: first call %.3f s, run %.4f s, "
+              "run after tier-up %.4f s"
+              % (tiered, latency, first_tier, final_tier))
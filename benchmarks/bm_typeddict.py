@@ -0,0 +1,59 @@
+from __future__ import absolute_import, print_function, division
+
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict
+from numba.utils import benchmark
+
+
+N = 10 ** 6
+NKEYS = 10 ** 4
+
+np.random.seed(42)
+keys = np.random.randint(0, NKEYS, N)
+other_keys = np.random.randint(0, NKEYS, N)
+values = np.random.random(N)
+
+
+def int_group_sum(d, keys, values):
+    for i in range(len(keys)):
+        k = keys[i]
+        d[k] = d.get(k, 0.0) + values[i]
+    return d
+
+
+def tuple_group_sum(d, keys, other_keys, values):
+    for i in range(len(keys)):
+        k = (keys[i], other_keys[i])
+        d[k] = d.get(k, 0.0) + values[i]
+    return d
+
+
+numba_int_group_sum = njit(int_group_sum)
+numba_tuple_group_sum = njit(tuple_group_sum)
+
+# The Python versions run on lists, as iterating over arrays from
+# Python would dominate their timings
+keys_list = keys.tolist()
+other_keys_list = other_keys.tolist()
+values_list = values.tolist()
+
+
+def python_main():
+    int_group_sum({}, keys_list, values_list)
+    tuple_group_sum({}, keys_list, other_keys_list, values_list)
+
+
+def numba_main():
+    numba_int_group_sum(Dict.empty(types.int64, types.float64),
+                        keys, values)
+    numba_tuple_group_sum(Dict.empty(types.UniTuple(types.int64, 2),
+                                     types.float64),
+                          keys, other_keys, values)
+
+
+if __name__ == '__main__':
+    # Exclude compilation from the timings
+    numba_main()
+    print('python', benchmark(python_main))
+    print('numba', benchmark(numba_main))
@@ -0,0 +1,42 @@
+from __future__ import absolute_import, print_function, division
+
+import numpy as np
+from numba import njit, types
+from numba.typed import List
+from numba.utils import benchmark
+
+
+N = 10 ** 6
+
+np.random.seed(42)
+arr = np.random.random(N)
+
+
+@njit
+def scale(l, factor):
+    for i in range(len(l)):
+        l[i] *= factor
+
+
+# A reflected list is converted to a native list on entry, and back to
+# Python objects on exit as it was modified.  A typed list is handed
+# over as a pointer in both directions.
+reflected_list = arr.tolist()
+typed_list = List.empty(types.float64)
+typed_list.extend(arr)
+
+
+def python_main():
+    scale(reflected_list, 1.0)
+
+
+def numba_main():
+    scale(typed_list, 1.0)
+
+
+if __name__ == '__main__':
+    # Exclude compilation from the timings
+    python_main()
+    numba_main()
+    print('reflected list', benchmark(python_main))
+    print('typed list', benchmark(numba_main))
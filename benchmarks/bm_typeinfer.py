@@ -0,0 +1,54 @@
+"""
+Type inference time of a large synthetic function.
+
+The function carries a chain of variables around a loop, written in
+reverse dataflow order, so that each type change has to travel through
+the whole chain.
+"""
+
+from __future__ import absolute_import, print_function, division
+
+from numba import compiler, typeinfer, types
+from numba.targets.registry import cpu_target
+from numba.utils import benchmark
+
+
+def make_function(n):
+    lines = ["def f(x):"]
+    lines += ["    v%d = 0" % i for i in range(n)]
+    lines += ["    for i in range(10):"]
+    lines += ["        v%d = v%d + 1" % (i, i + 1) for i in range(n - 1)]
+    lines += ["        v%d = x" % (n - 1)]
+    lines += ["    return v0"]
+    ns = {}
+    exec("\n".join(lines), ns)
+    return ns['f']
+
+
+N = 200
+
+func_ir = compiler.run_frontend(make_function(N))
+
+
+def infer_types(func_ir):
+    typingctx = cpu_target.typing_context
+    typingctx.refresh()
+    return compiler.type_inference_stage(typingctx, func_ir,
+                                         (types.float64,), None)
+
+
+def python_main():
+    # Baseline: build the function's IR
+    compiler.run_frontend(make_function(N))
+
+
+def numba_main():
+    infer_types(func_ir)
+
+
+if __name__ == '__main__':
+    typemap, restype, calltypes = infer_types(func_ir)
+    assert restype == types.float64, restype
+    for n in (100, 200, 400):
+        func_ir = compiler.run_frontend(make_function(n))
+        print(n, benchmark(lambda: infer_types(func_ir)))
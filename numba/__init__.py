@@ -26,11 +26,17 @@ from .decorators import autojit, cfunc, generated_jit, jit, njit
 from .npyufunc import vectorize, guvectorize
 
 # Re-export Numpy helpers
-from .numpy_support import carray, farray, from_dtype
+from .numpy_support import carray, farray, columnarize, from_dtype
 
 # Re-export jitclass
 from .jitclass import jitclass
 
+# Re-export chunked iteration of generators
+from .generators import chunked
+
+# Re-export compiled code statistics
+from .dispatcher import compiled_code_stats
+
 # Keep this for backward compatibility.
 test = runtests.main
 
@@ -38,6 +44,8 @@ test = runtests.main
 __all__ = """
     autojit
     cfunc
+    chunked
+    compiled_code_stats
     from_dtype
     guvectorize
     jit
@@ -222,6 +222,44 @@ Dispatcher_Insert(DispatcherObject *self, PyObject *args)
     Py_RETURN_NONE;
 }
 
+static
+PyObject*
+Dispatcher_Replace(DispatcherObject *self, PyObject *args)
+{
+    PyObject *sigtup, *cfunc;
+    int i, sigsz;
+    int *sig;
+    void *old;
+
+    if (!PyArg_ParseTuple(args, "OO", &sigtup, &cfunc)) {
+        return NULL;
+    }
+
+    if (!PyObject_TypeCheck(cfunc, &PyCFunction_Type) ) {
+        PyErr_SetString(PyExc_TypeError, "must be builtin_function_or_method");
+        return NULL;
+    }
+
+    sigsz = PySequence_Fast_GET_SIZE(sigtup);
+    sig = malloc(sigsz * sizeof(int));
+
+    for (i = 0; i < sigsz; ++i) {
+        sig[i] = PyLong_AsLong(PySequence_Fast_GET_ITEM(sigtup, i));
+    }
+
+    /* As in Dispatcher_Insert(), the reference to cfunc is borrowed.
+       The caller must also keep the old definition alive, as other
+       threads may still be executing it. */
+    old = dispatcher_replace_defn(self->dispatcher, sig, (void*) cfunc);
+    if (old != NULL && self->firstdef == old) {
+        self->firstdef = cfunc;
+    }
+
+    free(sig);
+
+    return PyBool_FromLong(old != NULL);
+}
+
 
 static
 void explain_issue(PyObject *dispatcher, PyObject *args, PyObject *kws,
@@ -588,6 +626,8 @@ static PyMethodDef Dispatcher_methods[] = {
     { "_clear", (PyCFunction)Dispatcher_clear, METH_NOARGS, NULL },
     { "_insert", (PyCFunction)Dispatcher_Insert, METH_VARARGS,
       "insert new definition"},
+    { "_replace", (PyCFunction)Dispatcher_Replace, METH_VARARGS,
+      "replace an existing definition"},
     { NULL },
 };
 
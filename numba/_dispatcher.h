@@ -19,6 +19,9 @@ dispatcher_del(dispatcher_t *obj);
 void
 dispatcher_add_defn(dispatcher_t *obj, int tys[], void* callable);
 
+void*
+dispatcher_replace_defn(dispatcher_t *obj, int tys[], void* callable);
+
 void*
 dispatcher_resolve(dispatcher_t *obj, int sig[], int *matches,
                    int allow_unsafe);
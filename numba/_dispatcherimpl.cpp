@@ -1,4 +1,5 @@
 #include "typeconv/typeconv.hpp"
+#include <algorithm>
 #include <cassert>
 #include <vector>
 
@@ -19,6 +20,20 @@ public:
         functions.push_back(callable);
     }
 
+    void* replaceDefinition(Type args[], void *callable) {
+        // Swap the callable of the overload with exactly these argument
+        // types, returning the previous callable (or NULL if not found)
+        const int ovct = functions.size();
+        for (int i=0; i<ovct; ++i) {
+            if (std::equal(args, args + argct, overloads.begin() + i * argct)) {
+                void *old = functions[i];
+                functions[i] = callable;
+                return old;
+            }
+        }
+        return NULL;
+    }
+
     void* resolve(Type sig[], int &matches, bool allow_unsafe) {
         const int ovct = functions.size();
         int selected;
@@ -89,6 +104,13 @@ dispatcher_add_defn(dispatcher_t *obj, int tys[], void* callable) {
     disp->addDefinition(args, callable);
 }
 
+void*
+dispatcher_replace_defn(dispatcher_t *obj, int tys[], void* callable) {
+    Dispatcher *disp = static_cast<Dispatcher*>(obj);
+    Type *args = reinterpret_cast<Type*>(tys);
+    return disp->replaceDefinition(args, callable);
+}
+
 void*
 dispatcher_resolve(dispatcher_t *obj, int sig[], int *count, int allow_unsafe) {
     Dispatcher *disp = static_cast<Dispatcher*>(obj);
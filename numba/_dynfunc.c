@@ -158,6 +158,10 @@ typedef struct {
        code alive. */
     PyObject *keepalive;
     PyObject *weakreflist;
+    /* The function address resolved by a lazy function's entry point
+       (see make_lazy_function()).  def.ml_meth can't be patched instead,
+       as it is part of the PyCFunction's hash. */
+    PyCFunctionWithKeywords lazy_addr;
 } ClosureObject;
 
 
@@ -311,6 +315,8 @@ typedef struct {
     PyCFunctionWithKeywords nextfunc;
     gen_finalizer_t finalizer;
     PyObject *weakreflist;
+    /* The Numba type of the generator, or NULL if unknown */
+    PyObject *numba_type;
     union {
         double dummy;   /* Force alignment */
         char state[0];
@@ -323,6 +329,7 @@ generator_traverse(GeneratorObject *gen, visitproc visit, void *arg)
     /* XXX this doesn't traverse the state, which can own references to
        PyObjects */
     Py_VISIT(gen->env);
+    Py_VISIT(gen->numba_type);
     return 0;
 }
 
@@ -334,6 +341,7 @@ generator_clear(GeneratorObject *gen)
         gen->finalizer = NULL;
     }
     Py_CLEAR(gen->env);
+    Py_CLEAR(gen->numba_type);
     gen->nextfunc = NULL;
     return 0;
 }
@@ -352,6 +360,7 @@ generator_dealloc(GeneratorObject *gen)
         if (gen->finalizer != NULL)
             gen->finalizer(gen->state);
     Py_XDECREF(gen->env);
+    Py_XDECREF(gen->numba_type);
     Py_TYPE(gen)->tp_free((PyObject *) gen);
 }
 
@@ -372,6 +381,37 @@ generator_iternext(GeneratorObject *gen)
     return res;
 }
 
+/*
+ * Run the generator natively until n items are gathered (see
+ * numba.generators.take()).
+ */
+static PyObject *
+generator_take(GeneratorObject *gen, PyObject *args)
+{
+    PyObject *n, *mod, *res;
+    if (!PyArg_ParseTuple(args, "O:take", &n))
+        return NULL;
+    mod = PyImport_ImportModule("numba.generators");
+    if (mod == NULL)
+        return NULL;
+    res = PyObject_CallMethod(mod, "take", "OO", (PyObject *) gen, n);
+    Py_DECREF(mod);
+    return res;
+}
+
+static PyMethodDef generator_methods[] = {
+    {"take", (PyCFunction) generator_take, METH_VARARGS,
+     "take(n) -> the next n items (or less if the generator is exhausted) "
+     "as a Numpy array, or a tuple of arrays for tuples."},
+    {NULL}  /* Sentinel */
+};
+
+static PyMemberDef generator_members[] = {
+    {"_numba_type_", T_OBJECT, offsetof(GeneratorObject, numba_type),
+     READONLY},
+    {NULL}  /* Sentinel */
+};
+
 static PyTypeObject GeneratorType = {
 #if (PY_MAJOR_VERSION < 3)
     PyObject_HEAD_INIT(NULL)
@@ -406,8 +446,8 @@ static PyTypeObject GeneratorType = {
     offsetof(GeneratorObject, weakreflist),   /* tp_weaklistoffset */
     PyObject_SelfIter,                        /* tp_iter */
     (iternextfunc) generator_iternext,        /* tp_iternext */
-    0,                                        /* tp_methods */
-    0,                                        /* tp_members */
+    generator_methods,                        /* tp_methods */
+    generator_members,                        /* tp_members */
     0,                                        /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
@@ -425,7 +465,8 @@ Numba_make_generator(Py_ssize_t gen_state_size,
                      void *initial_state,
                      PyCFunctionWithKeywords nextfunc,
                      gen_finalizer_t finalizer,
-                     EnvironmentObject *env)
+                     EnvironmentObject *env,
+                     PyObject *numba_type)
 {
     GeneratorObject *gen;
     gen = (GeneratorObject *) PyType_GenericAlloc(&GeneratorType, gen_state_size);
@@ -436,6 +477,8 @@ Numba_make_generator(Py_ssize_t gen_state_size,
     Py_XINCREF(env);
     gen->env = env;
     gen->finalizer = finalizer;
+    Py_XINCREF(numba_type);
+    gen->numba_type = numba_type;
     return (PyObject *) gen;
 }
 
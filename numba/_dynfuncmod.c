@@ -22,9 +22,64 @@ make_function(PyObject *self, PyObject *args)
     return pycfunction_new(module, fname, fdoc, fnaddr, env, keepalive);
 }
 
+/* Entry point of the functions created by make_lazy_function(): on the
+   first call, get the actual function address from the resolver (the
+   first item of the closure's keepalive tuple) and store it in the
+   closure, then forward the call to it. */
+static PyObject *
+lazy_function_call(PyObject *self, PyObject *args, PyObject *kws)
+{
+    ClosureObject *clo = (ClosureObject *) self;
+    PyObject *resolver, *fnaddrobj;
+    PyCFunctionWithKeywords fnaddr = clo->lazy_addr;
+
+    if (fnaddr == NULL) {
+        resolver = PyTuple_GET_ITEM(clo->keepalive, 0);
+        fnaddrobj = PyObject_CallObject(resolver, NULL);
+        if (fnaddrobj == NULL)
+            return NULL;
+        fnaddr = (PyCFunctionWithKeywords) PyLong_AsVoidPtr(fnaddrobj);
+        Py_DECREF(fnaddrobj);
+        if (fnaddr == NULL) {
+            if (!PyErr_Occurred())
+                PyErr_SetString(PyExc_RuntimeError,
+                                "lazy function resolved to a NULL address");
+            return NULL;
+        }
+        clo->lazy_addr = fnaddr;
+    }
+    return fnaddr(self, args, kws);
+}
+
+/* Python-facing function to create a new C function object whose address
+   is only resolved, by calling *resolver*, when it is first called */
+static PyObject*
+make_lazy_function(PyObject *self, PyObject *args)
+{
+    PyObject *module, *fname, *fdoc, *resolver, *funcobj;
+    EnvironmentObject *env;
+    PyObject *keepalive = Py_None;
+
+    if (!PyArg_ParseTuple(args, "OOOO!O|O",
+            &module, &fname, &fdoc, &EnvironmentType, &env, &resolver,
+            &keepalive)) {
+        return NULL;
+    }
+
+    keepalive = PyTuple_Pack(2, resolver, keepalive);
+    if (keepalive == NULL)
+        return NULL;
+    funcobj = pycfunction_new(module, fname, fdoc,
+                              (PyCFunction) lazy_function_call, env,
+                              keepalive);
+    Py_DECREF(keepalive);
+    return funcobj;
+}
+
 static PyMethodDef ext_methods[] = {
 #define declmethod(func) { #func , ( PyCFunction )func , METH_VARARGS , NULL }
     declmethod(make_function),
+    declmethod(make_lazy_function),
     { NULL },
 #undef declmethod
 };
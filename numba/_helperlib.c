@@ -378,8 +378,19 @@ numba_adapt_buffer(Py_buffer *buf, arystruct_t *arystruct)
         *p = buf->shape[i];
         arystruct->nitems *= buf->shape[i];
     }
-    for (i = 0; i < buf->ndim; i++, p++) {
-        *p = buf->strides[i];
+    if (buf->strides) {
+        for (i = 0; i < buf->ndim; i++, p++) {
+            *p = buf->strides[i];
+        }
+    }
+    else {
+        /* Some exporters (e.g. ctypes) don't fill in the strides of
+           C-contiguous buffers */
+        npy_intp stride = buf->itemsize;
+        for (i = buf->ndim - 1; i >= 0; i--) {
+            p[i] = stride;
+            stride *= buf->shape[i];
+        }
     }
     arystruct->meminfo = NULL;
 }
@@ -908,6 +919,75 @@ numba_unpickle(const char *data, int n)
 }
 
 
+/*
+ * Fast unboxing of lists of Python floats and ints.  The list items
+ * are copied into the native array *out* of *n* items.  Return 0 on
+ * success, or 1 if an item isn't exactly of the expected Python type
+ * (the caller should then fall back on generic unboxing).  If *convert*
+ * is true, such items are converted instead, and -1 is returned on error.
+ */
+
+NUMBA_EXPORT_FUNC(int)
+numba_unbox_float_list(PyObject *obj, double *out, Py_ssize_t n, int convert)
+{
+    Py_ssize_t i;
+    for (i = 0; i < n; i++) {
+        PyObject *item = PyList_GET_ITEM(obj, i);
+        if (PyFloat_CheckExact(item)) {
+            out[i] = PyFloat_AS_DOUBLE(item);
+        }
+        else if (convert) {
+            double v = PyFloat_AsDouble(item);
+            if (v == -1.0 && PyErr_Occurred())
+                return -1;
+            out[i] = v;
+        }
+        else
+            return 1;
+    }
+    return 0;
+}
+
+NUMBA_EXPORT_FUNC(int)
+numba_unbox_int_list(PyObject *obj, int64_t *out, Py_ssize_t n, int convert)
+{
+    Py_ssize_t i;
+    for (i = 0; i < n; i++) {
+        PyObject *item = PyList_GET_ITEM(obj, i);
+        PY_LONG_LONG v;
+#if PY_MAJOR_VERSION < 3
+        if (PyInt_CheckExact(item)) {
+            out[i] = PyInt_AS_LONG(item);
+            continue;
+        }
+#endif
+        if (PyLong_CheckExact(item)) {
+            int overflow;
+            v = PyLong_AsLongLongAndOverflow(item, &overflow);
+            if (overflow)
+                /* Let the generic unboxing raise the error */
+                return 1;
+            if (v == -1 && PyErr_Occurred())
+                return -1;
+        }
+        else if (convert) {
+            /* Reject non-integral items such as floats */
+            PyObject *num = PyNumber_Index(item);
+            if (num == NULL)
+                return -1;
+            v = PyLong_AsLongLong(num);
+            Py_DECREF(num);
+            if (v == -1 && PyErr_Occurred())
+                return -1;
+        }
+        else
+            return 1;
+        out[i] = v;
+    }
+    return 0;
+}
+
+
 /*
  * Define bridge for all math functions
  */
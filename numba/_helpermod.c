@@ -64,6 +64,8 @@ build_c_helpers_dict(void)
     declmethod(adapt_ndarray);
     declmethod(ndarray_new);
     declmethod(extract_record_data);
+    declmethod(unbox_float_list);
+    declmethod(unbox_int_list);
     declmethod(get_buffer);
     declmethod(adapt_buffer);
     declmethod(release_buffer);
@@ -225,6 +225,11 @@ compute_dtype_fingerprint(string_writer_t *w, PyArray_Descr *descr)
         TRY(string_writer_put_char, w, (char) typenum);
         return string_writer_put_intp(w, (npy_intp) interned);
     }
+    if (typenum == NPY_STRING || typenum == NPY_UNICODE) {
+        /* Fixed-width strings: the width is part of the type */
+        TRY(string_writer_put_char, w, (char) typenum);
+        return string_writer_put_intp(w, (npy_intp) descr->elsize);
+    }
 #if NPY_API_VERSION >= 0x00000007
     if (PyTypeNum_ISDATETIME(typenum)) {
         PyArray_DatetimeMetaData *md;
@@ -265,6 +270,18 @@ compute_fingerprint(string_writer_t *w, PyObject *val)
         TRY(string_writer_put_char, w, OP_END_TUPLE);
         return 0;
     }
+    /* Check before bytes, as np.bytes_ scalars are bytes objects */
+    if (PyArray_IsScalar(val, Generic)) {
+        /* Note: PyArray_DescrFromScalar() may be a bit slow on
+           non-trivial types. */
+        PyArray_Descr *descr = PyArray_DescrFromScalar(val);
+        if (descr == NULL)
+            return -1;
+        TRY(string_writer_put_char, w, OP_NP_SCALAR);
+        TRY(compute_dtype_fingerprint, w, descr);
+        Py_DECREF(descr);
+        return 0;
+    }
     if (PyBytes_Check(val))
         return string_writer_put_char(w, OP_BYTES);
     if (PyByteArray_Check(val))
@@ -278,17 +295,6 @@ compute_fingerprint(string_writer_t *w, PyObject *val)
         Py_DECREF(default_val);
         return 0;
     }
-    if (PyArray_IsScalar(val, Generic)) {
-        /* Note: PyArray_DescrFromScalar() may be a bit slow on
-           non-trivial types. */
-        PyArray_Descr *descr = PyArray_DescrFromScalar(val);
-        if (descr == NULL)
-            return -1;
-        TRY(string_writer_put_char, w, OP_NP_SCALAR);
-        TRY(compute_dtype_fingerprint, w, descr);
-        Py_DECREF(descr);
-        return 0;
-    }
     if (PyArray_Check(val)) {
         PyArrayObject *ary = (PyArrayObject *) val;
         int ndim = PyArray_NDIM(ary);
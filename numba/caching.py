@@ -6,24 +6,31 @@ from __future__ import print_function, division, absolute_import
 
 from abc import ABCMeta, abstractmethod, abstractproperty
 import contextlib
+import copy
 import errno
 import hashlib
 import inspect
 import itertools
 import os
 from .six.moves import cPickle as pickle
+import re
 import sys
 import tempfile
+import types as pytypes
 import warnings
+import weakref
+
+import numpy as np
+import llvmlite.binding as ll
 
 from .appdirs import AppDirs
-from .six import add_metaclass
+from .six import add_metaclass, text_type
 
 import numba
-from . import compiler, config, utils
+from . import compiler, config, types, utils
 from .errors import NumbaWarning
 from numba.targets.base import BaseContext
-from numba.targets.codegen import CodeLibrary
+from numba.targets.codegen import CodeLibrary, RuntimeLinker
 from numba.compiler import CompileResult
 
 
@@ -683,8 +690,122 @@ class FunctionCache(Cache):
     _impl_class = CompileResultCacheImpl
 
 
+class SubroutineCacheImpl(CodeLibraryCacheImpl):
+    """
+    Implements the logic to cache the helpers compiled by
+    BaseContext.compile_subroutine().
+    """
+
+    _filename_prefix = 'subroutine'
+
+    def reduce(self, cres):
+        """
+        Returns the serialized library and function descriptor of the
+        given CompileResult
+        """
+        fndesc = copy.copy(cres.fndesc)
+        # Those don't need to be pickled and may fail
+        fndesc.typemap = fndesc.calltypes = None
+        return cres.library.serialize_using_object_code(), fndesc
+
+    def rebuild(self, target_context, payload):
+        """
+        Returns the unserialized library and function descriptor
+        """
+        libdata, fndesc = payload
+        library = target_context.codegen().unserialize_library(libdata)
+        return library, fndesc
+
+    def check_cachable(self, cres):
+        """
+        Check that the library doesn't embed code which may differ in other
+        processes, such as copies of functions named after a process-specific
+        id (closure variables are fine, since they are part of the key).
+        """
+        library = cres.library
+        if library.has_dynamic_globals:
+            return False
+        prefix = RuntimeLinker.PREFIX
+        if any(gv.name.startswith(prefix)
+               for gv in library._final_module.global_variables):
+            return False
+        symbols = _get_relocatable_symbols(library.codegen)
+        for fn in library.get_defined_functions():
+            if (fn.linkage not in (ll.Linkage.internal, ll.Linkage.private)
+                and fn.name not in symbols):
+                return False
+        return True
+
+
+class SubroutineCache(Cache):
+    """
+    Implements Cache that saves and loads the helpers compiled by
+    BaseContext.compile_subroutine().  Entries are keyed on a digest of
+    the helper's code, closure variables, signature and compilation
+    options, and the helper's function is named after that digest so that
+    the copies embedded in other cached libraries are the same in every
+    process.
+
+    As helpers can call into any part of Numba, the index is also
+    invalidated when a Numba source file is modified.  For the same
+    reason, only the helpers defined by Numba itself are cached.
+    """
+
+    _impl_class = SubroutineCacheImpl
+
+    def __init__(self, py_func):
+        super(SubroutineCache, self).__init__(py_func)
+        self._qualname = getattr(py_func, '__qualname__', py_func.__name__)
+        source_stamp = (self._impl.locator.get_source_stamp(),
+                        _get_numba_source_stamp())
+        self._cache_file = IndexDataCacheFile(
+            cache_path=self._cache_path,
+            filename_base=self._impl.filename_base,
+            source_stamp=source_stamp)
+
+    def get_unique_name(self, key):
+        """
+        The unique name of the helper compiled for *key*.
+        """
+        return '%s$%s' % (self._qualname, key[:16])
+
+    def load_subroutine(self, key, target_context):
+        """
+        Load the helper saved under *key* and make it available for linking
+        in *target_context*.  Its function descriptor is returned, or None
+        if not found in the cache.
+        """
+        with self._guard_against_spurious_io_errors():
+            return self._load_subroutine(key, target_context)
+
+    def _load_subroutine(self, key, target_context):
+        if not self._enabled:
+            return
+        codegen = target_context.codegen()
+        data = self._cache_file.load(self._index_key(key, codegen))
+        # Another process may have reused the data file for another key
+        # while we were loading the index
+        if data is None or data[1].unique_name != self.get_unique_name(key):
+            return
+        library, fndesc = self._impl.rebuild(target_context, data)
+        codegen.add_linking_library(library)
+        symbols = _get_relocatable_symbols(codegen)
+        symbols.update(fn.name
+                       for fn in library._get_module_for_linking().functions
+                       if not fn.is_declaration)
+        return fndesc
+
+    def save_subroutine(self, key, cres):
+        """
+        Save the helper compiled in *cres* under *key*.
+        """
+        symbols = _get_relocatable_symbols(cres.library.codegen)
+        symbols.add(cres.fndesc.mangled_name)
+        self.save_overload(key, cres)
+
+
 # Remember used cache filename prefixes.
-_lib_cache_prefixes = set([''])
+_lib_cache_prefixes = set(['', SubroutineCacheImpl._filename_prefix])
 
 
 def make_library_cache(prefix):
@@ -710,3 +831,155 @@ def make_library_cache(prefix):
     return LibraryCache
 
 
+
+
+# { code object: SubroutineCache instance or None }
+_subroutine_caches = {}
+
+# { codegen: names of the functions defined identically in all processes }
+_relocatable_symbols = weakref.WeakKeyDictionary()
+
+_numba_source_stamp = None
+
+_has_address = re.compile(r'(0x|#)[0-9a-fA-F]{6,}').search
+
+
+def _is_numba_subroutine(impl):
+    """
+    Whether the helper *impl* is defined in the Numba package (outside of
+    its tests).  Only those helpers can be cached, as the key doesn't
+    cover the functions a helper calls: the Numba source stamp does.
+    """
+    root = os.path.dirname(os.path.abspath(numba.__file__))
+    filename = os.path.abspath(impl.__code__.co_filename)
+    try:
+        relpath = os.path.relpath(filename, root)
+    except ValueError:
+        # On another drive
+        return False
+    if relpath.startswith(os.pardir):
+        return False
+    return 'tests' not in relpath.split(os.sep)[:-1]
+
+
+def get_subroutine_cache(context, impl, sig):
+    """
+    Return a (SubroutineCache, key) tuple for the helper *impl* compiled
+    by *context* for *sig*, or (None, None) if it can't be cached.
+    """
+    if not _is_numba_subroutine(impl):
+        return None, None
+    tokens = [_code_digest(impl.__code__), str(sig),
+              type(context.error_model).__name__, context.enable_nrt,
+              context.enable_fastmath, context.enable_debuginfo,
+              context.enable_boundcheck, config.OPT, config.LOOP_VECTORIZE]
+    for cell in impl.__closure__ or ():
+        token = _stable_token(cell.cell_contents)
+        if token is None:
+            return None, None
+        tokens.append(token)
+    tokens = repr(tokens)
+    if _has_address(tokens):
+        # Probably differs in each process (e.g. the type of a jitclass)
+        return None, None
+
+    try:
+        cache = _subroutine_caches[impl.__code__]
+    except KeyError:
+        try:
+            cache = SubroutineCache(impl)
+        except RuntimeError:
+            # No locator available (e.g. code generated with exec())
+            cache = None
+        _subroutine_caches[impl.__code__] = cache
+    if cache is None:
+        return None, None
+    key = hashlib.sha1(tokens.encode('utf8')).hexdigest()
+    return cache, key
+
+
+def _get_relocatable_symbols(codegen):
+    try:
+        return _relocatable_symbols[codegen]
+    except KeyError:
+        from numba.runtime import rtsys
+        # The runtime functions are linked into all libraries
+        symbols = set(fn.name for fn in rtsys.library.get_defined_functions())
+        _relocatable_symbols[codegen] = symbols
+        return symbols
+
+
+def _get_numba_source_stamp():
+    """
+    Return a stamp of the Numba package's source and extension files.
+    """
+    global _numba_source_stamp
+    if _numba_source_stamp is None:
+        root = os.path.dirname(numba.__file__)
+        stamps = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames
+                           if d not in ('tests', '__pycache__')]
+            for fn in filenames:
+                if os.path.splitext(fn)[1] in ('.py', '.so', '.pyd'):
+                    st = os.stat(os.path.join(dirpath, fn))
+                    stamps.append((st.st_mtime, st.st_size))
+        _numba_source_stamp = (len(stamps), max(stamps),
+                               sum(size for _, size in stamps))
+    return _numba_source_stamp
+
+
+def _code_digest(code):
+    """
+    Return a digest of the given code object which doesn't depend on
+    the running process.
+    """
+    h = hashlib.sha1()
+
+    def update(code):
+        h.update(code.co_code)
+        h.update(repr((code.co_names, code.co_varnames, code.co_freevars,
+                       code.co_cellvars)).encode('utf8'))
+        for const in code.co_consts:
+            if isinstance(const, pytypes.CodeType):
+                update(const)
+            elif isinstance(const, frozenset):
+                h.update(repr(sorted(repr(c) for c in const)).encode('utf8'))
+            else:
+                h.update(repr(const).encode('utf8'))
+
+    update(code)
+    return h.hexdigest()
+
+
+def _stable_token(value, depth=0):
+    """
+    Return a string describing the closure variable *value* identically
+    in all processes, or None if there is no such string.
+    """
+    if depth > 3:
+        return None
+    if value is None or isinstance(value, (bool, float, complex,
+                                           utils.INT_TYPES,
+                                           text_type, bytes)):
+        return '%s(%r)' % (type(value).__name__, value)
+    if isinstance(value, (tuple, list)):
+        tokens = [_stable_token(v, depth + 1) for v in value]
+        if None in tokens:
+            return None
+        return '%s(%s)' % (type(value).__name__, ', '.join(tokens))
+    if isinstance(value, (types.Type, np.dtype)):
+        return '%s(%s)' % (type(value).__name__, value)
+    if isinstance(value, pytypes.FunctionType):
+        tokens = [_stable_token(c.cell_contents, depth + 1)
+                  for c in value.__closure__ or ()]
+        if None in tokens:
+            return None
+        return 'function(%s.%s, %s, %s)' % (
+            value.__module__, getattr(value, '__qualname__', value.__name__),
+            _code_digest(value.__code__), ', '.join(tokens))
+    if isinstance(value, (pytypes.BuiltinFunctionType, np.ufunc, type)):
+        return 'global(%s.%s)' % (getattr(value, '__module__', None),
+                                  getattr(value, '__qualname__',
+                                          value.__name__))
+    return None
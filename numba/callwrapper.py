@@ -90,13 +90,14 @@ class _GilManager(object):
 
 class PyCallWrapper(object):
     def __init__(self, context, module, func, fndesc, env, call_helper,
-                 release_gil):
+                 release_gil, assume_homogeneous=False):
         self.context = context
         self.module = module
         self.func = func
         self.fndesc = fndesc
         self.env = env
         self.release_gil = release_gil
+        self.assume_homogeneous = assume_homogeneous
 
     def build(self):
         wrapname = self.fndesc.llvm_cpython_wrapper_name
@@ -119,6 +120,7 @@ class PyCallWrapper(object):
         kws.name = 'py_kws'
 
         api = self.context.get_python_api(builder)
+        api.assume_homogeneous = self.assume_homogeneous
         self.build_wrapper(api, builder, closure, args, kws)
 
         return wrapper, api
@@ -9,6 +9,7 @@ import ctypes
 from llvmlite import ir
 
 from . import config, sigutils, utils, compiler
+from . import llvmthreadsafe as llvmts
 from .caching import NullCache, FunctionCache
 from .dispatcher import _FunctionCompiler
 from .targets import registry
@@ -87,14 +88,16 @@ class CFunc(object):
         library = cres.library
         module = library.create_ir_module(fndesc.unique_name)
         context = cres.target_context
-        ll_argtypes = [context.get_value_type(ty) for ty in sig.args]
-        ll_return_type = context.get_value_type(sig.return_type)
+        with llvmts.lock_llvm:
+            ll_argtypes = [context.get_value_type(ty) for ty in sig.args]
+            ll_return_type = context.get_value_type(sig.return_type)
 
-        wrapty = ir.FunctionType(ll_return_type, ll_argtypes)
-        wrapfn = module.add_function(wrapty, fndesc.llvm_cfunc_wrapper_name)
-        builder = ir.IRBuilder(wrapfn.append_basic_block('entry'))
+            wrapty = ir.FunctionType(ll_return_type, ll_argtypes)
+            wrapfn = module.add_function(wrapty,
+                                         fndesc.llvm_cfunc_wrapper_name)
+            builder = ir.IRBuilder(wrapfn.append_basic_block('entry'))
 
-        self._build_c_wrapper(context, builder, cres, wrapfn.args)
+            self._build_c_wrapper(context, builder, cres, wrapfn.args)
 
         library.add_ir_module(module)
         library.finalize()
@@ -14,14 +14,98 @@ from .tracing import trace, event
 from numba import (bytecode, interpreter, funcdesc, postproc,
                    typing, typeinfer, lowering, objmode, utils, config,
                    errors, types, ir, types, rewrites, transforms)
+from numba import llvmthreadsafe as llvmts
 from numba.targets import cpu, callconv
 from numba.annotations import type_annotations
-from numba.parfor import ParforPass
+from numba.parfor import ParforPass, prange
 from numba.inline_closurecall import InlineClosureCallPass
 
 
+class _CompilerLock(object):
+    """
+    A reentrant lock serializing accesses to the compiler's shared state
+    (typing and target contexts, dispatchers...).  The outermost
+    compilation pipeline can release it temporarily around work which
+    doesn't touch that state, i.e. optimizing and generating machine
+    code for a library.
+
+    That work holds the LLVM lock, which lowering also takes, so another
+    thread can only run the pipeline's stages before lowering (such as
+    typing) meanwhile.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    @property
+    def depth(self):
+        """
+        How many times the current thread holds the lock.
+        """
+        return getattr(self._local, 'depth', 0)
+
+    def acquire(self):
+        self._lock.acquire()
+        self._local.depth = self.depth + 1
+
+    def release(self):
+        self._local.depth -= 1
+        self._lock.release()
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, *args, **kwargs):
+        self.release()
+
+    @property
+    def pipelines(self):
+        """
+        How many compilation pipelines the current thread is running.
+        """
+        return getattr(self._local, 'pipelines', 0)
+
+    @contextmanager
+    def compiling(self):
+        """
+        Hold the lock while running a compilation pipeline.  Pipelines
+        can nest, e.g. when a callee or a parfor kernel is compiled while
+        compiling its caller.
+        """
+        with self:
+            self._local.pipelines = self.pipelines + 1
+            try:
+                yield
+            finally:
+                self._local.pipelines -= 1
+
+    @contextmanager
+    def released(self):
+        """
+        Release the lock in the block if the current thread is running a
+        single compilation pipeline and doesn't hold the LLVM lock.
+
+        Otherwise it is in the middle of another function's compilation
+        (possibly inside its lowering), whose state must stay protected.
+        Releasing the lock while holding the LLVM lock would also invert
+        the locking order and could deadlock with other threads.
+        """
+        if self.pipelines != 1 or llvmts.lock_llvm.held:
+            yield
+            return
+        depth = self.depth
+        for _ in range(depth):
+            self.release()
+        try:
+            yield
+        finally:
+            for _ in range(depth):
+                self.acquire()
+
+
 # Lock for the preventing multiple compiler execution
-lock_compiler = threading.RLock()
+lock_compiler = _CompilerLock()
 
 
 class Flags(utils.ConfigOptions):
@@ -49,6 +133,11 @@ class Flags(utils.ConfigOptions):
         'no_rewrites': False,
         'error_model': 'python',
         'fastmath': False,
+        # Don't check that all items of unboxed containers have the same type
+        'assume_homogeneous': False,
+        # Compile nopython code with cheap optimizations first (the
+        # dispatcher recompiles it with full optimizations later)
+        'tiered': False,
     }
 
 
@@ -342,30 +431,35 @@ class Pipeline(object):
 
         return bc
 
-    def compile_extra(self, func):
-        self.func_id = bytecode.FunctionIdentity.from_function(func)
-
-        try:
-            bc = self.extract_bytecode(self.func_id)
-        except BaseException as e:
-            if self.status.can_giveup:
-                self.stage_compile_interp_mode()
-                return self.cr
-            else:
-                raise e
-
-        self.bc = bc
-        self.lifted = ()
-        self.lifted_from = None
-        return self._compile_bytecode()
+    def compile_extra(self, func, unique_name=None):
+        with lock_compiler.compiling():
+            self.func_id = bytecode.FunctionIdentity.from_function(func)
+            if unique_name is not None:
+                # Let the caller choose a name that is stable across processes
+                self.func_id.unique_name = unique_name
+
+            try:
+                bc = self.extract_bytecode(self.func_id)
+            except BaseException as e:
+                if self.status.can_giveup:
+                    self.stage_compile_interp_mode()
+                    return self.cr
+                else:
+                    raise e
+
+            self.bc = bc
+            self.lifted = ()
+            self.lifted_from = None
+            return self._compile_bytecode()
 
     def compile_ir(self, func_ir, lifted=(), lifted_from=None):
-        self.func_id = func_ir.func_id
-        self.lifted = lifted
-        self.lifted_from = lifted_from
+        with lock_compiler.compiling():
+            self.func_id = func_ir.func_id
+            self.lifted = lifted
+            self.lifted_from = lifted_from
 
-        self._set_and_check_ir(func_ir)
-        return self._compile_ir()
+            self._set_and_check_ir(func_ir)
+            return self._compile_ir()
 
     def stage_analyze_bytecode(self):
         """
@@ -401,6 +495,8 @@ class Pipeline(object):
         # Do not recursively loop lift
         outer_flags.unset('enable_looplift')
         loop_flags.unset('enable_looplift')
+        # Lifted loops are never recompiled, optimize them fully
+        loop_flags.unset('tiered')
         if not self.flags.enable_pyobject_looplift:
             loop_flags.unset('enable_pyobject')
 
@@ -489,6 +585,8 @@ class Pipeline(object):
         """
         # Ensure we have an IR and type information.
         assert self.func_ir
+        if not may_parallelize(self.type_annotation.typemap):
+            return
         parfor_pass = ParforPass(self.func_ir, self.type_annotation.typemap,
             self.type_annotation.calltypes, self.return_type, self.typingctx)
         parfor_pass.run()
@@ -499,11 +597,14 @@ class Pipeline(object):
         """
         # Ensure we have an IR and type information.
         assert self.func_ir
-        inline_pass = InlineClosureCallPass(self.func_ir, self.flags, run_frontend)
-        inline_pass.run()
-        # Remove all Dels, and re-run postproc
-        post_proc = postproc.PostProcessor(self.func_ir)
-        post_proc.run()
+        # Only closures and list comprehensions (array calls) are inlined
+        if has_exprs(self.func_ir, ('make_function', 'build_list')):
+            inline_pass = InlineClosureCallPass(self.func_ir, self.flags,
+                                                run_frontend)
+            inline_pass.run()
+            # Remove all Dels, and re-run postproc
+            post_proc = postproc.PostProcessor(self.func_ir)
+            post_proc.run()
 
         if config.DEBUG or config.DUMP_IR:
             name = self.func_ir.func_id.func_qualname
@@ -572,6 +673,8 @@ class Pipeline(object):
             # Enable object caching upfront, so that the library can
             # be later serialized.
             self.library.enable_object_caching()
+            if self.flags.tiered and not objectmode:
+                self.library.use_quick_optimizations()
 
         lowered = lowerfn()
         signature = typing.signature(self.return_type, *self.args)
@@ -755,13 +858,14 @@ def compile_ir(typingctx, targetctx, func_ir, args, return_type, flags,
 
 
 def compile_internal(typingctx, targetctx, library,
-                     func, args, return_type, flags, locals):
+                     func, args, return_type, flags, locals,
+                     unique_name=None):
     """
     For internal use only.
     """
     pipeline = Pipeline(typingctx, targetctx, library,
                         args, return_type, flags, locals)
-    return pipeline.compile_extra(func)
+    return pipeline.compile_extra(func, unique_name=unique_name)
 
 
 def legalize_return_type(return_type, interp, targetctx):
@@ -799,6 +903,31 @@ def legalize_return_type(return_type, interp, targetctx):
         raise TypeError(msg.format(return_type))
 
 
+def has_exprs(func_ir, ops):
+    """
+    Whether *func_ir* contains expressions with any of the given *ops*.
+    """
+    for block in func_ir.blocks.values():
+        for inst in block.body:
+            if (isinstance(inst, ir.Assign) and isinstance(inst.value, ir.Expr)
+                and inst.value.op in ops):
+                return True
+    return False
+
+
+def may_parallelize(typemap):
+    """
+    Whether the parfor pass can find anything to convert in a function
+    with the given *typemap*: array computations or prange() loops.
+    """
+    for typ in typemap.values():
+        if isinstance(typ, types.Array):
+            return True
+        if isinstance(typ, types.Function) and typ.typing_key is prange:
+            return True
+    return False
+
+
 def translate_stage(func_id, bytecode):
     interp = interpreter.Interpreter(func_id)
     return interp.interpret(bytecode)
@@ -855,10 +984,15 @@ def native_lowering_stage(targetctx, library, interp, typemap, restype,
         interp, typemap, restype, calltypes, mangler=targetctx.mangler,
         inline=flags.forceinline)
 
-    lower = lowering.Lower(targetctx, library, fndesc, interp)
-    lower.lower()
-    if not flags.no_cpython_wrapper:
-        lower.create_cpython_wrapper(flags.release_gil)
+    # Lowering queries LLVM, which another thread may be using
+    # (see _CompilerLock.released()).  This waits for any machine code
+    # generation in progress to finish.
+    with llvmts.lock_llvm:
+        lower = lowering.Lower(targetctx, library, fndesc, interp)
+        lower.lower()
+        if not flags.no_cpython_wrapper:
+            lower.create_cpython_wrapper(flags.release_gil,
+                                         flags.assume_homogeneous)
     env = lower.env
     call_helper = lower.call_helper
     has_dynamic_globals = lower.has_dynamic_globals
@@ -868,6 +1002,10 @@ def native_lowering_stage(targetctx, library, interp, typemap, restype,
         return _LowerResult(fndesc, call_helper, cfunc=None, env=env,
                             has_dynamic_globals=has_dynamic_globals)
     else:
+        # Let other threads type their functions while generating
+        # machine code
+        with lock_compiler.released():
+            library.finalize()
         # Prepare for execution
         cfunc = targetctx.get_executable(library, fndesc, env)
         # Insert native function for use by other jitted-functions.
@@ -879,10 +1017,11 @@ def native_lowering_stage(targetctx, library, interp, typemap, restype,
 
 def py_lowering_stage(targetctx, library, interp, flags):
     fndesc = funcdesc.PythonFunctionDescriptor.from_object_mode_function(interp)
-    lower = objmode.PyLower(targetctx, library, fndesc, interp)
-    lower.lower()
-    if not flags.no_cpython_wrapper:
-        lower.create_cpython_wrapper()
+    with llvmts.lock_llvm:
+        lower = objmode.PyLower(targetctx, library, fndesc, interp)
+        lower.lower()
+        if not flags.no_cpython_wrapper:
+            lower.create_cpython_wrapper()
     env = lower.env
     call_helper = lower.call_helper
     has_dynamic_globals = lower.has_dynamic_globals
@@ -120,6 +120,14 @@ class _EnvReloader(object):
         # Contains path to the directory
         CACHE_DIR = _readenv("NUMBA_CACHE_DIR", str, "")
 
+        # Persist the internal helpers compiled along JIT functions
+        # (e.g. Numpy function implementations) in the cache
+        CACHE_SUBROUTINES = _readenv("NUMBA_CACHE_SUBROUTINES", int, 1)
+
+        # Record the signatures compiled by jitted functions
+        # Contains path to the log file (see numba.signature_log)
+        SIGNATURE_LOG = _readenv("NUMBA_SIGNATURE_LOG", str, "")
+
         # Enable tracing support
         TRACE = _readenv("NUMBA_TRACE", int, 0)
 
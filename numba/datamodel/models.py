@@ -736,8 +736,12 @@ class ListPayloadModel(StructModel):
         members = [
             ('size', types.intp),
             ('allocated', types.intp),
-            # This member is only used only for reflected lists
+            # These members are only used only for reflected lists:
+            # whether the list was changed, and the range of indices
+            # [dirty_lo, dirty_hi) which may hold changed items
             ('dirty', types.boolean),
+            ('dirty_lo', types.intp),
+            ('dirty_hi', types.intp),
             # Actually an inlined var-sized array
             ('data', fe_type.container.dtype),
         ]
@@ -745,6 +749,7 @@ class ListPayloadModel(StructModel):
 
 
 @register_default(types.List)
+@register_default(types.ListType)
 class ListModel(StructModel):
     def __init__(self, dmm, fe_type):
         payload_type = types.ListPayload(fe_type)
@@ -779,6 +784,8 @@ class SetEntryModel(StructModel):
             ('hash', types.intp),
             ('key', dtype),
         ]
+        if isinstance(fe_type.set_type, types.DictType):
+            members.append(('value', fe_type.set_type.value_type))
         super(SetEntryModel, self).__init__(dmm, fe_type, members)
 
 
@@ -802,7 +809,10 @@ class SetPayloadModel(StructModel):
         ]
         super(SetPayloadModel, self).__init__(dmm, fe_type, members)
 
+# A dict is laid out as a set whose entries also hold a value
+# (the parent member is unused, as dicts are never reflected)
 @register_default(types.Set)
+@register_default(types.DictType)
 class SetModel(StructModel):
     def __init__(self, dmm, fe_type):
         payload_type = types.SetPayload(fe_type)
@@ -815,6 +825,7 @@ class SetModel(StructModel):
         super(SetModel, self).__init__(dmm, fe_type, members)
 
 @register_default(types.SetIter)
+@register_default(types.DictIter)
 class SetIterModel(StructModel):
     def __init__(self, dmm, fe_type):
         payload_type = types.SetPayload(fe_type.container)
@@ -829,6 +840,7 @@ class SetIterModel(StructModel):
 
 
 @register_default(types.Array)
+@register_default(types.BufferArray)
 @register_default(types.Buffer)
 @register_default(types.ByteArray)
 @register_default(types.Bytes)
@@ -946,40 +958,18 @@ class RecordModel(CompositeModel):
 
 
 @register_default(types.UnicodeCharSeq)
-class UnicodeCharSeq(DataModel):
+class UnicodeCharSeq(PrimitiveModel):
     def __init__(self, dmm, fe_type):
-        super(UnicodeCharSeq, self).__init__(dmm, fe_type)
         charty = ir.IntType(numpy_support.sizeof_unicode_char * 8)
-        self._be_type = ir.ArrayType(charty, fe_type.count)
-
-    def get_value_type(self):
-        return self._be_type
-
-    def get_data_type(self):
-        return self._be_type
+        be_type = ir.ArrayType(charty, fe_type.count)
+        super(UnicodeCharSeq, self).__init__(dmm, fe_type, be_type)
 
 
 @register_default(types.CharSeq)
-class CharSeq(DataModel):
+class CharSeq(PrimitiveModel):
     def __init__(self, dmm, fe_type):
-        super(CharSeq, self).__init__(dmm, fe_type)
-        charty = ir.IntType(8)
-        self._be_type = ir.ArrayType(charty, fe_type.count)
-
-    def get_value_type(self):
-        return self._be_type
-
-    def get_data_type(self):
-        return self._be_type
-
-    def as_data(self, builder, value):
-        return value
-
-    def from_data(self, builder, value):
-        return value
-
-    def as_return(self, builder, value):
-        return value
+        be_type = ir.ArrayType(ir.IntType(8), fe_type.count)
+        super(CharSeq, self).__init__(dmm, fe_type, be_type)
 
     def from_return(self, builder, value):
         return value
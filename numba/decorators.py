@@ -12,6 +12,11 @@ from .errors import DeprecationError
 from .targets import registry
 
 
+# If a list, the signatures given to @jit are recorded on the dispatcher
+# (as `_declared_signatures`) instead of being compiled eagerly, and the
+# dispatcher is appended to the list.  See numba.precompile.
+_deferred_dispatchers = None
+
 
 # -----------------------------------------------------------------------------
 # Decorators
@@ -190,7 +195,10 @@ def _jit(sigs, locals, target, cache, targetoptions, **dispatcher_args):
                           **dispatcher_args)
         if cache:
             disp.enable_caching()
-        if sigs is not None:
+        if sigs is not None and _deferred_dispatchers is not None:
+            disp._declared_signatures = list(sigs)
+            _deferred_dispatchers.append(disp)
+        elif sigs is not None:
             # Register the Dispatcher to the type inference mechanism,
             # even though the decorator hasn't returned yet.
             from . import typeinfer
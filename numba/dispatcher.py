@@ -7,17 +7,20 @@ import functools
 import os
 import struct
 import sys
+import threading
 import uuid
+import warnings
 import weakref
 
 import numba
 from numba import _dispatcher, compiler, utils, types, config, errors
 from numba.typeconv.rules import default_type_manager
-from numba import sigutils, serialize, typing
+from numba import sigutils, serialize, typing, signature_log
 from numba.typing.templates import fold_arguments
 from numba.typing.typeof import Purpose, typeof, typeof_impl
 from numba.bytecode import get_code_object
 from numba.six import create_bound_method, next
+from numba.six.moves import queue
 from .caching import NullCache, FunctionCache
 
 
@@ -67,10 +70,12 @@ class _FunctionCompiler(object):
                               stararg_handler)
         return self.pysig, args
 
-    def compile(self, args, return_type):
+    def compile(self, args, return_type, final_tier=False):
         flags = compiler.Flags()
         self.targetdescr.options.parse_as_flags(flags, self.targetoptions)
         flags = self._customize_flags(flags)
+        if final_tier:
+            flags.unset('tiered')
 
         impl = self._get_implementation(args, {})
         cres = compiler.compile_extra(self.targetdescr.typing_context,
@@ -130,24 +135,82 @@ class _GeneratedFunctionCompiler(_FunctionCompiler):
         return impl
 
 
+class _TierUpWorker(object):
+    """
+    A background thread recompiling with full optimizations the functions
+    first compiled with cheap ones (see the "tiered" option).
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, dispatcher, sig, cres):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name="numba-tier-up")
+                self._thread.daemon = True
+                self._thread.start()
+        # Pending recompilations don't keep the dispatcher alive
+        self._queue.put((weakref.ref(dispatcher), sig, cres))
+
+    def join(self):
+        """
+        Wait for all pending recompilations to complete.
+        """
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            ref, sig, cres = self._queue.get()
+            try:
+                dispatcher = ref()
+                if dispatcher is not None and not utils.shutting_down():
+                    dispatcher._tier_up(sig, cres)
+            except Exception as e:
+                # The quickly compiled code remains in use
+                warnings.warn("failed recompiling %s with full optimizations: "
+                              "%s" % (cres.fndesc.qualname, e),
+                              errors.NumbaWarning)
+            finally:
+                dispatcher = None
+                self._queue.task_done()
+
+_tier_up_worker = _TierUpWorker()
+
+
 _CompileStats = collections.namedtuple(
     '_CompileStats', ('cache_path', 'cache_hits', 'cache_misses'))
 
+_CodeStats = collections.namedtuple(
+    '_CodeStats', ('overloads', 'code_size'))
+
+# All live dispatchers, for compiled_code_stats()
+_live_dispatchers = weakref.WeakSet()
+
 
 class _CompilingCounter(object):
     """
     A simple counter that increment in __enter__ and decrement in __exit__.
+    The count is per-thread, as several threads can be compiling the
+    same function (see compiler.lock_compiler).
     """
 
     def __init__(self):
-        self.counter = 0
+        self._local = threading.local()
+
+    @property
+    def counter(self):
+        return getattr(self._local, 'counter', 0)
 
     def __enter__(self):
         assert self.counter >= 0
-        self.counter += 1
+        self._local.counter = self.counter + 1
 
     def __exit__(self, *args, **kwargs):
-        self.counter -= 1
+        self._local.counter = self.counter - 1
         assert self.counter >= 0
 
     def __bool__(self):
@@ -168,6 +231,12 @@ class _DispatcherBase(_dispatcher.Dispatcher):
 
         # A mapping of signatures to compile results
         self.overloads = collections.OrderedDict()
+        # Compile results replaced in overloads by a better version,
+        # whose code must be kept alive
+        self._superseded = []
+        # Callables invoked when overloads are replaced or removed, e.g.
+        # to forget entry points cached elsewhere
+        self._overload_change_callbacks = []
 
         self.py_func = py_func
         # other parts of Numba assume the old Python 2 name for code object
@@ -193,10 +262,17 @@ class _DispatcherBase(_dispatcher.Dispatcher):
         self.doc = py_func.__doc__
         self._compiling_counter = _CompilingCounter()
         utils.finalize(self, self._make_finalizer())
+        _live_dispatchers.add(self)
 
     def _reset_overloads(self):
         self._clear()
         self.overloads.clear()
+        del self._superseded[:]
+        self._notify_overload_change()
+
+    def _notify_overload_change(self):
+        for callback in self._overload_change_callbacks:
+            callback()
 
     def _make_finalizer(self):
         """
@@ -204,6 +280,7 @@ class _DispatcherBase(_dispatcher.Dispatcher):
         related compiled functions.
         """
         overloads = self.overloads
+        superseded = self._superseded
         targetctx = self.targetctx
 
         # Early-bind utils.shutting_down() into the function's local namespace
@@ -215,7 +292,7 @@ class _DispatcherBase(_dispatcher.Dispatcher):
                 return
             # This function must *not* hold any reference to self:
             # we take care to bind the necessary objects in the closure.
-            for cres in overloads.values():
+            for cres in list(overloads.values()) + superseded:
                 try:
                     targetctx.remove_user_function(cres.entry_point)
                 except KeyError:
@@ -230,6 +307,22 @@ class _DispatcherBase(_dispatcher.Dispatcher):
         """
         return list(self.overloads)
 
+    @property
+    def code_stats(self):
+        """
+        Statistics about the code compiled for this dispatcher: the number
+        of overloads and the size in bytes of their object code, including
+        superseded versions which are kept alive.
+        """
+        libraries = set(cres.library
+                        for cres in list(self.overloads.values())
+                                    + self._superseded
+                        if cres.library is not None)
+        return _CodeStats(
+            overloads=len(self.overloads),
+            code_size=sum(library.code_size or 0 for library in libraries),
+            )
+
     @property
     def nopython_signatures(self):
         return [cres.signature for cres in self.overloads.values()
@@ -242,12 +335,40 @@ class _DispatcherBase(_dispatcher.Dispatcher):
         assert (not val) or len(self.signatures) > 0
         self._can_compile = not val
 
+    def _add_compiled_overload(self, cres):
+        """
+        Add a freshly compiled overload, unless another thread added
+        one for the same signature meanwhile.  The overload in use is
+        returned.
+        """
+        existing = self.overloads.get(tuple(cres.signature.args))
+        if existing is not None:
+            if not cres.objectmode and not cres.interpmode:
+                self.targetctx.remove_user_function(cres.entry_point)
+            return existing
+        self.add_overload(cres)
+        return cres
+
     def add_overload(self, cres):
         args = tuple(cres.signature.args)
         sig = [a._code for a in args]
         self._insert(sig, cres.entry_point, cres.objectmode, cres.interpmode)
         self.overloads[args] = cres
 
+    def replace_overload(self, cres):
+        """
+        Replace the existing overload for *cres*' signature with *cres*.
+        Calls already running the previous version are unaffected.
+        """
+        args = tuple(cres.signature.args)
+        sig = [a._code for a in args]
+        old = self.overloads[args]
+        self._superseded.append(old)
+        if not self._replace(sig, cres.entry_point):
+            raise RuntimeError("no native definition for %s" % (args,))
+        self.overloads[args] = cres
+        self._notify_overload_change()
+
     def fold_argument_types(self, args, kws):
         return self._compiler.fold_argument_types(args, kws)
 
@@ -573,14 +694,41 @@ class Dispatcher(_DispatcherBase):
                         self.targetctx.insert_user_function(cres.entry_point,
                                                     cres.fndesc, [cres.library])
                     self.add_overload(cres)
+                    signature_log.log_overload(self, args)
                     return cres.entry_point
 
                 self._cache_misses[sig] += 1
                 cres = self._compiler.compile(args, return_type)
-                self.add_overload(cres)
-                self._cache.save_overload(sig, cres)
+                existing = self._add_compiled_overload(cres)
+                if existing is not cres:
+                    return existing.entry_point
+                signature_log.log_overload(self, args)
+                if (not cres.objectmode and not cres.interpmode
+                    and cres.library.quick_optimized):
+                    # Only the fully optimized version will be cached
+                    _tier_up_worker.submit(self, sig, cres)
+                else:
+                    self._cache.save_overload(sig, cres)
                 return cres.entry_point
 
+    def _tier_up(self, sig, cres):
+        """
+        Recompile the quickly optimized *cres* with full optimizations
+        and swap it in.  This is called from a background thread.
+        """
+        with compiler.lock_compiler:
+            with self._compiling_counter:
+                args, return_type = sigutils.normalize_signature(sig)
+                if self.overloads.get(tuple(args)) is not cres:
+                    # Recompiled or disposed of in the meantime
+                    return
+                new_cres = self._compiler.compile(args, return_type,
+                                                  final_tier=True)
+                if self.overloads.get(tuple(args)) is not cres:
+                    return
+                self.replace_overload(new_cres)
+                self._cache.save_overload(sig, new_cres)
+
     def recompile(self):
         """
         Recompile all signatures afresh.
@@ -661,11 +809,18 @@ class LiftedLoop(_DispatcherBase):
                 if cres.typing_error is not None and not flags.enable_pyobject:
                     raise cres.typing_error
 
-                self.add_overload(cres)
-                return cres.entry_point
+                return self._add_compiled_overload(cres).entry_point
 
 
 # Initialize typeof machinery
 _dispatcher.typeof_init(
     OmittedArg,
     dict((str(t), t._code) for t in types.number_domain))
+
+
+def compiled_code_stats():
+    """
+    Return a dict mapping each live dispatcher to statistics about the
+    code compiled for it (see Dispatcher.code_stats).
+    """
+    return dict((disp, disp.code_stats) for disp in list(_live_dispatchers))
@@ -3,10 +3,13 @@ Support for lowering generators.
 """
 from __future__ import print_function, division, absolute_import
 
+import numpy as np
+
 from llvmlite.llvmpy.core import Constant, Type, Builder
 
-from . import cgutils, types, config
+from . import cgutils, types, config, numpy_support
 from .funcdesc import FunctionDescriptor
+from .six import exec_
 
 
 class GeneratorDescriptor(FunctionDescriptor):
@@ -344,3 +347,96 @@ class LowerYield(object):
             if self.context.enable_nrt:
                 self.context.nrt.decref(self.builder, ty, val)
         self.lower.debug_print("# generator resume end")
+
+
+#
+# Chunked iteration of nopython generators from Python
+#
+
+_take_template = """
+def take(__numba_gen_, n):
+    {allocs}
+    i = 0
+    if n > 0:
+        for v in __numba_gen_:
+            {stores}
+            i += 1
+            if i == n:
+                break
+    return {result}
+"""
+
+
+def _make_take(gentype):
+    """
+    Compile a function taking up to n items from generators of type
+    *gentype*, into one array per yielded value.
+    """
+    from .decorators import njit
+
+    yield_type = gentype.yield_type
+    if isinstance(yield_type, types.BaseTuple):
+        item_types = list(yield_type)
+        items = ['v[%d]' % i for i in range(len(item_types))]
+    else:
+        item_types = [yield_type]
+        items = ['v']
+    glbls = {'np': np}
+    for i, ty in enumerate(item_types):
+        if not isinstance(ty, (types.Number, types.Boolean)):
+            raise TypeError("cannot take() from a generator yielding %s"
+                            % (yield_type,))
+        glbls['__numba_scalar_%d' % i] = numpy_support.as_dtype(ty).type
+    bufs = ['buf%d' % i for i in range(len(items))]
+    source = _take_template.format(
+        allocs='; '.join('%s = np.empty(n, __numba_scalar_%d)' % (buf, i)
+                         for i, buf in enumerate(bufs)),
+        stores='; '.join('%s[i] = %s' % (buf, item)
+                         for buf, item in zip(bufs, items)),
+        result=(', '.join('%s[:i]' % buf for buf in bufs)
+                if isinstance(yield_type, types.BaseTuple)
+                else 'buf0[:i]'))
+    exec_(source, glbls)
+    return njit(glbls['take'])
+
+# { generator type: compiled take() function }
+_take_functions = {}
+
+
+def take(gen, n):
+    """
+    Run the nopython generator *gen* natively until *n* items are
+    gathered, and return them as a Numpy array (or a tuple of arrays,
+    one per element, if the generator yields tuples).  Less than *n*
+    items are returned if the generator is exhausted.
+    This is also available as the generator's take() method.
+    """
+    gentype = getattr(gen, '_numba_type_', None)
+    if not isinstance(gentype, types.Generator) \
+            or gentype.yield_type == types.pyobject:
+        raise TypeError("take() needs a nopython generator, got %r" % (gen,))
+    n = int(n)
+    if n < 0:
+        raise ValueError("the number of items cannot be negative")
+    try:
+        fn = _take_functions[gentype]
+    except KeyError:
+        fn = _take_functions[gentype] = _make_take(gentype)
+    return fn(gen, n)
+
+
+def chunked(gen, n):
+    """
+    Iterate over the nopython generator *gen* by chunks of *n* items,
+    each gathered natively as in take().  The last chunk can be
+    shorter; no empty chunk is ever yielded.
+    """
+    if n < 1:
+        raise ValueError("the chunk size must be at least 1")
+    while True:
+        chunk = take(gen, n)
+        size = len(chunk[0] if isinstance(chunk, tuple) else chunk)
+        if size > 0:
+            yield chunk
+        if size < n:
+            return
@@ -886,7 +886,7 @@ def get_call_table(blocks, call_table=None, reverse_call_table=None):
                         call_var = reverse_call_table[lhs]
                         call_table[call_var].append(rhs.attr)
                         reverse_call_table[rhs.value.name] = call_var
-                if isinstance(rhs, ir.Global):
+                if isinstance(rhs, (ir.Global, ir.FreeVar)):
                     if lhs in call_table:
                         call_table[lhs].append(rhs.value)
                     if lhs in reverse_call_table:
@@ -1,2 +1,3 @@
 from .decorators import jitclass
+from .columnar import columnar
 from . import boxing  # Has import-time side effect
@@ -8,6 +8,9 @@ typedef struct {
     void *meminfoptr, *dataptr;
 } BoxObject;
 
+/* The storage of booleans in jit-class data */
+typedef unsigned char box_bool_t;
+
 
 /* Store function defined in numba.runtime._nrt_python for use in box_dealloc.
  * It points to a function is code segment that does not need user deallocation
@@ -97,6 +100,506 @@ static PyTypeObject BoxType = {
 };
 
 
+/*
+ * Field descriptor
+ * Gets and sets a primitive-typed jitclass member directly in the
+ * instance's data, without going through a jitted accessor.  The member
+ * is described by its byte offset in the data and a struct-module-like
+ * format character.
+ */
+
+typedef struct {
+    PyObject_HEAD
+    Py_ssize_t offset;
+    char kind;
+    PyObject *name;
+} FieldObject;
+
+
+static
+int Field_init(FieldObject *self, PyObject *args, PyObject *kwds) {
+    static char *keywords[] = {"name", "offset", "kind", NULL};
+    PyObject *name;
+    char kind;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "Onc", keywords,
+                                     &name, &self->offset, &kind))
+    {
+        return -1;
+    }
+    switch (kind) {
+    case '?': case 'b': case 'B': case 'h': case 'H':
+    case 'i': case 'I': case 'q': case 'Q':
+    case 'f': case 'd': case 'F': case 'D':
+        break;
+    default:
+        PyErr_Format(PyExc_ValueError, "invalid field kind '%c'", kind);
+        return -1;
+    }
+    self->kind = kind;
+    Py_INCREF(name);
+    Py_XDECREF(self->name);
+    self->name = name;
+    return 0;
+}
+
+static
+void field_dealloc(FieldObject *self)
+{
+    Py_XDECREF(self->name);
+    Py_TYPE(self)->tp_free((PyObject *) self);
+}
+
+/* Return a pointer to the field's value in *obj*'s data, or NULL with
+ * an exception set.
+ */
+static
+char *field_pointer(FieldObject *self, PyObject *obj)
+{
+    BoxObject *box;
+    if (!PyObject_TypeCheck(obj, &BoxType)) {
+        PyErr_Format(PyExc_TypeError,
+                     "descriptor requires a jitclass instance, not '%s'",
+                     Py_TYPE(obj)->tp_name);
+        return NULL;
+    }
+    box = (BoxObject *) obj;
+    if (box->dataptr == NULL) {
+        PyErr_SetString(PyExc_ValueError, "uninitialized jitclass instance");
+        return NULL;
+    }
+    return (char *) box->dataptr + self->offset;
+}
+
+static
+PyObject *field_get(FieldObject *self, PyObject *obj, PyObject *type)
+{
+    char *ptr;
+    if (obj == NULL || obj == Py_None) {
+        Py_INCREF(self);
+        return (PyObject *) self;
+    }
+    ptr = field_pointer(self, obj);
+    if (ptr == NULL)
+        return NULL;
+    switch (self->kind) {
+    case '?': return PyBool_FromLong(*(box_bool_t *) ptr);
+    case 'b': return PyLong_FromLong(*(signed char *) ptr);
+    case 'B': return PyLong_FromLong(*(unsigned char *) ptr);
+    case 'h': return PyLong_FromLong(*(short *) ptr);
+    case 'H': return PyLong_FromLong(*(unsigned short *) ptr);
+    case 'i': return PyLong_FromLong(*(int *) ptr);
+    case 'I': return PyLong_FromUnsignedLong(*(unsigned int *) ptr);
+    case 'q': return PyLong_FromLongLong(*(long long *) ptr);
+    case 'Q': return PyLong_FromUnsignedLongLong(*(unsigned long long *) ptr);
+    case 'f': return PyFloat_FromDouble(*(float *) ptr);
+    case 'd': return PyFloat_FromDouble(*(double *) ptr);
+    case 'F': return PyComplex_FromDoubles(((float *) ptr)[0],
+                                           ((float *) ptr)[1]);
+    case 'D': return PyComplex_FromDoubles(((double *) ptr)[0],
+                                           ((double *) ptr)[1]);
+    }
+    /* unreachable: checked in Field_init() */
+    PyErr_SetString(PyExc_SystemError, "invalid field kind");
+    return NULL;
+}
+
+/* Convert *value*, an integer or a float, to an integer.  Floats are
+ * truncated; like nopython mode does when narrowing integers, the result
+ * is truncated to the field's size, but values that don't fit in 64
+ * bits raise OverflowError.
+ */
+static
+int field_as_integer(PyObject *value, unsigned long long *out)
+{
+    PyObject *num;
+    long long sval;
+    int overflow;
+
+    if (PyFloat_Check(value))
+        num = PyNumber_Long(value);
+    else
+        num = PyNumber_Index(value);
+    if (num == NULL)
+        return -1;
+    sval = PyLong_AsLongLongAndOverflow(num, &overflow);
+    if (overflow == 0) {
+        *out = (unsigned long long) sval;
+    }
+    else if (overflow > 0) {
+        /* Only fits in an unsigned 64-bit integer, if at all */
+        *out = PyLong_AsUnsignedLongLong(num);
+    }
+    else {
+        PyErr_SetString(PyExc_OverflowError,
+                        "int too large to convert to a 64-bit integer");
+        *out = (unsigned long long) -1;
+    }
+    Py_DECREF(num);
+    if (*out == (unsigned long long) -1 && PyErr_Occurred())
+        return -1;
+    return 0;
+}
+
+static
+int field_set(FieldObject *self, PyObject *obj, PyObject *value)
+{
+    char *ptr;
+    unsigned long long ival;
+    double fval;
+    Py_complex cval;
+    int bval;
+
+    if (value == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "can't delete attribute");
+        return -1;
+    }
+    ptr = field_pointer(self, obj);
+    if (ptr == NULL)
+        return -1;
+    switch (self->kind) {
+    case '?':
+        if (!PyBool_Check(value) && !PyNumber_Check(value)) {
+            PyErr_Format(PyExc_TypeError,
+                         "expected a bool or a number, got '%s'",
+                         Py_TYPE(value)->tp_name);
+            return -1;
+        }
+        bval = PyObject_IsTrue(value);
+        if (bval < 0)
+            return -1;
+        *(box_bool_t *) ptr = (box_bool_t) bval;
+        return 0;
+    case 'b': case 'B': case 'h': case 'H':
+    case 'i': case 'I': case 'q': case 'Q':
+        if (field_as_integer(value, &ival))
+            return -1;
+        switch (self->kind) {
+        case 'b': case 'B': *(unsigned char *) ptr = (unsigned char) ival;
+                            break;
+        case 'h': case 'H': *(unsigned short *) ptr = (unsigned short) ival;
+                            break;
+        case 'i': case 'I': *(unsigned int *) ptr = (unsigned int) ival;
+                            break;
+        default:            *(unsigned long long *) ptr = ival;
+        }
+        return 0;
+    case 'f': case 'd':
+        fval = PyFloat_AsDouble(value);
+        if (fval == -1.0 && PyErr_Occurred())
+            return -1;
+        if (self->kind == 'f')
+            *(float *) ptr = (float) fval;
+        else
+            *(double *) ptr = fval;
+        return 0;
+    case 'F': case 'D':
+        cval = PyComplex_AsCComplex(value);
+        if (cval.real == -1.0 && PyErr_Occurred())
+            return -1;
+        if (self->kind == 'F') {
+            ((float *) ptr)[0] = (float) cval.real;
+            ((float *) ptr)[1] = (float) cval.imag;
+        }
+        else {
+            ((double *) ptr)[0] = cval.real;
+            ((double *) ptr)[1] = cval.imag;
+        }
+        return 0;
+    }
+    PyErr_SetString(PyExc_SystemError, "invalid field kind");
+    return -1;
+}
+
+static PyMemberDef Field_members[] = {
+    {"__name__", T_OBJECT, offsetof(FieldObject, name), READONLY, NULL},
+    {"offset", T_PYSSIZET, offsetof(FieldObject, offset), READONLY, NULL},
+    {"kind", T_CHAR, offsetof(FieldObject, kind), READONLY, NULL},
+    {NULL}
+};
+
+static const char Field_doc[] = "A primitive-typed jit-class member";
+
+static PyTypeObject FieldType = {
+#if (PY_MAJOR_VERSION < 3)
+    PyObject_HEAD_INIT(NULL)
+    0,                         /*ob_size*/
+#else
+    PyVarObject_HEAD_INIT(NULL, 0)
+#endif
+    "_box.Field",              /*tp_name*/
+    sizeof(FieldObject),       /*tp_basicsize*/
+    0,                         /*tp_itemsize*/
+    (destructor)field_dealloc, /*tp_dealloc*/
+    0,                         /*tp_print*/
+    0,                         /*tp_getattr*/
+    0,                         /*tp_setattr*/
+    0,                         /*tp_compare*/
+    0,                         /*tp_repr*/
+    0,                         /*tp_as_number*/
+    0,                         /*tp_as_sequence*/
+    0,                         /*tp_as_mapping*/
+    0,                         /*tp_hash */
+    0,                         /*tp_call*/
+    0,                         /*tp_str*/
+    0,                         /*tp_getattro*/
+    0,                         /*tp_setattro*/
+    0,                         /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT,        /*tp_flags*/
+    Field_doc,                 /* tp_doc */
+    0,                         /* tp_traverse */
+    0,                         /* tp_clear */
+    0,                         /* tp_richcompare */
+    0,                         /* tp_weaklistoffset */
+    0,                         /* tp_iter */
+    0,                         /* tp_iternext */
+    0,                         /* tp_methods */
+    Field_members,             /* tp_members */
+    0,                         /* tp_getset */
+    0,                         /* tp_base */
+    0,                         /* tp_dict */
+    (descrgetfunc)field_get,   /* tp_descr_get */
+    (descrsetfunc)field_set,   /* tp_descr_set */
+    0,                         /* tp_dictoffset */
+    (initproc)Field_init,      /* tp_init */
+    0,                         /* tp_alloc */
+    PyType_GenericNew,         /* tp_new */
+};
+
+
+/*
+ * Method descriptor
+ * Calls a jitclass method.  Calls are first dispatched through the
+ * *resolver*, which returns the compiled entry point for the arguments'
+ * types, or None if those types are not enough to choose it; the entry
+ * point is then cached for the exact Python types of the arguments, so
+ * that later calls skip dispatching entirely.  Other calls (and calls
+ * with keyword arguments) go through the *dispatcher*.
+ * The cache must be cleared with clear_cache() when the dispatcher's
+ * overloads are replaced or removed.
+ */
+
+#define METHOD_CACHE_SIZE 4
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *dispatcher;
+    PyObject *resolver;
+    PyObject *name;
+    PyObject *doc;
+    PyObject *weakreflist;
+    int ncached;
+    /* Tuples of argument types, and the corresponding entry points */
+    PyObject *cached_types[METHOD_CACHE_SIZE];
+    PyObject *cached_entries[METHOD_CACHE_SIZE];
+} MethodObject;
+
+
+static
+int Method_init(MethodObject *self, PyObject *args, PyObject *kwds) {
+    static char *keywords[] = {"name", "dispatcher", "resolver", "doc", NULL};
+    PyObject *name, *dispatcher, *resolver, *doc = Py_None;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOO|O", keywords,
+                                     &name, &dispatcher, &resolver, &doc))
+    {
+        return -1;
+    }
+    Py_INCREF(name);
+    Py_INCREF(dispatcher);
+    Py_INCREF(resolver);
+    Py_INCREF(doc);
+    Py_XDECREF(self->name);
+    Py_XDECREF(self->dispatcher);
+    Py_XDECREF(self->resolver);
+    Py_XDECREF(self->doc);
+    self->name = name;
+    self->dispatcher = dispatcher;
+    self->resolver = resolver;
+    self->doc = doc;
+    return 0;
+}
+
+static
+void method_clear_cache(MethodObject *self)
+{
+    int i;
+    for (i = 0; i < self->ncached; i++) {
+        Py_CLEAR(self->cached_types[i]);
+        Py_CLEAR(self->cached_entries[i]);
+    }
+    self->ncached = 0;
+}
+
+static
+PyObject *method_clear_cache_py(MethodObject *self)
+{
+    method_clear_cache(self);
+    Py_RETURN_NONE;
+}
+
+static
+void method_dealloc(MethodObject *self)
+{
+    if (self->weakreflist != NULL)
+        PyObject_ClearWeakRefs((PyObject *) self);
+    method_clear_cache(self);
+    Py_XDECREF(self->name);
+    Py_XDECREF(self->dispatcher);
+    Py_XDECREF(self->resolver);
+    Py_XDECREF(self->doc);
+    Py_TYPE(self)->tp_free((PyObject *) self);
+}
+
+static
+PyObject *method_get(MethodObject *self, PyObject *obj, PyObject *type)
+{
+    if (obj == NULL || obj == Py_None) {
+        Py_INCREF(self);
+        return (PyObject *) self;
+    }
+#if (PY_MAJOR_VERSION < 3)
+    return PyMethod_New((PyObject *) self, obj, type);
+#else
+    return PyMethod_New((PyObject *) self, obj);
+#endif
+}
+
+/* Whether the arguments match the cached argument types *types*.
+ * Integers must also fit in an int64, as larger ones are typed
+ * differently.
+ */
+static
+int method_args_match(PyObject *types, PyObject *args)
+{
+    Py_ssize_t i, n = PyTuple_GET_SIZE(args);
+    if (PyTuple_GET_SIZE(types) != n)
+        return 0;
+    for (i = 0; i < n; i++) {
+        PyObject *arg = PyTuple_GET_ITEM(args, i);
+        if ((PyObject *) Py_TYPE(arg) != PyTuple_GET_ITEM(types, i))
+            return 0;
+        if (PyLong_CheckExact(arg)) {
+            int overflow;
+            (void) PyLong_AsLongLongAndOverflow(arg, &overflow);
+            if (overflow)
+                return 0;
+        }
+    }
+    return 1;
+}
+
+static
+PyObject *method_call(MethodObject *self, PyObject *args, PyObject *kws)
+{
+    PyObject *entry, *types, *res;
+    Py_ssize_t i, n;
+
+    if (kws != NULL && PyDict_Size(kws) > 0)
+        return PyObject_Call(self->dispatcher, args, kws);
+
+    for (i = 0; i < self->ncached; i++) {
+        if (method_args_match(self->cached_types[i], args))
+            return PyObject_Call(self->cached_entries[i], args, NULL);
+    }
+
+    entry = PyObject_Call(self->resolver, args, NULL);
+    if (entry == NULL)
+        return NULL;
+    if (entry == Py_None) {
+        Py_DECREF(entry);
+        return PyObject_Call(self->dispatcher, args, NULL);
+    }
+    if (self->ncached < METHOD_CACHE_SIZE) {
+        n = PyTuple_GET_SIZE(args);
+        types = PyTuple_New(n);
+        if (types == NULL) {
+            Py_DECREF(entry);
+            return NULL;
+        }
+        for (i = 0; i < n; i++) {
+            PyObject *typ = (PyObject *) Py_TYPE(PyTuple_GET_ITEM(args, i));
+            Py_INCREF(typ);
+            PyTuple_SET_ITEM(types, i, typ);
+        }
+        /* Don't cache calls which later calls couldn't hit (e.g. with
+           integers overflowing an int64) */
+        if (method_args_match(types, args)) {
+            self->cached_types[self->ncached] = types;
+            Py_INCREF(entry);
+            self->cached_entries[self->ncached] = entry;
+            self->ncached++;
+        }
+        else {
+            Py_DECREF(types);
+        }
+    }
+    res = PyObject_Call(entry, args, NULL);
+    Py_DECREF(entry);
+    return res;
+}
+
+static PyMemberDef Method_members[] = {
+    {"__name__", T_OBJECT, offsetof(MethodObject, name), READONLY, NULL},
+    {"__doc__", T_OBJECT, offsetof(MethodObject, doc), READONLY, NULL},
+    {"dispatcher", T_OBJECT, offsetof(MethodObject, dispatcher), READONLY,
+     NULL},
+    {NULL}
+};
+
+static PyMethodDef Method_methods[] = {
+    {"clear_cache", (PyCFunction) method_clear_cache_py, METH_NOARGS,
+     "Forget the entry points cached for argument types."},
+    {NULL}
+};
+
+static const char Method_doc[] = "A jit-class method";
+
+static PyTypeObject MethodType = {
+#if (PY_MAJOR_VERSION < 3)
+    PyObject_HEAD_INIT(NULL)
+    0,                         /*ob_size*/
+#else
+    PyVarObject_HEAD_INIT(NULL, 0)
+#endif
+    "_box.Method",             /*tp_name*/
+    sizeof(MethodObject),      /*tp_basicsize*/
+    0,                         /*tp_itemsize*/
+    (destructor)method_dealloc, /*tp_dealloc*/
+    0,                         /*tp_print*/
+    0,                         /*tp_getattr*/
+    0,                         /*tp_setattr*/
+    0,                         /*tp_compare*/
+    0,                         /*tp_repr*/
+    0,                         /*tp_as_number*/
+    0,                         /*tp_as_sequence*/
+    0,                         /*tp_as_mapping*/
+    0,                         /*tp_hash */
+    (ternaryfunc)method_call,  /*tp_call*/
+    0,                         /*tp_str*/
+    0,                         /*tp_getattro*/
+    0,                         /*tp_setattro*/
+    0,                         /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT,        /*tp_flags*/
+    Method_doc,                /* tp_doc */
+    0,                         /* tp_traverse */
+    0,                         /* tp_clear */
+    0,                         /* tp_richcompare */
+    offsetof(MethodObject, weakreflist), /* tp_weaklistoffset */
+    0,                         /* tp_iter */
+    0,                         /* tp_iternext */
+    Method_methods,            /* tp_methods */
+    Method_members,            /* tp_members */
+    0,                         /* tp_getset */
+    0,                         /* tp_base */
+    0,                         /* tp_dict */
+    (descrgetfunc)method_get,  /* tp_descr_get */
+    0,                         /* tp_descr_set */
+    0,                         /* tp_dictoffset */
+    (initproc)Method_init,     /* tp_init */
+    0,                         /* tp_alloc */
+    PyType_GenericNew,         /* tp_new */
+};
+
+
 /* Import MemInfo_Release from numba.runtime._nrt_python once for use in
  * Box_dealloc.
  */
@@ -174,6 +677,14 @@ MOD_INIT(_box) {
     Py_INCREF(&BoxType);
     PyModule_AddObject(m, "Box", (PyObject *) (&BoxType));
 
+    /* init and bind the descriptor types */
+    if (PyType_Ready(&FieldType) || PyType_Ready(&MethodType))
+        return MOD_ERROR_VAL;
+    Py_INCREF(&FieldType);
+    PyModule_AddObject(m, "Field", (PyObject *) (&FieldType));
+    Py_INCREF(&MethodType);
+    PyModule_AddObject(m, "Method", (PyObject *) (&MethodType));
+
     /* bind address to direct access utils */;
     PyModule_AddObject(m, "box_meminfoptr_offset",
                        PyLong_FromSsize_t(offsetof(BoxObject, meminfoptr)));
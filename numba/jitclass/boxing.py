@@ -4,14 +4,16 @@ of jitclasses for use inside the python interpreter.
 """
 from __future__ import print_function, absolute_import
 
-from functools import wraps, partial
+import weakref
+from functools import partial
 
 from llvmlite import ir
 
-from numba import types, cgutils
+from numba import types, cgutils, utils
 from numba.pythonapi import box, unbox, NativeValue
 from numba import njit
 from numba.six import exec_
+from numba.targets.registry import cpu_target
 from . import _box
 
 
@@ -30,6 +32,11 @@ def method(__numba_self_, *args):
     return __numba_self_.{method}(*args)
 """
 
+_explicit_method_code_template = """
+def method(__numba_self_, {params}):
+    return __numba_self_.{method}({args})
+"""
+
 
 def _generate_property(field, template, fname):
     """
@@ -47,21 +54,109 @@ _generate_setter = partial(_generate_property, template=_setter_code_template,
                            fname='mutator')
 
 
+# The format characters of the fields which _box.Field can access
+# directly in the instance data
+_field_kinds = {
+    types.boolean: b'?',
+    types.int8: b'b',
+    types.uint8: b'B',
+    types.int16: b'h',
+    types.uint16: b'H',
+    types.int32: b'i',
+    types.uint32: b'I',
+    types.int64: b'q',
+    types.uint64: b'Q',
+    types.float32: b'f',
+    types.float64: b'd',
+    types.complex64: b'F',
+    types.complex128: b'D',
+}
+
+
+def _field_offsets(typ):
+    """
+    Return a {field name: byte offset} dict for the instance data of
+    jitclass instance type *typ*.
+    """
+    context = cpu_target.target_context
+    model = context.data_model_manager[typ.get_data_type()]
+    offsets = {}
+    offset = 0
+    for name, llty in zip(typ.struct, model.get_data_type().elements):
+        align = context.get_abi_alignment(llty)
+        offset = (offset + align - 1) // align * align
+        offsets[name] = offset
+        offset += context.get_abi_sizeof(llty)
+    return offsets
+
+
+def _generate_field(name, fieldty, offset):
+    """
+    Generate a descriptor for a field, or None if the field's type isn't
+    primitive.
+    """
+    kind = _field_kinds.get(fieldty)
+    if kind is not None:
+        return _box.Field(name, offset, kind)
+
+
+def _is_resolvable_arg(val):
+    """
+    Whether the Numba type of *val* only depends on its Python type.
+    (this also holds for integers fitting in an int64, which _box.Method
+     checks by itself)
+    """
+    cls = type(val)
+    if cls in (bool, float, complex) or cls in utils.INT_TYPES:
+        return True
+    # A jitclass instance, or an item of a columnar container
+    return isinstance(getattr(cls, '_numba_type_', None),
+                      (types.ClassInstanceType, types.ColumnarViewType))
+
+
 def _generate_method(name, func):
     """
-    Generate a wrapper for calling a method.  Note the wrapper will only
-    accept positional arguments.
+    Generate a descriptor for calling a method.  Calls passing all
+    arguments positionally, with simple types, are dispatched directly
+    to the compiled code.
     """
-    source = _method_code_template.format(method=name)
-    glbls = {}
+    pysig = utils.pysignature(func)
+    params = list(pysig.parameters.values())[1:]
+    glbls = {'__numba_defaults_': [p.default for p in params]}
+    if all(p.kind == p.POSITIONAL_OR_KEYWORD for p in params):
+        # Mirror the method's parameters, so that the compiled code
+        # takes the arguments as passed (rather than a tuple of them)
+        source = _explicit_method_code_template.format(
+            method=name,
+            params=', '.join(p.name if p.default is p.empty
+                             else '%s=__numba_defaults_[%d]' % (p.name, i)
+                             for i, p in enumerate(params)),
+            args=', '.join(p.name for p in params))
+        nargs = len(params) + 1
+    else:
+        source = _method_code_template.format(method=name)
+        nargs = None
     exec_(source, glbls)
     method = njit(glbls['method'])
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return method(*args, **kwargs)
+    def resolver(*args):
+        if len(args) == nargs and all(_is_resolvable_arg(a) for a in args):
+            argtypes = tuple(method.typeof_pyval(a) for a in args)
+            return method.compile(argtypes)
 
-    return wrapper
+    meth = _box.Method(name, method, resolver, func.__doc__)
+    # The descriptor caches entry points, which can be replaced (e.g. by
+    # tiered compilation) or removed.  It references the dispatcher, so
+    # the dispatcher only references it weakly.
+    meth_ref = weakref.ref(meth)
+
+    def clear_cache():
+        meth = meth_ref()
+        if meth is not None:
+            meth.clear_cache()
+
+    method._overload_change_callbacks.append(clear_cache)
+    return meth
 
 
 _cache_specialized_box = {}
@@ -80,11 +175,16 @@ def _specialize_box(typ):
            '_numba_type_': typ,
            '__doc__': typ.class_type.class_def.__doc__,
            }
-    # Inject attributes as class properties
-    for field in typ.struct:
-        getter = _generate_getter(field)
-        setter = _generate_setter(field)
-        dct[field] = property(getter, setter)
+    # Inject attributes as class properties, or direct accessors for
+    # primitive types
+    offsets = _field_offsets(typ)
+    for field, fieldty in typ.struct.items():
+        descr = _generate_field(field, fieldty, offsets[field])
+        if descr is None:
+            getter = _generate_getter(field)
+            setter = _generate_setter(field)
+            descr = property(getter, setter)
+        dct[field] = descr
     # Inject properties as class properties
     for field, impdct in typ.jitprops.items():
         getter = None
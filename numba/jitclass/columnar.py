@@ -0,0 +1,678 @@
+"""
+Columnar (struct-of-arrays) containers of jitclass instances.
+
+A columnar container stores the values of each field of a jitclass in
+a separate contiguous 1d array.  Its items are views (a container and
+an index) exposing the fields, properties and methods of the jitclass,
+so that code written against jitclass instances works unchanged, while
+iterating over the items streams through contiguous memory rather than
+chasing one pointer per instance.
+"""
+from __future__ import absolute_import, print_function
+
+import importlib
+import itertools
+
+import numpy as np
+from llvmlite import ir as llvmir
+
+from numba import types, cgutils, numpy_support, six
+from numba.six.moves import copyreg
+from numba.datamodel import default_manager, models
+from numba.pythonapi import box, unbox, NativeValue
+from numba.targets import imputils
+from numba.targets.arrayobj import (make_array, load_item, store_item,
+                                    _empty_nd_impl, _zero_fill_array)
+from numba.targets.registry import cpu_target
+from numba.typing import templates
+from .base import _mangle_attr
+from .boxing import _generate_method
+
+
+##############################################################################
+# Data model
+
+class ColumnarModel(models.StructModel):
+    """
+    The field arrays are owned by a single meminfo (see _set_owner()):
+    the array members borrow from it, so that copying a container, or
+    making a view of it, is a single reference count operation rather
+    than one per field.
+    """
+    def __init__(self, dmm, fe_typ):
+        # As in InstanceModel, the meminfo's dtype is opaque since the
+        # nested meminfos are handled by the destructor.
+        dtype = types.Opaque('Opaque.' + str(fe_typ))
+        members = [('meminfo', types.MemInfoPointer(dtype))]
+        members += [(_mangle_attr(k), fe_typ.get_array_type(k))
+                    for k in fe_typ.fields]
+        super(ColumnarModel, self).__init__(dmm, fe_typ, members)
+
+    def traverse(self, builder):
+        def getter(value):
+            return self.get(builder, value, 'meminfo')
+        return [(self.get_type('meminfo'), getter)]
+
+    def inner_types(self):
+        return self._dmm.lookup(self.get_type('meminfo')).traverse_types()
+
+
+class ColumnarViewModel(models.StructModel):
+    """
+    Views hold a reference to their container, so that they remain valid
+    after the container itself is released.  This only references the
+    container's meminfo, not each of its arrays.
+    """
+    def __init__(self, dmm, fe_typ):
+        members = [('container', fe_typ.container_type),
+                   ('index', types.intp)]
+        super(ColumnarViewModel, self).__init__(dmm, fe_typ, members)
+
+
+class ColumnarIterModel(models.StructModel):
+    def __init__(self, dmm, fe_typ):
+        members = [('index', types.EphemeralPointer(types.intp)),
+                   ('container', fe_typ.container_type)]
+        super(ColumnarIterModel, self).__init__(dmm, fe_typ, members)
+
+
+default_manager.register(types.ColumnarType, ColumnarModel)
+default_manager.register(types.ColumnarViewType, ColumnarViewModel)
+default_manager.register(types.ColumnarIter, ColumnarIterModel)
+
+
+##############################################################################
+# Python classes
+
+class _ColumnarItem(object):
+    """
+    Base class for the items of columnar containers, as seen from Python.
+    """
+    __slots__ = ('_container', '_index')
+
+    def __init__(self, container, index):
+        self._container = container
+        self._index = index
+
+    def __repr__(self):
+        return '<%s item %d of %r>' % (type(self).__name__, self._index,
+                                       self._container)
+
+
+class _ColumnarClass(type):
+    """
+    Metaclass of columnar containers.  The container classes are created
+    dynamically, and are pickled (in order to be embedded in compiled
+    code) by reference to the jitclass they are created from.
+    """
+
+
+def _reduce_columnar_class(cls):
+    if cls._pickle_key is None:
+        # The _Columnar base class
+        return cls.__name__
+    return _rebuild_columnar_class, (cls._pickle_key,)
+
+
+def _rebuild_columnar_class(key):
+    try:
+        return _columnar_classes_by_key[key]
+    except KeyError:
+        # Unpickled in another process: look up the jitclass by name
+        modname, qualname, _ = key
+        cls = importlib.import_module(modname)
+        for name in qualname.split('.'):
+            cls = getattr(cls, name)
+        return columnar(cls)
+
+
+copyreg.pickle(_ColumnarClass, _reduce_columnar_class)
+
+
+class _Columnar(six.with_metaclass(_ColumnarClass)):
+    """
+    Base class for columnar containers, as seen from Python.  The field
+    arrays are shared with nopython code, which never copies them.
+    """
+    # Set on subclasses
+    _container_type = None
+    _item_class = None
+    _pickle_key = None
+
+    def __init__(self, n):
+        typ = self._container_type
+        arrays = [np.zeros(n, _field_dtype(typ, k)) for k in typ.fields]
+        self._set_arrays(arrays)
+
+    @classmethod
+    def from_arrays(cls, **arrays):
+        """
+        Create a container from 1d arrays (or sequences) of the field
+        values, given by field name.  C-contiguous arrays of the field
+        types are used without copying.
+        """
+        typ = cls._container_type
+        missing = set(typ.fields) - set(arrays)
+        unexpected = set(arrays) - set(typ.fields)
+        if missing or unexpected:
+            raise TypeError("from_arrays() expects exactly the fields %s"
+                            % (', '.join(typ.fields),))
+        arrays = [np.ascontiguousarray(arrays[k], _field_dtype(typ, k))
+                  for k in typ.fields]
+        if any(arr.ndim != 1 for arr in arrays):
+            raise ValueError("field arrays must be one-dimensional")
+        if len(set(len(arr) for arr in arrays)) > 1:
+            raise ValueError("field arrays must have the same length")
+        self = cls.__new__(cls)
+        self._set_arrays(arrays)
+        return self
+
+    @classmethod
+    def _wrap(cls, arrays):
+        """
+        Create a container around the field arrays returned by nopython
+        code.
+        """
+        self = cls.__new__(cls)
+        self._set_arrays(arrays)
+        return self
+
+    def _set_arrays(self, arrays):
+        self._arrays = tuple(arrays)
+        # Set on the instance, as the class itself is a global resolving
+        # to the constructor
+        self._numba_type_ = self._container_type
+
+    def __len__(self):
+        return len(self._arrays[0])
+
+    def __getitem__(self, index):
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("columnar index out of range")
+        return self._item_class(self, index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._item_class(self, i)
+
+    def __repr__(self):
+        return '<%s of %d items>' % (type(self).__name__, len(self))
+
+
+def _field_dtype(container_type, field):
+    return numpy_support.as_dtype(container_type.fields[field])
+
+
+def _make_array_property(i, field):
+    def fget(self):
+        return self._arrays[i]
+    return property(fget, doc="The array of %r values." % (field,))
+
+
+def _make_item_property(i):
+    def fget(self):
+        return self._container._arrays[i].item(self._index)
+
+    def fset(self, value):
+        self._container._arrays[i][self._index] = value
+
+    return property(fget, fset)
+
+
+def _make_item_jitproperty(instance_type, name):
+    impdct = instance_type.jitprops[name]
+    getter = impdct.get('get')
+    setter = impdct.get('set')
+    fget = fset = None
+    if getter is not None:
+        def fget(self):
+            return getter(self)
+    if setter is not None:
+        def fset(self, value):
+            setter(self, value)
+    doc = getattr(getter or setter, '__doc__', None)
+    return property(fget, fset, doc=doc)
+
+
+# { jitclass instance type: columnar container class }
+_columnar_classes = {}
+# { (module name, qualified name, number): columnar container class }
+_columnar_classes_by_key = {}
+_class_numbers = itertools.count()
+
+
+def columnar(cls):
+    """
+    Return the columnar container class for jitclass *cls*.  Calling it
+    with a length *n* creates a container of *n* zero-initialized items,
+    both from Python and from nopython code.  Each field is stored in
+    a separate 1d array, exposed as the attribute of the same name on
+    the container; each item is a view exposing the fields, properties
+    and methods of the jitclass.
+    """
+    instance_type = getattr(cls, 'class_type', None)
+    if not isinstance(instance_type, types.ClassType):
+        raise TypeError("expected a jitclass, got %r" % (cls,))
+    instance_type = instance_type.instance_type
+    try:
+        return _columnar_classes[instance_type]
+    except KeyError:
+        pass
+
+    if not instance_type.struct:
+        raise TypeError("columnar containers need at least one field")
+    for k, v in instance_type.struct.items():
+        try:
+            numpy_support.as_dtype(v)
+        except NotImplementedError:
+            raise TypeError("field %r of type %s cannot be stored in "
+                            "a columnar container" % (k, v))
+
+    name = instance_type.classname
+    item_dct = {'__slots__': (),
+                '__doc__': cls.__doc__}
+    container_dct = {'__doc__': "Columnar container of %s items." % (name,)}
+    for i, k in enumerate(instance_type.struct):
+        item_dct[k] = _make_item_property(i)
+        container_dct[k] = _make_array_property(i, k)
+    for k in instance_type.jitprops:
+        item_dct[k] = _make_item_jitproperty(instance_type, k)
+    for k, func in instance_type.methods.items():
+        if not (k.startswith('__') and k.endswith('__')):
+            item_dct[k] = _generate_method(k, func)
+
+    container_cls = _ColumnarClass('Columnar' + name, (_Columnar,),
+                                   container_dct)
+    container_type = types.ColumnarType(instance_type, container_cls)
+    item_dct['_numba_type_'] = container_type.view_type
+    container_cls._container_type = container_type
+    container_cls._item_class = type(name + 'Item', (_ColumnarItem,),
+                                     item_dct)
+
+    # Register resolution of the container class, as a constructor
+    class ColumnarConstructor(templates.AbstractTemplate):
+        key = container_cls
+
+        def generic(self, args, kws):
+            if not kws and len(args) == 1 \
+                    and isinstance(args[0], types.Integer):
+                return templates.signature(container_type, *args)
+
+    typingctx = cpu_target.typing_context
+    typingctx.insert_global(container_cls, types.Function(ColumnarConstructor))
+
+    targetctx = cpu_target.target_context
+    columnar_impl_registry.lower(container_cls, types.Integer)(ctor_impl)
+    _register_methods(instance_type)
+    targetctx.install_registry(columnar_impl_registry)
+
+    key = (cls.__module__, getattr(cls, '__qualname__', cls.__name__),
+           next(_class_numbers))
+    container_cls._pickle_key = key
+    _columnar_classes_by_key[key] = container_cls
+    _columnar_classes[instance_type] = container_cls
+    return container_cls
+
+
+##############################################################################
+# Typing
+
+@templates.infer_getattr
+class ColumnarAttribute(templates.AttributeTemplate):
+    key = types.ColumnarType
+
+    def generic_resolve(self, container, attr):
+        if attr in container.fields:
+            return container.get_array_type(attr)
+
+
+@templates.infer_getattr
+class ColumnarViewAttribute(templates.AttributeTemplate):
+    key = types.ColumnarViewType
+
+    def generic_resolve(self, view, attr):
+        instance_type = view.instance_type
+        if attr in instance_type.struct:
+            return instance_type.struct[attr]
+
+        elif attr in instance_type.jitmethods:
+            # Type the jitted method against the view, which stands in
+            # for the instance
+            meth = instance_type.jitmethods[attr]
+            disp_type = types.Dispatcher(meth)
+
+            class MethodTemplate(templates.AbstractTemplate):
+                key = (self.key, attr)
+
+                def generic(self, args, kws):
+                    args = (view,) + tuple(args)
+                    sig = disp_type.get_call_type(self.context, args, kws)
+                    return sig.as_method()
+
+            return types.BoundFunction(MethodTemplate, view)
+
+        elif attr in instance_type.jitprops:
+            getter = instance_type.jitprops[attr]['get']
+            disp_type = types.Dispatcher(getter)
+            sig = disp_type.get_call_type(self.context, (view,), {})
+            return sig.return_type
+
+
+##############################################################################
+# Lowering
+
+columnar_impl_registry = imputils.Registry()
+lower = columnar_impl_registry.lower
+
+_implemented_methods = set()
+
+
+def _register_methods(instance_type):
+    for meth in instance_type.jitmethods:
+        # As in ClassBuilder, a specific closure is needed for each name
+        if meth not in _implemented_methods:
+            _implement_method(meth)
+            _implemented_methods.add(meth)
+
+
+def _implement_method(attr):
+    @lower((types.ColumnarViewType, attr),
+           types.ColumnarViewType, types.VarArg(types.Any))
+    def imp(context, builder, sig, args):
+        method = sig.args[0].instance_type.jitmethods[attr]
+        disp_type = types.Dispatcher(method)
+        call = context.get_function(disp_type, sig)
+        out = call(builder, args)
+        return imputils.impl_ret_new_ref(context, builder,
+                                         sig.return_type, out)
+
+
+def _imp_dtor(context, module, typ):
+    """
+    Get the destructor of the meminfo owning the arrays of containers
+    of type *typ*.
+    """
+    llvoidptr = context.get_value_type(types.voidptr)
+    llsize = context.get_value_type(types.uintp)
+    dtor_ftype = llvmir.FunctionType(llvmir.VoidType(),
+                                     [llvoidptr, llsize, llvoidptr])
+
+    fname = "_Dtor.{0}".format(typ.name)
+    dtor_fn = module.get_or_insert_function(dtor_ftype, name=fname)
+    if dtor_fn.is_declaration:
+        # Define
+        builder = llvmir.IRBuilder(dtor_fn.append_basic_block())
+        tupty = _arrays_tuple_type(typ)
+        ptr = builder.bitcast(dtor_fn.args[0],
+                              context.get_value_type(tupty).as_pointer())
+        context.nrt.decref(builder, tupty, builder.load(ptr))
+        builder.ret_void()
+
+    return dtor_fn
+
+
+def _set_owner(context, builder, typ, container):
+    """
+    Allocate the meminfo owning the field arrays of *container*, which
+    steals the references to them.
+    """
+    tupty = _arrays_tuple_type(typ)
+    tup = context.make_tuple(builder, tupty,
+                             [getattr(container, _mangle_attr(k))
+                              for k in typ.fields])
+    lltupty = context.get_value_type(tupty)
+    meminfo = context.nrt.meminfo_alloc_dtor(
+        builder,
+        context.get_constant(types.uintp, context.get_abi_sizeof(lltupty)),
+        _imp_dtor(context, builder.module, typ),
+    )
+    data = builder.bitcast(context.nrt.meminfo_data(builder, meminfo),
+                           lltupty.as_pointer())
+    builder.store(tup, data)
+    container.meminfo = meminfo
+
+
+def ctor_impl(context, builder, sig, args):
+    """
+    Constructor of columnar containers: allocate zero-filled arrays.
+    """
+    typ = sig.return_type
+    n = context.cast(builder, args[0], sig.args[0], types.intp)
+    container = context.make_helper(builder, typ)
+    for k in typ.fields:
+        ary = _empty_nd_impl(context, builder, typ.get_array_type(k), [n])
+        _zero_fill_array(context, builder, ary)
+        setattr(container, _mangle_attr(k), ary._getvalue())
+    _set_owner(context, builder, typ, container)
+    return imputils.impl_ret_new_ref(context, builder, typ,
+                                     container._getvalue())
+
+
+def _get_length(context, builder, typ, container):
+    # All arrays have the same length: use the first one's
+    field = next(iter(typ.fields))
+    arrty = typ.get_array_type(field)
+    ary = make_array(arrty)(context, builder,
+                            getattr(container, _mangle_attr(field)))
+    return cgutils.unpack_tuple(builder, ary.shape, 1)[0]
+
+
+def _get_field_pointer(context, builder, viewty, view, field):
+    """
+    Get a pointer to the value of *field* for the item designated by
+    the view.
+    """
+    typ = viewty.container_type
+    view = context.make_helper(builder, viewty, view)
+    container = context.make_helper(builder, typ, view.container)
+    arrty = typ.get_array_type(field)
+    ary = make_array(arrty)(context, builder,
+                            getattr(container, _mangle_attr(field)))
+    ptr = cgutils.get_item_pointer(builder, arrty, ary, [view.index])
+    return arrty, ptr
+
+
+@columnar_impl_registry.lower_getattr_generic(types.ColumnarType)
+def container_getattr_impl(context, builder, typ, value, attr):
+    container = context.make_helper(builder, typ, value)
+    return imputils.impl_ret_borrowed(context, builder,
+                                      typ.get_array_type(attr),
+                                      getattr(container, _mangle_attr(attr)))
+
+
+@lower(len, types.ColumnarType)
+def container_len_impl(context, builder, sig, args):
+    typ, = sig.args
+    container = context.make_helper(builder, typ, args[0])
+    return _get_length(context, builder, typ, container)
+
+
+@lower('getitem', types.ColumnarType, types.Integer)
+def container_getitem_impl(context, builder, sig, args):
+    typ, idxty = sig.args
+    container = context.make_helper(builder, typ, args[0])
+    index = context.cast(builder, args[1], idxty, types.intp)
+    if idxty.signed:
+        # Wraparound negative indices; like lists, the bounds are
+        # not checked
+        size = _get_length(context, builder, typ, container)
+        wrapped = builder.add(index, size)
+        index = builder.select(cgutils.is_neg_int(builder, index),
+                               wrapped, index)
+    view = context.make_helper(builder, sig.return_type)
+    view.container = args[0]
+    view.index = index
+    return imputils.impl_ret_borrowed(context, builder, sig.return_type,
+                                      view._getvalue())
+
+
+@lower('getiter', types.ColumnarType)
+def container_getiter_impl(context, builder, sig, args):
+    it = context.make_helper(builder, sig.return_type)
+    index = context.get_constant(types.intp, 0)
+    it.index = cgutils.alloca_once_value(builder, index)
+    it.container = args[0]
+    return imputils.impl_ret_borrowed(context, builder, sig.return_type,
+                                      it._getvalue())
+
+
+@lower('iternext', types.ColumnarIter)
+@imputils.iternext_impl
+def iternext_columnar_impl(context, builder, sig, args, result):
+    iterty, = sig.args
+    typ = iterty.container_type
+    it = context.make_helper(builder, iterty, args[0])
+    container = context.make_helper(builder, typ, it.container)
+
+    index = builder.load(it.index)
+    size = _get_length(context, builder, typ, container)
+    is_valid = builder.icmp_signed('<', index, size)
+    result.set_valid(is_valid)
+
+    with builder.if_then(is_valid):
+        view = context.make_helper(builder, typ.view_type)
+        view.container = it.container
+        view.index = index
+        result.yield_(view._getvalue())
+        builder.store(builder.add(index, context.get_constant(types.intp, 1)),
+                      it.index)
+
+
+@columnar_impl_registry.lower_getattr_generic(types.ColumnarViewType)
+def view_getattr_impl(context, builder, typ, value, attr):
+    instance_type = typ.instance_type
+    if attr in instance_type.struct:
+        arrty, ptr = _get_field_pointer(context, builder, typ, value, attr)
+        return load_item(context, builder, arrty, ptr)
+
+    elif attr in instance_type.jitprops:
+        getter = instance_type.jitprops[attr]['get']
+        disp_type = types.Dispatcher(getter)
+        sig = disp_type.get_call_type(context.typing_context, (typ,), {})
+        call = context.get_function(disp_type, sig)
+        out = call(builder, [value])
+        return imputils.impl_ret_new_ref(context, builder, sig.return_type,
+                                         out)
+
+    raise NotImplementedError('attribute {0!r} not implemented'.format(attr))
+
+
+@columnar_impl_registry.lower_setattr_generic(types.ColumnarViewType)
+def view_setattr_impl(context, builder, sig, args, attr):
+    typ, valty = sig.args
+    target, val = args
+    instance_type = typ.instance_type
+
+    if attr in instance_type.struct:
+        arrty, ptr = _get_field_pointer(context, builder, typ, target, attr)
+        val = context.cast(builder, val, valty, arrty.dtype)
+        store_item(context, builder, arrty, val, ptr)
+
+    elif attr in instance_type.jitprops:
+        setter = instance_type.jitprops[attr]['set']
+        disp_type = types.Dispatcher(setter)
+        sig = disp_type.get_call_type(context.typing_context,
+                                      (typ, valty), {})
+        call = context.get_function(disp_type, sig)
+        call(builder, (target, val))
+
+    else:
+        raise NotImplementedError('attribute {0!r} not implemented'
+                                  .format(attr))
+
+
+##############################################################################
+# Boxing and unboxing
+
+def _arrays_tuple_type(typ):
+    return types.Tuple([typ.get_array_type(k) for k in typ.fields])
+
+
+def _get_class(typ, c):
+    return c.pyapi.unserialize(c.pyapi.serialize_object(typ.container_class))
+
+
+@box(types.ColumnarType)
+def _box_columnar(typ, val, c):
+    container = c.context.make_helper(c.builder, typ, val)
+    tupty = _arrays_tuple_type(typ)
+    tup = c.context.make_tuple(c.builder, tupty,
+                               [getattr(container, _mangle_attr(k))
+                                for k in typ.fields])
+    # Boxing the arrays steals references to them, while boxing the
+    # container steals the reference to their owner
+    c.context.nrt.incref(c.builder, tupty, tup)
+    c.context.nrt.decref(c.builder, typ, val)
+    tupobj = c.box(tupty, tup)
+    res = cgutils.alloca_once_value(c.builder, c.pyapi.get_null_object())
+    with cgutils.if_likely(c.builder, cgutils.is_not_null(c.builder, tupobj)):
+        cls = _get_class(typ, c)
+        with cgutils.if_likely(c.builder, cgutils.is_not_null(c.builder, cls)):
+            wrap = c.pyapi.object_getattr_string(cls, "_wrap")
+            with cgutils.if_likely(c.builder,
+                                   cgutils.is_not_null(c.builder, wrap)):
+                obj = c.pyapi.call_function_objargs(wrap, (tupobj,))
+                c.builder.store(obj, res)
+                c.pyapi.decref(wrap)
+            c.pyapi.decref(cls)
+        c.pyapi.decref(tupobj)
+    return c.builder.load(res)
+
+
+@unbox(types.ColumnarType)
+def _unbox_columnar(typ, obj, c):
+    tupty = _arrays_tuple_type(typ)
+    tupobj = c.pyapi.object_getattr_string(obj, "_arrays")
+    native = c.unbox(tupty, tupobj)
+    c.pyapi.decref(tupobj)
+    container = c.context.make_helper(c.builder, typ)
+    with cgutils.if_likely(c.builder, c.builder.not_(native.is_error)):
+        for i, k in enumerate(typ.fields):
+            setattr(container, _mangle_attr(k),
+                    c.builder.extract_value(native.value, i))
+        _set_owner(c.context, c.builder, typ, container)
+    return NativeValue(container._getvalue(), is_error=native.is_error,
+                       cleanup=native.cleanup)
+
+
+@box(types.ColumnarViewType)
+def _box_columnar_view(typ, val, c):
+    view = c.context.make_helper(c.builder, typ, val)
+    container_type = typ.container_type
+    res = cgutils.alloca_once_value(c.builder, c.pyapi.get_null_object())
+    # Boxing the container steals the view's reference
+    contobj = c.box(container_type, view.container)
+    with cgutils.if_likely(c.builder, cgutils.is_not_null(c.builder,
+                                                          contobj)):
+        clsobj = c.pyapi.object_getattr_string(contobj, "_item_class")
+        with cgutils.if_likely(c.builder, cgutils.is_not_null(c.builder,
+                                                              clsobj)):
+            idxobj = c.pyapi.long_from_ssize_t(view.index)
+            with cgutils.if_likely(c.builder,
+                                   cgutils.is_not_null(c.builder, idxobj)):
+                obj = c.pyapi.call_function_objargs(clsobj,
+                                                    (contobj, idxobj))
+                c.builder.store(obj, res)
+                c.pyapi.decref(idxobj)
+            c.pyapi.decref(clsobj)
+        c.pyapi.decref(contobj)
+    return c.builder.load(res)
+
+
+@unbox(types.ColumnarViewType)
+def _unbox_columnar_view(typ, obj, c):
+    contobj = c.pyapi.object_getattr_string(obj, "_container")
+    container = c.unbox(typ.container_type, contobj)
+    c.pyapi.decref(contobj)
+    idxobj = c.pyapi.object_getattr_string(obj, "_index")
+    index = c.unbox(types.intp, idxobj)
+    c.pyapi.decref(idxobj)
+    view = c.context.make_helper(c.builder, typ)
+    view.container = container.value
+    view.index = index.value
+    is_error = c.builder.or_(container.is_error, index.is_error)
+    return NativeValue(view._getvalue(), is_error=is_error,
+                       cleanup=container.cleanup)
@@ -16,11 +16,21 @@ class LockLLVM(object):
 
     def __init__(self):
         self._llvm_lock = threading.RLock()
+        self._local = threading.local()
+
+    @property
+    def held(self):
+        """
+        Whether the current thread holds the lock.
+        """
+        return getattr(self._local, 'depth', 0) > 0
 
     def __enter__(self):
         self._llvm_lock.acquire()
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
 
     def __exit__(self, *args, **kwargs):
+        self._local.depth -= 1
         self._llvm_lock.release()
 
     def __call__(self, fn):
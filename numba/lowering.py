@@ -215,18 +215,19 @@ class BaseLower(object):
                                    loc=self.loc, errcls_=defaulterrcls):
                 self.lower_inst(inst)
 
-    def create_cpython_wrapper(self, release_gil=False):
+    def create_cpython_wrapper(self, release_gil=False,
+                               assume_homogeneous=False):
         """
         Create CPython wrapper(s) around this function (or generator).
         """
         if self.genlower:
-            self.context.create_cpython_wrapper(self.library,
-                                                self.genlower.gendesc,
-                                                self.env, self.call_helper,
-                                                release_gil=release_gil)
-        self.context.create_cpython_wrapper(self.library, self.fndesc,
-                                            self.env, self.call_helper,
-                                            release_gil=release_gil)
+            self.context.create_cpython_wrapper(
+                self.library, self.genlower.gendesc, self.env,
+                self.call_helper, release_gil=release_gil,
+                assume_homogeneous=assume_homogeneous)
+        self.context.create_cpython_wrapper(
+            self.library, self.fndesc, self.env, self.call_helper,
+            release_gil=release_gil, assume_homogeneous=assume_homogeneous)
 
     def setup_function(self, fndesc):
         # Setup function
@@ -446,7 +447,9 @@ class Lower(BaseLower):
         # Yield to caller
         val = self.loadvar(inst.value.name)
         typ = self.typeof(inst.value.name)
-        val = self.context.cast(self.builder, val, typ, self.gentype.yield_type)
+        yield_type = self.gentype.yield_type
+        val = self.context.cast(self.builder, val, typ, yield_type)
+        val = self.context.get_return_value(self.builder, yield_type, val)
         self.call_conv.return_value(self.builder, val)
 
         # Resumption point
@@ -16,6 +16,10 @@ def _is_ufunc(func):
     return isinstance(func, (np.ufunc, DUFunc))
 
 
+def _has_arrays(typemap):
+    return any(isinstance(typ, types.Array) for typ in typemap.values())
+
+
 @rewrites.register_rewrite('after-inference')
 class RewriteArrayExprs(rewrites.Rewrite):
     '''The RewriteArrayExprs class is responsible for finding array
@@ -30,6 +34,9 @@ class RewriteArrayExprs(rewrites.Rewrite):
         if 'arrayexpr' not in special_ops:
             special_ops['arrayexpr'] = _lower_array_expr
 
+    def prematch(self, func_ir, typemap, calltypes):
+        return _has_arrays(typemap)
+
     def match(self, func_ir, block, typemap, calltypes):
         """
         Using typing and a basic block, search the basic block for array
@@ -127,6 +134,17 @@ class RewriteArrayExprs(rewrites.Rewrite):
             "Don't know how to find the operands for '{0}' expressions.".format(
                 ir_op))
 
+    @staticmethod
+    def _list_leaves(expr):
+        '''Return the variables at the leaves of an array expression tree.
+        '''
+        if isinstance(expr, tuple):
+            return [var for arg in expr[1]
+                    for var in RewriteArrayExprs._list_leaves(arg)]
+        elif isinstance(expr, ir.Var):
+            return [expr]
+        return []
+
     def _translate_expr(self, ir_expr):
         '''Translate the given expression from Numba IR to an array expression
         tree.
@@ -385,7 +403,9 @@ def _lower_array_expr(lowerer, expr):
     # division (issue #1223).
     flags = compiler.Flags()
     flags.set('error_model', 'numpy')
-    cres = context.compile_subroutine_no_cache(builder, impl, inner_sig, flags=flags)
+    cres = context.compile_subroutine_no_cache(builder, impl, inner_sig,
+                                               flags=flags,
+                                               caller_library=lowerer.library)
 
     # Create kernel subclass calling our native function
     from ..targets import npyimpl
@@ -403,3 +423,409 @@ def _lower_array_expr(lowerer, expr):
     args = [lowerer.loadvar(name) for name in expr_args]
     return npyimpl.numpy_ufunc_kernel(
         context, builder, outer_sig, args, ExprKernel, explicit_output=False)
+
+
+@rewrites.register_rewrite('after-inference')
+class RewriteFancyIndexedArrayExprs(rewrites.Rewrite):
+    '''Fuse fancy indexing into array expressions.  When all the array
+    operands of an array expression are indexed with the same 1-d integer
+    or boolean array, as in ``a[idx] * b[idx] + 1``, the items are fetched
+    from the indexed arrays inside the expression's loop rather than
+    copied into temporary arrays.  If the result is itself assigned with
+    the same index, as in ``out[idx] = a[idx] * b[idx]``, it is stored
+    into the indexed array directly.
+    '''
+    def __init__(self, pipeline, *args, **kws):
+        super(RewriteFancyIndexedArrayExprs, self).__init__(
+            pipeline, *args, **kws)
+        special_ops = self.pipeline.targetctx.special_ops
+        if 'fancy_arrayexpr' not in special_ops:
+            special_ops['fancy_arrayexpr'] = _lower_fancy_array_expr
+            special_ops['fancy_arrayexpr_setitem'] = \
+                _lower_fancy_array_expr_setitem
+
+    def prematch(self, func_ir, typemap, calltypes):
+        return _has_arrays(typemap)
+
+    def match(self, func_ir, block, typemap, calltypes):
+        # Leave array expressions to the parfor pass (some pipelines,
+        # such as the one used to test parfors, don't carry any flags)
+        flags = getattr(self.pipeline, 'flags', None)
+        if flags is None or flags.auto_parallel:
+            return False
+        self.crnt_block = block
+        self.typemap = typemap
+        # { variable name: IR assignment }
+        self.assigns = {}
+        # { variable name: number of uses in the block }
+        self.uses = defaultdict(int)
+        for instr in block.body:
+            if isinstance(instr, ir.Assign):
+                value = instr.value
+                if isinstance(value, ir.Expr):
+                    used = value.list_vars()
+                elif isinstance(value, ir.Var):
+                    used = [value]
+                else:
+                    used = []
+            elif isinstance(instr, ir.Del):
+                used = []
+            else:
+                used = instr.list_vars()
+            for var in used:
+                self.uses[var.name] += 1
+
+        for instr in block.body:
+            if isinstance(instr, ir.Assign):
+                self.assigns[instr.target.name] = instr
+                expr = instr.value
+                if isinstance(expr, ir.Expr) and expr.op == 'arrayexpr':
+                    if self._match_fancy_array_expr(instr):
+                        return True
+        return False
+
+    def _is_fancy_index(self, var):
+        ty = self.typemap[var.name]
+        return (isinstance(ty, types.Array) and ty.ndim == 1 and
+                isinstance(ty.dtype, (types.Integer, types.Boolean)))
+
+    def _is_single_use_temp(self, var):
+        return var.is_temp and self.uses[var.name] == 1
+
+    def _match_fancy_array_expr(self, instr):
+        '''Check whether the array expression assigned by *instr* only
+        has fancy indexed array operands, all with the same index.
+        '''
+        # { operand name: (getitem assignment, indexed array) }
+        gathers = OrderedDict()
+        index = []
+
+        def walk(expr):
+            if isinstance(expr, tuple):
+                return all(walk(arg) for arg in expr[1])
+            elif isinstance(expr, ir.Const):
+                return True
+            ty = self.typemap[expr.name]
+            if not isinstance(ty, types.Array):
+                return isinstance(ty, (types.Number, types.Boolean))
+            # An array operand must be a temporary from a fancy getitem
+            getitem = self.assigns.get(expr.name)
+            if (getitem is None or not self._is_single_use_temp(expr) or
+                not isinstance(getitem.value, ir.Expr) or
+                getitem.value.op != 'getitem'):
+                return False
+            source = getitem.value.value
+            idx = getitem.value.index
+            srcty = self.typemap[source.name]
+            if (not isinstance(srcty, types.Array) or srcty.ndim != 1 or
+                not self._is_fancy_index(idx)):
+                return False
+            if index and index[0].name != idx.name:
+                return False
+            index[:] = [idx]
+            gathers[expr.name] = getitem, source
+            return True
+
+        if not walk(instr.value.expr) or not gathers:
+            return False
+        self.match_instr = instr
+        self.gathers = gathers
+        self.index = index[0]
+
+        # Is the result assigned with the same index?
+        self.setitem = None
+        target = instr.target
+        if self._is_single_use_temp(target):
+            for stmt in self.crnt_block.body:
+                if (isinstance(stmt, ir.SetItem) and
+                    stmt.value.name == target.name and
+                    stmt.index.name == self.index.name):
+                    arrty = self.typemap[stmt.target.name]
+                    if isinstance(arrty, types.Array) and arrty.ndim == 1:
+                        self.setitem = stmt
+                    break
+
+        # The gathers are moved into the fused expression: nothing with
+        # side effects (a call or setitem could mutate the source arrays)
+        # may run between the first getitem and the fused expression,
+        # and the variables it reads must not be reassigned.
+        body = self.crnt_block.body
+        first = min(body.index(getitem) for getitem, _ in gathers.values())
+        last = body.index(self.setitem or instr)
+        chain = set(id(getitem) for getitem, _ in gathers.values())
+        chain.add(id(instr))
+        read = set(var.name for var in instr.value.list_vars())
+        read.add(self.index.name)
+        read.update(source.name for _, source in gathers.values())
+        if self.setitem is not None:
+            read.add(self.setitem.target.name)
+        for stmt in body[first:last]:
+            if id(stmt) in chain or isinstance(stmt, ir.Del):
+                continue
+            if not (isinstance(stmt, ir.Assign) and
+                    isinstance(stmt.value, (ir.Const, ir.Global, ir.FreeVar,
+                                            ir.Var))):
+                return False
+            if stmt.target.name in read:
+                return False
+        return True
+
+    def _replace_gathers(self, expr):
+        if isinstance(expr, tuple):
+            op, args = expr
+            return op, [self._replace_gathers(arg) for arg in args]
+        elif isinstance(expr, ir.Var) and expr.name in self.gathers:
+            return self.gathers[expr.name][1]
+        return expr
+
+    def apply(self):
+        instr = self.match_instr
+        tree = self._replace_gathers(instr.value.expr)
+        dead_instrs = set(getitem for getitem, _ in self.gathers.values())
+        dead_vars = set(self.gathers)
+        if self.setitem is None:
+            new_expr = ir.Expr(op='fancy_arrayexpr', loc=instr.loc,
+                               index=self.index, expr=tree,
+                               ty=instr.value.ty)
+            new_instr = ir.Assign(new_expr, instr.target, instr.loc)
+            replaced = instr
+        else:
+            new_expr = ir.Expr(op='fancy_arrayexpr_setitem', loc=instr.loc,
+                               array=self.setitem.target, index=self.index,
+                               expr=tree, ty=instr.value.ty)
+            scope = instr.target.scope
+            dummy = ir.Var(scope, scope.redefine("$fancy_setitem",
+                                                 instr.loc).name, instr.loc)
+            self.typemap[dummy.name] = types.none
+            new_instr = ir.Assign(new_expr, dummy, instr.loc)
+            dead_instrs.add(instr)
+            dead_vars.add(instr.target.name)
+            replaced = self.setitem
+
+        # Deletions of the variables read by the new instruction are
+        # moved after it.
+        read = set(var.name for var in new_expr.list_vars())
+        delayed = []
+        result = self.crnt_block.copy()
+        result.clear()
+        emitted = False
+        for stmt in self.crnt_block.body:
+            if stmt is replaced:
+                result.append(new_instr)
+                result.body.extend(delayed)
+                emitted = True
+            elif stmt in dead_instrs:
+                continue
+            elif isinstance(stmt, ir.Del):
+                if stmt.value in dead_vars:
+                    continue
+                if stmt.value in read and not emitted:
+                    delayed.append(stmt)
+                else:
+                    result.append(stmt)
+            else:
+                result.append(stmt)
+        return result
+
+
+def _fancy_array_expr_ast(expr, gathered, index_name):
+    '''Build a Python expression AST from the array expression tree
+    *expr*, fetching the items of the *gathered* arrays at *index_name*.
+    '''
+    ast_expr, namespace = _arr_expr_to_ast(expr)
+
+    class GatherTransformer(ast.NodeTransformer):
+        def visit_Name(self, node):
+            if node.id in gathered:
+                return ast.Subscript(node, ast.Index(ast.Name(index_name,
+                                                              ast.Load())),
+                                     ast.Load())
+            return node
+
+    return GatherTransformer().visit(ast_expr), namespace
+
+
+# Templates of the functions implementing fused fancy indexing.
+# __expr_at_j__ is replaced with the array expression, with the items of
+# the indexed arrays fetched at index __j; __expr__ is replaced with the
+# original array expression, indexing them with __index__.
+
+_fancy_gather_templates = {
+    # Integer index
+    False: '''
+def {name}({params}):
+    __out = __empty(len(__index__), __dtype)
+    for __k in range(len(__index__)):
+        __j = __index__[__k]
+        __out[__k] = __expr_at_j__
+    return __out
+''',
+    # Boolean index: count the true items first, to allocate the output
+    # at its exact size
+    True: '''
+def {name}({params}):
+    __n = 0
+    for __j in range(len(__index__)):
+        if __index__[__j]:
+            __n += 1
+    __out = __empty(__n, __dtype)
+    __k = 0
+    for __j in range(len(__index__)):
+        if __index__[__j]:
+            __out[__k] = __expr_at_j__
+            __k += 1
+    return __out
+''',
+    }
+
+# If __fuse is false, the destination overlaps the operands and items
+# could be overwritten before being read: temporaries are used instead.
+
+_fancy_scatter_templates = {
+    # Integer index
+    False: '''
+def {name}(__fuse, {params}):
+    if __fuse:
+        for __k in range(len(__index__)):
+            __j = __index__[__k]
+            __array__[__j] = __expr_at_j__
+    else:
+        __tmp = __expr__
+        __array__[__index__] = __tmp
+''',
+    # Boolean index
+    True: '''
+def {name}(__fuse, {params}):
+    if __fuse:
+        for __j in range(len(__index__)):
+            if __index__[__j]:
+                __array__[__j] = __expr_at_j__
+    else:
+        __tmp = __expr__
+        __array__[__index__] = __tmp
+''',
+    }
+
+
+def _can_fuse_fancy_setitem(lowerer, expr, gathered_vars):
+    '''Emit code checking whether the fancy indexed assignment *expr* can
+    store the items as they are computed.  The destination mustn't
+    overlap the index or the operands, except with a boolean index for an
+    operand which is the same view as the destination: each item is then
+    read just before being overwritten.
+    '''
+    from ..targets import arrayobj
+
+    context = lowerer.context
+    builder = lowerer.builder
+
+    def load_array(var):
+        ty = lowerer.typeof(var.name)
+        return ty, arrayobj.make_array(ty)(context, builder,
+                                           lowerer.loadvar(var.name))
+
+    aryty, ary = load_array(expr.array)
+    idxty, idx = load_array(expr.index)
+    is_mask = isinstance(idxty.dtype, types.Boolean)
+    fuse = builder.not_(arrayobj.arrays_may_overlap(context, builder,
+                                                    aryty, ary, idxty, idx))
+    for var in gathered_vars:
+        srcty, src = load_array(var)
+        ok = builder.not_(arrayobj.arrays_may_overlap(context, builder,
+                                                      aryty, ary, srcty, src))
+        if is_mask:
+            ok = builder.or_(ok, arrayobj.arrays_are_same_view(
+                context, builder, aryty, ary, srcty, src))
+        fuse = builder.and_(fuse, ok)
+    return fuse
+
+
+def _compile_fancy_array_expr(lowerer, expr, templates, sig_ty,
+                              extra_args=()):
+    '''Compile and call the function implementing the fancy indexed array
+    expression *expr*, from one of the *templates*.  *extra_args* are
+    (value, type) pairs passed before the expression's variables.
+    '''
+    expr_name = "__numba_fancy_array_expr_%s" % (
+        hex(hash(expr)).replace("-", "_"))
+    expr_filename = expr.loc.filename
+    expr_var_unique = sorted(set(expr.list_vars()), key=lambda var: var.name)
+    expr_args = [var.name for var in expr_var_unique]
+    is_mask = isinstance(lowerer.typeof(expr.index.name).dtype,
+                         types.Boolean)
+    array = expr._kws.get('array')
+
+    with _legalize_parameter_names(expr_var_unique) as expr_params:
+        gathered = set(var.name for var in _gathered_vars(lowerer, expr))
+        replacements = {'__index__': expr.index.name}
+        if array is not None:
+            replacements['__array__'] = array.name
+        source = templates[is_mask].format(name=expr_name,
+                                           params=', '.join(expr_params))
+        ast_module = ast.parse(source, expr_filename, 'exec')
+        expr_at_j, namespace = _fancy_array_expr_ast(expr.expr, gathered,
+                                                      '__j')
+        expr_at_index, _ = _fancy_array_expr_ast(expr.expr, gathered,
+                                                  expr.index.name)
+
+        class Substitute(ast.NodeTransformer):
+            def visit_Name(self, node):
+                if node.id == '__expr_at_j__':
+                    return expr_at_j
+                elif node.id == '__expr__':
+                    return expr_at_index
+                elif node.id in replacements:
+                    return ast.Name(replacements[node.id], node.ctx)
+                return node
+
+        ast_module = Substitute().visit(ast_module)
+        ast.fix_missing_locations(ast_module)
+
+    namespace.update(__empty=np.empty, __dtype=expr.ty.dtype)
+    code_obj = compile(ast_module, expr_filename, 'exec')
+    six.exec_(code_obj, namespace)
+    impl = namespace[expr_name]
+
+    context = lowerer.context
+    builder = lowerer.builder
+    arg_types = [ty for _, ty in extra_args]
+    arg_types += [lowerer.typeof(name) for name in expr_args]
+    sig = sig_ty(*arg_types)
+    # Follow the Numpy error model, as for array expressions
+    flags = compiler.Flags()
+    flags.set('nrt')
+    flags.set('error_model', 'numpy')
+    cres = context.compile_subroutine_no_cache(builder, impl, sig,
+                                               flags=flags,
+                                               caller_library=lowerer.library)
+    args = [val for val, _ in extra_args]
+    args += [lowerer.loadvar(name) for name in expr_args]
+    return context.call_internal(builder, cres.fndesc, sig, args)
+
+
+def _gathered_vars(lowerer, expr):
+    '''Return the arrays indexed by the fancy indexed array expression
+    *expr*, i.e. its array operands.
+    '''
+    return sorted(set(var for var in RewriteArrayExprs._list_leaves(expr.expr)
+                      if isinstance(lowerer.typeof(var.name), types.Array)),
+                  key=lambda var: var.name)
+
+
+def _lower_fancy_array_expr(lowerer, expr):
+    '''Lower an array expression with fancy indexed operands, built by
+    RewriteFancyIndexedArrayExprs.
+    '''
+    return _compile_fancy_array_expr(lowerer, expr, _fancy_gather_templates,
+                                     expr.ty)
+
+
+def _lower_fancy_array_expr_setitem(lowerer, expr):
+    '''Lower the fancy indexed assignment of an array expression with
+    fancy indexed operands, built by RewriteFancyIndexedArrayExprs.
+    '''
+    fuse = _can_fuse_fancy_setitem(lowerer, expr,
+                                   _gathered_vars(lowerer, expr))
+    _compile_fancy_array_expr(lowerer, expr, _fancy_scatter_templates,
+                              types.none, [(fuse, types.boolean)])
+    return lowerer.context.get_dummy_value()
@@ -12,6 +12,7 @@ from numba.targets.descriptors import TargetDescriptor
 from numba.targets.options import TargetOptions
 from numba.targets.registry import dispatcher_registry, cpu_target
 from numba import utils, compiler, types, sigutils
+from numba import llvmthreadsafe as llvmts
 from numba.numpy_support import as_dtype
 from . import _internal
 from .sigparse import parse_signature
@@ -156,7 +157,7 @@ def _build_element_wise_ufunc_wrapper(cres, signature):
     env = cres.environment
     envptr = env.as_pointer(ctx)
 
-    with compiler.lock_compiler:
+    with compiler.lock_compiler, llvmts.lock_llvm:
         ptr = build_ufunc_wrapper(library, ctx, fname, signature,
                                 cres.objectmode, envptr, env)
 
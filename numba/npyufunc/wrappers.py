@@ -4,6 +4,7 @@ import numpy as np
 from llvmlite.llvmpy.core import Type, Builder, ICMP_EQ, Constant
 
 from numba import types, cgutils, compiler
+from numba import llvmthreadsafe as llvmts
 from ..caching import make_library_cache, NullCache
 
 
@@ -399,10 +400,15 @@ class _GufuncWrapper(object):
 
     def build(self):
         # Use cache and compiler in a critical section
-        with compiler.lock_compiler:
+        with compiler.lock_compiler, llvmts.lock_llvm:
             wrapperlib = self.cache.load_overload(self.cres.signature, self.cres.target_context)
             wrapper_name = "__gufunc__." + self.fndesc.mangled_name
 
+            if (wrapperlib is not None and
+                not wrapperlib.get_pointer_to_function(wrapper_name)):
+                # The cached wrapper was built for another compilation
+                # of the kernel (e.g. in a concurrent thread)
+                wrapperlib = None
             if wrapperlib is None:
                 # Create library and enable caching
                 wrapperlib = self.context.codegen().create_library(str(self))
@@ -181,7 +181,9 @@ def get_sys_info():
 
 
 def make_parser():
-    parser = argparse.ArgumentParser()
+    parser = argparse.ArgumentParser(
+        epilog="Use 'numba precompile --help' for warming up the caches of "
+               "jitted functions.")
     parser.add_argument('--annotate', help='Annotate source',
                         action='store_true')
     parser.add_argument('--dump-llvm', action="store_true",
@@ -203,6 +205,10 @@ def make_parser():
 
 
 def main():
+    if sys.argv[1:2] == ['precompile']:
+        from numba.precompile import main as precompile_main
+        sys.exit(precompile_main(sys.argv[2:]))
+
     parser = make_parser()
     args = parser.parse_args()
 
@@ -0,0 +1,216 @@
+"""
+Array routines complementing the Numpy functions supported in nopython
+mode.  They are jitted functions, callable both from Python and from
+other jitted functions.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import numpy as np
+
+from .decorators import generated_jit, njit
+from .extending import register_jitable
+from .numpy_support import as_dtype, from_dtype
+from .targets.arraysetops import (_unique_sorted, _unique_hashed,
+                                  _unique_all_sorted, _unique_all_hashed)
+
+
+#----------------------------------------------------------------------------
+# Distinct values
+#
+# np.unique() can't be compiled with its return_* flags, as they change
+# the return type.  These functions return the same values as the
+# corresponding flags.  If *hashed* is true, the distinct values are
+# found with a hash set rather than by sorting the whole input, which
+# is faster when the input has many duplicates.
+
+@njit
+def unique(ar, hashed=True):
+    """
+    Return the sorted distinct values of *ar*, like np.unique(ar).
+    """
+    if hashed:
+        return _unique_hashed(ar)
+    else:
+        return _unique_sorted(ar)
+
+
+@njit
+def unique_all(ar, hashed=True):
+    """
+    Return a (values, index, inverse, counts) tuple, like
+    np.unique(ar, True, True, True).
+    """
+    if hashed:
+        return _unique_all_hashed(ar)
+    else:
+        return _unique_all_sorted(ar)
+
+
+@njit
+def unique_counts(ar, hashed=True):
+    """
+    Return a (values, counts) tuple, like
+    np.unique(ar, return_counts=True).
+    """
+    values, index, inverse, counts = unique_all(ar, hashed)
+    return values, counts
+
+
+@njit
+def unique_inverse(ar, hashed=True):
+    """
+    Return a (values, inverse) tuple, like
+    np.unique(ar, return_inverse=True).
+    """
+    values, index, inverse, counts = unique_all(ar, hashed)
+    return values, inverse
+
+
+#----------------------------------------------------------------------------
+# Rolling windows
+#
+# These functions take a 1-d array *a* and return one value per full
+# window of *window* consecutive items, i.e. len(a) - window + 1 values
+# (the "valid" mode of np.convolve()).  They run in O(len(a)) time
+# whatever the window size.  The result for a window containing a NaN
+# is NaN.
+
+@register_jitable
+def _rolling_length(a, window):
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    return max(len(a) - window + 1, 0)
+
+
+def _make_rolling_sum(mean):
+    if mean:
+        @register_jitable
+        def result(s, window):
+            return s / window
+    else:
+        @register_jitable
+        def result(s, window):
+            return s
+
+    @register_jitable
+    def rolling_sum(a, window, out):
+        # Keep a running sum of the non-NaN values in the window
+        s = 0
+        last_nan = -1 - window
+        for i in range(len(a)):
+            v = a[i]
+            if v != v:
+                last_nan = i
+            else:
+                s += v
+            j = i - window + 1
+            if j > 0:
+                w = a[j - 1]
+                if w == w:
+                    s -= w
+            if j >= 0:
+                if last_nan >= j:
+                    out[j] = a[last_nan]
+                else:
+                    out[j] = result(s, window)
+
+    return rolling_sum
+
+
+def _make_rolling_extremum(is_max):
+    if is_max:
+        @register_jitable
+        def dominates(x, y):
+            return x >= y
+    else:
+        @register_jitable
+        def dominates(x, y):
+            return x <= y
+
+    @register_jitable
+    def rolling_extremum(a, window, out):
+        # A monotonic deque of indices into *a*, stored in a ring buffer:
+        # the first index is the window's extremum, and the values at the
+        # other indices are the candidates for the next windows.
+        deque = np.empty(window, np.intp)
+        head = 0
+        size = 0
+        last_nan = -1 - window
+        for i in range(len(a)):
+            j = i - window + 1
+            # Drop the index which left the window
+            if size > 0 and deque[head] < j:
+                head = (head + 1) % window
+                size -= 1
+            v = a[i]
+            if v != v:
+                last_nan = i
+            else:
+                # Drop the candidates dominated by the new value
+                while size > 0:
+                    tail = (head + size - 1) % window
+                    if dominates(a[deque[tail]], v):
+                        break
+                    size -= 1
+                deque[(head + size) % window] = i
+                size += 1
+            if j >= 0:
+                if last_nan >= j:
+                    out[j] = a[last_nan]
+                else:
+                    out[j] = a[deque[head]]
+
+    return rolling_extremum
+
+
+_rolling_sum = _make_rolling_sum(mean=False)
+_rolling_mean = _make_rolling_sum(mean=True)
+_rolling_min = _make_rolling_extremum(is_max=False)
+_rolling_max = _make_rolling_extremum(is_max=True)
+
+
+@generated_jit(nopython=True)
+def rolling_sum(a, window):
+    """
+    Return the sums of *a* over a rolling window, with the dtype of
+    a.sum().
+    """
+    dtype = from_dtype(np.empty(0, as_dtype(a.dtype)).sum().dtype)
+
+    def impl(a, window):
+        out = np.empty(_rolling_length(a, window), dtype)
+        _rolling_sum(a, window, out)
+        return out
+
+    return impl
+
+
+@njit
+def rolling_mean(a, window):
+    """
+    Return the means of *a* over a rolling window.
+    """
+    out = np.empty(_rolling_length(a, window), np.float64)
+    _rolling_mean(a, window, out)
+    return out
+
+
+@njit
+def rolling_min(a, window):
+    """
+    Return the minima of *a* over a rolling window.
+    """
+    out = np.empty(_rolling_length(a, window), a.dtype)
+    _rolling_min(a, window, out)
+    return out
+
+
+@njit
+def rolling_max(a, window):
+    """
+    Return the maxima of *a* over a rolling window.
+    """
+    out = np.empty(_rolling_length(a, window), a.dtype)
+    _rolling_max(a, window, out)
+    return out
@@ -2,6 +2,7 @@ from __future__ import print_function, division, absolute_import
 
 import collections
 import ctypes
+import hashlib
 import re
 
 import numpy as np
@@ -464,3 +465,67 @@ def farray(ptr, shape, dtype=None):
     if not isinstance(shape, utils.INT_TYPES):
         shape = shape[::-1]
     return carray(ptr, shape, dtype).T
+
+
+# { field names: namedtuple class }
+_columns_classes = {}
+
+def _reduce_columns(self):
+    return _rebuild_columns, (self._dtype_names, tuple(self))
+
+def _rebuild_columns(names, values):
+    return get_columns_class(names)(*values)
+
+class _ColumnsClassRef(object):
+    """
+    A stand-in for the Columns class of the given field *names*, which
+    unpickles to that class (e.g. when boxing from nopython code).
+    """
+
+    def __init__(self, names):
+        self.names = names
+
+    def __reduce__(self):
+        return get_columns_class, (self.names,)
+
+def get_columns_class(names):
+    """
+    Return the named tuple class returned by columnarize() for a
+    structured dtype with the given field *names*.
+    """
+    names = tuple(names)
+    try:
+        return _columns_classes[names]
+    except KeyError:
+        cls = collections.namedtuple('Columns', names, rename=True)
+        # Make the class itself picklable within this process (older
+        # pickle protocols look the class up by __name__).  It only
+        # exists once requested, so instances and references to the
+        # class are pickled by field names instead.
+        digest = hashlib.md5(repr(names).encode('utf-8')).hexdigest()
+        cls.__module__ = __name__
+        cls.__name__ = cls.__qualname__ = '_Columns_%s' % digest
+        # (the original names, as _fields may be renamed)
+        cls._dtype_names = names
+        cls.__reduce__ = _reduce_columns
+        cls._pickle_ref = _ColumnsClassRef(names)
+        globals()[cls.__name__] = cls
+        _columns_classes[names] = cls
+        return cls
+
+
+def columnarize(arr):
+    """
+    Return a named tuple of C-contiguous copies of the fields of the
+    structured array *arr*, in field order.  Contrary to the ``arr[name]``
+    views, which are strided over the records, each column is stored
+    contiguously, which helps loops over a single field of wide records.
+    Field names which aren't valid identifiers are renamed by position
+    (see :func:`collections.namedtuple`).
+    """
+    names = arr.dtype.names
+    if names is None:
+        raise TypeError("expected a structured array, got dtype %s"
+                        % (arr.dtype,))
+    cls = get_columns_class(names)
+    return cls(*[arr[name].copy(order='C') for name in names])
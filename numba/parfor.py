@@ -359,7 +359,7 @@ class ParforPass(object):
         if func_var not in call_table:
             return False
         call = call_table[func_var]
-        return call[0] == 'prange' or call[0] == prange
+        return len(call) > 0 and (call[0] == 'prange' or call[0] == prange)
 
     def _is_C_order(self, arr_name):
         typ = self.typemap[arr_name]
@@ -0,0 +1,205 @@
+"""
+Warm up the on-disk caches of the jitted functions of a set of modules,
+by compiling them across a pool of processes.  This implements the
+``numba precompile`` command.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import argparse
+import contextlib
+import importlib
+import multiprocessing
+import os
+import sys
+
+from . import decorators, sigutils, signature_log, typeinfer
+from .caching import NullCache
+from .dispatcher import Dispatcher
+
+
+@contextlib.contextmanager
+def _deferred_signatures():
+    """
+    Defer the compilation of the signatures given to @jit, and yield
+    the list of the dispatchers concerned.
+    """
+    old = decorators._deferred_dispatchers
+    deferred = decorators._deferred_dispatchers = []
+    try:
+        yield deferred
+    finally:
+        decorators._deferred_dispatchers = old
+
+
+def _compile_declared_signatures(dispatchers):
+    """
+    Compile the deferred @jit signatures of *dispatchers* and disable
+    further compilation, as @jit would have done.  Failures were
+    already reported by the workers and are ignored.
+    """
+    for disp in dispatchers:
+        with typeinfer.register_dispatcher(disp):
+            for sig in disp._declared_signatures:
+                try:
+                    disp.compile(sig)
+                except Exception:
+                    pass
+        disp.disable_compile()
+
+
+def _unique_signatures(sigs):
+    """
+    Remove the signatures of *sigs* whose argument types are the same
+    as those of a previous one.
+    """
+    seen = set()
+    unique = []
+    for sig in sigs:
+        args, return_type = sigutils.normalize_signature(sig)
+        if args not in seen:
+            seen.add(args)
+            unique.append(sig)
+    return unique
+
+
+def _qualname(func):
+    return getattr(func, '__qualname__', func.__name__)
+
+
+def find_cached_dispatchers(module):
+    """
+    Return a dict mapping qualified names to the cache-enabled
+    dispatchers defined at the top level of *module*.
+    """
+    dispatchers = {}
+    for obj in vars(module).values():
+        if (isinstance(obj, Dispatcher)
+            and not isinstance(obj._cache, NullCache)
+            and obj.py_func.__module__ == module.__name__):
+            qualname = _qualname(obj.py_func)
+            if getattr(module, qualname, None) is obj:
+                dispatchers[qualname] = obj
+    return dispatchers
+
+
+def _init_worker():
+    # Only compile the signatures the worker is asked for
+    decorators._deferred_dispatchers = []
+
+
+def _compile_dispatcher(task):
+    """
+    Compile and cache the given signatures of a dispatcher, in a worker
+    process.  All signatures of a dispatcher are handled by the same
+    worker, as its cache index can't be updated concurrently.
+    """
+    modname, qualname, sigs = task
+    disp = getattr(importlib.import_module(modname), qualname)
+    results = []
+    for sig in sigs:
+        args, return_type = sigutils.normalize_signature(sig)
+        label = "%s.%s(%s)" % (modname, qualname,
+                               ", ".join(str(a) for a in args))
+        if tuple(args) in disp.overloads:
+            # Already compiled, e.g. if the module was imported by the
+            # parent process before forking
+            results.append((label, "skipped"))
+            continue
+        hits = sum(disp.stats.cache_hits.values())
+        try:
+            disp.compile(sig)
+        except Exception as e:
+            outcome = "failed: %s: %s" % (type(e).__name__, e)
+        else:
+            if sum(disp.stats.cache_hits.values()) > hits:
+                outcome = "cached"
+            else:
+                outcome = "compiled"
+        results.append((label, outcome))
+    return results
+
+
+def precompile(modules, signatures=None, processes=None):
+    """
+    Compile the signatures of the cache-enabled dispatchers defined in
+    *modules* (a list of module names) across a pool of *processes*,
+    so that the results are written to the dispatchers' caches.
+
+    The signatures compiled are those given to @jit, and those recorded
+    for the dispatchers in *signatures* (see numba.signature_log.read()).
+    A list of ``(function and signature, outcome)`` strings is returned,
+    where the outcome is "compiled", "cached", "skipped" (if the
+    signature was already compiled) or a failure message.
+
+    This is meant to be run in a fresh process: the modules already
+    imported have their @jit signatures compiled, and are reported as
+    "skipped".  The signatures given to @jit in the modules imported
+    here are compiled in this process (from the warmed up caches) once
+    the workers are done.
+    """
+    signatures = signatures or {}
+    tasks = []
+    with _deferred_signatures() as deferred:
+        for modname in modules:
+            module = importlib.import_module(modname)
+            dispatchers = find_cached_dispatchers(module)
+            for qualname, disp in sorted(dispatchers.items()):
+                sigs = list(getattr(disp, '_declared_signatures', ()))
+                sigs += signatures.get((modname, qualname), ())
+                sigs = _unique_signatures(sigs)
+                if sigs:
+                    tasks.append((modname, qualname, sigs))
+
+    results = []
+    try:
+        if tasks:
+            pool = multiprocessing.Pool(processes, initializer=_init_worker)
+            try:
+                for res in pool.imap_unordered(_compile_dispatcher, tasks):
+                    results.extend(res)
+            finally:
+                pool.close()
+                pool.join()
+    finally:
+        _compile_declared_signatures(deferred)
+    return sorted(results)
+
+
+def make_parser():
+    parser = argparse.ArgumentParser(
+        prog="numba precompile",
+        description="Compile the cached functions (cache=True) of the "
+                    "given modules in parallel, to warm up their caches.")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of processes (default: CPU count)')
+    parser.add_argument('--signatures', metavar='FILE',
+                        help='File of signatures recorded by a previous run '
+                             '(see numba.signature_log)')
+    parser.add_argument('modules', nargs='*', metavar='module',
+                        help='Module names (default: the modules in the '
+                             'signatures file)')
+    return parser
+
+
+def main(argv=None):
+    parser = make_parser()
+    args = parser.parse_args(argv)
+
+    signatures = {}
+    if args.signatures:
+        signatures = signature_log.read(args.signatures)
+    modules = args.modules or sorted(set(modname
+                                         for modname, _ in signatures))
+    if not modules:
+        parser.error("no modules to precompile")
+
+    # Like "python -m", allow importing modules from the current directory
+    if os.getcwd() not in sys.path and '' not in sys.path:
+        sys.path.insert(0, os.getcwd())
+
+    failed = False
+    for label, outcome in precompile(modules, signatures, args.jobs):
+        print("%s: %s" % (label, outcome))
+        failed = failed or outcome not in ("compiled", "cached", "skipped")
+    return 1 if failed else 0
@@ -172,6 +172,9 @@ class PythonAPI(object):
             self.py_hash_t = self.py_ssize_t
         else:
             self.py_hash_t = self.long
+        # Whether unboxing can skip checking that all items of a
+        # container have the same type (see the assume_homogeneous option)
+        self.assume_homogeneous = False
 
     def get_env_manager(self, env, env_body, env_ptr):
         return EnvironmentManager(self, env, env_body, env_ptr)
@@ -452,6 +455,11 @@ class PythonAPI(object):
         fn = self._get_function(fnty, name="PyNumber_Long")
         return self.builder.call(fn, [numobj])
 
+    def number_index(self, numobj):
+        fnty = Type.function(self.pyobj, [self.pyobj])
+        fn = self._get_function(fnty, name="PyNumber_Index")
+        return self.builder.call(fn, [numobj])
+
     def long_as_ulonglong(self, numobj):
         fnty = Type.function(self.ulonglong, [self.pyobj])
         fn = self._get_function(fnty, name="PyLong_AsUnsignedLongLong")
@@ -708,6 +716,29 @@ class PythonAPI(object):
         fn = self._get_function(fnty, name="PyList_New")
         return self.builder.call(fn, [szval])
 
+    def list_unbox_floats(self, lst, data, size, convert):
+        """
+        Copy the Python floats in *lst* to the native double array *data*.
+        See numba_unbox_float_list() for the return value.
+        """
+        fnty = Type.function(Type.int(), [self.pyobj, self.double.as_pointer(),
+                                          self.py_ssize_t, Type.int()])
+        fn = self._get_function(fnty, name="numba_unbox_float_list")
+        return self.builder.call(fn, [lst, data, size,
+                                      Type.int()(int(convert))])
+
+    def list_unbox_ints(self, lst, data, size, convert):
+        """
+        Copy the Python ints in *lst* to the native int64 array *data*.
+        See numba_unbox_int_list() for the return value.
+        """
+        fnty = Type.function(Type.int(), [self.pyobj,
+                                          Type.int(64).as_pointer(),
+                                          self.py_ssize_t, Type.int()])
+        fn = self._get_function(fnty, name="numba_unbox_int_list")
+        return self.builder.call(fn, [lst, data, size,
+                                      Type.int()(int(convert))])
+
     def list_size(self, lst):
         fnty = Type.function(self.py_ssize_t, [self.pyobj])
         fn = self._get_function(fnty, name="PyList_Size")
@@ -1134,6 +1165,48 @@ class PythonAPI(object):
         fn = self._get_function(fnty, name=fname)
         return self.builder.call(fn, [string])
 
+    def string_as_utf32(self, strobj):
+        """
+        Return a new bytes object holding the native-endian UTF-32
+        encoding of *strobj*, preceded by a byte order mark.
+        """
+        fnty = Type.function(self.pyobj, [self.pyobj])
+        fn = self._get_function(fnty, name="PyUnicode_AsUTF32String")
+        return self.builder.call(fn, [strobj])
+
+    def string_from_utf32(self, string, size):
+        """
+        Return a new string object decoded from the native-endian UTF-32
+        buffer *string* of *size* code points.
+        """
+        fnty = Type.function(self.pyobj, [self.cstring, self.py_ssize_t,
+                                          self.cstring, Type.int().as_pointer()])
+        fn = self._get_function(fnty, name="PyUnicode_DecodeUTF32")
+        nbytes = self.builder.mul(size, ir.Constant(size.type, 4))
+        return self.builder.call(fn, [self.builder.bitcast(string, self.cstring),
+                                      nbytes,
+                                      ir.Constant(self.cstring, None),
+                                      ir.Constant(Type.int().as_pointer(), None)])
+
+    def bytes_as_string_and_size(self, obj):
+        """
+        Returns a tuple of ``(ok, buffer, length)`` for the bytes
+        object *obj*, as string_as_string_and_size() does for strings.
+        """
+        p_buffer = cgutils.alloca_once(self.builder, self.cstring)
+        p_length = cgutils.alloca_once(self.builder, self.py_ssize_t)
+        fnty = Type.function(lc.Type.int(), [self.pyobj,
+                                             self.cstring.as_pointer(),
+                                             self.py_ssize_t.as_pointer()])
+        if PYVERSION >= (3, 0):
+            fname = "PyBytes_AsStringAndSize"
+        else:
+            fname = "PyString_AsStringAndSize"
+        fn = self._get_function(fnty, name=fname)
+        status = self.builder.call(fn, [obj, p_buffer, p_length])
+        ok = self.builder.icmp_signed("!=", status, ir.Constant(status.type, -1))
+        return (ok, self.builder.load(p_buffer), self.builder.load(p_length))
+
     def bytes_from_string_and_size(self, string, size):
         fnty = Type.function(self.pyobj, [self.cstring, self.py_ssize_t])
         if PYVERSION >= (3, 0):
@@ -1363,12 +1436,14 @@ class PythonAPI(object):
         value = self.context.get_generator_state(self.builder, obj, gen_ptr_ty)
         return NativeValue(value)
 
-    def from_native_generator(self, val, typ, env=None):
+    def from_native_generator(self, val, typ, env=None, typobj=None):
         """
         Make a Numba generator (a _dynfunc.Generator instance) from a
         generator structure pointer *val*.
         *env* is an optional _dynfunc.Environment instance to be wrapped
         in the generator.
+        *typobj* is an optional object exposed as the generator's
+        _numba_type_ attribute.
         """
         llty = self.context.get_data_type(typ)
         assert not llty.is_pointer
@@ -1387,12 +1462,14 @@ class PythonAPI(object):
         else:
             finalizer = Constant.null(Type.pointer(finalizerty))
 
-        # PyObject *numba_make_generator(state_size, initial_state, nextfunc, finalizer, env)
+        # PyObject *numba_make_generator(state_size, initial_state, nextfunc,
+        #                                finalizer, env, numba_type)
         fnty = Type.function(self.pyobj, [self.py_ssize_t,
                                           self.voidptr,
                                           Type.pointer(genfnty),
                                           Type.pointer(finalizerty),
-                                          self.voidptr])
+                                          self.voidptr,
+                                          self.pyobj])
         fn = self._get_function(fnty, name="numba_make_generator")
 
         state_size = ir.Constant(self.py_ssize_t, gen_struct_size)
@@ -1400,9 +1477,12 @@ class PythonAPI(object):
         if env is None:
             env = self.get_null_object()
         env = self.builder.bitcast(env, self.voidptr)
+        if typobj is None:
+            typobj = self.get_null_object()
 
         return self.builder.call(fn,
-                                 (state_size, initial_state, genfn, finalizer, env))
+                                 (state_size, initial_state, genfn, finalizer,
+                                  env, typobj))
 
     def numba_array_adaptor(self, ary, ptr):
         assert not self.context.enable_nrt
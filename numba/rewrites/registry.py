@@ -14,6 +14,12 @@ class Rewrite(object):
         '''
         self.pipeline = pipeline
 
+    def prematch(self, func_ir, typemap, calltypes):
+        '''Overload this method to cheaply rule out the whole function
+        before match() is called on each of its blocks.
+        '''
+        return True
+
     def match(self, func_ir, block, typemap, calltypes):
         '''Overload this method to check an IR block for matching terms in the
         rewrite.
@@ -63,6 +69,9 @@ class RewriteRegistry(object):
         for rewrite_cls in self.rewrites[kind]:
             # Exhaustively apply a rewrite until it stops matching.
             rewrite = rewrite_cls(pipeline)
+            if not rewrite.prematch(func_ir, pipeline.typemap,
+                                    pipeline.calltypes):
+                continue
             work_list = list(blocks.items())
             while work_list:
                 key, block = work_list.pop()
@@ -386,8 +386,24 @@ NRT_adapt_buffer_from_python(Py_buffer *buf, arystruct_t *arystruct)
     npy_intp *p;
 
     if (buf->obj) {
-        /* Allocate new MemInfo only if the buffer has a parent */
-        arystruct->meminfo = meminfo_new_from_pyobject((void*)buf->buf, buf->obj);
+        /* Allocate new MemInfo only if the buffer has a parent.
+           Unless the parent is already a memoryview, the MemInfo owns
+           a memoryview of it rather than the parent itself, so that the
+           export stays active (e.g. a mmap can't be closed or a bytearray
+           resized) as long as the native array is alive, even after *buf*
+           is released. */
+        PyObject *owner = NULL;
+        if (!PyMemoryView_Check(buf->obj)) {
+            owner = PyMemoryView_FromObject(buf->obj);
+            if (owner == NULL)
+                PyErr_Clear();
+        }
+        if (owner == NULL) {
+            owner = buf->obj;
+            Py_INCREF(owner);
+        }
+        arystruct->meminfo = meminfo_new_from_pyobject((void*)buf->buf, owner);
+        Py_DECREF(owner);
     }
     arystruct->data = buf->buf;
     arystruct->itemsize = buf->itemsize;
@@ -398,8 +414,19 @@ NRT_adapt_buffer_from_python(Py_buffer *buf, arystruct_t *arystruct)
         *p = buf->shape[i];
         arystruct->nitems *= buf->shape[i];
     }
-    for (i = 0; i < buf->ndim; i++, p++) {
-        *p = buf->strides[i];
+    if (buf->strides) {
+        for (i = 0; i < buf->ndim; i++, p++) {
+            *p = buf->strides[i];
+        }
+    }
+    else {
+        /* Some exporters (e.g. ctypes) don't fill in the strides of
+           C-contiguous buffers */
+        npy_intp stride = buf->itemsize;
+        for (i = buf->ndim - 1; i >= 0; i--) {
+            p[i] = stride;
+            stride *= buf->shape[i];
+        }
     }
 }
 
@@ -0,0 +1,149 @@
+"""
+Record the signatures compiled by jitted functions to a file, and replay
+them in another process, so that a long-running program can compile
+(or load from the cache) everything it will need before starting work.
+
+The file is a stream of pickled ``(module name, qualified name, argument
+types)`` tuples, which is also understood by ``numba precompile``.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import importlib
+import threading
+import warnings
+
+from .six.moves import cPickle as pickle, queue
+from . import config
+from .errors import NumbaWarning
+
+
+_lock = threading.Lock()
+_log_file = None
+_logged = set()
+
+
+def record(path):
+    """
+    Start appending the signatures compiled by top-level jitted functions
+    to the file at *path*.  Recording can also be enabled with the
+    :envvar:`NUMBA_SIGNATURE_LOG` environment variable.
+    """
+    global _log_file
+    with _lock:
+        if _log_file is not None:
+            _log_file.close()
+        _log_file = open(path, "ab")
+        _logged.clear()
+
+
+def stop():
+    """
+    Stop recording signatures.
+    """
+    global _log_file
+    with _lock:
+        if _log_file is not None:
+            _log_file.close()
+            _log_file = None
+
+
+def log_overload(dispatcher, args):
+    """
+    Record that *dispatcher* was compiled for the argument types *args*,
+    if recording.
+    """
+    if _log_file is None:
+        return
+    func = dispatcher.py_func
+    qualname = getattr(func, '__qualname__', func.__name__)
+    if '<locals>' in qualname:
+        # Can't be looked up again in another process
+        return
+    entry = (func.__module__, qualname, tuple(args))
+    try:
+        data = pickle.dumps(entry, protocol=-1)
+    except Exception:
+        # Some types can't be pickled
+        return
+    with _lock:
+        if _log_file is None or entry in _logged:
+            return
+        _logged.add(entry)
+        _log_file.write(data)
+        _log_file.flush()
+
+
+def read(path):
+    """
+    Read the signatures recorded in the file at *path*.  A dict mapping
+    ``(module name, qualified name)`` to lists of argument types is
+    returned.
+    """
+    signatures = {}
+    with open(path, "rb") as f:
+        while True:
+            try:
+                modname, qualname, args = pickle.load(f)
+            except EOFError:
+                break
+            sigs = signatures.setdefault((modname, qualname), [])
+            if args not in sigs:
+                sigs.append(args)
+    return signatures
+
+
+def replay(path, threads=None):
+    """
+    Compile all signatures recorded in the file at *path*, using the
+    given number of *threads* (by default, the number of CPU cores).
+    Only the typing of some functions overlaps with the machine code
+    generation of others, so the speedup over a single thread is
+    limited (loading from the cache is serialized too).
+    Signatures of functions which can't be found anymore, or which
+    fail compiling, are skipped with a warning.
+    The number of signatures compiled is returned.
+    """
+    from .dispatcher import Dispatcher
+
+    work = queue.Queue()
+    for (modname, qualname), sigs in sorted(read(path).items()):
+        try:
+            disp = getattr(importlib.import_module(modname), qualname)
+        except (ImportError, AttributeError) as e:
+            warnings.warn("cannot replay signatures of %s.%s: %s"
+                          % (modname, qualname, e), NumbaWarning)
+            continue
+        if not isinstance(disp, Dispatcher) or not disp._can_compile:
+            # Signatures given to @jit are compiled at import
+            continue
+        for args in sigs:
+            work.put((disp, args))
+
+    compiled = []
+
+    def worker():
+        while True:
+            try:
+                disp, args = work.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                disp.compile(args)
+            except Exception as e:
+                warnings.warn("cannot replay signature %s of %s: %s"
+                              % (args, disp.py_func, e), NumbaWarning)
+            else:
+                compiled.append(args)
+
+    nthreads = threads or config.NUMBA_DEFAULT_NUM_THREADS
+    workers = [threading.Thread(target=worker) for i in range(nthreads)]
+    for th in workers:
+        th.start()
+    for th in workers:
+        th.join()
+    return len(compiled)
+
+
+if config.SIGNATURE_LOG:
+    record(config.SIGNATURE_LOG)
@@ -4,6 +4,7 @@ Implementation of math operations on Array objects.
 
 from __future__ import print_function, absolute_import, division
 
+import collections
 import math
 
 import numpy as np
@@ -446,79 +447,271 @@ if numpy_version >= (1, 10):
 #----------------------------------------------------------------------------
 # Median and partitioning
 
-@register_jitable
-def _partition(A, low, high):
-    mid = (low + high) >> 1
-    # NOTE: the pattern of swaps below for the pivot choice and the
-    # partitioning gives good results (i.e. regular O(n log n))
-    # on sorted, reverse-sorted, and uniform arrays.  Subtle changes
-    # risk breaking this property.
-
-    # Use median of three {low, middle, high} as the pivot
-    if A[mid] < A[low]:
-        A[low], A[mid] = A[mid], A[low]
-    if A[high] < A[mid]:
-        A[high], A[mid] = A[mid], A[high]
-    if A[mid] < A[low]:
-        A[low], A[mid] = A[mid], A[low]
-    pivot = A[mid]
-
-    A[high], A[mid] = A[mid], A[high]
-    i = low
-    j = high - 1
-    while True:
-        while i < high and A[i] < pivot:
-            i += 1
-        while j >= low and pivot < A[j]:
-            j -= 1
-        if i >= j:
-            break
-        A[i], A[j] = A[j], A[i]
-        i += 1
-        j -= 1
-    # Put the pivot back in its final place (all items before `i`
-    # are smaller than the pivot, all items at/after `i` are larger)
-    A[i], A[high] = A[high], A[i]
-    return i
+SelectImplementation = collections.namedtuple(
+    'SelectImplementation',
+    ('partition', 'median_of_medians', 'linear_select', 'select',
+     'select_two', 'select_multi', 'move_nans_back'))
+
 
 @register_jitable
-def _select(arry, k, low, high):
+def _introselect_depth(n):
     """
-    Select the k'th smallest element in array[low:high + 1].
+    The number of median-of-three partitions allowed on *n* items before
+    switching to median-of-medians pivots.
     """
-    i = _partition(arry, low, high)
-    while i != k:
-        if i < k:
-            low = i + 1
-            i = _partition(arry, low, high)
-        else:
-            high = i - 1
-            i = _partition(arry, low, high)
-    return arry[k]
+    depth = 0
+    while n > 1:
+        depth += 2
+        n >>= 1
+    return depth
 
-@register_jitable
-def _select_two(arry, k, low, high):
-    """
-    Select the k'th and k+1'th smallest elements in array[low:high + 1].
 
-    This is significantly faster than doing two independent selections
-    for k and k+1.
+def make_select_impl(is_argpartition=False):
     """
-    while True:
-        assert high > low  # by construction
-        i = _partition(arry, low, high)
-        if i < k:
-            low = i + 1
-        elif i > k + 1:
-            high = i - 1
-        elif i == k:
-            _select(arry, k + 1, i + 1, high)
-            break
-        else:  # i == k + 1
-            _select(arry, k, low, i - 1)
-            break
+    Make a quickselect implementation working on the index array (for
+    argpartition) or the values themselves.  All functions take an
+    array of keys *A* and a work array *R* holding either indices into
+    *A* or, when not argpartitioning, the keys themselves (*R* is *A*).
+    """
+    if is_argpartition:
+        @register_jitable
+        def GET(A, idx_or_val):
+            return A[idx_or_val]
+
+    else:
+        @register_jitable
+        def GET(A, idx_or_val):
+            return idx_or_val
+
+    @register_jitable
+    def partition_at(A, R, low, high, p):
+        """
+        Partition R[low:high + 1] around the pivot R[p].  The pivot's
+        final index is returned.
+        """
+        pivot = GET(A, R[p])
+        # Temporarily stash the pivot at the end
+        R[high], R[p] = R[p], R[high]
+        i = low
+        j = high - 1
+        while True:
+            while i < high and GET(A, R[i]) < pivot:
+                i += 1
+            while j >= low and pivot < GET(A, R[j]):
+                j -= 1
+            if i >= j:
+                break
+            R[i], R[j] = R[j], R[i]
+            i += 1
+            j -= 1
+        # Put the pivot back in its final place (all items before `i`
+        # are smaller than the pivot, all items at/after `i` are larger)
+        R[i], R[high] = R[high], R[i]
+        return i
+
+    @register_jitable
+    def partition(A, R, low, high):
+        """
+        Partition R[low:high + 1] around a median of three.
+        """
+        mid = (low + high) >> 1
+        # NOTE: the pattern of swaps below for the pivot choice and the
+        # partitioning gives good results (i.e. regular O(n log n))
+        # on sorted, reverse-sorted, and uniform arrays.  Subtle changes
+        # risk breaking this property.
+
+        # Use median of three {low, middle, high} as the pivot
+        if GET(A, R[mid]) < GET(A, R[low]):
+            R[low], R[mid] = R[mid], R[low]
+        if GET(A, R[high]) < GET(A, R[mid]):
+            R[high], R[mid] = R[mid], R[high]
+        if GET(A, R[mid]) < GET(A, R[low]):
+            R[low], R[mid] = R[mid], R[low]
+        return partition_at(A, R, low, high, mid)
+
+    @register_jitable
+    def group_medians(A, R, low, high):
+        """
+        Move the medians of the groups of 5 items of R[low:high + 1] to
+        the front of the range, and return their number.
+        """
+        m = 0
+        for start in range(low, high + 1, 5):
+            stop = min(start + 4, high)
+            # Insertion sort the group
+            for i in range(start + 1, stop + 1):
+                k = R[i]
+                v = GET(A, k)
+                j = i
+                while j > start and v < GET(A, R[j - 1]):
+                    R[j] = R[j - 1]
+                    j -= 1
+                R[j] = k
+            mid = (start + stop) >> 1
+            R[low + m], R[mid] = R[mid], R[low + m]
+            m += 1
+        return m
+
+    @register_jitable
+    def linear_select(A, R, k, low, high):
+        """
+        Move the k'th smallest element of R[low:high + 1] to R[k], in
+        linear time in the worst case (BFPRT).  Each pivot is the median
+        of the group medians, itself selected by a nested selection; the
+        nested selections are kept on an explicit stack, as the functions
+        here can't recurse.
+        """
+        # Each nested range is at most a fifth of the enclosing one
+        stack = np.empty((64, 4), np.intp)
+        stack[0, 0] = k
+        stack[0, 1] = low
+        stack[0, 2] = high
+        stack[0, 3] = -1    # the pivot's index, once selected
+        sp = 1
+        while sp > 0:
+            f = sp - 1
+            k = stack[f, 0]
+            low = stack[f, 1]
+            high = stack[f, 2]
+            if stack[f, 3] >= 0:
+                i = partition_at(A, R, low, high, stack[f, 3])
+                stack[f, 3] = -1
+                if i == k:
+                    low = high = k
+                elif i < k:
+                    low = i + 1
+                else:
+                    high = i - 1
+                stack[f, 1] = low
+                stack[f, 2] = high
+            if high <= low:
+                sp -= 1
+                if sp > 0:
+                    # Done selecting the enclosing range's pivot
+                    stack[sp - 1, 3] = k
+                continue
+            m = group_medians(A, R, low, high)
+            if m == 1:
+                stack[f, 3] = low
+            else:
+                stack[sp, 0] = low + ((m - 1) >> 1)
+                stack[sp, 1] = low
+                stack[sp, 2] = low + m - 1
+                stack[sp, 3] = -1
+                sp += 1
+
+    @register_jitable
+    def median_of_medians(A, R, low, high):
+        """
+        Move the median of the medians of the groups of 5 items of
+        R[low:high + 1] to R[low] and return its index.  Its rank is
+        about between 3/10 and 7/10 of the range regardless of the input
+        order, and it is found in linear time.
+        """
+        m = group_medians(A, R, low, high)
+        k = low + ((m - 1) >> 1)
+        linear_select(A, R, k, low, low + m - 1)
+        R[low], R[k] = R[k], R[low]
+        return low
+
+    @register_jitable
+    def partition_step(A, R, low, high, depth):
+        if depth > 0:
+            return partition(A, R, low, high)
+        else:
+            p = median_of_medians(A, R, low, high)
+            return partition_at(A, R, low, high, p)
+
+    @register_jitable
+    def select(A, R, k, low, high):
+        """
+        Select the k'th smallest element in R[low:high + 1].
+        """
+        depth = _introselect_depth(high - low + 1)
+        while high > low:
+            i = partition_step(A, R, low, high, depth)
+            depth -= 1
+            if i == k:
+                break
+            elif i < k:
+                low = i + 1
+            else:
+                high = i - 1
+        return GET(A, R[k])
+
+    @register_jitable
+    def select_two(A, R, k, low, high):
+        """
+        Select the k'th and k+1'th smallest elements in R[low:high + 1].
+
+        This is significantly faster than doing two independent selections
+        for k and k+1.
+        """
+        depth = _introselect_depth(high - low + 1)
+        while True:
+            assert high > low  # by construction
+            i = partition_step(A, R, low, high, depth)
+            depth -= 1
+            if i < k:
+                low = i + 1
+            elif i > k + 1:
+                high = i - 1
+            elif i == k:
+                select(A, R, k + 1, i + 1, high)
+                break
+            else:  # i == k + 1
+                select(A, R, k, low, i - 1)
+                break
+
+        return GET(A, R[k]), GET(A, R[k + 1])
+
+    @register_jitable
+    def select_multi(A, R, kth, low, high):
+        """
+        Select the k'th smallest elements in R[low:high + 1] for all k
+        in the sorted array *kth*, relative to *low*.  Each selection
+        only needs to look at the items above the previous one.
+        """
+        start = low
+        for k in kth:
+            k += low
+            if k > high:
+                break
+            if k >= start:
+                select(A, R, k, start, high)
+                start = k + 1
+
+    @register_jitable
+    def move_nans_back(A, R, low, high):
+        """
+        Move NaNs in R[low:high + 1] to the end of the range, and return
+        the index of the last non-NaN item.  Only valid for floats.
+        """
+        i = low
+        j = high
+        while i <= j:
+            if np.isnan(GET(A, R[i])):
+                R[i], R[j] = R[j], R[i]
+                j -= 1
+            else:
+                i += 1
+        return j
+
+    return SelectImplementation(partition, median_of_medians, linear_select,
+                                select, select_two, select_multi,
+                                move_nans_back)
+
+
+_sel = make_select_impl()
+_select = _sel.select
+_select_two = _sel.select_two
+_select_multi = _sel.select_multi
+_move_nans_back = _sel.move_nans_back
+
+_argsel = make_select_impl(is_argpartition=True)
+_argselect_multi = _argsel.select_multi
+_arg_move_nans_back = _argsel.move_nans_back
 
-    return arry[k], arry[k + 1]
 
 @register_jitable
 def _median_inner(temp_arry, n):
@@ -530,10 +723,10 @@ def _median_inner(temp_arry, n):
     high = n - 1
     half = n >> 1
     if n & 1 == 0:
-        a, b = _select_two(temp_arry, half - 1, low, high)
+        a, b = _select_two(temp_arry, temp_arry, half - 1, low, high)
         return (a + b) / 2
     else:
-        return _select(temp_arry, half, low, high)
+        return _select(temp_arry, temp_arry, half, low, high)
 
 @overload(np.median)
 def np_median(a):
@@ -570,6 +763,230 @@ if numpy_version >= (1, 9):
         return nanmedian_impl
 
 
+@register_jitable
+def _no_nans_back(A, R, low, high):
+    return high
+
+def _get_nans_back(dtype, is_argpartition=False):
+    """
+    A function moving NaNs to the end of a range, for the given dtype.
+    """
+    if isinstance(dtype, types.Float):
+        if is_argpartition:
+            return _arg_move_nans_back
+        return _move_nans_back
+    else:
+        return _no_nans_back
+
+def _make_kth_normalizer(kth):
+    """
+    Make a function converting *kth* to a sorted array of non-negative
+    indices into an axis of the given length.
+    """
+    @register_jitable
+    def check_kth(k, n):
+        if k < 0:
+            k += n
+        if k < 0 or k >= n:
+            raise ValueError("kth out of bounds")
+        return k
+
+    if isinstance(kth, types.Integer):
+        def normalize_kth(kth, n):
+            res = np.empty(1, np.intp)
+            res[0] = check_kth(kth, n)
+            return res
+
+    elif (isinstance(kth, (types.Array, types.UniTuple, types.List)) and
+          isinstance(kth.dtype, types.Integer) and
+          getattr(kth, 'ndim', 1) == 1):
+        def normalize_kth(kth, n):
+            res = np.empty(len(kth), np.intp)
+            i = 0
+            for k in kth:
+                res[i] = check_kth(k, n)
+                i += 1
+            res.sort()
+            return res
+
+    else:
+        return None
+
+    return register_jitable(normalize_kth)
+
+@overload(np.partition)
+def np_partition(a, kth):
+    if not isinstance(a, types.Array) or a.ndim == 0:
+        return
+    normalize_kth = _make_kth_normalizer(kth)
+    if normalize_kth is None:
+        return
+    nans_back = _get_nans_back(a.dtype)
+
+    def partition_impl(a, kth):
+        # Partition each item along the last axis, NaNs last
+        out = a.copy()
+        n = a.shape[-1]
+        kth = normalize_kth(kth, n)
+        if n == 0:
+            return out
+        flat = out.reshape(out.size)
+        for low in range(0, out.size, n):
+            high = nans_back(flat, flat, low, low + n - 1)
+            _select_multi(flat, flat, kth, low, high)
+        return out
+
+    return partition_impl
+
+@overload(np.argpartition)
+def np_argpartition(a, kth):
+    if not isinstance(a, types.Array) or a.ndim == 0:
+        return
+    normalize_kth = _make_kth_normalizer(kth)
+    if normalize_kth is None:
+        return
+    nans_back = _get_nans_back(a.dtype, is_argpartition=True)
+
+    def argpartition_impl(a, kth):
+        keys = a.ravel()
+        out = np.empty(a.shape, np.intp)
+        n = a.shape[-1]
+        kth = normalize_kth(kth, n)
+        if n == 0:
+            return out
+        # Partition indices into the flattened keys, then make them
+        # relative to their own axis
+        idx = out.reshape(out.size)
+        for low in range(0, out.size, n):
+            for i in range(low, low + n):
+                idx[i] = i
+            high = nans_back(keys, idx, low, low + n - 1)
+            _argselect_multi(keys, idx, kth, low, high)
+            for i in range(low, low + n):
+                idx[i] -= low
+        return out
+
+    return argpartition_impl
+
+@register_jitable
+def _quantiles_inner(temp_arry, n, q, scale):
+    """
+    Compute the quantiles *q* (in [0, scale]) of the first *n* items of
+    *temp_arry*, using linear interpolation as Numpy does.  *temp_arry*
+    must be disposable, as this function will mutate it.
+    """
+    out = np.empty(len(q), np.float64)
+    if n == 0:
+        for i in range(len(q)):
+            out[i] = np.nan
+        return out
+
+    # Select all the order statistics needed in a single pass
+    kth = np.empty(2 * len(q), np.intp)
+    for i in range(len(q)):
+        index = q[i] / scale * (n - 1)
+        below = int(np.floor(index))
+        kth[2 * i] = below
+        kth[2 * i + 1] = min(below + 1, n - 1)
+    kth.sort()
+    _select_multi(temp_arry, temp_arry, kth, 0, n - 1)
+
+    for i in range(len(q)):
+        index = q[i] / scale * (n - 1)
+        below = int(np.floor(index))
+        above = min(below + 1, n - 1)
+        weight_above = index - below
+        weight_below = 1.0 - weight_above
+        out[i] = (temp_arry[below] * weight_below +
+                  temp_arry[above] * weight_above)
+    return out
+
+def _make_quantile_impl(a, q, scale, skip_nans):
+    """
+    Make an implementation of percentile()-like functions over the
+    flattened array *a*.  *scale* is the value of q for the maximum.
+    """
+    if not isinstance(a, types.Array):
+        return
+    if not (isinstance(q, types.Number) or
+            (isinstance(q, (types.Array, types.UniTuple, types.List)) and
+             isinstance(q.dtype, (types.Integer, types.Float)))):
+        return
+    nans_back = _get_nans_back(a.dtype)
+
+    @register_jitable
+    def check_q(v):
+        if not (v >= 0 and v <= scale):
+            if scale == 100.0:
+                raise ValueError("Percentiles must be in the range [0,100]")
+            else:
+                raise ValueError("Quantiles must be in the range [0,1]")
+
+    @register_jitable
+    def check_not_empty(n):
+        # As in Numpy, the NaN-ignoring variants return NaN instead
+        if n == 0 and not skip_nans:
+            if scale == 100.0:
+                raise ValueError("Cannot compute percentiles of an empty "
+                                 "array")
+            else:
+                raise ValueError("Cannot compute quantiles of an empty array")
+
+    @register_jitable
+    def quantiles(a, q):
+        temp_arry = a.flatten()
+        n = temp_arry.size
+        check_not_empty(n)
+        last = nans_back(temp_arry, temp_arry, 0, n - 1)
+        if last < n - 1 and not skip_nans:
+            # Any NaN makes all results NaN
+            return _quantiles_inner(temp_arry, 0, q, scale)
+        return _quantiles_inner(temp_arry, last + 1, q, scale)
+
+    if isinstance(q, types.Number):
+        def quantile_impl(a, q):
+            check_q(q)
+            qs = np.empty(1, np.float64)
+            qs[0] = q
+            return quantiles(a, qs)[0]
+    elif isinstance(q, types.Array):
+        def quantile_impl(a, q):
+            for v in np.nditer(q):
+                check_q(v.item())
+            qs = q.flatten().astype(np.float64)
+            return quantiles(a, qs).reshape(q.shape)
+    else:
+        def quantile_impl(a, q):
+            for v in q:
+                check_q(v)
+            qs = np.empty(len(q), np.float64)
+            i = 0
+            for v in q:
+                qs[i] = v
+                i += 1
+            return quantiles(a, qs)
+
+    return quantile_impl
+
+@overload(np.percentile)
+def np_percentile(a, q):
+    return _make_quantile_impl(a, q, scale=100.0, skip_nans=False)
+
+if numpy_version >= (1, 9):
+    @overload(np.nanpercentile)
+    def np_nanpercentile(a, q):
+        return _make_quantile_impl(a, q, scale=100.0, skip_nans=True)
+
+if numpy_version >= (1, 15):
+    @overload(np.quantile)
+    def np_quantile(a, q):
+        return _make_quantile_impl(a, q, scale=1.0, skip_nans=False)
+
+    @overload(np.nanquantile)
+    def np_nanquantile(a, q):
+        return _make_quantile_impl(a, q, scale=1.0, skip_nans=True)
+
+
 #----------------------------------------------------------------------------
 # Element-wise computations
 
@@ -1193,3 +1610,134 @@ def np_histogram(a, bins=10, range=None):
             return hist, bins
 
     return histogram_impl
+
+
+#----------------------------------------------------------------------------
+# Convolution and correlation
+
+# The output is computed in blocks of this size, each of which stays in
+# cache while the kernel is applied to it.
+CORRELATE_BLOCK_SIZE = 1024
+
+@register_jitable
+def _correlate_range(a, v, out, start):
+    """
+    Store items [start, start + len(out)) of the full correlation of
+    the 1-d arrays *a* and *v* (without conjugation) into *out*.
+    """
+    n = len(a)
+    m = len(v)
+    out[:] = 0
+    for i0 in range(0, len(out), CORRELATE_BLOCK_SIZE):
+        i1 = min(i0 + CORRELATE_BLOCK_SIZE, len(out))
+        # Add the contributions of each kernel item in turn: the inner
+        # loop doesn't carry a dependency and can be vectorized.
+        for j in range(m):
+            # a[start - m + 1 + j + i] is in bounds for
+            # m - 1 - j - start <= i < n + m - 1 - j - start
+            lo = max(i0, m - 1 - j - start)
+            hi = min(i1, n + m - 1 - j - start)
+            if lo >= hi:
+                continue
+            offset = start - m + 1 + j
+            # Looping over slices helps LLVM vectorize
+            dest = out[lo:hi]
+            src = a[offset + lo:offset + hi]
+            vj = v[j]
+            for i in range(hi - lo):
+                dest[i] += src[i] * vj
+
+
+def _get_correlate_mode(mode):
+    if isinstance(mode, types.Const):
+        mode = mode.value
+    if mode not in ('full', 'same', 'valid'):
+        raise ValueError("mode must be one of 'valid', 'same', or 'full'")
+    return mode
+
+
+def _make_correlate_impl(a, v, mode, is_convolve):
+    """
+    Make the implementation of np.convolve() or np.correlate() for the
+    given types.  Like Numpy, the output of the "same" and "valid" modes
+    is a slice of the full output.
+    """
+    for arg in (a, v):
+        if not isinstance(arg, types.Array) or arg.ndim != 1:
+            return
+        if not isinstance(arg.dtype, types.Number):
+            return
+    mode = _get_correlate_mode(mode)
+    dtype = np.promote_types(as_dtype(a.dtype), as_dtype(v.dtype))
+    conjugate = not is_convolve and isinstance(v.dtype, types.Complex)
+
+    if is_convolve:
+        @register_jitable
+        def prepare_kernel(v):
+            return v[::-1].copy()
+    elif conjugate:
+        @register_jitable
+        def prepare_kernel(v):
+            return np.conj(v)
+    else:
+        @register_jitable
+        def prepare_kernel(v):
+            return v
+
+    # The (start, length) of the output in the full output
+    if mode == 'full':
+        @register_jitable
+        def output_range(n, m):
+            return 0, n + m - 1
+    elif mode == 'same':
+        # np.correlate() is computed with the longest array first and
+        # reversed if necessary; np.convolve() is symmetric.
+        @register_jitable
+        def output_range(n, m):
+            if is_convolve or n >= m:
+                start = (min(n, m) - 1) // 2
+            else:
+                start = n // 2
+            return start, max(n, m)
+    else:
+        @register_jitable
+        def output_range(n, m):
+            return min(n, m) - 1, abs(n - m) + 1
+
+    def correlate_impl(a, v):
+        n = len(a)
+        m = len(v)
+        if n == 0:
+            raise ValueError("a cannot be empty")
+        if m == 0:
+            raise ValueError("v cannot be empty")
+        start, length = output_range(n, m)
+        out = np.empty(length, dtype)
+        _correlate_range(a, prepare_kernel(v), out, start)
+        return out
+
+    return register_jitable(correlate_impl)
+
+
+@overload(np.convolve)
+def np_convolve(a, v, mode='full'):
+    correlate = _make_correlate_impl(a, v, mode, is_convolve=True)
+    if correlate is None:
+        return
+
+    def convolve_impl(a, v, mode='full'):
+        return correlate(a, v)
+
+    return convolve_impl
+
+
+@overload(np.correlate)
+def np_correlate(a, v, mode='valid'):
+    correlate = _make_correlate_impl(a, v, mode, is_convolve=False)
+    if correlate is None:
+        return
+
+    def correlate_impl(a, v, mode='valid'):
+        return correlate(a, v)
+
+    return correlate_impl
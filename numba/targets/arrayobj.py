@@ -15,7 +15,7 @@ from llvmlite.llvmpy.core import Constant
 import numpy as np
 
 from numba import types, cgutils, typing, utils, extending
-from numba.numpy_support import as_dtype, carray, farray
+from numba.numpy_support import as_dtype, carray, farray, columnarize
 from numba.numpy_support import version as numpy_version
 from numba.targets.imputils import (lower_builtin, lower_getattr,
                                     lower_getattr_generic,
@@ -25,7 +25,7 @@ from numba.targets.imputils import (lower_builtin, lower_getattr,
                                     impl_ret_new_ref, impl_ret_untracked)
 from numba.typing import signature
 from numba.extending import register_jitable
-from . import quicksort, slicing
+from . import quicksort, parallelsort, slicing
 
 
 def set_range_metadata(builder, load, lower_bound, upper_bound):
@@ -561,6 +561,13 @@ class Indexer(object):
         """
         raise NotImplementedError
 
+    def get_exact_index_bounds(self):
+        """
+        Like get_index_bounds(), but the range may be narrowed down at the
+        expense of scanning the indices.
+        """
+        return self.get_index_bounds()
+
     def loop_head(self):
         """
         Start indexation loop.  Return a (index, count) tuple.
@@ -691,6 +698,28 @@ class IntegerArrayIndexer(Indexer):
         # Pessimal heuristic, as we don't want to scan for the min and max
         return (self.ll_intp(0), self.size)
 
+    def get_exact_index_bounds(self):
+        builder = self.builder
+        lower = cgutils.alloca_once_value(builder, self.size)
+        upper = cgutils.alloca_once_value(builder, self.ll_intp(0))
+        # Scan for the min and max
+        with cgutils.for_range(builder, self.idx_size) as loop:
+            index = _getitem_array1d(self.context, builder,
+                                     self.idxty, self.idxary,
+                                     loop.index, wraparound=False)
+            index = fix_integer_index(self.context, builder,
+                                      self.idxty.dtype, index, self.size)
+            cur = builder.load(lower)
+            builder.store(builder.select(builder.icmp_signed('<', index, cur),
+                                         index, cur),
+                          lower)
+            index = cgutils.increment_index(builder, index)
+            cur = builder.load(upper)
+            builder.store(builder.select(builder.icmp_signed('>', index, cur),
+                                         index, cur),
+                          upper)
+        return builder.load(lower), builder.load(upper)
+
     def loop_head(self):
         builder = self.builder
         # Initialize loop variable
@@ -763,6 +792,25 @@ class BooleanArrayIndexer(Indexer):
         # first and last true items
         return (self.ll_intp(0), self.size)
 
+    def get_exact_index_bounds(self):
+        builder = self.builder
+        lower = cgutils.alloca_once_value(builder, self.size)
+        upper = cgutils.alloca_once_value(builder, self.zero)
+        # Scan for the first and last true items
+        with cgutils.for_range(builder, self.size) as loop:
+            pred = _getitem_array1d(self.context, builder,
+                                    self.idxty, self.idxary,
+                                    loop.index, wraparound=False)
+            with builder.if_then(pred):
+                cur = builder.load(lower)
+                builder.store(builder.select(
+                    builder.icmp_signed('<', loop.index, cur),
+                    loop.index, cur),
+                    lower)
+                builder.store(cgutils.increment_index(builder, loop.index),
+                              upper)
+        return builder.load(lower), builder.load(upper)
+
     def loop_head(self):
         builder = self.builder
         # Initialize loop variable
@@ -932,20 +980,32 @@ class FancyIndexer(object):
     def prepare(self):
         for i in self.indexers:
             i.prepare()
-        # Compute the resulting shape
-        self.indexers_shape = sum([i.get_shape() for i in self.indexers], ())
+        self.indexers_shape = None
 
     def get_shape(self):
         """
-        Get the resulting data shape as Python tuple.
+        Get the resulting data shape as Python tuple.  It is computed on
+        the first call, as a boolean array index needs counting its true
+        items: that call must dominate all uses of the shape.
         """
+        if self.indexers_shape is None:
+            self.indexers_shape = sum([i.get_shape() for i in self.indexers],
+                                      ())
         return self.indexers_shape
 
-    def get_offset_bounds(self, strides, itemsize):
+    def has_array_indexers(self):
+        """
+        Whether any dimension is indexed with an array.
+        """
+        return any(isinstance(i, (IntegerArrayIndexer, BooleanArrayIndexer))
+                   for i in self.indexers)
+
+    def get_offset_bounds(self, strides, itemsize, exact=False):
         """
         Get a half-open [lower, upper) range of byte offsets spanned by
         the indexer with the given strides and itemsize.  The indexer is
-        guaranteed to not go past those bounds.
+        guaranteed to not go past those bounds.  If *exact* is true, the
+        index arrays are scanned to narrow down the range.
         """
         assert len(strides) == self.aryty.ndim
         builder = self.builder
@@ -954,12 +1014,15 @@ class FancyIndexer(object):
         one = self.ll_intp(1)
         lower = zero
         upper = zero
-        for indexer, shape, stride in zip(self.indexers, self.indexers_shape,
+        for indexer, shape, stride in zip(self.indexers, self.get_shape(),
                                           strides):
             is_empty = builder.or_(is_empty,
                                    builder.icmp_unsigned('==', shape, zero))
             # Compute [lower, upper) indices on this dimension
-            lower_index, upper_index = indexer.get_index_bounds()
+            if exact:
+                lower_index, upper_index = indexer.get_exact_index_bounds()
+            else:
+                lower_index, upper_index = indexer.get_index_bounds()
             lower_offset = builder.mul(stride, lower_index)
             upper_offset = builder.mul(stride, builder.sub(upper_index, one))
             # Adjust total interval
@@ -1120,6 +1183,38 @@ def extents_may_overlap(context, builder, a_start, a_end, b_start, b_end):
     return may_overlap
 
 
+def arrays_may_overlap(context, builder, aty, a, bty, b):
+    """
+    Whether the data of arrays *a* and *b* may overlap.
+    """
+    def extents(arrty, arr):
+        shapes = cgutils.unpack_tuple(builder, arr.shape)
+        strides = cgutils.unpack_tuple(builder, arr.strides)
+        return get_array_memory_extents(context, builder, arrty, arr,
+                                        shapes, strides, arr.data)
+
+    a_start, a_end = extents(aty, a)
+    b_start, b_end = extents(bty, b)
+    return extents_may_overlap(context, builder, a_start, a_end,
+                               b_start, b_end)
+
+
+def arrays_are_same_view(context, builder, aty, a, bty, b):
+    """
+    Whether arrays *a* and *b* have the same items at the same positions.
+    """
+    if aty.ndim != bty.ndim:
+        return cgutils.false_bit
+    same = builder.icmp_unsigned('==', builder.ptrtoint(a.data, cgutils.intp_t),
+                                 builder.ptrtoint(b.data, cgutils.intp_t))
+    for attr in ('shape', 'strides'):
+        a_values = cgutils.unpack_tuple(builder, getattr(a, attr))
+        b_values = cgutils.unpack_tuple(builder, getattr(b, attr))
+        for u, v in zip(a_values, b_values):
+            same = builder.and_(same, builder.icmp_signed('==', u, v))
+    return same
+
+
 def maybe_copy_source(context, builder, use_copy,
                       srcty, src, src_shapes, src_strides, src_data):
     ptrty = src_data.type
@@ -1308,11 +1403,22 @@ def fancy_setslice(context, builder, sig, args, index_types, indices):
         src_start, src_end = get_array_memory_extents(context, builder, srcty, src,
                                                       src_shapes, src_strides, src_data)
 
-        dest_lower, dest_upper = indexer.get_offset_bounds(dest_strides, ary.itemsize)
-        dest_start, dest_end = compute_memory_extents(context, builder,
-                                                      dest_lower, dest_upper, dest_data)
-
-        use_copy = extents_may_overlap(context, builder, src_start, src_end, dest_start, dest_end)
+        def dest_may_overlap(exact):
+            dest_lower, dest_upper = indexer.get_offset_bounds(
+                dest_strides, ary.itemsize, exact=exact)
+            dest_start, dest_end = compute_memory_extents(
+                context, builder, dest_lower, dest_upper, dest_data)
+            return extents_may_overlap(context, builder, src_start, src_end,
+                                       dest_start, dest_end)
+
+        use_copy = dest_may_overlap(exact=False)
+        if indexer.has_array_indexers():
+            # The index arrays are only scanned if the cheap estimate
+            # of the destination's extent overlaps the source.
+            use_copy_ptr = cgutils.alloca_once_value(builder, use_copy)
+            with builder.if_then(use_copy, likely=False):
+                builder.store(dest_may_overlap(exact=True), use_copy_ptr)
+            use_copy = builder.load(use_copy_ptr)
 
         src_getitem, src_cleanup = maybe_copy_source(context, builder, use_copy,
                                                      srcty, src, src_shapes,
@@ -3639,6 +3745,25 @@ def np_cfarray(context, builder, sig, args):
     return impl_ret_new_ref(context, builder, sig.return_type, res)
 
 
+@lower_builtin(columnarize, types.Array)
+def np_columnarize(context, builder, sig, args):
+    """
+    numba.numpy_support.columnarize(...): copy each field of a structured
+    array into a new C-contiguous array.
+    """
+    aryty, = sig.args
+    ary, = args
+    columns = []
+    for name, colty in zip(aryty.dtype.dtype.names, sig.return_type):
+        view = array_record_getattr(context, builder, aryty, ary, name)
+        viewty = aryty.copy(dtype=colty.dtype, layout='A')
+        col = _array_copy(context, builder, signature(colty, viewty), [view])
+        context.nrt.decref(builder, viewty, view)
+        columns.append(col)
+    res = context.make_tuple(builder, sig.return_type, columns)
+    return impl_ret_new_ref(context, builder, sig.return_type, res)
+
+
 def _get_seq_size(context, builder, seqty, seq):
     if isinstance(seqty, types.BaseTuple):
         return context.get_constant(types.intp, len(seqty))
@@ -4320,24 +4445,39 @@ _sorts = {}
 def lt_floats(a, b):
     return math.isnan(b) or a < b
 
-def get_sort_func(is_float, is_argsort=False):
+def get_sort_func(is_float, is_argsort=False, is_parallel=False):
     """
     Get a sort implementation of the given kind.
     """
-    key = is_float, is_argsort
+    key = is_float, is_argsort, is_parallel
     try:
         return _sorts[key]
     except KeyError:
-        sort = quicksort.make_jit_quicksort(lt=lt_floats if is_float else None,
-                                            is_argsort=is_argsort)
-        func = _sorts[key] = sort.run_quicksort
+        lt = lt_floats if is_float else None
+        if is_parallel:
+            sort = parallelsort.make_jit_parallel_sort(lt=lt,
+                                                       is_argsort=is_argsort)
+            func = _sorts[key] = sort.run_parallel_sort
+        else:
+            sort = quicksort.make_jit_quicksort(lt=lt, is_argsort=is_argsort)
+            func = _sorts[key] = sort.run_quicksort
         return func
 
+def use_parallel_sort(context):
+    """
+    Whether sorts lowered in *context* should use the parallel sort.
+    Inside a parfor body (i.e. already on a worker thread) the serial
+    sort is always used.
+    """
+    from numba import parfor
+    return context.auto_parallel and not parfor.sequential_parfor_lowering
+
 
 @lower_builtin("array.sort", types.Array)
 def array_sort(context, builder, sig, args):
     arytype = sig.args[0]
-    sort_func = get_sort_func(is_float=isinstance(arytype.dtype, types.Float))
+    sort_func = get_sort_func(is_float=isinstance(arytype.dtype, types.Float),
+                              is_parallel=use_parallel_sort(context))
 
     def array_sort_impl(arr):
         # Note we clobber the return value
@@ -4347,10 +4487,13 @@ def array_sort(context, builder, sig, args):
 
 @lower_builtin(np.sort, types.Array)
 def np_sort(context, builder, sig, args):
+    arytype = sig.args[0]
+    sort_func = get_sort_func(is_float=isinstance(arytype.dtype, types.Float),
+                              is_parallel=use_parallel_sort(context))
 
     def np_sort_impl(a):
         res = a.copy()
-        res.sort()
+        sort_func(res)
         return res
 
     return context.compile_internal(builder, np_sort_impl, sig, args)
@@ -4360,7 +4503,8 @@ def np_sort(context, builder, sig, args):
 def array_argsort(context, builder, sig, args):
     arytype = sig.args[0]
     sort_func = get_sort_func(is_float=isinstance(arytype.dtype, types.Float),
-                              is_argsort=True)
+                              is_argsort=True,
+                              is_parallel=use_parallel_sort(context))
 
     def array_argsort_impl(arr):
         return sort_func(arr)
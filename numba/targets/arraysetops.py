@@ -0,0 +1,263 @@
+"""
+Implementation of the routines of numpy.lib.arraysetops: unique(),
+in1d(), isin(), intersect1d() and union1d().
+
+Two strategies are used to find the distinct values of an array.  The
+sort-based one follows Numpy and sorts the whole input.  The hash-based
+one collects the distinct values in a nopython set (see setobj.py) and
+only sorts those, which is much cheaper when the input has many
+duplicates.  np.unique() uses the former, np.in1d() and np.isin() the
+latter; numba.numpy_extensions lets the caller choose and also exposes
+the counts and inverse indices.
+"""
+
+from __future__ import print_function, absolute_import, division
+
+import numpy as np
+
+from numba import types
+from numba.extending import overload, register_jitable
+from numba.numpy_support import version as numpy_version, from_dtype, as_dtype
+
+
+def _is_set_operand(a):
+    return (isinstance(a, types.Array) and
+            isinstance(a.dtype, (types.Boolean, types.Integer, types.Float)))
+
+
+#----------------------------------------------------------------------------
+# Distinct values
+#
+# Like Numpy, NaNs never compare equal so each of them is a distinct value.
+# They sort last; they are also kept out of the hash sets, as they would
+# all collide on the same hash.
+
+@register_jitable
+def _unique_sorted(ar):
+    """
+    The sorted distinct values of *ar*, found by sorting.
+    """
+    b = ar.flatten()
+    b.sort()
+    n = b.size
+    if n == 0:
+        return b
+    nuniq = 1
+    for i in range(1, n):
+        if b[i] != b[i - 1]:
+            nuniq += 1
+    out = np.empty(nuniq, b.dtype)
+    out[0] = b[0]
+    j = 1
+    for i in range(1, n):
+        if b[i] != b[i - 1]:
+            out[j] = b[i]
+            j += 1
+    return out
+
+
+@register_jitable
+def _unique_hashed(ar):
+    """
+    The sorted distinct values of *ar*, found by hashing.
+    """
+    s = set()
+    nnans = 0
+    for v in ar.flat:
+        if v != v:
+            nnans += 1
+        else:
+            s.add(v)
+    nvals = len(s)
+    out = np.empty(nvals + nnans, ar.dtype)
+    i = 0
+    for v in s:
+        out[i] = v
+        i += 1
+    out[:nvals].sort()
+    if nnans:
+        for v in ar.flat:
+            if v != v:
+                out[i] = v
+                i += 1
+    return out
+
+
+@register_jitable
+def _first_nan_group(values):
+    """
+    The position of the first NaN in the sorted distinct *values*.
+    """
+    g = values.size
+    while g > 0 and values[g - 1] != values[g - 1]:
+        g -= 1
+    return g
+
+
+@register_jitable
+def _unique_all_sorted(ar):
+    """
+    Sort-based unique() with the indices of the first occurrences, the
+    inverse indices and the counts.
+    """
+    b = ar.flatten()
+    n = b.size
+    perm = np.argsort(b)
+    nuniq = 0
+    for i in range(n):
+        if i == 0 or b[perm[i]] != b[perm[i - 1]]:
+            nuniq += 1
+    values = np.empty(nuniq, b.dtype)
+    index = np.empty(nuniq, np.intp)
+    inverse = np.empty(n, np.intp)
+    counts = np.zeros(nuniq, np.intp)
+    g = -1
+    for i in range(n):
+        j = perm[i]
+        v = b[j]
+        if i == 0 or v != b[perm[i - 1]]:
+            g += 1
+            values[g] = v
+            index[g] = j
+        elif j < index[g]:
+            index[g] = j
+        inverse[j] = g
+        counts[g] += 1
+    # The sort is not stable: put the NaNs back in order of appearance
+    g = _first_nan_group(values)
+    if g < nuniq:
+        for j in range(n):
+            if b[j] != b[j]:
+                index[g] = j
+                inverse[j] = g
+                g += 1
+    return values, index, inverse, counts
+
+
+@register_jitable
+def _unique_all_hashed(ar):
+    """
+    Hash-based unique() with the indices of the first occurrences, the
+    inverse indices and the counts.  Without a typed mapping, the group
+    of each element is found by bisecting the distinct values.
+    """
+    values = _unique_hashed(ar)
+    b = ar.ravel()
+    n = b.size
+    nuniq = values.size
+    nvals = _first_nan_group(values)
+    index = np.full(nuniq, -1, np.intp)
+    inverse = np.empty(n, np.intp)
+    counts = np.zeros(nuniq, np.intp)
+    nan_group = nvals
+    for j in range(n):
+        v = b[j]
+        if v != v:
+            g = nan_group
+            nan_group += 1
+        else:
+            g = np.searchsorted(values[:nvals], v)
+        if index[g] < 0:
+            index[g] = j
+        inverse[j] = g
+        counts[g] += 1
+    return values, index, inverse, counts
+
+
+@overload(np.unique)
+def np_unique(ar):
+    if not _is_set_operand(ar):
+        return
+
+    def np_unique_impl(ar):
+        return _unique_sorted(ar)
+
+    return np_unique_impl
+
+
+#----------------------------------------------------------------------------
+# Membership
+
+def _common_type(ar1, ar2):
+    return from_dtype(np.promote_types(as_dtype(ar1.dtype),
+                                       as_dtype(ar2.dtype)))
+
+
+def _make_in1d(ar1, ar2):
+    """
+    Make a hash-based in1d() for the given array types.  Both operands
+    are converted to their common type, so that e.g. integers can be
+    looked up amongst floats.
+    """
+    dt = _common_type(ar1, ar2)
+
+    def in1d(ar1, ar2, invert):
+        s = set()
+        for v in ar2.flat:
+            # NaNs never match
+            if v == v:
+                s.add(dt(v))
+        out = np.empty(ar1.size, np.bool_)
+        i = 0
+        for v in ar1.flat:
+            out[i] = (dt(v) in s) != invert
+            i += 1
+        return out
+
+    return register_jitable(in1d)
+
+
+@overload(np.in1d)
+def np_in1d(ar1, ar2, assume_unique=False, invert=False):
+    if not (_is_set_operand(ar1) and _is_set_operand(ar2)):
+        return
+    in1d = _make_in1d(ar1, ar2)
+
+    def np_in1d_impl(ar1, ar2, assume_unique=False, invert=False):
+        return in1d(ar1, ar2, invert)
+
+    return np_in1d_impl
+
+
+if numpy_version >= (1, 13):
+    @overload(np.isin)
+    def np_isin(element, test_elements, assume_unique=False, invert=False):
+        if not (_is_set_operand(element) and _is_set_operand(test_elements)):
+            return
+        in1d = _make_in1d(element, test_elements)
+
+        def np_isin_impl(element, test_elements, assume_unique=False,
+                         invert=False):
+            return in1d(element, test_elements, invert).reshape(element.shape)
+
+        return np_isin_impl
+
+
+#----------------------------------------------------------------------------
+# Set operations
+
+@overload(np.intersect1d)
+def np_intersect1d(ar1, ar2, assume_unique=False):
+    if not (_is_set_operand(ar1) and _is_set_operand(ar2)):
+        return
+
+    def np_intersect1d_impl(ar1, ar2, assume_unique=False):
+        if assume_unique:
+            aux = np.concatenate((ar1.ravel(), ar2.ravel()))
+        else:
+            aux = np.concatenate((_unique_sorted(ar1), _unique_sorted(ar2)))
+        aux.sort()
+        return aux[:-1][aux[1:] == aux[:-1]]
+
+    return np_intersect1d_impl
+
+
+@overload(np.union1d)
+def np_union1d(ar1, ar2):
+    if not (_is_set_operand(ar1) and _is_set_operand(ar2)):
+        return
+
+    def np_union1d_impl(ar1, ar2):
+        return _unique_sorted(np.concatenate((ar1.ravel(), ar2.ravel())))
+
+    return np_union1d_impl
@@ -14,7 +14,7 @@ from llvmlite.llvmpy.core import Type, Constant, LLVMException
 import llvmlite.binding as ll
 
 from numba import llvmthreadsafe as llvmts
-from numba import types, utils, cgutils, typing, funcdesc, debuginfo
+from numba import types, utils, cgutils, typing, funcdesc, debuginfo, config
 from numba import _dynfunc, _helperlib
 from numba.pythonapi import PythonAPI
 from . import arrayobj, builtins, imputils
@@ -217,6 +217,9 @@ class BaseContext(object):
     # Fast math flags
     enable_fastmath = False
 
+    # Whether compile_subroutine() results can be persisted on disk
+    cache_subroutines = False
+
     # python exceution environment
     environment = None
 
@@ -256,9 +259,9 @@ class BaseContext(object):
         Useful for third-party extensions.
         """
         # Populate built-in registry
-        from . import (arraymath, enumimpl, iterators, linalg, numbers,
-                       optional, polynomial, rangeobj, slicing, smartarray,
-                       tupleobj)
+        from . import (arraymath, arraysetops, charseq, dictobj, enumimpl,
+                       iterators, linalg, numbers, optional, polynomial,
+                       rangeobj, slicing, smartarray, tupleobj)
         try:
             from . import npdatetime
         except NotImplementedError:
@@ -745,12 +748,22 @@ class BaseContext(object):
     def get_dummy_type(self):
         return GENERIC_POINTER
 
-    def compile_subroutine_no_cache(self, builder, impl, sig, locals={}, flags=None):
+    def compile_subroutine_no_cache(self, builder, impl, sig, locals={},
+                                    flags=None, unique_name=None,
+                                    caller_library=None):
         """
         Invoke the compiler to compile a function to be used inside a
         nopython function, but without generating code to call that
         function.
 
+        If *unique_name* is given, it is used instead of a process-specific
+        name and the library keeps its object code, so that it can be
+        saved in the cache.
+
+        If *caller_library* is given, the function is only made available
+        for linking into that library, so that it can be released along
+        with it.  Otherwise it is available to all libraries of the codegen.
+
         Note this context's flags are not inherited.
         """
         # Compile
@@ -758,6 +771,8 @@ class BaseContext(object):
 
         codegen = self.codegen()
         library = codegen.create_library(impl.__name__)
+        if unique_name is not None:
+            library.enable_object_caching()
         if flags is None:
             flags = compiler.Flags()
         flags.set('no_compile')
@@ -766,10 +781,14 @@ class BaseContext(object):
                                          library,
                                          impl, sig.args,
                                          sig.return_type, flags,
-                                         locals=locals)
+                                         locals=locals,
+                                         unique_name=unique_name)
 
         # Allow inlining the function inside callers.
-        codegen.add_linking_library(cres.library)
+        if caller_library is not None:
+            caller_library.add_linking_library(cres.library)
+        else:
+            codegen.add_linking_library(cres.library)
         return cres
 
     def compile_subroutine(self, builder, impl, sig, locals={}):
@@ -777,6 +796,9 @@ class BaseContext(object):
         Compile the function *impl* for the given *sig* (in nopython mode).
         Return a placeholder object that's callable from another Numba
         function.
+
+        Compiled functions are memoized in this context and, if the target
+        supports it, saved in the on-disk cache for other processes.
         """
         cache_key = (impl.__code__, sig, type(self.error_model))
         if impl.__closure__:
@@ -785,9 +807,21 @@ class BaseContext(object):
             cache_key += tuple(c.cell_contents for c in impl.__closure__)
         ty = self.cached_internal_func.get(cache_key)
         if ty is None:
-            cres = self.compile_subroutine_no_cache(builder, impl, sig,
-                                                    locals=locals)
-            ty = types.NumbaFunction(cres.fndesc, sig)
+            cache = key = fndesc = None
+            if (self.cache_subroutines and not self.aot_mode
+                and config.CACHE_SUBROUTINES):
+                from numba import caching
+                cache, key = caching.get_subroutine_cache(self, impl, sig)
+            if cache is not None:
+                fndesc = cache.load_subroutine(key, self)
+            if fndesc is None:
+                unique_name = cache.get_unique_name(key) if cache else None
+                cres = self.compile_subroutine_no_cache(
+                    builder, impl, sig, locals=locals, unique_name=unique_name)
+                fndesc = cres.fndesc
+                if cache is not None:
+                    cache.save_subroutine(key, cres)
+            ty = types.NumbaFunction(fndesc, sig)
             self.cached_internal_func[cache_key] = ty
         return ty
 
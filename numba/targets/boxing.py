@@ -4,10 +4,10 @@ Boxing and unboxing of native Numba values to / from CPython objects.
 
 from llvmlite import ir
 
-from .. import cgutils, numpy_support, types
+from .. import cgutils, numpy_support, types, utils
 from ..pythonapi import box, unbox, reflect, NativeValue
 
-from . import listobj, setobj
+from . import dictobj, listobj, setobj
 
 
 #
@@ -158,7 +158,11 @@ def box_enum(typ, val, c):
     """
     valobj = c.box(typ.dtype, val)
     # Call the enum class with the value object
-    cls_obj = c.pyapi.unserialize(c.pyapi.serialize_object(typ.instance_class))
+    cls = typ.instance_class
+    # Classes created on demand can't be pickled by reference, they
+    # provide a stand-in instead (see numpy_support.get_columns_class())
+    cls_ref = getattr(cls, '_pickle_ref', cls)
+    cls_obj = c.pyapi.unserialize(c.pyapi.serialize_object(cls_ref))
     return c.pyapi.call_function_objargs(cls_obj, (valobj,))
 
 @unbox(types.EnumMember)
@@ -218,10 +222,46 @@ def box_charseq(typ, val, c):
     strlen = c.builder.load(count)
     return c.pyapi.bytes_from_string_and_size(strptr, strlen)
 
-@unbox(types.CharSeq)
-def unbox_charseq(typ, obj, c):
+def _charseq_as_string_and_size(obj, c):
+    """
+    Return ``(ok, buffer, length)`` for the str or bytes object *obj*.
+    """
+    if not utils.IS_PY3:
+        return c.pyapi.string_as_string_and_size(obj)
+    # Strings are encoded as UTF-8, anything else (e.g. np.bytes_)
+    # must be a bytes object
+    is_str = c.builder.icmp_unsigned(
+        '==', c.pyapi.get_type(obj), c.pyapi.get_c_object("PyUnicode_Type"))
+    with c.builder.if_else(is_str) as (then, orelse):
+        with then:
+            str_ok, str_buffer, str_size = \
+                c.pyapi.string_as_string_and_size(obj)
+            str_block = c.builder.basic_block
+        with orelse:
+            bytes_ok, bytes_buffer, bytes_size = \
+                c.pyapi.bytes_as_string_and_size(obj)
+            bytes_block = c.builder.basic_block
+    res = []
+    for str_val, bytes_val in [(str_ok, bytes_ok),
+                               (str_buffer, bytes_buffer),
+                               (str_size, bytes_size)]:
+        phi = c.builder.phi(str_val.type)
+        phi.add_incoming(str_val, str_block)
+        phi.add_incoming(bytes_val, bytes_block)
+        res.append(phi)
+    return tuple(res)
+
+
+def _unbox_fixed_width(typ, ok, buffer, size, c):
+    """
+    Copy at most *typ.count* characters from *buffer* to zero-filled
+    storage for *typ*, and return a NativeValue.
+    """
     lty = c.context.get_value_type(typ)
-    ok, buffer, size = c.pyapi.string_as_string_and_size(obj)
+
+    # Initialize output to zero bytes
+    null_string = ir.Constant(lty, None)
+    outspace  = cgutils.alloca_once_value(c.builder, null_string)
 
     # If conversion is ok, copy the buffer to the output storage.
     with cgutils.if_likely(c.builder, ok):
@@ -232,19 +272,62 @@ def unbox_charseq(typ, obj, c):
         # Allow truncation of string
         size = c.builder.select(size_fits, size, storage_size)
 
-        # Initialize output to zero bytes
-        null_string = ir.Constant(lty, None)
-        outspace  = cgutils.alloca_once_value(c.builder, null_string)
-
         # We don't need to set the NULL-terminator because the storage
         # is already zero-filled.
+        charsize = ir.Constant(size.type, lty.element.width // 8)
         cgutils.memcpy(c.builder,
                        c.builder.bitcast(outspace, buffer.type),
-                       buffer, size)
+                       buffer, c.builder.mul(size, charsize))
 
     ret = c.builder.load(outspace)
     return NativeValue(ret, is_error=c.builder.not_(ok))
 
+@unbox(types.CharSeq)
+def unbox_charseq(typ, obj, c):
+    ok, buffer, size = _charseq_as_string_and_size(obj, c)
+    return _unbox_fixed_width(typ, ok, buffer, size, c)
+
+
+@box(types.UnicodeCharSeq)
+def box_unicodecharseq(typ, val, c):
+    rawptr = cgutils.alloca_once_value(c.builder, value=val)
+    zero = ir.Constant(ir.IntType(32), 0)
+    charptr = c.builder.gep(rawptr, [zero, zero])
+    fullsize = c.context.get_constant(types.intp, typ.count)
+    one = fullsize.type(1)
+    count = cgutils.alloca_once_value(c.builder, fullsize.type(0))
+
+    # Ignore the trailing nulls, as in box_charseq()
+    with cgutils.loop_nest(c.builder, [fullsize], fullsize.type) as [idx]:
+        ch = c.builder.load(c.builder.gep(charptr, [idx]))
+        with c.builder.if_then(cgutils.is_not_null(c.builder, ch)):
+            c.builder.store(c.builder.add(idx, one), count)
+
+    strlen = c.builder.load(count)
+    return c.pyapi.string_from_utf32(charptr, strlen)
+
+@unbox(types.UnicodeCharSeq)
+def unbox_unicodecharseq(typ, obj, c):
+    encoded = c.pyapi.string_as_utf32(obj)
+    is_encoded = cgutils.is_not_null(c.builder, encoded)
+    ok = cgutils.alloca_once_value(c.builder, cgutils.false_bit)
+    buffer = cgutils.alloca_once(c.builder, c.pyapi.cstring)
+    size = cgutils.alloca_once(c.builder, c.pyapi.py_ssize_t)
+    with cgutils.if_likely(c.builder, is_encoded):
+        bytes_ok, bytes_buffer, bytes_size = \
+            c.pyapi.bytes_as_string_and_size(encoded)
+        # Skip the 4-byte byte order mark
+        bom = ir.Constant(bytes_size.type, 4)
+        c.builder.store(bytes_ok, ok)
+        c.builder.store(c.builder.gep(bytes_buffer, [bom]), buffer)
+        c.builder.store(c.builder.udiv(c.builder.sub(bytes_size, bom), bom),
+                        size)
+
+    res = _unbox_fixed_width(typ, c.builder.load(ok), c.builder.load(buffer),
+                             c.builder.load(size), c)
+    c.pyapi.decref(encoded)
+    return res
+
 
 @unbox(types.Optional)
 def unbox_optional(typ, obj, c):
@@ -350,6 +433,7 @@ def box_smart_array(typ, value, c):
     return c.builder.load(res)
 
 @unbox(types.Buffer)
+@unbox(types.BufferArray)
 def unbox_buffer(typ, obj, c):
     """
     Convert a Py_buffer-providing object to a native array structure.
@@ -450,7 +534,11 @@ def box_namedtuple(typ, val, c):
     """
     Convert native array or structure *val* to a namedtuple object.
     """
-    cls_obj = c.pyapi.unserialize(c.pyapi.serialize_object(typ.instance_class))
+    cls = typ.instance_class
+    # Classes created on demand can't be pickled by reference, they
+    # provide a stand-in instead (see numpy_support.get_columns_class())
+    cls_ref = getattr(cls, '_pickle_ref', cls)
+    cls_obj = c.pyapi.unserialize(c.pyapi.serialize_object(cls_ref))
     tuple_obj = box_tuple(typ, val, c)
     obj = c.pyapi.call(cls_obj, tuple_obj)
     c.pyapi.decref(cls_obj)
@@ -541,6 +629,57 @@ def box_list(typ, val, c):
     return c.builder.load(res)
 
 
+# Native list item types which can be unboxed by a C helper
+# (the values are the names of PythonAPI methods)
+_fast_list_unboxers = {
+    types.float64: 'list_unbox_floats',
+    types.int64: 'list_unbox_ints',
+    }
+
+
+def _unbox_list_items(typ, obj, c, size, list, errorptr):
+    """
+    Unbox the *size* items of Python list *obj* into the native *list*.
+    """
+    zero = ir.Constant(size.type, 0)
+    expected_typobj = c.pyapi.get_type(c.pyapi.list_getitem(obj, zero))
+    # Only scalars are converted to the item type when assuming the
+    # list is homogeneous: other unboxers (e.g. arrays') may trust the
+    # object to match the item type exactly.
+    convert = (c.pyapi.assume_homogeneous and
+               isinstance(typ.dtype, (types.Number, types.Boolean)))
+    with cgutils.for_range(c.builder, size) as loop:
+        itemobj = c.pyapi.list_getitem(obj, loop.index)
+
+        if not convert:
+            # Mandate that objects all have the same exact type
+            typobj = c.pyapi.get_type(itemobj)
+            type_mismatch = c.builder.icmp_signed('!=', typobj,
+                                                  expected_typobj)
+            with c.builder.if_then(type_mismatch, likely=False):
+                c.builder.store(cgutils.true_bit, errorptr)
+                c.pyapi.err_set_string("PyExc_TypeError",
+                                       "can't unbox heterogenous list")
+                loop.do_break()
+
+        elif isinstance(typ.dtype, types.Integer):
+            # Reject non-integral items, which unbox_integer() truncates
+            indexobj = c.pyapi.number_index(itemobj)
+            with cgutils.if_unlikely(c.builder,
+                                     cgutils.is_null(c.builder, indexobj)):
+                c.builder.store(cgutils.true_bit, errorptr)
+                loop.do_break()
+            c.pyapi.decref(indexobj)
+
+        # XXX we don't call native cleanup for each
+        # list element, since that would require keeping
+        # of which unboxings have been successful.
+        native = c.unbox(typ.dtype, itemobj)
+        with c.builder.if_then(native.is_error, likely=False):
+            c.builder.store(cgutils.true_bit, errorptr)
+        list.inititem(loop.index, native.value)
+
+
 def _python_list_to_native(typ, obj, c, size, listptr, errorptr):
     """
     Construct a new native list from a Python list.
@@ -553,28 +692,22 @@ def _python_list_to_native(typ, obj, c, size, listptr, errorptr):
             zero = ir.Constant(size.type, 0)
             with c.builder.if_then(c.builder.icmp_signed('>', size, zero),
                                    likely=True):
-                # Traverse Python list and unbox objects into native list
-                expected_typobj = c.pyapi.get_type(c.pyapi.list_getitem(obj, zero))
-                with cgutils.for_range(c.builder, size) as loop:
-                    itemobj = c.pyapi.list_getitem(obj, loop.index)
-                    typobj = c.pyapi.get_type(itemobj)
-
-                    # Mandate that objects all have the same exact type
-                    type_mismatch = c.builder.icmp_signed('!=', typobj,
-                                                          expected_typobj)
-                    with c.builder.if_then(type_mismatch, likely=False):
-                        c.builder.store(cgutils.true_bit, errorptr)
-                        c.pyapi.err_set_string("PyExc_TypeError",
-                                               "can't unbox heterogenous list")
-                        loop.do_break()
-
-                    # XXX we don't call native cleanup for each
-                    # list element, since that would require keeping
-                    # of which unboxings have been successful.
-                    native = c.unbox(typ.dtype, itemobj)
-                    with c.builder.if_then(native.is_error, likely=False):
+                fast_unbox = _fast_list_unboxers.get(typ.dtype)
+                if fast_unbox is None:
+                    _unbox_list_items(typ, obj, c, size, list, errorptr)
+                else:
+                    # Lists of exact Python floats or ints are copied
+                    # by a C helper, otherwise use generic unboxing
+                    status = getattr(c.pyapi, fast_unbox)(
+                        obj, list.data, size, c.pyapi.assume_homogeneous)
+                    is_error = c.builder.icmp_signed(
+                        '<', status, status.type(0))
+                    use_generic = c.builder.icmp_signed(
+                        '>', status, status.type(0))
+                    with c.builder.if_then(is_error, likely=False):
                         c.builder.store(cgutils.true_bit, errorptr)
-                    list.setitem(loop.index, native.value)
+                    with c.builder.if_then(use_generic, likely=False):
+                        _unbox_list_items(typ, obj, c, size, list, errorptr)
 
             if typ.reflected:
                 list.parent = obj
@@ -645,6 +778,18 @@ def reflect_list(typ, val, c):
         obj = list.parent
         size = c.pyapi.list_size(obj)
         new_size = list.size
+        dirty_lo, dirty_hi = list.dirty_range
+
+        def overwrite_items(stop):
+            # Only box the items in the dirty range below *stop*
+            stop = c.builder.select(c.builder.icmp_signed('<', dirty_hi, stop),
+                                    dirty_hi, stop)
+            with cgutils.for_range_slice(c.builder, dirty_lo, stop,
+                                         ir.Constant(stop.type, 1)) as (idx, _):
+                item = list.getitem(idx)
+                itemobj = c.box(typ.dtype, item)
+                c.pyapi.list_setitem(obj, idx, itemobj)
+
         diff = c.builder.sub(new_size, size)
         diff_gt_0 = c.builder.icmp_signed('>=', diff,
                                           ir.Constant(diff.type, 0))
@@ -652,10 +797,7 @@ def reflect_list(typ, val, c):
             # XXX no error checking below
             with if_grow:
                 # First overwrite existing items
-                with cgutils.for_range(c.builder, size) as loop:
-                    item = list.getitem(loop.index)
-                    itemobj = c.box(typ.dtype, item)
-                    c.pyapi.list_setitem(obj, loop.index, itemobj)
+                overwrite_items(size)
                 # Then add missing items
                 with cgutils.for_range(c.builder, diff) as loop:
                     idx = c.builder.add(size, loop.index)
@@ -668,10 +810,7 @@ def reflect_list(typ, val, c):
                 # First delete list tail
                 c.pyapi.list_setslice(obj, new_size, size, None)
                 # Then overwrite remaining items
-                with cgutils.for_range(c.builder, new_size) as loop:
-                    item = list.getitem(loop.index)
-                    itemobj = c.box(typ.dtype, item)
-                    c.pyapi.list_setitem(obj, loop.index, itemobj)
+                overwrite_items(new_size)
 
         # Mark the list clean, in case it is reflected twice
         list.set_dirty(False)
@@ -849,13 +988,86 @@ def reflect_set(typ, val, c):
         inst.set_dirty(False)
 
 
+def _typed_meminfo_ptr(obj, c):
+    """
+    Return a pointer to the meminfo pointer of numba.typed container *obj*.
+    """
+    from numba.jitclass import _box
+    offset = c.context.get_constant(types.uintp, _box.box_meminfoptr_offset)
+    ptr = cgutils.pointer_add(c.builder, obj, offset)
+    return c.builder.bitcast(ptr, c.pyapi.voidptr.as_pointer())
+
+def _box_typed(typ, val, meminfo, factory, c):
+    """
+    Wrap native container *val* in the Python object returned by
+    *factory*(typ), which takes over the native reference: the payload
+    is shared, not converted.
+    """
+    factory = c.pyapi.unserialize(c.pyapi.serialize_object(factory))
+    typobj = c.pyapi.unserialize(c.pyapi.serialize_object(typ))
+    obj = c.pyapi.call_function_objargs(factory, (typobj,))
+    c.pyapi.decref(factory)
+    c.pyapi.decref(typobj)
+    with c.builder.if_else(cgutils.is_not_null(c.builder, obj)) \
+        as (if_ok, if_error):
+        with if_ok:
+            meminfo = c.builder.bitcast(meminfo, c.pyapi.voidptr)
+            c.builder.store(meminfo, _typed_meminfo_ptr(obj, c))
+        with if_error:
+            c.context.nrt.decref(c.builder, typ, val)
+    return obj
+
+@box(types.DictType)
+def box_dict(typ, val, c):
+    """
+    Wrap a native dict in a numba.typed.Dict.
+    """
+    from numba.typed import typeddict
+    inst = dictobj.DictInstance(c.context, c.builder, typ, val)
+    return _box_typed(typ, val, inst.meminfo, typeddict._box_dict, c)
+
+@unbox(types.DictType)
+def unbox_dict(typ, obj, c):
+    """
+    Get the native dict wrapped by numba.typed.Dict *obj*.
+    """
+    meminfo = c.builder.load(_typed_meminfo_ptr(obj, c))
+    inst = dictobj.DictInstance.from_meminfo(c.context, c.builder, typ,
+                                             meminfo)
+    return NativeValue(inst.value)
+
+@box(types.ListType)
+def box_typed_list(typ, val, c):
+    """
+    Wrap a native list in a numba.typed.List.
+    """
+    from numba.typed import typedlist
+    inst = listobj.ListInstance(c.context, c.builder, typ, val)
+    return _box_typed(typ, val, inst.meminfo, typedlist._box_list, c)
+
+@unbox(types.ListType)
+def unbox_typed_list(typ, obj, c):
+    """
+    Get the native list wrapped by numba.typed.List *obj*.  Unlike
+    reflected lists, nothing is converted: this is O(1).
+    """
+    meminfo = c.builder.load(_typed_meminfo_ptr(obj, c))
+    inst = listobj.ListInstance.from_meminfo(c.context, c.builder, typ,
+                                             meminfo)
+    return NativeValue(inst.value)
+
+
 #
 # Other types
 #
 
 @box(types.Generator)
 def box_generator(typ, val, c):
-    return c.pyapi.from_native_generator(val, typ, c.env_manager.env_ptr)
+    # Expose the generator's type, so that it can be passed back to
+    # compiled code (see numba.generators.take())
+    typobj = c.env_manager.read_const(c.env_manager.add_const(typ))
+    return c.pyapi.from_native_generator(val, typ, c.env_manager.env_ptr,
+                                         typobj)
 
 @unbox(types.Generator)
 def unbox_generator(typ, obj, c):
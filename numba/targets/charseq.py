@@ -0,0 +1,168 @@
+"""
+Implementation of operations on fixed-width character sequences (the
+items of Numpy 'S' and 'U' arrays).
+
+Like Numpy, a sequence's logical value ignores its trailing null
+characters, so that e.g. b'ab' stored as S2 and as S5 compare and hash
+equal.
+"""
+
+from __future__ import print_function, absolute_import
+
+from llvmlite import ir
+
+from numba import cgutils, types, utils
+from .imputils import (lower_builtin, lower_cast, lower_constant,
+                       impl_ret_untracked)
+
+
+def _char_pointer(builder, val):
+    """
+    Spill the sequence *val* to the stack and return a pointer to its
+    first character.
+    """
+    ptr = cgutils.alloca_once_value(builder, val)
+    zero = ir.Constant(ir.IntType(32), 0)
+    return builder.gep(ptr, [zero, zero])
+
+
+def _logical_length(builder, ptr, count, intp_t):
+    """
+    Return the length of the *count*-wide sequence at *ptr*, i.e. the
+    index of the last non-null character plus one.
+    """
+    length = cgutils.alloca_once_value(builder, intp_t(0))
+    with cgutils.for_range(builder, intp_t(count)) as loop:
+        ch = builder.load(builder.gep(ptr, [loop.index]))
+        with builder.if_then(cgutils.is_not_null(builder, ch)):
+            builder.store(builder.add(loop.index, intp_t(1)), length)
+    return builder.load(length)
+
+
+def _wider(fromty, toty):
+    return fromty if fromty.count >= toty.count else toty
+
+
+@lower_cast(types.CharSeq, types.CharSeq)
+@lower_cast(types.UnicodeCharSeq, types.UnicodeCharSeq)
+def charseq_to_charseq(context, builder, fromty, toty, val):
+    # Truncate or pad with nulls
+    res = ir.Constant(context.get_value_type(toty), None)
+    for i in range(min(fromty.count, toty.count)):
+        res = builder.insert_value(res, builder.extract_value(val, i), i)
+    return res
+
+
+def _compare(context, builder, ty, a, b):
+    """
+    Lexicographically compare sequences *a* and *b* of type *ty*,
+    returning -1, 0 or 1 as an int32.  Characters are compared as
+    unsigned code units.
+    """
+    int32_t = ir.IntType(32)
+    intp_t = context.get_value_type(types.intp)
+    aptr = _char_pointer(builder, a)
+    bptr = _char_pointer(builder, b)
+    res = cgutils.alloca_once_value(builder, int32_t(0))
+
+    bb_loop = builder.append_basic_block("cmp.loop")
+    bb_body = builder.append_basic_block("cmp.body")
+    bb_differ = builder.append_basic_block("cmp.differ")
+    bb_end = builder.append_basic_block("cmp.end")
+
+    index = cgutils.alloca_once_value(builder, intp_t(0))
+    builder.branch(bb_loop)
+    with builder.goto_block(bb_loop):
+        i = builder.load(index)
+        more = builder.icmp_signed('<', i, intp_t(ty.count))
+        builder.cbranch(more, bb_body, bb_end)
+    with builder.goto_block(bb_body):
+        i = builder.load(index)
+        ca = builder.load(builder.gep(aptr, [i]))
+        cb = builder.load(builder.gep(bptr, [i]))
+        builder.store(builder.add(i, intp_t(1)), index)
+        builder.cbranch(builder.icmp_unsigned('!=', ca, cb),
+                        bb_differ, bb_loop)
+    with builder.goto_block(bb_differ):
+        i = builder.sub(builder.load(index), intp_t(1))
+        ca = builder.load(builder.gep(aptr, [i]))
+        cb = builder.load(builder.gep(bptr, [i]))
+        lt = builder.icmp_unsigned('<', ca, cb)
+        builder.store(builder.select(lt, int32_t(-1), int32_t(1)), res)
+        builder.branch(bb_end)
+
+    builder.position_at_end(bb_end)
+    return builder.load(res)
+
+
+def _make_comparison_impl(op):
+    def impl(context, builder, sig, args):
+        lty, rty = sig.args
+        ty = _wider(lty, rty)
+        a = context.cast(builder, args[0], lty, ty)
+        b = context.cast(builder, args[1], rty, ty)
+        cmp = _compare(context, builder, ty, a, b)
+        res = builder.icmp_signed(op, cmp, cmp.type(0))
+        return impl_ret_untracked(context, builder, sig.return_type, res)
+
+    return impl
+
+
+for op in ('==', '!=', '<', '<=', '>', '>='):
+    for cls in (types.CharSeq, types.UnicodeCharSeq):
+        lower_builtin(op, cls, cls)(_make_comparison_impl(op))
+
+
+@lower_builtin(len, types.CharSeq)
+@lower_builtin(len, types.UnicodeCharSeq)
+def charseq_len(context, builder, sig, args):
+    ty, = sig.args
+    intp_t = context.get_value_type(types.intp)
+    ptr = _char_pointer(builder, args[0])
+    res = _logical_length(builder, ptr, ty.count, intp_t)
+    return impl_ret_untracked(context, builder, sig.return_type, res)
+
+
+# FNV-1a parameters for the platform's word size
+if utils.MACHINE_BITS == 64:
+    _FNV_OFFSET = 0xcbf29ce484222325 - (1 << 64)
+    _FNV_PRIME = 0x100000001b3
+else:
+    _FNV_OFFSET = 0x811c9dc5 - (1 << 32)
+    _FNV_PRIME = 0x01000193
+
+
+@lower_builtin(hash, types.CharSeq)
+@lower_builtin(hash, types.UnicodeCharSeq)
+def charseq_hash(context, builder, sig, args):
+    """
+    FNV-1a hash of the characters up to the logical length, so that
+    equal sequences of different widths have the same hash.
+    """
+    ty, = sig.args
+    intp_t = context.get_value_type(types.intp)
+    ptr = _char_pointer(builder, args[0])
+    length = _logical_length(builder, ptr, ty.count, intp_t)
+    h = cgutils.alloca_once_value(builder, intp_t(_FNV_OFFSET))
+    with cgutils.for_range(builder, length) as loop:
+        ch = builder.load(builder.gep(ptr, [loop.index]))
+        val = builder.xor(builder.load(h), builder.zext(ch, intp_t))
+        builder.store(builder.mul(val, intp_t(_FNV_PRIME)), h)
+    res = builder.load(h)
+    return impl_ret_untracked(context, builder, sig.return_type, res)
+
+
+@lower_constant(types.CharSeq)
+def constant_charseq(context, builder, ty, pyval):
+    lty = context.get_value_type(ty)
+    data = bytearray(bytes(pyval)[:ty.count])
+    data += bytearray(ty.count - len(data))
+    return ir.Constant(lty, data)
+
+
+@lower_constant(types.UnicodeCharSeq)
+def constant_unicodecharseq(context, builder, ty, pyval):
+    lty = context.get_value_type(ty)
+    codes = [ord(c) for c in pyval[:ty.count]]
+    codes += [0] * (ty.count - len(codes))
+    return ir.Constant(lty, [lty.element(c) for c in codes])
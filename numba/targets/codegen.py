@@ -67,6 +67,11 @@ class CodeLibrary(object):
     _finalized = False
     _object_caching_enabled = False
     _disable_inspection = False
+    _quick_optimized = False
+    _code_size = None
+    # Whether loading the code of an unserialized library into the
+    # engine is deferred until needed (see _unserialize())
+    _load_deferred = False
 
     def __init__(self, codegen, name):
         self._codegen = codegen
@@ -76,6 +81,8 @@ class CodeLibrary(object):
             str(self._codegen._create_empty_module(self._name)))
         self._final_module.name = cgutils.normalize_ir_text(self._name)
         self._shared_module = None
+        self._shared_bitcode = None
+        self._defined_symbols = None
         # Track names of the dynamic globals
         self._dynamic_globals = []
 
@@ -93,6 +100,31 @@ class CodeLibrary(object):
     def __repr__(self):
         return "<Library %r at 0x%x>" % (self._name, id(self))
 
+    @property
+    def code_size(self):
+        """
+        The size in bytes of the object code generated for this library,
+        or None if it isn't known (e.g. the library isn't finalized yet).
+        """
+        return self._code_size
+
+    @property
+    def quick_optimized(self):
+        """
+        Whether this library's code is optimized with the cheap pass
+        pipeline (see use_quick_optimizations()).
+        """
+        return self._quick_optimized
+
+    def use_quick_optimizations(self):
+        """
+        Optimize this library's code with a cheap pass pipeline, trading
+        execution speed for compilation speed.  This must be called
+        before any code is added.
+        """
+        self._raise_if_finalized()
+        self._quick_optimized = True
+
     def _raise_if_finalized(self):
         if self._finalized:
             raise RuntimeError("operation impossible on finalized object %r"
@@ -100,7 +132,33 @@ class CodeLibrary(object):
 
     def _ensure_finalized(self):
         if not self._finalized:
-            self.finalize()
+            if self._load_deferred:
+                self._load_deferred_code()
+            else:
+                self.finalize()
+
+    def _ensure_linkable(self):
+        """
+        Make sure this library can be linked into other libraries.  This
+        doesn't need loading the code of an unserialized library.
+        """
+        if not self._load_deferred:
+            self._ensure_finalized()
+
+    @property
+    def load_deferred(self):
+        """
+        Whether this library was unserialized and its code isn't loaded
+        in the engine yet.  It is loaded on first use, e.g. when getting
+        a function's address.
+        """
+        return self._load_deferred and not self._finalized
+
+    @llvmts.lock_llvm
+    def _load_deferred_code(self):
+        # Another thread may have loaded it meanwhile
+        if not self._finalized:
+            self._finalize_final_module()
 
     def _optimize_functions(self, ll_module):
         """
@@ -108,7 +166,8 @@ class CodeLibrary(object):
         """
         # Enforce data layout to enable layout-specific optimizations
         ll_module.data_layout = self._codegen._data_layout
-        with self._codegen._function_pass_manager(ll_module) as fpm:
+        with self._codegen._function_pass_manager(
+                ll_module, quick=self._quick_optimized) as fpm:
             # Run function-level optimizations to reduce memory usage and improve
             # module-level optimization.
             for func in ll_module.functions:
@@ -120,7 +179,10 @@ class CodeLibrary(object):
         """
         Internal: optimize this library's final module.
         """
-        self._codegen._mpm.run(self._final_module)
+        if self._quick_optimized:
+            self._codegen._quick_mpm.run(self._final_module)
+        else:
+            self._codegen._mpm.run(self._final_module)
         self._final_module = remove_redundant_nrt_refct(self._final_module)
 
     def _get_module_for_linking(self):
@@ -132,9 +194,14 @@ class CodeLibrary(object):
 
         See discussion in https://github.com/numba/numba/pull/890
         """
-        self._ensure_finalized()
         if self._shared_module is not None:
             return self._shared_module
+        if self._shared_bitcode is not None:
+            # Unserialized library, parse its bitcode on first use
+            self._shared_module = llvmts.parse_bitcode(self._shared_bitcode)
+            self._shared_bitcode = None
+            return self._shared_module
+        self._ensure_finalized()
         mod = self._final_module
         to_fix = []
         nfuncs = 0
@@ -158,6 +225,51 @@ class CodeLibrary(object):
         self._shared_module = mod
         return mod
 
+    def _get_defined_symbols(self):
+        """
+        Internal: get the set of names defined by the module returned
+        by _get_module_for_linking().
+        """
+        if self._defined_symbols is None:
+            mod = self._get_module_for_linking()
+            self._defined_symbols = set(
+                gv.name
+                for gvs in (mod.functions, mod.global_variables)
+                for gv in gvs if not gv.is_declaration)
+        return self._defined_symbols
+
+    def _get_undefined_symbols(self):
+        """
+        Internal: get the set of names declared but not defined in this
+        library's final module.
+        """
+        mod = self._final_module
+        return set(gv.name
+                   for gvs in (mod.functions, mod.global_variables)
+                   for gv in gvs if gv.is_declaration)
+
+    def _link_libraries(self):
+        """
+        Internal: link into the final module the libraries defining the
+        symbols it needs, including those needed by the linked code.
+        Other libraries are skipped, so that the cost of finalizing
+        doesn't grow with the number of libraries registered with the
+        codegen.
+        """
+        candidates = set(self._linking_libraries)
+        candidates.update(self._codegen._libraries)
+        while candidates:
+            undefined = self._get_undefined_symbols()
+            needed = [library for library in candidates
+                      if not undefined.isdisjoint(
+                          library._get_defined_symbols())]
+            if not needed:
+                break
+            for library in needed:
+                self._final_module.link_in(
+                    library._get_module_for_linking(), preserve=True)
+                candidates.discard(library)
+
     def create_ir_module(self, name):
         """
         Create a LLVM IR module for use by this library.
@@ -171,7 +283,7 @@ class CodeLibrary(object):
         Add a library for linking into this library, without losing
         the original library.
         """
-        library._ensure_finalized()
+        library._ensure_linkable()
         self._linking_libraries.add(library)
 
     def add_ir_module(self, ir_module):
@@ -219,12 +331,7 @@ class CodeLibrary(object):
             dump("FUNCTION OPTIMIZED DUMP %s" % self._name, self.get_llvm_str())
 
         # Link libraries for shared code
-        for library in self._linking_libraries:
-            self._final_module.link_in(
-                library._get_module_for_linking(), preserve=True)
-        for library in self._codegen._libraries:
-            self._final_module.link_in(
-                library._get_module_for_linking(), preserve=True)
+        self._link_libraries()
 
         # Optimize the module after all dependences are linked in above,
         # to allow for inlining.
@@ -363,6 +470,7 @@ class CodeLibrary(object):
             self = ll_module.__library
         except AttributeError:
             return
+        self._code_size = len(buf)
         if self._object_caching_enabled:
             self._compiled = True
             self._compiled_object = buf
@@ -379,6 +487,7 @@ class CodeLibrary(object):
         if self._object_caching_enabled and self._compiled_object:
             buf = self._compiled_object
             self._compiled_object = None
+            self._code_size = len(buf)
             return buf
 
     @llvmts.lock_llvm
@@ -416,8 +525,12 @@ class CodeLibrary(object):
             object_code, shared_bitcode = data
             self.enable_object_caching()
             self._set_compiled_object(object_code)
-            self._shared_module = llvmts.parse_bitcode(shared_bitcode)
-            self._finalize_final_module()
+            self._code_size = len(object_code)
+            # Loading the object code into the engine and parsing the
+            # bitcode are deferred until needed, as many unserialized
+            # libraries are never called or linked.
+            self._shared_bitcode = shared_bitcode
+            self._load_deferred = True
             return self
         else:
             raise ValueError("unsupported serialization kind %r" % (kind,))
@@ -551,6 +664,7 @@ class BaseCPUCodegen(object):
         self._target_data = engine.target_data
         self._data_layout = str(self._target_data)
         self._mpm = self._module_pass_manager()
+        self._quick_mpm = self._module_pass_manager(quick=True)
 
         self._engine.set_object_cache(self._library_class._object_compiled_hook,
                                       self._library_class._object_getbuffer_hook)
@@ -574,7 +688,7 @@ class BaseCPUCodegen(object):
         Add a library for linking into all libraries created by this
         codegen object, without losing the original library.
         """
-        library._ensure_finalized()
+        library._ensure_linkable()
         self._libraries.add(library)
 
     def create_library(self, name):
@@ -587,31 +701,36 @@ class BaseCPUCodegen(object):
     def unserialize_library(self, serialized):
         return self._library_class._unserialize(self, serialized)
 
-    def _module_pass_manager(self):
+    def _module_pass_manager(self, quick=False):
         pm = llvmts.create_module_pass_manager()
         self._tm.add_analysis_passes(pm)
-        with self._pass_manager_builder() as pmb:
+        with self._pass_manager_builder(quick) as pmb:
             pmb.populate(pm)
         return pm
 
-    def _function_pass_manager(self, llvm_module):
+    def _function_pass_manager(self, llvm_module, quick=False):
         pm = llvmts.create_function_pass_manager(llvm_module)
         self._tm.add_analysis_passes(pm)
-        with self._pass_manager_builder() as pmb:
+        with self._pass_manager_builder(quick) as pmb:
             pmb.populate(pm)
         return pm
 
-    def _pass_manager_builder(self):
+    def _pass_manager_builder(self, quick=False):
         """
-        Create a PassManagerBuilder.
+        Create a PassManagerBuilder.  If *quick* is true, the passes
+        are those of a cheap optimization level without vectorization.
 
         Note: a PassManagerBuilder seems good only for one use, so you
         should call this method each time you want to populate a module
         or function pass manager.  Otherwise some optimizations will be
         missed...
         """
-        pmb = lp.create_pass_manager_builder(
-            opt=config.OPT, loop_vectorize=config.LOOP_VECTORIZE)
+        if quick:
+            pmb = lp.create_pass_manager_builder(
+                opt=min(config.OPT, 1), loop_vectorize=False)
+        else:
+            pmb = lp.create_pass_manager_builder(
+                opt=config.OPT, loop_vectorize=config.LOOP_VECTORIZE)
         return pmb
 
     def _check_llvm_bugs(self):
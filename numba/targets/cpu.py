@@ -32,6 +32,7 @@ class CPUContext(BaseContext):
     Changes BaseContext calling convention
     """
     allow_dynamic_globals = True
+    cache_subroutines = True
 
     # Overrides
     def create_module(self, name):
@@ -139,13 +140,14 @@ class CPUContext(BaseContext):
         library.add_linking_library(rtsys.library)
 
     def create_cpython_wrapper(self, library, fndesc, env, call_helper,
-                               release_gil=False):
+                               release_gil=False, assume_homogeneous=False):
         wrapper_module = self.create_module("wrapper")
         fnty = self.call_conv.get_function_type(fndesc.restype, fndesc.argtypes)
         wrapper_callee = wrapper_module.add_function(fnty, fndesc.llvm_func_name)
         builder = PyCallWrapper(self, wrapper_module, wrapper_callee,
                                 fndesc, env, call_helper=call_helper,
-                                release_gil=release_gil)
+                                release_gil=release_gil,
+                                assume_homogeneous=assume_homogeneous)
         builder.build()
         library.add_ir_module(wrapper_module)
 
@@ -162,13 +164,24 @@ class CPUContext(BaseContext):
         - env
             an execution environment (from _dynfunc)
         """
+        # Note: we avoid reusing the original docstring to avoid encoding
+        # issues on Python 2, see issue #1908
+        doc = "compiled wrapper for %r" % (fndesc.qualname,)
+
+        if library.load_deferred:
+            # Only load the library's code when the function is first called
+            def resolve():
+                return library.get_pointer_to_function(
+                    fndesc.llvm_cpython_wrapper_name)
+
+            return _dynfunc.make_lazy_function(fndesc.lookup_module(),
+                                               fndesc.qualname.split('.')[-1],
+                                               doc, env, resolve)
+
         # Code generation
         baseptr = library.get_pointer_to_function(fndesc.llvm_func_name)
         fnptr = library.get_pointer_to_function(fndesc.llvm_cpython_wrapper_name)
 
-        # Note: we avoid reusing the original docstring to avoid encoding
-        # issues on Python 2, see issue #1908
-        doc = "compiled wrapper for %r" % (fndesc.qualname,)
         cfunc = _dynfunc.make_function(fndesc.lookup_module(),
                                        fndesc.qualname.split('.')[-1],
                                        doc, fnptr, env,
@@ -203,6 +216,8 @@ class CPUTargetOptions(TargetOptions):
         "fastmath": bool,
         "error_model": str,
         "parallel": bool,
+        "assume_homogeneous": bool,
+        "tiered": bool,
     }
 
 
@@ -0,0 +1,371 @@
+"""
+Support for native typed dicts.
+
+A dict is implemented as a set (see setobj.py) whose hash table entries
+also hold a value: the lookup, probing and resizing logic is shared.
+"""
+
+from __future__ import print_function, absolute_import, division
+
+from numba import types, cgutils
+from numba.targets.imputils import (lower_builtin, iternext_impl,
+                                    impl_ret_borrowed, impl_ret_new_ref)
+from .setobj import SetInstance, SetIterInstance, get_hash_value
+
+
+class DictInstance(SetInstance):
+
+    @property
+    def key_type(self):
+        return self._ty.key_type
+
+    @property
+    def value_type(self):
+        return self._ty.value_type
+
+    def set_dirty(self, val):
+        # Dicts are never reflected
+        pass
+
+    def _reinsert_entry(self, payload, entry):
+        found, i = payload._lookup(entry.key, entry.hash, for_insert=True)
+        new_entry = payload.get_entry(i)
+        new_entry.value = entry.value
+        self._add_entry(payload, new_entry, entry.key, entry.hash,
+                        do_resize=False)
+
+    def cast_key(self, key, keyty):
+        """
+        Cast *key* of type *keyty* to the dict's key type.  Return a
+        (fits, key) tuple, where *fits* is false if *key* can't be
+        represented exactly by the key type (e.g. an integer out of
+        range), and therefore can't be in the dict.
+        """
+        context = self._context
+        builder = self._builder
+        toty = self.key_type
+        res = context.cast(builder, key, keyty, toty)
+        fits = cgutils.true_bit
+        if keyty == toty:
+            pass
+        elif (isinstance(keyty, types.Integer) and
+              isinstance(toty, types.Integer)):
+            back = context.cast(builder, res, toty, keyty)
+            fits = builder.icmp_unsigned('==', back, key)
+            # Reject values changing sign, which can survive a round trip
+            if keyty.signed and not toty.signed:
+                fits = builder.and_(fits,
+                                    builder.icmp_signed('>=', key,
+                                                        key.type(0)))
+            elif toty.signed and not keyty.signed:
+                fits = builder.and_(fits,
+                                    builder.icmp_signed('>=', res,
+                                                        res.type(0)))
+        elif (isinstance(keyty, types.Float) and
+              isinstance(toty, types.Float)):
+            back = context.cast(builder, res, toty, keyty)
+            fits = builder.fcmp_ordered('==', back, key)
+        elif (isinstance(keyty, (types.CharSeq, types.UnicodeCharSeq)) and
+              keyty.count > toty.count):
+            # The truncated characters must be nulls
+            for i in range(toty.count, keyty.count):
+                ch = builder.extract_value(key, i)
+                fits = builder.and_(fits, cgutils.is_null(builder, ch))
+        return fits, res
+
+    def cast_stored_key(self, key, keyty):
+        """
+        Like cast_key(), but raise OverflowError if *key* doesn't fit,
+        as it can't be stored in the dict.
+        """
+        builder = self._builder
+        fits, key = self.cast_key(key, keyty)
+        with builder.if_then(builder.not_(fits), likely=False):
+            self._context.call_conv.return_user_exc(
+                builder, OverflowError, ("dict key out of range",))
+        return key
+
+    def lookup(self, key, keyty=None):
+        """
+        Look up *key*.  Return a (found, entry) tuple, where the entry
+        is only valid if *found* is true.  If *keyty* is given, *key*
+        is first cast from that type.
+        """
+        builder = self._builder
+        fits = cgutils.true_bit
+        if keyty is not None:
+            fits, key = self.cast_key(key, keyty)
+        payload = self.payload
+        h = get_hash_value(self._context, builder, self.key_type, key)
+        found, i = payload._lookup(key, h)
+        return builder.and_(fits, found), payload.get_entry(i)
+
+    def getitem(self, key, keyty=None):
+        """
+        Return the value for *key*, raising KeyError if missing.
+        """
+        builder = self._builder
+        found, entry = self.lookup(key, keyty)
+        with builder.if_then(builder.not_(found), likely=False):
+            self._context.call_conv.return_user_exc(builder, KeyError,
+                                                    ("key not found",))
+        return entry.value
+
+    def setitem(self, key, value):
+        """
+        Set the value for *key*, adding it if missing.
+        """
+        context = self._context
+        builder = self._builder
+
+        payload = self.payload
+        h = get_hash_value(context, builder, self.key_type, key)
+        found, i = payload._lookup(key, h, for_insert=True)
+        entry = payload.get_entry(i)
+        entry.value = value
+        with builder.if_then(builder.not_(found)):
+            self._add_entry(payload, entry, key, h)
+
+    def pop(self, key, keyty=None):
+        """
+        Remove *key*.  Return a (found, value) tuple, where the value
+        is only valid if *found* is true.
+        """
+        builder = self._builder
+
+        fits = cgutils.true_bit
+        if keyty is not None:
+            fits, key = self.cast_key(key, keyty)
+        lty = self._context.get_value_type(self.value_type)
+        value = cgutils.alloca_once(builder, lty)
+        payload = self.payload
+        h = get_hash_value(self._context, builder, self.key_type, key)
+        found, i = payload._lookup(key, h)
+        found = builder.and_(fits, found)
+        with builder.if_then(found):
+            entry = payload.get_entry(i)
+            # Load the value before the payload can be resized
+            builder.store(entry.value, value)
+            self._remove_entry(payload, entry)
+        return found, builder.load(value)
+
+    def popitem(self):
+        """
+        Remove an arbitrary item and return it as a (key, value) pair.
+        The dict mustn't be empty.
+        """
+        context = self._context
+        builder = self._builder
+
+        key = cgutils.alloca_once(builder,
+                                  context.get_value_type(self.key_type))
+        value = cgutils.alloca_once(builder,
+                                    context.get_value_type(self.value_type))
+        payload = self.payload
+        with payload._next_entry() as entry:
+            builder.store(entry.key, key)
+            builder.store(entry.value, value)
+            self._remove_entry(payload, entry)
+        return builder.load(key), builder.load(value)
+
+    def update(self, other):
+        """
+        In-place update with the items of *other* dict, whose key and
+        value types may differ.
+        """
+        context = self._context
+        with other.payload._iterate() as loop:
+            entry = loop.entry
+            key = self.cast_stored_key(entry.key, other.key_type)
+            value = context.cast(self._builder, entry.value,
+                                 other.value_type, self.value_type)
+            self.setitem(key, value)
+
+
+class DictIterInstance(SetIterInstance):
+
+    def get_yield_value(self, entry):
+        kind = self._ty.kind
+        if kind == 'keys':
+            return entry.key
+        elif kind == 'values':
+            return entry.value
+        else:
+            return self._context.make_tuple(self._builder,
+                                            self._ty.yield_type,
+                                            (entry.key, entry.value))
+
+
+#-------------------------------------------------------------------------------
+# Constructors
+
+@lower_builtin(dict)
+def dict_empty_constructor(context, builder, sig, args):
+    dict_type = sig.return_type
+    inst = DictInstance.allocate(context, builder, dict_type)
+    return impl_ret_new_ref(context, builder, dict_type, inst.value)
+
+
+#-------------------------------------------------------------------------------
+# Various operations
+
+@lower_builtin(len, types.DictType)
+def dict_len(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    return inst.get_size()
+
+@lower_builtin("in", types.Any, types.DictType)
+def in_dict(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[1], args[1])
+    found, _ = inst.lookup(args[0], sig.args[0])
+    return found
+
+@lower_builtin('getitem', types.DictType, types.Any)
+def getitem_dict(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    value = inst.getitem(args[1], sig.args[1])
+    return impl_ret_borrowed(context, builder, sig.return_type, value)
+
+@lower_builtin('setitem', types.DictType, types.Any, types.Any)
+def setitem_dict(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    key = inst.cast_stored_key(args[1], sig.args[1])
+    inst.setitem(key, args[2])
+    return context.get_dummy_value()
+
+@lower_builtin('delitem', types.DictType, types.Any)
+def delitem_dict(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    found, _ = inst.pop(args[1], sig.args[1])
+    with builder.if_then(builder.not_(found), likely=False):
+        context.call_conv.return_user_exc(builder, KeyError,
+                                          ("key not found",))
+    return context.get_dummy_value()
+
+@lower_builtin('getiter', types.DictType)
+def getiter_dict(context, builder, sig, args):
+    inst = DictIterInstance.from_set(context, builder, sig.return_type,
+                                     args[0])
+    return impl_ret_borrowed(context, builder, sig.return_type, inst.value)
+
+@lower_builtin('iternext', types.DictIter)
+@iternext_impl
+def iternext_dictiter(context, builder, sig, args, result):
+    inst = DictIterInstance(context, builder, sig.args[0], args[0])
+    inst.iternext(result)
+
+
+#-------------------------------------------------------------------------------
+# Methods
+
+@lower_builtin("dict.get", types.DictType, types.Any)
+def dict_get(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    found, entry = inst.lookup(args[1], sig.args[1])
+    restype = sig.return_type
+    with builder.if_else(found) as (if_found, if_not_found):
+        with if_found:
+            present = context.make_optional_value(builder, inst.value_type,
+                                                  entry.value)
+            bb_found = builder.basic_block
+        with if_not_found:
+            absent = context.make_optional_none(builder, inst.value_type)
+            bb_not_found = builder.basic_block
+    res = builder.phi(present.type)
+    res.add_incoming(present, bb_found)
+    res.add_incoming(absent, bb_not_found)
+    return impl_ret_borrowed(context, builder, restype, res)
+
+@lower_builtin("dict.get", types.DictType, types.Any, types.Any)
+def dict_get_default(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    found, entry = inst.lookup(args[1], sig.args[1])
+    restype = sig.return_type
+    with builder.if_else(found) as (if_found, if_not_found):
+        with if_found:
+            present = context.cast(builder, entry.value, inst.value_type,
+                                   restype)
+            bb_found = builder.basic_block
+        with if_not_found:
+            absent = context.cast(builder, args[2], sig.args[2], restype)
+            bb_not_found = builder.basic_block
+    res = builder.phi(present.type)
+    res.add_incoming(present, bb_found)
+    res.add_incoming(absent, bb_not_found)
+    return impl_ret_borrowed(context, builder, restype, res)
+
+@lower_builtin("dict.pop", types.DictType, types.Any)
+def dict_pop(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    found, value = inst.pop(args[1], sig.args[1])
+    with builder.if_then(builder.not_(found), likely=False):
+        context.call_conv.return_user_exc(builder, KeyError,
+                                          ("key not found",))
+    return value
+
+@lower_builtin("dict.pop", types.DictType, types.Any, types.Any)
+def dict_pop_default(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    found, value = inst.pop(args[1], sig.args[1])
+    restype = sig.return_type
+    value = context.cast(builder, value, inst.value_type, restype)
+    default = context.cast(builder, args[2], sig.args[2], restype)
+    return builder.select(found, value, default)
+
+@lower_builtin("dict.setdefault", types.DictType, types.Any, types.Any)
+def dict_setdefault(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    key = inst.cast_stored_key(args[1], sig.args[1])
+    default = args[2]
+    found, entry = inst.lookup(key)
+    with builder.if_else(found) as (if_found, if_not_found):
+        with if_found:
+            present = entry.value
+            bb_found = builder.basic_block
+        with if_not_found:
+            inst.setitem(key, default)
+            bb_not_found = builder.basic_block
+    res = builder.phi(present.type)
+    res.add_incoming(present, bb_found)
+    res.add_incoming(default, bb_not_found)
+    return impl_ret_borrowed(context, builder, sig.return_type, res)
+
+@lower_builtin("dict.popitem", types.DictType)
+def dict_popitem(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    used = inst.payload.used
+    with builder.if_then(cgutils.is_null(builder, used), likely=False):
+        context.call_conv.return_user_exc(builder, KeyError,
+                                          ("popitem(): dictionary is empty",))
+    key, value = inst.popitem()
+    return context.make_tuple(builder, sig.return_type, (key, value))
+
+@lower_builtin("dict.clear", types.DictType)
+def dict_clear(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    inst.clear()
+    return context.get_dummy_value()
+
+@lower_builtin("dict.copy", types.DictType)
+def dict_copy(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    other = inst.copy()
+    return impl_ret_new_ref(context, builder, sig.return_type, other.value)
+
+@lower_builtin("dict.update", types.DictType, types.DictType)
+def dict_update(context, builder, sig, args):
+    inst = DictInstance(context, builder, sig.args[0], args[0])
+    other = DictInstance(context, builder, sig.args[1], args[1])
+    inst.update(other)
+    return context.get_dummy_value()
+
+def _dict_iter(kind):
+    def dict_iter(context, builder, sig, args):
+        inst = DictIterInstance.from_set(context, builder, sig.return_type,
+                                         args[0])
+        return impl_ret_borrowed(context, builder, sig.return_type,
+                                 inst.value)
+    return dict_iter
+
+for kind in ('keys', 'values', 'items'):
+    lower_builtin("dict." + kind, types.DictType)(_dict_iter(kind))
@@ -35,6 +35,23 @@ def get_itemsize(context, list_type):
     return context.get_abi_sizeof(llty)
 
 
+def _set_payload_dirty(context, payload, val):
+    """
+    Mark the whole list *payload* as changed or unchanged.
+    """
+    intp_t = context.get_value_type(types.intp)
+    maxint = ir.Constant(intp_t, (1 << (intp_t.width - 1)) - 1)
+    zero = ir.Constant(intp_t, 0)
+    if val:
+        payload.dirty = cgutils.true_bit
+        payload.dirty_lo = zero
+        payload.dirty_hi = maxint
+    else:
+        payload.dirty = cgutils.false_bit
+        payload.dirty_lo = maxint
+        payload.dirty_hi = zero
+
+
 class _ListPayloadMixin(object):
 
     @property
@@ -49,6 +66,14 @@ class _ListPayloadMixin(object):
     def dirty(self):
         return self._payload.dirty
 
+    @property
+    def dirty_range(self):
+        """
+        The (start, stop) range of indices which may hold changed items.
+        """
+        payload = self._payload
+        return payload.dirty_lo, payload.dirty_hi
+
     @property
     def data(self):
         return self._payload._get_ptr_by_name('data')
@@ -155,14 +180,33 @@ class ListInstance(_ListPayloadMixin):
         return self._list.meminfo
 
     def set_dirty(self, val):
+        """
+        Mark the whole list as changed (if *val* is true) or unchanged.
+        """
         if self._ty.reflected:
-            self._payload.dirty = cgutils.true_bit if val else cgutils.false_bit
+            _set_payload_dirty(self._context, self._payload, val)
+
+    def mark_dirty(self, start, stop):
+        """
+        Mark the items in [start, stop) as changed, so that only those
+        need reflecting (together with any size change).
+        """
+        if self._ty.reflected:
+            builder = self._builder
+            payload = self._payload
+            lo = payload.dirty_lo
+            hi = payload.dirty_hi
+            payload.dirty = cgutils.true_bit
+            payload.dirty_lo = builder.select(
+                builder.icmp_signed('<', start, lo), start, lo)
+            payload.dirty_hi = builder.select(
+                builder.icmp_signed('>', stop, hi), stop, hi)
 
     def setitem(self, idx, val):
         ptr = self._gep(idx)
         data_item = self._datamodel.as_data(self._builder, val)
         self._builder.store(data_item, ptr)
-        self.set_dirty(True)
+        self.mark_dirty(idx, self._builder.add(idx, ir.Constant(idx.type, 1)))
 
     def inititem(self, idx, val):
         ptr = self._gep(idx)
@@ -210,7 +254,7 @@ class ListInstance(_ListPayloadMixin):
                     self._list.parent = context.get_constant_null(types.pyobject)
                     self._payload.allocated = nitems
                     self._payload.size = ir.Constant(intp_t, 0)  # for safety
-                    self._payload.dirty = cgutils.false_bit
+                    _set_payload_dirty(context, self._payload, False)
 
         return builder.load(ok), self
 
@@ -295,8 +339,13 @@ class ListInstance(_ListPayloadMixin):
                                                     builder.ashr(new_size, two)))
             _payload_realloc(new_allocated)
 
+        # The items between the old and new sizes are either removed
+        # or uninitialized, so they need reflecting
+        old_size = self._payload.size
         self._payload.size = new_size
-        self.set_dirty(True)
+        is_growing = builder.icmp_signed('<', old_size, new_size)
+        self.mark_dirty(builder.select(is_growing, old_size, new_size),
+                        builder.select(is_growing, new_size, old_size))
 
     def move(self, dest_idx, src_idx, count):
         """
@@ -306,7 +355,7 @@ class ListInstance(_ListPayloadMixin):
         src_ptr = self._gep(src_idx)
         cgutils.raw_memmove(self._builder, dest_ptr, src_ptr,
                             count, itemsize=self._itemsize)
-        self.set_dirty(True)
+        self.mark_dirty(dest_idx, self._builder.add(dest_idx, count))
 
 
 class ListIterInstance(_ListPayloadMixin):
@@ -738,7 +787,8 @@ def list_clear(context, builder, sig, args):
 @lower_builtin("list.copy", types.List)
 def list_copy(context, builder, sig, args):
     def list_copy_impl(lst):
-        return list(lst)
+        # Slicing preserves the list type, unlike list()
+        return lst[:]
 
     return context.compile_internal(builder, list_copy_impl, sig, args)
 
@@ -771,12 +821,35 @@ def _list_extend_list(context, builder, sig, args):
 
     return dest
 
+def _list_extend_array(context, builder, sig, args):
+    from .arrayobj import make_array, load_item
+
+    arrty = sig.args[1]
+    src = make_array(arrty)(context, builder, args[1])
+    dest = ListInstance(context, builder, sig.args[0], args[0])
+
+    src_size = src.nitems
+    dest_size = dest.size
+    dest.resize(builder.add(src_size, dest_size))
+
+    with cgutils.for_range(builder, src_size) as loop:
+        ptr = cgutils.get_item_pointer(builder, arrty, src, [loop.index])
+        value = load_item(context, builder, arrty, ptr)
+        value = context.cast(builder, value, arrty.dtype, dest.dtype)
+        dest.setitem(builder.add(loop.index, dest_size), value)
+
+    return dest
+
 @lower_builtin("list.extend", types.List, types.IterableType)
 def list_extend(context, builder, sig, args):
     if isinstance(sig.args[1], types.List):
         # Specialize for list operands, for speed.
         _list_extend_list(context, builder, sig, args)
         return context.get_dummy_value()
+    if isinstance(sig.args[1], types.Array) and sig.args[1].ndim == 1:
+        # Likewise for 1d arrays: resize once and copy the items.
+        _list_extend_array(context, builder, sig, args)
+        return context.get_dummy_value()
 
     def list_extend(lst, iterable):
         # Speed hack to avoid NRT refcount operations inside the loop
@@ -70,6 +70,12 @@ class TargetOptions(object):
         if kws.pop('fastmath', False):
             flags.set('fastmath')
 
+        if kws.pop('assume_homogeneous', False):
+            flags.set('assume_homogeneous')
+
+        if kws.pop('tiered', False):
+            flags.set('tiered')
+
         if 'error_model' in kws:
             flags.set('error_model', kws.pop('error_model'))
 
@@ -0,0 +1,179 @@
+"""
+A parallel sample sort for 1-d arrays, built on top of the serial
+quicksort in quicksort.py.  The parallel phases are written as prange
+loops, so that a jitted driver compiled with parallel=True runs them
+on the npyufunc thread pool.
+"""
+
+from __future__ import print_function, absolute_import, division
+
+import collections
+
+import numpy as np
+
+from numba import config
+from numba.parfor import prange
+from . import quicksort
+
+
+ParallelSortImplementation = collections.namedtuple(
+    'ParallelSortImplementation',
+    (# The compile function itself
+     'compile',
+     # Subroutines exercised by test_sort
+     'choose_splitters', 'find_bucket',
+     # The top-level function
+     'run_parallel_sort',
+     ))
+
+
+# Under this size, the serial quicksort is used directly
+PARALLEL_SORT_THRESHOLD = 1 << 16
+
+# Number of samples taken per bucket when choosing the splitters
+OVERSAMPLING = 32
+
+
+def make_parallel_sort_impl(wrap, par_wrap, make_quicksort, lt=None,
+                            is_argsort=False, nbuckets=None,
+                            threshold=PARALLEL_SORT_THRESHOLD):
+    """
+    Make a sample sort implementation.  *wrap* compiles the serial
+    subroutines, *par_wrap* compiles the top-level function whose prange
+    loops are run in parallel.  *nbuckets* defaults to the size of the
+    thread pool.
+    """
+    if nbuckets is None:
+        nbuckets = config.NUMBA_NUM_THREADS
+    nsamples = nbuckets * OVERSAMPLING
+    # The sample must not exceed the array
+    min_size = max(threshold, nsamples)
+
+    # The splitters are always chosen with a value sort, the buckets
+    # are sorted with the requested kind of sort.
+    sample_sort = make_quicksort(lt=lt).run_quicksort_range
+    sort_impl = make_quicksort(lt=lt, is_argsort=is_argsort)
+    run_quicksort = sort_impl.run_quicksort
+    run_quicksort_range = sort_impl.run_quicksort_range
+
+    if is_argsort:
+        @wrap
+        def make_out(A):
+            return np.empty(len(A), np.intp)
+
+        @wrap
+        def PUT(A, i):
+            return i
+
+    else:
+        @wrap
+        def make_out(A):
+            return np.empty_like(A)
+
+        @wrap
+        def PUT(A, i):
+            return A[i]
+
+    def default_lt(a, b):
+        """
+        Trivial comparison function between two keys.
+        """
+        return a < b
+
+    LT = wrap(lt if lt is not None else default_lt)
+
+    @wrap
+    def choose_splitters(A):
+        """
+        Choose (nbuckets - 1) splitters from a regular sample of A.
+        """
+        step = len(A) // nsamples
+        sample = np.empty(nsamples, A.dtype)
+        for i in range(nsamples):
+            sample[i] = A[i * step]
+        sample_sort(sample, sample, 0, nsamples - 1)
+        splitters = np.empty(nbuckets - 1, A.dtype)
+        for i in range(nbuckets - 1):
+            splitters[i] = sample[(i + 1) * OVERSAMPLING]
+        return splitters
+
+    @wrap
+    def find_bucket(splitters, v):
+        """
+        Return the number of splitters that are not greater than v.
+        """
+        lo = 0
+        hi = len(splitters)
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if LT(v, splitters[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    @par_wrap
+    def run_parallel_sort(A):
+        n = len(A)
+        if nbuckets < 2 or n < min_size:
+            return run_quicksort(A)
+
+        splitters = choose_splitters(A)
+        chunk = (n + nbuckets - 1) // nbuckets
+
+        # Histogram of bucket sizes, per input chunk
+        counts = np.zeros((nbuckets, nbuckets), np.intp)
+        for c in prange(nbuckets):
+            start = c * chunk
+            stop = min(start + chunk, n)
+            for i in range(start, stop):
+                b = find_bucket(splitters, A[i])
+                counts[c, b] += 1
+
+        # Each chunk gets its own write cursor inside each bucket
+        cursors = np.empty((nbuckets, nbuckets), np.intp)
+        bounds = np.empty(nbuckets + 1, np.intp)
+        pos = 0
+        for b in range(nbuckets):
+            bounds[b] = pos
+            for c in range(nbuckets):
+                cursors[c, b] = pos
+                pos += counts[c, b]
+        bounds[nbuckets] = n
+
+        # Scatter into the buckets
+        R = make_out(A)
+        for c in prange(nbuckets):
+            start = c * chunk
+            stop = min(start + chunk, n)
+            for i in range(start, stop):
+                b = find_bucket(splitters, A[i])
+                R[cursors[c, b]] = PUT(A, i)
+                cursors[c, b] += 1
+
+        # Sort the buckets independently
+        for b in prange(nbuckets):
+            run_quicksort_range(A, R, bounds[b], bounds[b + 1] - 1)
+
+        if not is_argsort:
+            for i in prange(n):
+                A[i] = R[i]
+        return R
+
+    return ParallelSortImplementation(wrap,
+                                      choose_splitters, find_bucket,
+                                      run_parallel_sort)
+
+
+def make_py_parallel_sort(*args, **kwargs):
+    return make_parallel_sort_impl((lambda f: f), (lambda f: f),
+                                   quicksort.make_py_quicksort,
+                                   *args, **kwargs)
+
+def make_jit_parallel_sort(*args, **kwargs):
+    from numba.extending import register_jitable
+    from numba.decorators import njit
+    return make_parallel_sort_impl((lambda f: register_jitable(f)),
+                                   (lambda f: njit(parallel=True)(f)),
+                                   quicksort.make_jit_quicksort,
+                                   *args, **kwargs)
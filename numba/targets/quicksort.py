@@ -14,6 +14,8 @@ QuicksortImplementation = collections.namedtuple(
      'compile',
      # All subroutines exercised by test_sort
      'partition', 'partition3', 'insertion_sort',
+     # Sort a sub-range in place (used by the parallel sort)
+     'run_quicksort_range',
      # The top-level function
      'run_quicksort',
      ))
@@ -160,14 +162,15 @@ def make_quicksort_impl(wrap, lt=None, is_argsort=False):
         return lt, gt
 
     @wrap
-    def run_quicksort(A):
-        R = make_res(A)
-
-        if len(A) < 2:
-            return R
+    def run_quicksort_range(A, R, low, high):
+        """
+        Sort R[low:high + 1] in place. Note the inclusive bounds.
+        """
+        if high <= low:
+            return
 
         stack = [Partition(zero, zero)] * MAX_STACK
-        stack[0] = Partition(zero, len(A) - 1)
+        stack[0] = Partition(low, high)
         n = 1
 
         while n > 0:
@@ -192,6 +195,14 @@ def make_quicksort_impl(wrap, lt=None, is_argsort=False):
 
             insertion_sort(A, R, low, high)
 
+    @wrap
+    def run_quicksort(A):
+        R = make_res(A)
+
+        if len(A) < 2:
+            return R
+
+        run_quicksort_range(A, R, zero, len(A) - 1)
         return R
 
     # Unused quicksort implementation based on 3-way partitioning; the
@@ -230,7 +241,7 @@ def make_quicksort_impl(wrap, lt=None, is_argsort=False):
 
     return QuicksortImplementation(wrap,
                                    partition, partition3, insertion_sort,
-                                   run_quicksort)
+                                   run_quicksort_range, run_quicksort)
 
 
 def make_py_quicksort(*args, **kwargs):
@@ -441,6 +441,14 @@ class SetInstance(object):
                 self.upsize(used)
             self.set_dirty(True)
 
+    def _reinsert_entry(self, payload, entry):
+        """
+        Insert into *payload* the contents of *entry*, an entry of another
+        payload for the same set (e.g. when resizing).  The payload isn't
+        resized.
+        """
+        self._add_key(payload, entry.key, entry.hash, do_resize=False)
+
     def _remove_entry(self, payload, entry, do_resize=True):
         # Mark entry deleted
         entry.hash = ir.Constant(entry.hash.type, DELETED)
@@ -547,9 +555,7 @@ class SetInstance(object):
 
                 other_payload = other.payload
                 with payload._iterate() as loop:
-                    entry = loop.entry
-                    other._add_key(other_payload, entry.key, entry.hash,
-                                   do_resize=False)
+                    other._reinsert_entry(other_payload, loop.entry)
 
         return other
 
@@ -898,9 +904,7 @@ class SetInstance(object):
         # Re-insert old entries
         payload = self.payload
         with old_payload._iterate() as loop:
-            entry = loop.entry
-            self._add_key(payload, entry.key, entry.hash,
-                          do_resize=False)
+            self._reinsert_entry(payload, loop.entry)
 
         self._free_payload(old_payload.ptr)
 
@@ -1082,6 +1086,12 @@ class SetIterInstance(object):
     def index(self, value):
         self._builder.store(value, self._iter.index)
 
+    def get_yield_value(self, entry):
+        """
+        Return the value yielded for the given *entry*.
+        """
+        return entry.key
+
     def iternext(self, result):
         index = self.index
         payload = self._payload
@@ -1093,7 +1103,7 @@ class SetIterInstance(object):
             # An entry was found
             entry = loop.entry
             result.set_valid()
-            result.yield_(entry.key)
+            result.yield_(self.get_yield_value(entry))
             self.index = self._builder.add(loop.index, one)
             loop.do_break()
 
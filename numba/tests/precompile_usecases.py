@@ -0,0 +1,19 @@
+"""
+This file will be copied to a temporary directory in order to
+exercise the "numba precompile" command.
+"""
+
+from numba import jit
+
+
+@jit("float64(float64)", cache=True, nopython=True)
+def double(x):
+    return x * 2
+
+@jit(cache=True, nopython=True)
+def add(x, y):
+    return x + y
+
+@jit(nopython=True)
+def add_nocache(x, y):
+    return x + y
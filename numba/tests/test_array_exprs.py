@@ -75,6 +75,30 @@ def distance_matrix(vectors):
     return result
 
 
+def fancy_gather(idx, a, b):
+    return np.sqrt(a[idx]) * b[idx] + 1.0
+
+def fancy_scatter(out, idx, a, b):
+    out[idx] = a[idx] * b[idx] - 1
+
+def fancy_mixed_indices(idx1, idx2, a, b):
+    return a[idx1] * b[idx2]
+
+@njit
+def _fill_ones(a):
+    a[:] = 1.0
+
+def fancy_gather_call_between(idx, a):
+    t = a[idx]
+    _fill_ones(a)
+    return t * 2.0
+
+def fancy_gather_setitem_between(idx, a):
+    t = a[idx]
+    a[idx[0]] = 100.0
+    return t * 2.0
+
+
 class RewritesTester(Pipeline):
     @classmethod
     def mk_pipeline(cls, args, return_type=None, flags=None, locals={},
@@ -376,6 +400,97 @@ class TestArrayExpressions(MemoryLeakMixin, TestCase):
                                 ns.test_pipeline.func_ir.blocks)
 
 
+class TestFancyIndexedArrayExprs(MemoryLeakMixin, TestCase):
+    """
+    Tests for the fusion of fancy indexing into array expressions.
+    """
+
+    def _get_ops(self, pipeline):
+        return set(instr.value.op
+                   for block in pipeline.func_ir.blocks.values()
+                   for instr in block.body
+                   if isinstance(instr, ir.Assign)
+                   and isinstance(instr.value, ir.Expr))
+
+    def _compile_function(self, fn, args):
+        arg_tys = [typeof(arg) for arg in args]
+        test_pipeline = RewritesTester.mk_pipeline(arg_tys)
+        cfunc = test_pipeline.compile_extra(fn).entry_point
+        return test_pipeline, cfunc
+
+    def _indices(self, n):
+        rnd = np.random.RandomState(42)
+        yield np.array([0, n - 1, -2, 3, 3])
+        yield rnd.randint(0, n, size=2 * n).astype(np.int32)
+        yield rnd.random_sample(n) > 0.5
+        yield np.zeros(n, dtype=np.bool_)
+
+    def test_gather(self):
+        a = np.linspace(1, 2, 10)
+        b = np.arange(10)
+        for idx in self._indices(10):
+            pipeline, cfunc = self._compile_function(fancy_gather,
+                                                     (idx, a, b))
+            self.assertIn('fancy_arrayexpr', self._get_ops(pipeline))
+            self.assertNotIn('getitem', self._get_ops(pipeline))
+            self.assertPreciseEqual(cfunc(idx, a, b), fancy_gather(idx, a, b))
+
+    def test_scatter(self):
+        a = np.linspace(1, 2, 10)
+        b = np.arange(10)
+        for idx in self._indices(10):
+            out = np.zeros(10, dtype=np.int32)
+            args = (out, idx, a, b)
+            pipeline, cfunc = self._compile_function(fancy_scatter, args)
+            self.assertIn('fancy_arrayexpr_setitem', self._get_ops(pipeline))
+            expected = out.copy()
+            fancy_scatter(expected, idx, a, b)
+            cfunc(*args)
+            self.assertPreciseEqual(out, expected)
+
+    def test_scatter_overlap(self):
+        # The destination overlaps the operands: the result must be the
+        # same as with temporaries.
+        arr = np.linspace(1, 2, 12)
+        views = [lambda x: (x[:10], x[:10]),
+                 lambda x: (x[2:], x[:10]),
+                 lambda x: (x[:10], x[::-1][:10])]
+        for idx in self._indices(10):
+            for make_views in views:
+                out, a = make_views(arr)
+                pipeline, cfunc = self._compile_function(fancy_scatter,
+                                                         (out, idx, a, a))
+                expected = arr.copy()
+                out, a = make_views(expected)
+                fancy_scatter(out, idx, a, a)
+                got = arr.copy()
+                out, a = make_views(got)
+                cfunc(out, idx, a, a)
+                self.assertPreciseEqual(got, expected)
+
+    def test_mixed_indices(self):
+        # Different indices are not fused
+        idx1 = np.array([0, 1])
+        idx2 = np.array([2, 3])
+        a = np.arange(5.0)
+        args = (idx1, idx2, a, a)
+        pipeline, cfunc = self._compile_function(fancy_mixed_indices, args)
+        self.assertNotIn('fancy_arrayexpr', self._get_ops(pipeline))
+        self.assertPreciseEqual(cfunc(*args), fancy_mixed_indices(*args))
+
+    def test_side_effect_between(self):
+        # The gathers aren't moved past calls or setitems which may
+        # mutate the source arrays
+        idx = np.array([1, 3])
+        for pyfunc in (fancy_gather_call_between,
+                       fancy_gather_setitem_between):
+            a = np.arange(5.0)
+            pipeline, cfunc = self._compile_function(pyfunc, (idx, a))
+            self.assertNotIn('fancy_arrayexpr', self._get_ops(pipeline))
+            expected = pyfunc(idx, a.copy())
+            self.assertPreciseEqual(cfunc(idx, a.copy()), expected)
+
+
 class TestRewriteIssues(MemoryLeakMixin, TestCase):
 
     def test_issue_1184(self):
@@ -116,6 +116,12 @@ def array_nanvar(arr):
 def array_nanmedian_global(arr):
     return np.nanmedian(arr)
 
+def array_percentile_global(arr, q):
+    return np.percentile(arr, q)
+
+def array_nanpercentile_global(arr, q):
+    return np.nanpercentile(arr, q)
+
 
 def base_test_arrays(dtype):
     if dtype == np.bool_:
@@ -348,6 +354,82 @@ class TestArrayReductions(MemoryLeakMixin, TestCase):
 
         self.check_median_basic(pyfunc, variations)
 
+    def check_percentile_basic(self, pyfunc, array_variations):
+        cfunc = jit(nopython=True)(pyfunc)
+        def check(arr, q):
+            expected = pyfunc(arr, q)
+            got = cfunc(arr, q)
+            self.assertPreciseEqual(got, expected)
+
+        qs = [0, 13, 50, 99.5, 100, np.float64([0, 25, 50, 75]), [30, 70]]
+        for a in array_variations(np.arange(63) + 10.5):
+            for q in qs:
+                check(a, q)
+                check(a.reshape((9, 7)).T, q)
+        for a in array_variations(np.arange(64, dtype=np.int32)):
+            for q in qs:
+                check(a, q)
+
+        # Exceptions leak references
+        self.disable_leak_check()
+        with self.assertRaises(ValueError) as raises:
+            cfunc(np.arange(5.), 101)
+        self.assertIn("Percentiles must be in the range [0,100]",
+                      str(raises.exception))
+
+    def test_percentile_basic(self):
+        pyfunc = array_percentile_global
+
+        def variations(a):
+            # Sorted, reversed, random, many duplicates
+            yield a
+            a = a[::-1].copy()
+            yield a
+            np.random.shuffle(a)
+            yield a
+            a[a % 4 >= 1] = 3
+            yield a
+
+        self.check_percentile_basic(pyfunc, variations)
+
+        # A NaN makes the result NaN
+        cfunc = jit(nopython=True)(pyfunc)
+        a = np.arange(10.)
+        a[3] = np.nan
+        self.assertTrue(np.isnan(cfunc(a, 50)))
+
+        # Numpy raises on empty arrays too
+        with self.assertRaises(ValueError) as raises:
+            cfunc(np.empty(0), 50)
+        self.assertIn("Cannot compute percentiles of an empty array",
+                      str(raises.exception))
+        with self.assertRaises(ValueError):
+            cfunc(np.empty((0, 3)), [30, 70])
+
+    @unittest.skipUnless(np_version >= (1, 9), "nanpercentile needs Numpy 1.9+")
+    def test_nanpercentile_basic(self):
+        pyfunc = array_nanpercentile_global
+
+        def variations(a):
+            # Sorted, reversed, random, many duplicates, many NaNs
+            yield a
+            a = a[::-1].copy()
+            yield a
+            np.random.shuffle(a)
+            yield a
+            a[a % 4 <= 1] = 3
+            yield a
+            if a.dtype.kind == 'f':
+                a[a % 4 >= 2] = float('nan')
+                yield a
+
+        self.check_percentile_basic(pyfunc, variations)
+
+        # Empty arrays, or arrays of NaNs only, give NaN as in Numpy
+        cfunc = jit(nopython=True)(pyfunc)
+        self.assertTrue(np.isnan(cfunc(np.empty(0), 50)))
+        self.assertTrue(np.isnan(cfunc(np.full(3, np.nan), 50)))
+
     def test_array_sum_global(self):
         arr = np.arange(10, dtype=np.int32)
         arrty = typeof(arr)
@@ -1,6 +1,8 @@
 from __future__ import print_function, division, absolute_import
 
 import array
+import ctypes
+import mmap
 import sys
 
 import numpy as np
@@ -244,6 +246,77 @@ class TestBufferProtocol(MemoryLeakMixin, TestCase):
             self.check_getitem(buf)
 
 
+@jit(nopython=True)
+def sum_usecase(buf):
+    return buf.sum()
+
+
+@jit(nopython=True)
+def scale_usecase(buf, k):
+    buf *= k
+
+
+@jit(nopython=True)
+def identity_usecase(buf):
+    return buf
+
+
+@unittest.skipUnless(sys.version_info >= (3,),
+                     "mmap and ctypes don't support PEP 3118 on 2.7")
+class TestBufferArray(MemoryLeakMixin, TestCase):
+    """
+    Test generic buffer-providing objects, which are viewed as arrays.
+    """
+
+    def test_mmap(self):
+        m = mmap.mmap(-1, 16)
+        m[:4] = b"\x01\x02\x03\x04"
+        self.assertPreciseEqual(sum_usecase(m), np.uint64(10))
+        scale_usecase(m, np.uint8(2))
+        self.assertEqual(m[:5], b"\x02\x04\x06\x08\x00")
+        m.close()
+
+    def test_ctypes(self):
+        arr = ((ctypes.c_double * 3) * 2)()
+        arr[1][2] = 1.5
+        self.assertPreciseEqual(sum_usecase(arr), 1.5)
+        # The data is modified in place
+        scale_usecase(arr, 2.0)
+        self.assertEqual(arr[1][2], 3.0)
+        got = identity_usecase(arr)
+        self.assertIsInstance(got, np.ndarray)
+        self.assertEqual(got.shape, (2, 3))
+        got[0, 1] = 4.0
+        self.assertEqual(arr[0][1], 4.0)
+
+    def test_ctypes_struct(self):
+        class Struct(ctypes.Structure):
+            _fields_ = [('a', ctypes.c_int8), ('b', ctypes.c_double)]
+
+        arr = (Struct * 3)()
+        for i in range(3):
+            arr[i].a = i
+            arr[i].b = i + 0.5
+        got = identity_usecase(arr)
+        self.assertEqual(list(got['a']), [0, 1, 2])
+        self.assertEqual(list(got['b']), [0.5, 1.5, 2.5])
+
+    def test_lifetime(self):
+        # The exporter is pinned while a view of its data is alive
+        m = mmap.mmap(-1, 16)
+        got = identity_usecase(m)
+        with self.assertRaises(BufferError):
+            m.close()
+        del got
+        m.close()
+        # Read-only exporters give read-only arrays
+        m = mmap.mmap(-1, 16, access=mmap.ACCESS_READ)
+        got = identity_usecase(m)
+        self.assertFalse(got.flags.writeable)
+        del got
+        m.close()
+
+
 class TestMemoryView(MemoryLeakMixin, TestCase):
     """
     Test memoryview-specific attributes and operations.
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+import numpy as np
+
+from numba import njit, types
+from numba.typed import Dict, typeddict
+from numba import unittest_support as unittest
+from .support import TestCase, MemoryLeakMixin
+
+
+def getitem_usecase(a, i):
+    return a[i]
+
+def setitem_usecase(a, i, v):
+    a[i] = v
+
+def slice_usecase(a):
+    return a[1:]
+
+def len_usecase(s):
+    return len(s)
+
+def eq_usecase(x, y):
+    return x == y
+
+def ne_usecase(x, y):
+    return x != y
+
+def lt_usecase(x, y):
+    return x < y
+
+def le_usecase(x, y):
+    return x <= y
+
+def gt_usecase(x, y):
+    return x > y
+
+def ge_usecase(x, y):
+    return x >= y
+
+def hash_usecase(s):
+    return hash(s)
+
+def unique_usecase(a):
+    return len(set(a))
+
+def count_usecase(a):
+    d = dict()
+    for s in a:
+        if s in d:
+            d[s] += 1
+        else:
+            d[s] = 1
+    return d
+
+KEY = np.str_(u'yy')
+
+def constant_usecase(a):
+    n = 0
+    for s in a:
+        if s == KEY:
+            n += 1
+    return n
+
+
+class TestCharSeq(MemoryLeakMixin, TestCase):
+
+    def setUp(self):
+        super(TestCharSeq, self).setUp()
+        words = [u'foo', u'bär', u'', u'foobar', u'foo', u'ba']
+        self.unicode_array = np.array(words, dtype='U6')
+        self.bytes_array = np.array([w.encode('utf8') for w in words],
+                                    dtype='S7')
+
+    def arrays(self):
+        return self.bytes_array, self.unicode_array
+
+    def test_getitem(self):
+        cfunc = njit(getitem_usecase)
+        for a in self.arrays():
+            for i in range(len(a)):
+                got = cfunc(a, i)
+                self.assertEqual(got, a[i])
+                self.assertIs(type(got), type(a[i].item()))
+
+    def test_setitem(self):
+        cfunc = njit(setitem_usecase)
+        for a in self.arrays():
+            a = a.copy()
+            # Between arrays of different widths
+            b = a.astype(a.dtype.kind + '3')
+            cfunc(a, 0, b[3])
+            self.assertEqual(a[0], a[3][:3])
+            cfunc(b, 1, a[3])
+            self.assertEqual(b[1], a[3][:3])
+
+    def test_slice(self):
+        cfunc = njit(slice_usecase)
+        for a in self.arrays():
+            self.assertPreciseEqual(cfunc(a), a[1:])
+
+    def test_len(self):
+        cfunc = njit(len_usecase)
+        for a in self.arrays():
+            for s in a:
+                self.assertEqual(cfunc(s), len(s))
+        # Trailing nulls are ignored, other nulls are not
+        self.assertEqual(cfunc(np.bytes_(b'a\0b\0\0')), 3)
+
+    def test_comparisons(self):
+        for pyfunc in (eq_usecase, ne_usecase, lt_usecase, le_usecase,
+                       gt_usecase, ge_usecase):
+            cfunc = njit(pyfunc)
+            for a in self.arrays():
+                # Also compare sequences of different widths
+                b = a.astype(a.dtype.kind + '3')
+                for x in a:
+                    for y in np.concatenate([a, b]):
+                        self.assertPreciseEqual(cfunc(x, y), pyfunc(x, y),
+                                                msg=(pyfunc, x, y))
+
+    def test_hash(self):
+        cfunc = njit(hash_usecase)
+        for a in self.arrays():
+            b = a.astype(a.dtype.kind + '10')
+            hashes = [cfunc(s) for s in a]
+            # Equal values have equal hashes whatever their widths
+            self.assertEqual(hashes, [cfunc(s) for s in b])
+            self.assertEqual(hashes[0], hashes[4])
+            self.assertEqual(len(set(hashes)), 5)
+
+    def test_set(self):
+        cfunc = njit(unique_usecase)
+        for a in self.arrays():
+            self.assertEqual(cfunc(a), len(set(a)))
+
+    def test_dict_keys(self):
+        cfunc = njit(count_usecase)
+        for a in self.arrays():
+            d = cfunc(a)
+            self.assertIsInstance(d, Dict)
+            self.assertEqual(dict(d), count_usecase(a))
+            # Python str and bytes can be used as keys
+            self.assertEqual(d[a[0].item()], 2)
+            self.assertIn(a[1].item(), d)
+
+    def test_dict_python_keys(self):
+        # References are leaked on exception
+        self.disable_leak_check()
+
+        cases = [(types.UnicodeCharSeq(4), [u'a', u'bb', u'dddd']),
+                 (types.CharSeq(4), [b'a', b'bb', b'dddd'])]
+        for key_type, keys in cases:
+            d = Dict.empty(key_type, types.int64)
+            for i, key in enumerate(keys):
+                d[key] = i
+            for i, key in enumerate(keys):
+                self.assertEqual(d[key], i)
+            self.assertNotIn(keys[0] * 2, d)
+            # Keys of all lengths share one specialization
+            dict_type = d._numba_type_
+            sigs = [sig for sig in typeddict._setitem.signatures
+                    if sig[0] == dict_type]
+            self.assertEqual(sigs, [(dict_type, key_type, types.int64)])
+            # Keys which don't fit or have the wrong type are rejected
+            with self.assertRaises(ValueError):
+                d[keys[-1] * 2] = 0
+            with self.assertRaises(TypeError):
+                d[keys[0].decode() if isinstance(keys[0], bytes)
+                  else keys[0].encode()]
+            self.assertEqual(len(d), len(keys))
+
+    def test_constant(self):
+        cfunc = njit(constant_usecase)
+        a = np.array([u'x', u'yy', u'yy', u'yyy'], dtype='U3')
+        self.assertEqual(cfunc(a), 2)
+
+    def test_boxing(self):
+        cfunc = njit(lambda x: x)
+        for s in [np.bytes_(b'ab\0c'), np.str_(u'héllo'), np.str_(u'\U0001F600'),
+                  np.str_(u'')]:
+            got = cfunc(s)
+            self.assertEqual(got, s)
+            self.assertIs(type(got), type(s.item()))
+
+
+if __name__ == '__main__':
+    unittest.main()
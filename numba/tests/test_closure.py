@@ -7,7 +7,7 @@ import numpy as np
 import numpy
 
 import numba.unittest_support as unittest
-from numba import njit, jit, testing, utils
+from numba import compiler, njit, jit, testing, utils
 from numba.errors import NotDefinedError, TypingError, LoweringError
 from .support import TestCase, tag
 
@@ -117,6 +117,31 @@ class TestInlinedClosure(TestCase):
     at compile time.
     """
 
+    def test_inline_prescan(self):
+        # The inline pass is only run on functions defining closures
+        # or lists
+
+        def outer(x):
+
+            def inner(x):
+                return x * x
+
+            return inner(x)
+
+        def plain(x):
+            return x * x
+
+        def with_list(n):
+            return [i for i in range(n)]
+
+        ops = ('make_function', 'build_list')
+        self.assertTrue(compiler.has_exprs(compiler.run_frontend(outer), ops))
+        self.assertFalse(compiler.has_exprs(compiler.run_frontend(plain), ops))
+        self.assertTrue(compiler.has_exprs(compiler.run_frontend(with_list),
+                                           ops))
+        self.assertEqual(njit(outer)(3), outer(3))
+        self.assertEqual(njit(plain)(3), plain(3))
+
     @tag('important')
     def test_inner_function(self):
 
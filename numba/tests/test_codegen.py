@@ -46,6 +46,30 @@ asm_sum_outer = """
     }
 """
 
+asm_sum_middle = """
+    declare i32 @"__main__.ising_element_update$1.array(int8,_2d,_C).int64.int64"(i32 %.1, i32 %.2)
+
+    define i32 @sum_middle(i32 %.1, i32 %.2) {
+      %.3 = call i32 @"__main__.ising_element_update$1.array(int8,_2d,_C).int64.int64"(i32 %.1, i32 %.2)
+      ret i32 %.3
+    }
+"""
+
+asm_sum_through_middle = """
+    declare i32 @sum_middle(i32 %.1, i32 %.2)
+
+    define i32 @sum(i32 %.1, i32 %.2) {
+      %.3 = call i32 @sum_middle(i32 %.1, i32 %.2)
+      ret i32 %.3
+    }
+"""
+
+asm_unrelated = """
+    define i32 @unrelated(i32 %.1) {
+      ret i32 %.1
+    }
+"""
+
 ctypes_sum_ty = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_int, ctypes.c_int)
 
 
@@ -101,6 +125,25 @@ class JITCPUCodegenTestCase(TestCase):
         cfunc = ctypes_sum_ty(ptr)
         self.assertEqual(cfunc(2, 3), 5)
 
+    def test_link_needed_libraries(self):
+        def make_library(asm):
+            library = self.codegen.create_library('linking_module')
+            library.add_llvm_module(ll.parse_assembly(asm))
+            return library
+
+        # Libraries registered with the codegen are only linked in if
+        # they define something needed
+        self.codegen.add_linking_library(make_library(asm_unrelated))
+        self.codegen.add_linking_library(make_library(asm_sum_inner))
+        self.codegen.add_linking_library(make_library(asm_sum_middle))
+        library = self.compile_module(asm_sum_through_middle)
+        library._link_libraries()
+        names = set(fn.name for fn in library._final_module.functions)
+        self.assertIn("sum_middle", names)
+        self.assertNotIn("unrelated", names)
+        cfunc = ctypes_sum_ty(library.get_pointer_to_function("sum"))
+        self.assertEqual(cfunc(2, 3), 5)
+
     def test_magic_tuple(self):
         tup = self.codegen.magic_tuple()
         pickle.dumps(tup)
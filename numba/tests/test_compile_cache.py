@@ -1,13 +1,19 @@
 from __future__ import division
 
+import contextlib
+import os
+import subprocess
+import sys
+
 import numba.unittest_support as unittest
 
 import llvmlite.llvmpy.core as lc
 
 import numpy as np
 
-from numba import compiler, types, typing
-from numba.targets import callconv, cpu
+from numba import caching, compiler, types, typing
+from numba.targets import arraymath, callconv, cpu
+from .support import TestCase, override_config, temp_directory
 
 
 class TestCompileCache(unittest.TestCase):
@@ -129,5 +135,131 @@ class TestCompileCache(unittest.TestCase):
         self.assertEqual(2, len(context.cached_internal_func))
 
 
+class TestSubroutineCache(TestCase):
+    """
+    Tests for the on-disk cache of the functions compiled by
+    BaseContext.compile_subroutine().
+    """
+
+    @contextlib.contextmanager
+    def cache_test_helpers(self):
+        """
+        Allow caching the helpers defined by the tests, like Numba's own.
+        """
+        old = caching._is_numba_subroutine
+        caching._is_numba_subroutine = lambda impl: True
+        try:
+            yield
+        finally:
+            caching._is_numba_subroutine = old
+
+    def test_numba_helpers_only(self):
+        def times5(i):
+            return 5 * i
+
+        # Only the helpers of Numba are covered by its source stamp
+        self.assertTrue(caching._is_numba_subroutine(arraymath.array_sum))
+        self.assertFalse(caching._is_numba_subroutine(times5))
+        self.assertFalse(caching._is_numba_subroutine(temp_directory))
+        context = cpu.CPUContext(typing.Context())
+        sig = typing.signature(types.int32, types.int32)
+        self.assertEqual(caching.get_subroutine_cache(context, times5, sig),
+                         (None, None))
+
+    def test_keys(self):
+        def make_closure(x):
+            def f(z):
+                return z + x
+            return f
+
+        context = cpu.CPUContext(typing.Context())
+        sig = typing.signature(types.int32, types.int32)
+        get_cache = caching.get_subroutine_cache
+
+        with self.cache_test_helpers():
+            cache1, key1 = get_cache(context, make_closure(1), sig)
+            cache2, key2 = get_cache(context, make_closure(2), sig)
+            # Closures share the index of their code, but not their keys
+            self.assertIsInstance(cache1, caching.SubroutineCache)
+            self.assertIs(cache1, cache2)
+            self.assertNotEqual(key1, key2)
+            self.assertEqual(get_cache(context, make_closure(1), sig)[1], key1)
+            self.assertNotEqual(cache1.get_unique_name(key1),
+                                cache1.get_unique_name(key2))
+            # Other signature, other key
+            sig2 = typing.signature(types.int64, types.int64)
+            self.assertNotEqual(get_cache(context, make_closure(1), sig2)[1],
+                                key1)
+            # Other error model, other key
+            np_context = context.subtarget(
+                error_model=callconv.create_error_model('numpy', context))
+            self.assertNotEqual(get_cache(np_context, make_closure(1), sig)[1],
+                                key1)
+            # Closure variables without a stable representation can't be cached
+            self.assertEqual(get_cache(context, make_closure(object()), sig),
+                             (None, None))
+
+    def test_unique_name(self):
+        """
+        Cached functions are named after their key, not after a
+        process-specific id.
+        """
+        def times4(i):
+            return 4 * i
+
+        sig = typing.signature(types.int32, types.int32)
+        with override_config('CACHE_DIR',
+                             temp_directory('test_subroutine_cache')), \
+                self.cache_test_helpers():
+            context = cpu.CPUContext(typing.Context())
+            module = lc.Module("test_module")
+            builder = lc.Builder(module.add_function(
+                context.call_conv.get_function_type(sig.return_type,
+                                                    sig.args),
+                name='test_fn').append_basic_block('entry'))
+            ty = context.compile_subroutine(builder, times4, sig)
+            cache, key = caching.get_subroutine_cache(context, times4, sig)
+            self.assertEqual(ty.fndesc.unique_name, cache.get_unique_name(key))
+            # A fresh context loads the function from the cache
+            context = cpu.CPUContext(typing.Context())
+            ty2 = context.compile_subroutine(builder, times4, sig)
+            self.assertEqual(ty2.fndesc.mangled_name, ty.fndesc.mangled_name)
+
+    def run_in_separate_process(self, cache_dir):
+        code = """if 1:
+            import numpy as np
+            from numba import njit
+
+            f = njit(lambda a: a.sum() + a.argmax())
+            print(f(np.arange(10.0)))
+            """
+        env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir,
+                   NUMBA_DEBUG_CACHE='1')
+        popen = subprocess.Popen([sys.executable, "-c", code], env=env,
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, err = popen.communicate()
+        if popen.returncode != 0:
+            raise AssertionError("process failed with code %s: stderr follows\n%s\n"
+                                 % (popen.returncode, err.decode()))
+        return out.decode().splitlines()
+
+    def test_cold_process(self):
+        cache_dir = temp_directory('test_subroutine_cache')
+
+        def helper_events(lines, event):
+            return [line for line in lines
+                    if event in line and 'subroutine-arraymath' in line]
+
+        lines = self.run_in_separate_process(cache_dir)
+        self.assertEqual(lines[-1], '54.0')
+        self.assertTrue(helper_events(lines, 'data saved to'))
+        self.assertFalse(helper_events(lines, 'data loaded from'))
+        # The helpers needn't be compiled again in another process
+        lines = self.run_in_separate_process(cache_dir)
+        self.assertEqual(lines[-1], '54.0')
+        self.assertFalse(helper_events(lines, 'data saved to'))
+        self.assertTrue(helper_events(lines, 'data loaded from'))
+
+
 if __name__ == '__main__':
     unittest.main()
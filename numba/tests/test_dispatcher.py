@@ -1,6 +1,7 @@
 from __future__ import print_function, division, absolute_import
 
 import errno
+import gc
 import multiprocessing
 import os
 import shutil
@@ -8,14 +9,18 @@ import subprocess
 import sys
 import threading
 import warnings
+import weakref
 
 import numpy as np
 
 from numba import unittest_support as unittest
 from numba import utils, jit, generated_jit, types, typeof
+from numba import compiled_code_stats, signature_log
 from numba import config
 from numba import _dispatcher
+from numba.dispatcher import _tier_up_worker
 from numba.errors import NumbaWarning
+from numba.six.moves import cPickle as pickle
 from .support import TestCase, tag, temp_directory, import_dynamic
 
 
@@ -58,6 +63,13 @@ def bad_generated_usecase(x, y=5):
     return impl
 
 
+@jit(nopython=True, tiered=True)
+def tiered_fib(n):
+    if n < 2:
+        return n
+    return tiered_fib(n - 1) + tiered_fib(n - 2)
+
+
 class BaseTest(TestCase):
 
     jit_args = dict(nopython=True)
@@ -582,6 +594,110 @@ class TestDispatcherMethods(TestCase):
         self.assertEqual(exp_f, got_f)
 
 
+class TestTieredCompilation(TestCase):
+
+    def check_tier_up(self, cfunc):
+        """
+        Wait for *cfunc*'s overloads to be recompiled and check their
+        first and final tiers.
+        """
+        _tier_up_worker.join()
+        self.assertEqual(len(cfunc._superseded), len(cfunc.overloads))
+        for cres in cfunc._superseded:
+            self.assertTrue(cres.library.quick_optimized)
+        for cres in cfunc.overloads.values():
+            self.assertFalse(cres.library.quick_optimized)
+
+    def test_tier_up(self):
+        cfunc = jit(nopython=True, tiered=True)(add)
+        self.assertPreciseEqual(cfunc(1, 2), 3)
+        self.assertPreciseEqual(cfunc(1.5, 2.0), 3.5)
+        self.check_tier_up(cfunc)
+        # The final tier is used, without compiling new signatures
+        self.assertPreciseEqual(cfunc(3, 4), 7)
+        self.assertPreciseEqual(cfunc(3.5, 4.0), 7.5)
+        self.assertEqual(len(cfunc.signatures), 2)
+
+    def test_not_tiered(self):
+        cfunc = jit(nopython=True)(add)
+        cfunc(1, 2)
+        _tier_up_worker.join()
+        self.assertEqual(cfunc._superseded, [])
+        cres, = cfunc.overloads.values()
+        self.assertFalse(cres.library.quick_optimized)
+
+    def test_caller(self):
+        callee = jit(nopython=True, tiered=True)(add)
+
+        @jit(nopython=True)
+        def caller(x, y):
+            return callee(x, y) * 2
+
+        self.assertPreciseEqual(caller(1, 2), 6)
+        self.check_tier_up(callee)
+        self.assertPreciseEqual(caller(3, 4), 14)
+        self.assertPreciseEqual(callee(3, 4), 7)
+
+    def test_recursion(self):
+        self.assertPreciseEqual(tiered_fib(10), 55)
+        self.check_tier_up(tiered_fib)
+        self.assertPreciseEqual(tiered_fib(20), 6765)
+
+    def test_recompile(self):
+        cfunc = jit(nopython=True, tiered=True)(add)
+        self.assertPreciseEqual(cfunc(1, 2), 3)
+        cfunc.recompile()
+        self.check_tier_up(cfunc)
+        self.assertPreciseEqual(cfunc(3, 4), 7)
+
+
+class TestCodeReclamation(TestCase):
+
+    def test_compiled_code_stats(self):
+        cfunc = jit(nopython=True)(add)
+        self.assertEqual(cfunc.code_stats, (0, 0))
+        cfunc(1, 2)
+        stats = cfunc.code_stats
+        self.assertEqual(stats.overloads, 1)
+        self.assertGreater(stats.code_size, 0)
+        cfunc(1.5, 2.0)
+        self.assertEqual(cfunc.code_stats.overloads, 2)
+        self.assertGreater(cfunc.code_stats.code_size, stats.code_size)
+        self.assertEqual(compiled_code_stats()[cfunc], cfunc.code_stats)
+
+    def check_released(self, libraries):
+        """
+        Check the *libraries* are collected once the caller drops them.
+        """
+        refs = [weakref.ref(library) for library in libraries]
+        del libraries[:]
+        gc.collect()
+        for ref in refs:
+            self.assertIs(ref(), None)
+
+    def test_collected_dispatcher(self):
+        cfunc = jit(nopython=True)(lambda a: np.sin(a) + 1)
+        a = np.arange(3.0)
+        self.assertPreciseEqual(cfunc(a), np.sin(a) + 1)
+        self.assertIn(cfunc, compiled_code_stats())
+        cres, = cfunc.overloads.values()
+        # Array expressions are compiled as separate libraries
+        libraries = [lib for lib in cres.library._linking_libraries
+                     if lib._name.startswith('__numba_array_expr')]
+        self.assertTrue(libraries)
+        libraries.append(cres.library)
+        del cfunc, cres
+        self.check_released(libraries)
+
+    def test_recompile(self):
+        cfunc = jit(nopython=True)(add)
+        cfunc(1, 2)
+        libraries = [cres.library for cres in cfunc.overloads.values()]
+        cfunc.recompile()
+        self.check_released(libraries)
+        self.assertPreciseEqual(cfunc(1, 2), 3)
+
+
 class BaseCacheTest(TestCase):
     # This class is also used in test_cfunc.py.
 
@@ -744,6 +860,47 @@ class TestCache(BaseCacheTest):
         self.check_pycache(3)  # 1 index, 2 data
         self.check_hits(f, 0, 2)
 
+    def test_lazy_loading(self):
+        mod = self.import_module()
+        self.assertPreciseEqual(mod.inner(3, 2), 6)
+        self.assertPreciseEqual(mod.add_usecase(3, 2), 6)
+        sig = (types.intp, types.intp)
+
+        mod = self.import_module()
+        # The code loaded from the cache is only loaded in the engine
+        # when the function is called
+        f = mod.add_usecase
+        f.compile(sig)
+        self.check_hits(f, 1, 0)
+        library = f.overloads[sig].library
+        self.assertTrue(library.load_deferred)
+        self.assertPreciseEqual(f(3, 2), 6)
+        self.assertFalse(library.load_deferred)
+        self.assertPreciseEqual(f(4, 2), 7)
+
+        # ... or linked into another library, which doesn't need loading it
+        f = mod.inner
+        f.compile(sig)
+        library = f.overloads[sig].library
+        self.assertTrue(library.load_deferred)
+        self.assertPreciseEqual(mod.outer_uncached(3, 2), 2)
+        self.assertTrue(library.load_deferred)
+        self.assertPreciseEqual(f(3, 2), 6)
+        self.assertFalse(library.load_deferred)
+
+    def test_lazy_loading_then_caller(self):
+        # A function loaded from the cache can still be called from
+        # new functions after its own first call
+        mod = self.import_module()
+        self.assertPreciseEqual(mod.inner(3, 2), 6)
+
+        mod = self.import_module()
+        f = mod.inner
+        self.assertPreciseEqual(f(3, 2), 6)
+        self.check_hits(f, 1, 0)
+        self.assertPreciseEqual(mod.outer_uncached(3, 2), 2)
+        self.assertPreciseEqual(f(4, 2), 7)
+
     def test_inner_then_outer(self):
         # Caching inner then outer function is ok
         mod = self.import_module()
@@ -1022,6 +1179,127 @@ class TestCache(BaseCacheTest):
         self.assertEqual(err.strip(), "cache hits = 1")
 
 
+class TestPrecompile(BaseCacheTest):
+
+    # Nested multiprocessing.Pool raises AssertionError:
+    # "daemonic processes are not allowed to have children"
+    _numba_parallel_test_ = False
+
+    here = os.path.dirname(__file__)
+    usecases_file = os.path.join(here, "precompile_usecases.py")
+    modname = "dispatcher_precompile_test_fodder"
+
+    def run_precompile(self, *args):
+        code = """if 1:
+            import sys
+
+            sys.path.insert(0, %(tempdir)r)
+            from numba.numba_entry import main
+            main()
+            """ % dict(tempdir=self.tempdir)
+        popen = subprocess.Popen([sys.executable, "-c", code, "precompile"]
+                                 + list(args),
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE)
+        out, err = popen.communicate()
+        if popen.returncode != 0:
+            raise AssertionError("process failed with code %s: stderr follows\n%s\n"
+                                 % (popen.returncode, err.decode()))
+        return out.decode().splitlines()
+
+    def test_precompile(self):
+        sigs_file = os.path.join(self.tempdir, "signatures.pkl")
+        with open(sigs_file, "wb") as f:
+            for args in [(types.int64, types.int64),
+                         (types.float64, types.float64)]:
+                pickle.dump((self.modname, "add", args), f)
+                pickle.dump((self.modname, "add_nocache", args), f)
+            # Same as the signature declared in @jit
+            pickle.dump((self.modname, "double", (types.float64,)), f)
+        expected = ["%s.add(float64, float64)" % self.modname,
+                    "%s.add(int64, int64)" % self.modname,
+                    "%s.double(float64)" % self.modname]
+        out = self.run_precompile("-j", "2", "--signatures", sigs_file,
+                                  self.modname)
+        self.assertEqual(out, [s + ": compiled" for s in expected])
+        # 3 data files + 2 index files
+        self.check_pycache(5)
+        out = self.run_precompile("--signatures", sigs_file)
+        self.assertEqual(out, [s + ": cached" for s in expected])
+        self.check_pycache(5)
+
+        mod = self.import_module()
+        self.assertPreciseEqual(mod.add(2, 3), 5)
+        self.assertPreciseEqual(mod.add(2.5, 3.0), 5.5)
+        self.assertPreciseEqual(mod.double(2.5), 5.0)
+        for f in (mod.add, mod.double):
+            self.assertEqual(len(f.stats.cache_misses), 0)
+        self.assertEqual(len(mod.add.stats.cache_hits), 2)
+
+    def test_precompile_in_process(self):
+        from numba.precompile import precompile
+        sigs = {(self.modname, "add"): [(types.int64, types.int64)]}
+        expected = ["%s.add(int64, int64)" % self.modname,
+                    "%s.double(float64)" % self.modname]
+        results = precompile([self.modname], sigs, processes=1)
+        self.assertEqual(results, [(s, "compiled") for s in expected])
+        # The signatures given to @jit are compiled, from the cache
+        mod = sys.modules[self.modname]
+        self.assertEqual(mod.double.signatures, [(types.float64,)])
+        self.assertEqual(len(mod.double.stats.cache_hits), 1)
+        self.assertFalse(mod.double._can_compile)
+        with self.assertRaises(TypeError):
+            mod.double(1j)
+        self.assertEqual(mod.add.signatures, [])
+        # Existing overloads are skipped
+        results = precompile([self.modname], sigs, processes=1)
+        self.assertEqual(results, [(expected[0], "cached"),
+                                   (expected[1], "skipped")])
+
+
+class TestSignatureLog(BaseCacheTest):
+
+    here = os.path.dirname(__file__)
+    usecases_file = os.path.join(here, "precompile_usecases.py")
+    modname = "dispatcher_signature_log_test_fodder"
+
+    def test_record_replay(self):
+        log_file = os.path.join(self.tempdir, "signatures.pkl")
+        mod = self.import_module()
+        signature_log.record(log_file)
+        try:
+            mod.add(2, 3)
+            mod.add(2.5, 3.0)
+            mod.add(4, 5)
+            mod.add_nocache(2, 3)
+            mod.double(2.5)
+        finally:
+            signature_log.stop()
+        mod.add(1j, 2j)
+        int_sig = (types.int64, types.int64)
+        float_sig = (types.float64, types.float64)
+        self.assertEqual(signature_log.read(log_file),
+                         {(self.modname, 'add'): [int_sig, float_sig],
+                          (self.modname, 'add_nocache'): [int_sig]})
+
+        # Replay in a fresh module
+        mod = self.import_module()
+        self.assertEqual(signature_log.replay(log_file, threads=2), 3)
+        self.assertEqual(set(mod.add.signatures), set([int_sig, float_sig]))
+        self.assertEqual(mod.add_nocache.signatures, [int_sig])
+        self.assertEqual(len(mod.add.stats.cache_hits), 2)
+
+        # Functions which have disappeared are skipped
+        with open(log_file, "ab") as f:
+            pickle.dump((self.modname, 'missing', int_sig), f)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always', NumbaWarning)
+            self.assertEqual(signature_log.replay(log_file), 3)
+        self.assertEqual(len(w), 1)
+        self.assertIn("cannot replay signatures of %s.missing"
+                      % (self.modname,), str(w[0].message))
+
+
 class TestMultiprocessCache(BaseCacheTest):
 
     # Nested multiprocessing.Pool raises AssertionError:
@@ -162,6 +162,26 @@ class TestFancyIndexing(MemoryLeakMixin, TestCase):
         indices = self.generate_advanced_indices(N)
         self.check_setitem_indices(arr, indices)
 
+    def test_setitem_overlapping_source(self):
+        # The source is a view of the destination array, which may or may
+        # not overlap the indexed items
+        pyfunc = setitem_usecase
+        cfunc = jit(nopython=True)(pyfunc)
+        mask = np.zeros(20, dtype=np.bool_)
+        mask[[2, 5, 6]] = True
+        cases = [(np.int64([0, 3, 1, 4]), slice(10, 14)),
+                 (np.int64([0, 3, 1, 4]), slice(1, 5)),
+                 (np.int64([0, 3, 1, 4]), slice(5, 1, -1)),
+                 (mask, slice(5, 8)),
+                 (mask, slice(10, 13))]
+        for idx, src in cases:
+            expected = np.arange(20.0)
+            # Old Numpy versions don't copy an overlapping source
+            pyfunc(expected, idx, expected[src].copy())
+            got = np.arange(20.0)
+            cfunc(got, idx, got[src])
+            self.assertPreciseEqual(got, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,7 +5,7 @@ import numpy as np
 
 import numba.unittest_support as unittest
 from numba.compiler import compile_isolated, Flags
-from numba import jit, njit, types
+from numba import jit, njit, types, chunked
 from .support import TestCase, MemoryLeakMixin, tag
 from numba import testing
 from numba.datamodel.testing import test_factory
@@ -615,6 +615,54 @@ class TestGeneratorWithNRT(MemoryLeakMixin, TestCase):
         self.assertEqual(main(), magic)
 
 
+def gen_floats(n):
+    for i in range(n):
+        yield i * 0.5
+
+
+def gen_pairs(n):
+    for i in range(n):
+        yield i, i % 2 == 0
+
+
+class TestChunkedIteration(MemoryLeakMixin, TestCase):
+
+    def test_take(self):
+        gen = njit(gen_floats)(10)
+        self.assertPreciseEqual(next(gen), 0.0)
+        self.assertPreciseEqual(gen.take(3), np.array([0.5, 1.0, 1.5]))
+        # Regular iteration resumes where take() stopped
+        self.assertPreciseEqual(next(gen), 2.0)
+        self.assertPreciseEqual(gen.take(0), np.empty(0))
+        self.assertPreciseEqual(gen.take(10), np.arange(5, 10) * 0.5)
+        self.assertPreciseEqual(gen.take(10), np.empty(0))
+
+    def test_take_tuples(self):
+        gen = njit(gen_pairs)(5)
+        ints, bools = gen.take(3)
+        self.assertPreciseEqual(ints, np.arange(3))
+        self.assertPreciseEqual(bools, np.array([True, False, True]))
+        self.assertEqual(list(gen), [(3, False), (4, True)])
+
+    def test_chunked(self):
+        chunks = list(chunked(njit(gen_floats)(5), 2))
+        self.assertEqual(len(chunks), 3)
+        self.assertPreciseEqual(np.concatenate(chunks), np.arange(5) * 0.5)
+        self.assertEqual(list(chunked(njit(gen_floats)(4), 2))[-1].size, 2)
+        self.assertEqual(list(chunked(njit(gen_floats)(0), 2)), [])
+        with self.assertRaises(ValueError):
+            next(chunked(njit(gen_floats)(1), 0))
+
+    def test_invalid(self):
+        cr = compile_isolated(gen_floats, (types.int64,), flags=forceobj_flags)
+        with self.assertRaises(TypeError) as raises:
+            cr.entry_point(3).take(2)
+        self.assertIn("take() needs a nopython generator",
+                      str(raises.exception))
+        with self.assertRaises(ValueError):
+            njit(gen_floats)(1).take(-1)
+
+
 class TestGeneratorModel(test_factory()):
     fe_type = types.Generator(gen_func=None, yield_type=types.int32,
                               arg_types=[types.int64, types.float32],
@@ -2,17 +2,20 @@ from __future__ import absolute_import, print_function, division
 
 from collections import OrderedDict
 import ctypes
+import gc
+import pickle
 import sys
+import weakref
 
 import numpy as np
 
-from numba import (float32, float64, int16, int32, boolean, deferred_type,
-                   optional)
+from numba import (float32, float64, int16, int32, int64, uint8, complex128,
+                   boolean, deferred_type, optional)
 from numba import njit, typeof, errors
 from numba import unittest_support as unittest
 from numba import jitclass
 from .support import TestCase, MemoryLeakMixin, tag
-from numba.jitclass import _box
+from numba.jitclass import _box, columnar
 from numba.runtime.nrt import MemInfo
 from numba.errors import LoweringError
 
@@ -602,6 +605,301 @@ class TestJitClass(TestCase, MemoryLeakMixin):
         self.assertEqual(tc.a, x * y)
         self.assertEqual(tc.b, z)
 
+    def test_primitive_fields(self):
+        # Primitive fields are accessed directly in the instance data
+        spec = [('a', boolean),
+                ('b', int16),
+                ('c', uint8),
+                ('d', float32),
+                ('e', complex128),
+                ('f', int64)]
+
+        @jitclass(spec)
+        class TestClass(object):
+            def __init__(self):
+                self.a = False
+                self.b = 1
+                self.c = 2
+                self.d = 3.5
+                self.e = 4j
+                self.f = -5
+
+            def values(self):
+                return self.a, self.b, self.c, self.d, self.e, self.f
+
+        tc = TestClass()
+        for name in 'abcdef':
+            self.assertIsInstance(getattr(type(tc), name), _box.Field)
+        self.assertEqual(tc.values(), (False, 1, 2, 3.5, 4j, -5))
+        self.assertPreciseEqual((tc.a, tc.b, tc.c, tc.d, tc.e, tc.f),
+                                (False, 1, 2, 3.5, 4j, -5))
+
+        tc.a = 1
+        tc.b = -2
+        tc.c = 300      # truncated like in nopython mode
+        tc.d = 0.1
+        tc.e = 1.5
+        tc.f = 2 ** 40
+        expected = (True, -2, 44, float(np.float32(0.1)), 1.5 + 0j, 2 ** 40)
+        self.assertPreciseEqual((tc.a, tc.b, tc.c, tc.d, tc.e, tc.f),
+                                expected)
+        self.assertPreciseEqual(tc.values(), expected)
+
+        tc.f = 2.7      # floats are truncated
+        self.assertPreciseEqual(tc.f, 2)
+        tc.f = np.int32(-3)
+        self.assertPreciseEqual(tc.f, -3)
+        tc.a = np.bool_(False)
+        self.assertPreciseEqual(tc.a, False)
+
+        with self.assertRaises(TypeError):
+            tc.d = "foo"
+        # Only numbers are accepted
+        with self.assertRaises(TypeError):
+            tc.f = "12"
+        with self.assertRaises(TypeError):
+            tc.a = "no"
+        with self.assertRaises(TypeError):
+            tc.a = None
+        for value in (2 ** 64, -2 ** 63 - 1, 2 ** 70):
+            with self.assertRaises(OverflowError):
+                tc.f = value
+        self.assertPreciseEqual(tc.f, -3)
+        self.assertPreciseEqual(tc.a, False)
+        with self.assertRaises(AttributeError):
+            del tc.b
+        with self.assertRaises(TypeError):
+            type(tc).b.__get__(object())
+
+    def test_method_fast_path(self):
+        spec = [('x', float64)]
+
+        @jitclass(spec)
+        class TestClass(object):
+            def __init__(self, x):
+                self.x = x
+
+            def add(self, y, z=1):
+                self.x += y * z
+                return self.x
+
+            def merge(self, other):
+                self.x += other.x
+
+        tc = TestClass(1.0)
+        self.assertIsInstance(type(tc).add, _box.Method)
+        self.assertEqual(type(tc).add.__name__, 'add')
+        # Same argument types: the cached entry point is called
+        self.assertPreciseEqual(tc.add(2, 3), 7.0)
+        self.assertPreciseEqual(tc.add(1, 2), 9.0)
+        # Other argument types, default and keyword arguments
+        self.assertPreciseEqual(tc.add(0.5, 2.0), 10.0)
+        self.assertPreciseEqual(tc.add(1), 11.0)
+        self.assertPreciseEqual(tc.add(1, z=-1), 10.0)
+        self.assertPreciseEqual(type(tc).add(tc, 2, 1), 12.0)
+        # Integers which don't fit in an int64 are dispatched normally
+        self.assertPreciseEqual(tc.add(2 ** 63, 0), 12.0)
+        # jitclass arguments
+        tc.merge(TestClass(3.0))
+        self.assertPreciseEqual(tc.x, 15.0)
+
+    def test_method_cache_invalidation(self):
+        spec = [('x', float64)]
+
+        @jitclass(spec)
+        class TestClass(object):
+            def __init__(self, x):
+                self.x = x
+
+            def add(self, y):
+                self.x += y
+                return self.x
+
+        tc = TestClass(1.0)
+        self.assertPreciseEqual(tc.add(2), 3.0)
+        disp = type(tc).add.dispatcher
+        cres, = disp.overloads.values()
+        entry_ref = weakref.ref(cres.entry_point)
+        del cres
+        # The cached entry point is dropped when the overloads change
+        disp.recompile()
+        gc.collect()
+        self.assertIs(entry_ref(), None)
+        self.assertPreciseEqual(tc.add(2), 5.0)
+
+
+def _make_particle_class():
+    spec = [('x', float64), ('vx', float64), ('hits', int32)]
+
+    @jitclass(spec)
+    class Particle(object):
+        """A particle"""
+
+        def __init__(self, x, vx):
+            self.x = x
+            self.vx = vx
+            self.hits = 0
+
+        def move(self, dt):
+            self.x += self.vx * dt
+            self.hits += 1
+            return self.x
+
+        @property
+        def energy(self):
+            return 0.5 * self.vx ** 2
+
+        @property
+        def speed(self):
+            return abs(self.vx)
+
+        @speed.setter
+        def speed(self, value):
+            self.vx = value if self.vx >= 0 else -value
+
+    return Particle
+
+
+class TestColumnar(MemoryLeakMixin, TestCase):
+
+    def setUp(self):
+        super(TestColumnar, self).setUp()
+        self.Particles = columnar(_make_particle_class())
+
+    def test_cached(self):
+        Particle = _make_particle_class()
+        self.assertIs(columnar(Particle), columnar(Particle))
+
+    def test_pickle_class(self):
+        # Container classes are embedded in compiled code by pickling
+        Particles = self.Particles
+        self.assertIs(pickle.loads(pickle.dumps(Particles, protocol=-1)),
+                      Particles)
+        other = columnar(_make_particle_class())
+        self.assertIsNot(other, Particles)
+        self.assertIs(pickle.loads(pickle.dumps(other, protocol=-1)), other)
+
+    def test_python_container(self):
+        # References are leaked on exception
+        self.disable_leak_check()
+
+        ps = self.Particles(4)
+        self.assertEqual(len(ps), 4)
+        self.assertEqual(ps.x.dtype, np.float64)
+        self.assertEqual(ps.hits.dtype, np.int32)
+        self.assertPreciseEqual(ps.x, np.zeros(4))
+        ps.vx[:] = np.arange(4) - 1.5
+        p = ps[-1]
+        self.assertEqual(p.__doc__, "A particle")
+        self.assertPreciseEqual(p.vx, 1.5)
+        self.assertPreciseEqual(p.move(2.0), 3.0)
+        self.assertPreciseEqual(ps.x[3], 3.0)
+        self.assertPreciseEqual(p.energy, 1.125)
+        ps[0].speed = 2.0
+        self.assertPreciseEqual(ps.vx[0], -2.0)
+        ps[1].hits = 5
+        self.assertEqual(list(ps.hits), [0, 5, 0, 1])
+        self.assertEqual([p.vx for p in ps], [-2.0, -0.5, 0.5, 1.5])
+        with self.assertRaises(IndexError):
+            ps[4]
+
+    def test_from_arrays(self):
+        x = np.arange(3.0)
+        ps = self.Particles.from_arrays(x=x, vx=[1, 2, 3], hits=[0, 0, 0])
+        # Compatible arrays are not copied
+        self.assertTrue(np.shares_memory(ps.x, x))
+        self.assertEqual(ps.vx.dtype, np.float64)
+        with self.assertRaises(TypeError):
+            self.Particles.from_arrays(x=x, vx=x)
+        with self.assertRaises(ValueError):
+            self.Particles.from_arrays(x=x, vx=x[:2], hits=x)
+
+    def test_nopython(self):
+        Particles = self.Particles
+
+        @njit
+        def step(ps, dt):
+            s = 0.0
+            for p in ps:
+                p.move(dt)
+                s += p.energy
+            return s
+
+        @njit
+        def make(n):
+            ps = Particles(n)
+            ps.vx[:] = 1.0
+            ps[-1].x = 3
+            ps[0].speed = 2.0
+            return ps
+
+        @njit
+        def get_item(ps, i):
+            return ps[i]
+
+        ps = make(4)
+        self.assertIsInstance(ps, Particles)
+        self.assertPreciseEqual(ps.x, np.array([0.0, 0.0, 0.0, 3.0]))
+        self.assertPreciseEqual(step(ps, 0.5), 3.5)
+        self.assertPreciseEqual(ps.x, np.array([1.0, 0.5, 0.5, 3.5]))
+        self.assertEqual(list(ps.hits), [1] * 4)
+        # Changes made from either side are seen by the other
+        p = get_item(ps, 2)
+        p.x = 10.0
+        self.assertPreciseEqual(ps.x[2], 10.0)
+        self.assertPreciseEqual(p.move(1.0), 11.0)
+        self.assertEqual(ps.hits[2], 2)
+
+    def test_single_reference(self):
+        # Containers, and views of them, only hold a reference to the
+        # meminfo owning the field arrays, rather than one per field
+        from numba.datamodel import default_manager
+        typ = self.Particles._container_type
+        for t in (typ, typ.view_type):
+            models = default_manager[t].traverse_models()
+            self.assertEqual(sum(m.has_nrt_meminfo() for m in models), 1)
+
+    def test_view_outlives_container(self):
+        Particles = self.Particles
+
+        @njit
+        def get_x(n):
+            ps = Particles(n)
+            ps.x[:] = 5.0
+            p = ps[2]
+            # Allocate and write over the memory ps would free
+            a = np.ones(n)
+            a[:] = 1.0
+            return p.x
+
+        @njit
+        def last_view(n):
+            ps = Particles(n)
+            ps.x[:] = np.arange(n)
+            q = ps[0]
+            for p in ps:
+                q = p
+            return q
+
+        for n in (5, 100000):
+            self.assertPreciseEqual(get_x(n), 5.0)
+        p = last_view(5)
+        self.assertPreciseEqual(p.x, 4.0)
+        self.assertEqual(len(p._container), 5)
+
+    def test_invalid(self):
+        @jitclass([('a', float64[:])])
+        class WithArray(object):
+            def __init__(self):
+                pass
+
+        with self.assertRaises(TypeError) as raises:
+            columnar(WithArray)
+        self.assertIn("field 'a' of type array(float64, 1d, A) cannot be "
+                      "stored in a columnar container", str(raises.exception))
+        with self.assertRaises(TypeError):
+            columnar(object)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,6 +6,8 @@ import itertools
 import math
 import sys
 
+import numpy as np
+
 from numba.compiler import compile_isolated, Flags
 from numba import jit, types
 import numba.unittest_support as unittest
@@ -123,6 +125,14 @@ def list_extend_heterogenous(n):
     l.extend([123.0])
     return l
 
+def list_extend_array(n):
+    l = [0.5]
+    # A non-contiguous 1d array, with items converted to the list's type
+    a = np.arange(2 * n)
+    l.extend(a[::2])
+    l.extend(a[:0])
+    return l
+
 def list_pop0(n):
     l = list(range(n))
     res = 0
@@ -365,6 +375,30 @@ def reflect_dual(l, ll):
     l.append(ll.pop())
     return l is ll
 
+def reflect_append(l):
+    l.append(42j)
+
+def reflect_setitem(l):
+    l[2] = 42j
+
+def reflect_pop_append(l):
+    l.pop()
+    l.pop()
+    l.append(42j)
+
+def reflect_insert(l):
+    l.insert(3, 42j)
+
+def reflect_delitem(l):
+    del l[1:3]
+
+def reflect_reverse(l):
+    l.reverse()
+
+def reflect_clear_extend(l):
+    l.clear()
+    l.extend([1j, 2j])
+
 
 class TestLists(MemoryLeakMixin, TestCase):
 
@@ -421,6 +455,9 @@ class TestLists(MemoryLeakMixin, TestCase):
     def test_extend_heterogenous(self):
         self.check_unary_with_size(list_extend_heterogenous, precise=False)
 
+    def test_extend_array(self):
+        self.check_unary_with_size(list_extend_array, precise=False)
+
     def test_pop0(self):
         self.check_unary_with_size(list_pop0)
 
@@ -796,6 +833,52 @@ class TestUnboxing(MemoryLeakMixin, TestCase):
         self.assertEqual(str(raises.exception),
                          "size mismatch for tuple, expected 1 element(s) but got 2")
 
+    def test_fast_path(self):
+        # Lists of exact floats and ints are unboxed by a C helper
+        check = self.check_unary(unbox_usecase)
+        check([1.5, -2.0, float('inf')])
+        check([1, -2, 2**62])
+        # Items of other exact types use the generic path
+        check([np.float64(1.5), np.float64(2.0)])
+        check([np.int64(1), np.int64(2)])
+        check([True, False])
+
+    def test_fast_path_errors(self):
+        # References are leaked on exception
+        self.disable_leak_check()
+        cfunc = jit(nopython=True)(noop)
+        msg = "can't unbox heterogenous list"
+        with self.assert_type_error(msg):
+            cfunc([1.0, 2])
+        with self.assert_type_error(msg):
+            cfunc([1, 2.0])
+        with self.assertRaises(OverflowError):
+            cfunc([1, 2**64])
+
+    def test_assume_homogeneous(self):
+        pyfunc = unbox_usecase
+        cfunc = jit(nopython=True, assume_homogeneous=True)(pyfunc)
+        # Items are converted to the type of the first item
+        self.assertPreciseEqual(cfunc([1.0, 2, np.float32(3.5)]), 6.5)
+        self.assertPreciseEqual(cfunc([1, True, np.int8(4)]), 6)
+        self.assertPreciseEqual(cfunc([1j, 2.0]), 2 + 1j)
+        # Items which can't be converted still raise an error
+        self.disable_leak_check()
+        with self.assert_type_error(None):
+            cfunc([1.0, "a"])
+        # Including non-integral items in lists of integers
+        with self.assert_type_error(None):
+            cfunc([1, 2.7])
+        with self.assert_type_error(None):
+            cfunc([1, 2.0])
+        # Including lists of integers unboxed by the generic path
+        with self.assert_type_error(None):
+            cfunc([np.int32(1), 2.7])
+        # Items of non-scalar lists must still have the same exact type
+        msg = "can't unbox heterogenous list"
+        with self.assert_type_error(msg):
+            cfunc([np.arange(3.0), np.arange(3, dtype=np.int32)])
+
 
 class TestListReflection(MemoryLeakMixin, TestCase):
     """
@@ -864,6 +947,28 @@ class TestListReflection(MemoryLeakMixin, TestCase):
         cfunc(l)
         self.assertEqual([id(x) for x in l], ids)
 
+    def test_reflect_partial(self):
+        """
+        Only the changed part of the list should be reflected, the other
+        items are left untouched.
+        """
+        # (function, number of leading items left untouched)
+        cases = [(reflect_append, 6), (reflect_setitem, 2),
+                 (reflect_pop_append, 4), (reflect_insert, 3),
+                 (reflect_delitem, 1), (reflect_reverse, 0),
+                 (reflect_clear_extend, 0)]
+        for pyfunc, nkept in cases:
+            cfunc = jit(nopython=True)(pyfunc)
+            expected = [1j * i for i in range(6)]
+            got = list(expected)
+            ids = [id(x) for x in got]
+            pyfunc(expected)
+            with self.assertRefCount(got):
+                cfunc(got)
+            self.assertPreciseEqual(got, expected)
+            self.assertEqual([id(x) for x in got[:nkept]], ids[:nkept],
+                             pyfunc)
+
 
 if __name__ == '__main__':
     unittest.main()
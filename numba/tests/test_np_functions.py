@@ -47,6 +47,59 @@ def digitize(*args):
 def histogram(*args):
     return np.histogram(*args)
 
+def partition(a, kth):
+    return np.partition(a, kth)
+
+def argpartition(a, kth):
+    return np.argpartition(a, kth)
+
+def unique(a):
+    return np.unique(a)
+
+def in1d(a, b, invert=False):
+    return np.in1d(a, b, invert=invert)
+
+def isin(a, b):
+    return np.isin(a, b)
+
+def intersect1d(a, b):
+    return np.intersect1d(a, b)
+
+def union1d(a, b):
+    return np.union1d(a, b)
+
+def convolve(a, v):
+    return np.convolve(a, v)
+
+def convolve_same(a, v):
+    return np.convolve(a, v, 'same')
+
+def convolve_valid(a, v):
+    return np.convolve(a, v, mode='valid')
+
+def correlate(a, v):
+    return np.correlate(a, v)
+
+def correlate_same(a, v):
+    return np.correlate(a, v, 'same')
+
+def correlate_full(a, v):
+    return np.correlate(a, v, mode='full')
+
+
+def set_arrays(rnd):
+    """
+    Inputs for the tests of the set routines, with duplicates and NaNs.
+    """
+    yield np.zeros(0)
+    yield np.array([3, 1, 2, 3, 1, 1])
+    yield rnd.randint(0, 10, size=(6, 7)).astype(np.int32)
+    yield np.array([True, False, True])
+    a = rnd.randint(0, 5, size=40).astype(np.float64)
+    a[::7] = np.nan
+    yield a
+    yield a.reshape((5, 8))[:, ::2]
+
 
 class TestNPFunctions(TestCase):
     """
@@ -410,3 +463,235 @@ class TestNPFunctions(TestCase):
         self.rnd.shuffle(values)
 
         check_values(values)
+
+    def check_partition(self, got, a, kth):
+        """
+        Check *got* is a partition of *a* around each of the *kth*.
+        """
+        expected = np.partition(a, kth)
+        self.assertEqual(got.shape, expected.shape)
+        # Same values along the last axis
+        np.testing.assert_array_equal(np.sort(got), np.sort(a))
+        for k in np.atleast_1d(kth):
+            k = k % a.shape[-1]
+            # Same values at the selected positions as Numpy...
+            np.testing.assert_array_equal(got[..., k], expected[..., k])
+            # ... and correctly partitioned around them
+            pivot = got[..., k:k + 1]
+            self.assertFalse(np.any(got[..., :k] > pivot))
+            self.assertFalse(np.any(got[..., k + 1:] < pivot))
+
+    def partition_arrays(self):
+        yield np.arange(50) % 7
+        yield self.rnd.randint(0, 100, size=101)
+        a = np.arange(64.)[::-1]
+        yield a
+        yield a.reshape((4, 16))
+        yield a.reshape((4, 16)).T
+        # NaNs are partitioned last
+        a = self.rnd.random_sample(63)
+        a[::4] = float('nan')
+        yield a
+        yield a.reshape((9, 7))
+
+    def partition_kths(self, n):
+        yield 0
+        yield n // 2
+        yield -1
+        yield (1, n // 3, n - 2)
+        yield np.array([n - 1, 2, 2])
+
+    def test_partition(self):
+        pyfunc = partition
+        cfunc = jit(nopython=True)(pyfunc)
+
+        for a in self.partition_arrays():
+            for kth in self.partition_kths(a.shape[-1]):
+                self.check_partition(cfunc(a, kth), a, kth)
+
+        with self.assertRaises(ValueError) as raises:
+            cfunc(np.arange(3), 3)
+        self.assertIn("kth out of bounds", str(raises.exception))
+
+    def test_argpartition(self):
+        pyfunc = argpartition
+        cfunc = jit(nopython=True)(pyfunc)
+
+        for a in self.partition_arrays():
+            n = a.shape[-1]
+            rows = a.reshape((-1, n))
+            for kth in self.partition_kths(n):
+                idx = cfunc(a, kth)
+                self.assertEqual(idx.dtype, np.intp)
+                idx = idx.reshape((-1, n))
+                got = np.array([row[i] for row, i in zip(rows, idx)])
+                self.check_partition(got.reshape(a.shape), a, kth)
+
+    def test_select_adversarial(self):
+        # Inputs which defeat median-of-three pivots still select
+        # correctly with the median-of-medians fallback.
+        from numba.targets.arraymath import make_select_impl
+
+        impl = make_select_impl()
+        select = impl.select
+        linear_select = impl.linear_select
+        median_of_medians = impl.median_of_medians
+
+        @jit(nopython=True)
+        def select_all(a):
+            for k in range(len(a)):
+                b = a.copy()
+                if select(b, b, k, 0, len(b) - 1) != k:
+                    return False
+                b = a.copy()
+                linear_select(b, b, k, 0, len(b) - 1)
+                if b[k] != k:
+                    return False
+            return True
+
+        @jit(nopython=True)
+        def pivot(a):
+            i = median_of_medians(a, a, 0, len(a) - 1)
+            return i, a[i]
+
+        n = 300
+        organ_pipe = np.concatenate((np.arange(0, n, 2),
+                                     np.arange(n - 1, 0, -2)))
+        sawtooth = np.arange(n) % 10 * (n // 10) + np.arange(n) // 10
+        for a in (organ_pipe, sawtooth, np.arange(n)[::-1]):
+            self.assertTrue(select_all(a.astype(np.float64)))
+
+        for n in (1, 5, 24, 125, 1000):
+            a = self.rnd.permutation(n).astype(np.float64)
+            i, rank = pivot(a)
+            # The pivot is moved to the front of the range, and its rank
+            # is bounded away from both ends (by about 3/10 of the range)
+            self.assertEqual(i, 0)
+            margin = max(n // 25, 3 * n // 10 - 6)
+            self.assertGreaterEqual(rank, margin)
+            self.assertLessEqual(rank, n - 1 - margin)
+
+
+    def set_arrays(self):
+        return set_arrays(self.rnd)
+
+    def test_unique(self):
+        pyfunc = unique
+        cfunc = jit(nopython=True)(pyfunc)
+
+        for a in self.set_arrays():
+            self.assertPreciseEqual(cfunc(a), pyfunc(a))
+
+    def test_in1d(self):
+        pyfunc = in1d
+        cfunc = jit(nopython=True)(pyfunc)
+
+        arrays = list(self.set_arrays())
+        arrays.append(np.array([0.5, 1.0, 4.0]))
+        for a, b in itertools.product(arrays, arrays):
+            for invert in (False, True):
+                self.assertPreciseEqual(cfunc(a, b, invert),
+                                        pyfunc(a, b, invert))
+
+    @unittest.skipIf(np_version < (1, 13), "requires Numpy 1.13+")
+    def test_isin(self):
+        pyfunc = isin
+        cfunc = jit(nopython=True)(pyfunc)
+
+        arrays = list(self.set_arrays())
+        for a, b in itertools.product(arrays, arrays):
+            self.assertPreciseEqual(cfunc(a, b), pyfunc(a, b))
+
+    def test_intersect1d_union1d(self):
+        arrays = [a.ravel() for a in self.set_arrays()]
+        for pyfunc in (intersect1d, union1d):
+            cfunc = jit(nopython=True)(pyfunc)
+            for a, b in itertools.product(arrays, arrays):
+                self.assertPreciseEqual(cfunc(a, b), pyfunc(a, b))
+
+    def correlate_arrays(self):
+        for n in (1, 2, 3, 6):
+            yield self.rnd.randint(-10, 10, size=n).astype(np.int32)
+            yield self.rnd.random_sample(n)
+            yield self.rnd.random_sample(n) + 1j * self.rnd.random_sample(n)
+        yield self.rnd.random_sample(20)[::3]
+
+    def check_correlate(self, pyfuncs):
+        arrays = list(self.correlate_arrays())
+        for pyfunc in pyfuncs:
+            cfunc = jit(nopython=True)(pyfunc)
+            for a, v in itertools.product(arrays, arrays):
+                got = cfunc(a, v)
+                expected = pyfunc(a, v)
+                # The summation order differs from Numpy's
+                self.assertEqual(got.dtype, expected.dtype)
+                np.testing.assert_allclose(got, expected)
+
+        # Larger than a block
+        a = self.rnd.random_sample(3000)
+        v = self.rnd.random_sample(1500)
+        for pyfunc in pyfuncs:
+            cfunc = jit(nopython=True)(pyfunc)
+            np.testing.assert_allclose(cfunc(a, v), pyfunc(a, v))
+            np.testing.assert_allclose(cfunc(v, a), pyfunc(v, a))
+
+        for a, v in [(np.zeros(0), np.ones(3)), (np.ones(3), np.zeros(0))]:
+            with self.assertRaises(ValueError) as raises:
+                cfunc(a, v)
+            self.assertIn("cannot be empty", str(raises.exception))
+
+    def test_convolve(self):
+        self.check_correlate([convolve, convolve_same, convolve_valid])
+
+    def test_correlate(self):
+        self.check_correlate([correlate, correlate_same, correlate_full])
+
+
+class TestNumpyExtensions(TestCase):
+    """
+    Tests for the routines in numba.numpy_extensions.
+    """
+
+    def setUp(self):
+        self.rnd = np.random.RandomState(42)
+
+    def test_unique(self):
+        from numba import numpy_extensions as npext
+
+        for a in set_arrays(self.rnd):
+            expected = np.unique(a, True, True, True)
+            for hashed in (False, True):
+                self.assertPreciseEqual(npext.unique(a, hashed), expected[0])
+                got = npext.unique_all(a, hashed)
+                for x, y in zip(got, expected):
+                    np.testing.assert_array_equal(x, y)
+                got = npext.unique_counts(a, hashed)
+                np.testing.assert_array_equal(got[1], expected[3])
+                got = npext.unique_inverse(a, hashed)
+                np.testing.assert_array_equal(got[1], expected[2])
+
+    def test_rolling(self):
+        from numba import numpy_extensions as npext
+
+        def expected(a, window, func):
+            return np.array([func(a[j:j + window])
+                             for j in range(max(len(a) - window + 1, 0))])
+
+        a = self.rnd.random_sample(40)
+        a[[7, 8, 30]] = np.nan
+        arrays = [a, a[::-1], self.rnd.randint(0, 100, size=40),
+                  np.arange(30.0), np.arange(30.0)[::-1], np.zeros(0)]
+        funcs = [(npext.rolling_sum, np.sum), (npext.rolling_mean, np.mean),
+                 (npext.rolling_min, np.min), (npext.rolling_max, np.max)]
+        for a in arrays:
+            for window in (1, 2, 5, 40, 41):
+                for func, npfunc in funcs:
+                    got = func(a, window)
+                    np.testing.assert_allclose(
+                        got, expected(a, window, npfunc).astype(got.dtype))
+
+        self.assertEqual(npext.rolling_sum(np.arange(5, dtype=np.int8), 2).dtype,
+                         np.arange(5, dtype=np.int8).sum().dtype)
+        with self.assertRaises(ValueError) as raises:
+            npext.rolling_max(np.arange(5), 0)
+        self.assertIn("window must be at least 1", str(raises.exception))
@@ -835,5 +835,37 @@ class TestParforsMisc(unittest.TestCase):
         # make sure the cache is set to false, cf. NullCache
         self.assertTrue(isinstance(cfunc._cache, numba.caching.NullCache))
 
+    @skip_unsupported
+    def test_may_parallelize(self):
+        # The parfor pass is skipped for functions without arrays or prange
+        flags = Flags()
+        flags.set('auto_parallel')
+
+        def check(pyfunc, args, expected):
+            cres = compile_isolated(pyfunc, args, flags=flags)
+            typemap = cres.type_annotation.typemap
+            self.assertIs(compiler.may_parallelize(typemap), expected)
+            self.assertEqual(cres.entry_point(*(1,) * len(args)),
+                             pyfunc(*(1,) * len(args)))
+
+        def scalar(n):
+            s = 0
+            for i in range(n):
+                s += i
+            return s
+
+        def with_prange(n):
+            s = 0
+            for i in prange(n):
+                s += i
+            return s
+
+        def with_array(n):
+            return np.ones(n).sum()
+
+        check(scalar, (types.intp,), False)
+        check(with_prange, (types.intp,), True)
+        check(with_array, (types.intp,), True)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,15 @@
 from __future__ import print_function, division, absolute_import
 
+import base64
+import pickle
+import subprocess
 import sys
 
 import numpy as np
-from numba import jit, numpy_support, types
+from numba import jit, njit, numpy_support, types, columnarize
 from numba import unittest_support as unittest
 from numba.compiler import compile_isolated
+from numba.errors import TypingError
 from numba.itanium_mangler import mangle_type
 from numba.utils import IS_PY3
 from .support import tag
@@ -219,6 +223,18 @@ def set_charseq(ary, i, cs):
 def get_charseq_tuple(ary, i):
     return ary[i].m, ary[i].n
 
+def field_view_usecase(ary):
+    a = ary['a']
+    a[0] = 42.0
+    return a
+
+def columnarize_usecase(ary):
+    cols = columnarize(ary)
+    s = 0.0
+    for i in range(cols.a.shape[0]):
+        s += cols.a[i] * cols.b[i]
+    return s, cols
+
 
 recordtype = np.dtype([('a', np.float64),
                        ('b', np.int16),
@@ -861,5 +877,87 @@ class TestRecordDtypeWithCharSeq(unittest.TestCase):
             self.assertEqual(expected, got)
 
 
+class TestColumnarize(unittest.TestCase):
+
+    def setUp(self):
+        self.sample = np.recarray(5, dtype=recordtype)
+        self.sample.a = np.arange(5) * 1.5
+        self.sample.b = np.arange(5)
+        self.sample.c = 1j
+        self.sample.d = 'abc'
+
+    def test_field_view(self):
+        # Fields are strided views sharing the records' memory
+        cfunc = njit(field_view_usecase)
+        ary = self.sample.copy()
+        got = cfunc(ary[::2])
+        self.assertFalse(got.flags.c_contiguous)
+        np.testing.assert_equal(got, ary['a'][::2])
+        self.assertEqual(ary[0].a, 42.0)
+
+    def check_columns(self, cols, ary):
+        self.assertEqual(cols._fields, ary.dtype.names)
+        for name, col in zip(ary.dtype.names, cols):
+            self.assertTrue(col.flags.c_contiguous)
+            np.testing.assert_equal(col, ary[name])
+
+    def test_python(self):
+        cols = columnarize(self.sample[::2])
+        self.check_columns(cols, self.sample[::2])
+        # The columns are copies
+        cols.a[0] = 42.0
+        self.assertEqual(self.sample[0].a, 0.0)
+        with self.assertRaises(TypeError):
+            columnarize(np.zeros(3))
+
+    def test_pickle(self):
+        cols = columnarize(self.sample)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            got = pickle.loads(pickle.dumps(cols, protocol=proto))
+            self.assertIs(type(got), type(cols))
+            self.check_columns(got, self.sample)
+
+    def test_pickle_other_process(self):
+        # The class doesn't exist yet in a fresh process.  Nopython code
+        # boxing the results pickles a reference to the class.
+        cols = columnarize(self.sample)
+        state = cols, type(cols)._pickle_ref
+        arg = base64.b64encode(pickle.dumps(state, protocol=2))
+        code = """if 1:
+            import base64
+            import pickle
+            import sys
+
+            cols, cls = pickle.loads(base64.b64decode(sys.argv[1]))
+            assert type(cols) is cls
+            print(repr((cols._fields, [c.tolist() for c in cols])))
+            """
+        out = subprocess.check_output([sys.executable, '-c', code,
+                                       arg.decode()])
+        expected = (cols._fields, [c.tolist() for c in cols])
+        self.assertEqual(out.decode().strip(), repr(expected))
+
+    def test_nopython(self):
+        pyfunc = columnarize_usecase
+        cfunc = njit(pyfunc)
+        for ary in (self.sample, self.sample[::-2]):
+            expected, expected_cols = pyfunc(ary)
+            got, got_cols = cfunc(ary)
+            self.assertEqual(got, expected)
+            self.assertIs(type(got_cols), type(expected_cols))
+            self.check_columns(got_cols, ary)
+        # 2d array
+        ary = np.zeros((2, 3), dtype=recordtype3)
+        ary['second'] = np.arange(6).reshape((2, 3))
+        cols = njit(lambda a: columnarize(a))(ary[:, ::2])
+        self.check_columns(cols, ary[:, ::2])
+
+    def test_nested_array(self):
+        cfunc = njit(lambda a: columnarize(a))
+        with self.assertRaises(TypingError) as raises:
+            cfunc(np.zeros(3, dtype=recordwitharray))
+        self.assertIn("unsupported subarray field 'h'", str(raises.exception))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -11,13 +11,24 @@ import numpy as np
 from numba.compiler import compile_isolated, Flags
 from numba import jit, types, utils
 import numba.unittest_support as unittest
-from numba import testing
+from numba import testing, njit
 from .support import TestCase, MemoryLeakMixin, tag
 
 from numba.targets.quicksort import make_py_quicksort, make_jit_quicksort
+from numba.targets.parallelsort import (make_py_parallel_sort,
+                                        make_jit_parallel_sort,
+                                        PARALLEL_SORT_THRESHOLD)
 from .timsort import make_py_timsort, make_jit_timsort, MergeRun
 
 
+# parfors are not supported on 32-bit platforms and Windows with Python 2.7
+_windows_py27 = (sys.platform.startswith('win32') and
+                 sys.version_info[:2] == (2, 7))
+_32bit = sys.maxsize <= 2 ** 32
+skip_parallel_unsupported = unittest.skipIf(_32bit or _windows_py27,
+                                            'parfors not supported')
+
+
 def make_temp_list(keys, n):
     return [keys[0]] * n
 
@@ -707,6 +718,86 @@ class TestQuicksortArrays(BaseQuicksortTest, TestCase):
         return np.array(lst, dtype=np.float64)
 
 
+class BaseParallelSortTest(BaseSortingTest):
+
+    # Small buckets and no size threshold, so that small inputs
+    # exercise the parallel code path.
+    sort_options = dict(nbuckets=4, threshold=0)
+
+    def sample_arrays(self):
+        for n in (128, 1000):
+            for l in self.make_sample_lists(n):
+                yield self.array_factory(l)
+
+    def test_find_bucket(self):
+        f = self.make_parallel_sort(**self.sort_options).find_bucket
+        splitters = self.array_factory([10, 20, 20, 30])
+        self.assertEqual(f(splitters, 5), 0)
+        self.assertEqual(f(splitters, 10), 1)
+        self.assertEqual(f(splitters, 15), 1)
+        self.assertEqual(f(splitters, 20), 3)
+        self.assertEqual(f(splitters, 35), 4)
+
+    def test_choose_splitters(self):
+        f = self.make_parallel_sort(**self.sort_options).choose_splitters
+        for keys in self.sample_arrays():
+            splitters = f(keys)
+            self.assertEqual(len(splitters), self.sort_options['nbuckets'] - 1)
+            self.assertSorted(list(splitters), splitters)
+
+    def test_run_parallel_sort(self):
+        f = self.make_parallel_sort(**self.sort_options).run_parallel_sort
+        for keys in self.sample_arrays():
+            orig_keys = list(keys)
+            f(keys)
+            self.assertSorted(orig_keys, keys)
+
+    def test_run_parallel_argsort(self):
+        f = self.make_parallel_sort(is_argsort=True,
+                                    **self.sort_options).run_parallel_sort
+        for keys in self.sample_arrays():
+            orig_keys = keys.copy()
+            res = f(keys)
+            self.assertSorted(list(orig_keys), keys[res])
+            # The input wasn't mutated
+            self.assertEqual(list(orig_keys), list(keys))
+
+    def test_run_parallel_sort_nans(self):
+        def lt_floats(a, b):
+            return math.isnan(b) or a < b
+
+        f = self.make_parallel_sort(lt=lt_floats,
+                                    **self.sort_options).run_parallel_sort
+
+        np.random.seed(42)
+        for size in (200, 2000):
+            orig = np.random.random(size=size) * 100
+            orig[np.random.random(size=size) < 0.1] = float('nan')
+            keys = orig.copy()
+            f(keys)
+            non_nans = orig[~np.isnan(orig)]
+            # Non-NaNs are sorted at the front
+            self.assertSorted(non_nans, keys[:len(non_nans)])
+            self.assertTrue(np.all(np.isnan(keys[len(non_nans):])))
+
+
+class TestParallelSortPurePython(BaseParallelSortTest, TestCase):
+
+    make_parallel_sort = staticmethod(make_py_parallel_sort)
+
+    def array_factory(self, lst):
+        return np.array(lst, dtype=np.float64)
+
+
+@skip_parallel_unsupported
+class TestParallelSortArrays(BaseParallelSortTest, TestCase):
+
+    make_parallel_sort = staticmethod(make_jit_parallel_sort)
+
+    def array_factory(self, lst):
+        return np.array(lst, dtype=np.float64)
+
+
 class TestNumpySort(TestCase):
 
     def setUp(self):
@@ -814,6 +905,72 @@ class TestNumpySort(TestCase):
         check(np_argsort_usecase)
 
 
+@skip_parallel_unsupported
+class TestNumpyParallelSort(TestNumpySort):
+    """
+    Same as TestNumpySort, but with parallel=True and arrays large
+    enough to take the parallel sort path.
+    """
+
+    def int_arrays(self):
+        for size in (PARALLEL_SORT_THRESHOLD, 3 * PARALLEL_SORT_THRESHOLD + 7):
+            yield np.random.randint(99, size=size)
+
+    def float_arrays(self):
+        for size in (PARALLEL_SORT_THRESHOLD, 3 * PARALLEL_SORT_THRESHOLD + 7):
+            yield np.random.random(size=size) * 100
+        for size in (PARALLEL_SORT_THRESHOLD, 3 * PARALLEL_SORT_THRESHOLD + 7):
+            orig = np.random.random(size=size) * 100
+            orig[np.random.random(size=size) < 0.1] = float('nan')
+            yield orig
+
+    def test_array_sort_int(self):
+        pyfunc = sort_usecase
+        cfunc = njit(parallel=True)(pyfunc)
+
+        for orig in self.int_arrays():
+            self.check_sort_inplace(pyfunc, cfunc, orig)
+
+    def test_array_sort_float(self):
+        pyfunc = sort_usecase
+        cfunc = njit(parallel=True)(pyfunc)
+
+        for orig in self.float_arrays():
+            self.check_sort_inplace(pyfunc, cfunc, orig)
+
+    def test_np_sort_int(self):
+        pyfunc = np_sort_usecase
+        cfunc = njit(parallel=True)(pyfunc)
+
+        for orig in self.int_arrays():
+            self.check_sort_copy(pyfunc, cfunc, orig)
+
+    def test_np_sort_float(self):
+        pyfunc = np_sort_usecase
+        cfunc = njit(parallel=True)(pyfunc)
+
+        for orig in self.float_arrays():
+            self.check_sort_copy(pyfunc, cfunc, orig)
+
+    def test_argsort_int(self):
+        def check(pyfunc):
+            cfunc = njit(parallel=True)(pyfunc)
+            for orig in self.int_arrays():
+                self.check_argsort(pyfunc, cfunc, orig)
+
+        check(argsort_usecase)
+        check(np_argsort_usecase)
+
+    def test_argsort_float(self):
+        def check(pyfunc):
+            cfunc = njit(parallel=True)(pyfunc)
+            for orig in self.float_arrays():
+                self.check_argsort(pyfunc, cfunc, orig)
+
+        check(argsort_usecase)
+        check(np_argsort_usecase)
+
+
 class TestPythonSort(TestCase):
 
     @tag('important')
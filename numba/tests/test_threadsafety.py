@@ -12,6 +12,7 @@ from numba import unittest_support as unittest
 from numba import jit, vectorize, guvectorize
 
 from .support import temp_directory, override_config
+from .test_parfors import skip_unsupported as parfors_skip_unsupported
 
 
 class TestThreadSafety(unittest.TestCase):
@@ -85,6 +86,70 @@ class TestThreadSafety(unittest.TestCase):
                           self.run_guvectorize(nopython=True, cache=True),
                           self.run_guvectorize(nopython=True)])
 
+    def test_concurrent_shared_dispatcher(self):
+        # Threads compiling the same functions, or functions calling
+        # them, while other threads may be generating their code
+        @jit(nopython=True)
+        def callee(x):
+            return x + 1
+
+        @jit(nopython=True)
+        def caller(x):
+            return callee(x) * 2
+
+        values = [1, 1.5, 2j, np.int32(3), np.float32(4.5)]
+        errors = []
+
+        def chooser():
+            try:
+                for _ in range(10):
+                    x = random.choice(values)
+                    self.assertEqual(callee(x), x + 1)
+                    self.assertEqual(caller(x), (x + 1) * 2)
+            except Exception as e:
+                errors.append(e)
+
+        ths = [threading.Thread(target=chooser) for i in range(4)]
+        for th in ths:
+            th.start()
+        for th in ths:
+            th.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(callee.signatures), len(set(callee.signatures)))
+
+    @parfors_skip_unsupported
+    def test_concurrent_parallel_compile(self):
+        # parfor kernels are compiled while lowering their caller, with
+        # the LLVM lock held; this mustn't release the compiler lock
+        # in the middle of the caller's compilation, nor deadlock with
+        # threads waiting for the LLVM lock.
+        def make_func(k):
+            @jit(nopython=True, parallel=True)
+            def foo(a):
+                return (a * k + 1).sum()
+            return foo
+
+        funcs = [make_func(k) for k in range(4)]
+        arrays = [np.arange(10), np.arange(10.0),
+                  np.arange(10, dtype=np.int32)]
+        errors = []
+
+        def chooser():
+            try:
+                for _ in range(5):
+                    k = random.randrange(len(funcs))
+                    a = random.choice(arrays)
+                    self.assertEqual(funcs[k](a), (a * k + 1).sum())
+            except Exception as e:
+                errors.append(e)
+
+        ths = [threading.Thread(target=chooser) for i in range(4)]
+        for th in ths:
+            th.start()
+        for th in ths:
+            th.join()
+        self.assertEqual(errors, [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,344 @@
+from __future__ import print_function
+
+import numpy as np
+
+from numba import njit, types
+from numba.errors import TypingError
+from numba.typed import Dict
+import numba.unittest_support as unittest
+from .support import TestCase, MemoryLeakMixin
+
+
+def constructor_usecase(n):
+    d = dict()
+    for i in range(n):
+        d[i] = i * 1.5
+    return len(d), d[n // 2]
+
+def contains_usecase(n, key):
+    d = dict()
+    for i in range(n):
+        d[i * 2] = i
+    return key in d
+
+def delitem_usecase(n, key):
+    d = dict()
+    for i in range(n):
+        d[i] = i
+    del d[key]
+    return len(d), key in d
+
+def getitem_usecase(key):
+    d = dict()
+    d[1] = 2.0
+    return d[key]
+
+def get_usecase(n, key):
+    d = dict()
+    for i in range(n):
+        d[i] = i + 0.5
+    return d.get(key, -1.0), d.get(key) is None
+
+def pop_usecase(n, key):
+    d = dict()
+    for i in range(n):
+        d[i] = i + 0.5
+    return d.pop(key, -1.0), len(d)
+
+def pop_missing_usecase(key):
+    d = dict()
+    d[1] = 2.0
+    return d.pop(key)
+
+def setdefault_usecase(n):
+    d = dict()
+    for i in range(n):
+        d.setdefault(i % 7, i)
+    s = 0
+    for k in d:
+        s += k * d[k]
+    return len(d), s
+
+def popitem_usecase(n):
+    d = dict()
+    for i in range(n):
+        d[i] = i * 2
+    s = 0
+    while len(d) > 0:
+        k, v = d.popitem()
+        s += k + v
+    return s
+
+def popitem_empty_usecase():
+    d = dict()
+    d[1] = 2
+    d.clear()
+    return d.popitem()
+
+def copy_update_usecase(n):
+    a = dict()
+    for i in range(n):
+        a[i] = i
+    b = a.copy()
+    for i in range(n, 2 * n):
+        b[i] = i
+    c = dict()
+    c.update(b)
+    c[0] = 42
+    return len(a), len(b), len(c), a[0], c[0]
+
+def iteration_usecase(n):
+    d = dict()
+    for i in range(n):
+        d[i] = i * 3
+    ks = 0
+    for k in d.keys():
+        ks += k
+    vs = 0
+    for v in d.values():
+        vs += v
+    ts = 0
+    for k, v in d.items():
+        ts += k * v
+    return ks, vs, ts
+
+def tuple_keys_usecase(n):
+    d = dict()
+    for i in range(n):
+        d[(i, i % 3)] = i
+    return d[(n - 1, (n - 1) % 3)], (1, 2) in d
+
+def grow_shrink_usecase(n):
+    # Many inserts and deletes, exercising resizing
+    d = dict()
+    for i in range(n):
+        d[i] = i
+    for i in range(0, n, 2):
+        del d[i]
+    s = 0
+    for k, v in d.items():
+        s += k - v
+    return len(d), s
+
+def return_dict_usecase(n):
+    d = dict()
+    for i in range(n):
+        d[i] = i + 0.25
+    return d
+
+def array_value_usecase():
+    d = dict()
+    d[1] = np.zeros(3)
+    return len(d)
+
+
+def sum_values(d):
+    s = 0.0
+    for v in d.values():
+        s += v
+    return s
+
+def fill(d, n):
+    for i in range(n):
+        d[i] = i * 2.0
+
+def identity(d):
+    return d
+
+def update(d, other):
+    d.update(other)
+
+def contains(d, key):
+    return key in d
+
+
+class TestDictInNopython(MemoryLeakMixin, TestCase):
+
+    def check(self, pyfunc, *args):
+        cfunc = njit(pyfunc)
+        self.assertPreciseEqual(cfunc(*args), pyfunc(*args))
+
+    def test_constructor(self):
+        self.check(constructor_usecase, 10)
+        self.check(constructor_usecase, 1000)
+
+    def test_contains(self):
+        for key in (-1, 0, 5, 6, 100):
+            self.check(contains_usecase, 20, key)
+
+    def test_delitem(self):
+        # References are leaked on exception
+        self.disable_leak_check()
+
+        self.check(delitem_usecase, 20, 7)
+        cfunc = njit(delitem_usecase)
+        with self.assertRaises(KeyError):
+            cfunc(20, 21)
+
+    def test_getitem(self):
+        # References are leaked on exception
+        self.disable_leak_check()
+
+        self.check(getitem_usecase, 1)
+        cfunc = njit(getitem_usecase)
+        with self.assertRaises(KeyError):
+            cfunc(2)
+
+    def test_get(self):
+        for key in (0, 5, 20):
+            self.check(get_usecase, 10, key)
+
+    def test_pop(self):
+        # References are leaked on exception
+        self.disable_leak_check()
+
+        for key in (0, 5, 20):
+            self.check(pop_usecase, 10, key)
+        self.check(pop_missing_usecase, 1)
+        cfunc = njit(pop_missing_usecase)
+        with self.assertRaises(KeyError):
+            cfunc(2)
+
+    def test_setdefault(self):
+        self.check(setdefault_usecase, 50)
+
+    def test_popitem(self):
+        # References are leaked on exception
+        self.disable_leak_check()
+
+        self.check(popitem_usecase, 100)
+        cfunc = njit(popitem_empty_usecase)
+        with self.assertRaises(KeyError) as raises:
+            cfunc()
+        self.assertIn("dictionary is empty", str(raises.exception))
+
+    def test_copy_update(self):
+        self.check(copy_update_usecase, 50)
+
+    def test_iteration(self):
+        self.check(iteration_usecase, 100)
+
+    def test_tuple_keys(self):
+        self.check(tuple_keys_usecase, 10)
+
+    def test_grow_shrink(self):
+        self.check(grow_shrink_usecase, 5000)
+
+    def test_return_dict(self):
+        cfunc = njit(return_dict_usecase)
+        d = cfunc(10)
+        self.assertIsInstance(d, Dict)
+        self.assertEqual(d.key_type, types.intp)
+        self.assertEqual(d.value_type, types.float64)
+        self.assertEqual(dict(d), return_dict_usecase(10))
+
+    def test_array_value(self):
+        cfunc = njit(array_value_usecase)
+        with self.assertRaises(TypingError) as raises:
+            cfunc()
+        self.assertIn("dict values cannot be reference-counted objects",
+                      str(raises.exception))
+
+
+class TestTypedDict(MemoryLeakMixin, TestCase):
+
+    def test_empty(self):
+        d = Dict.empty(types.int64, types.float64)
+        self.assertEqual(len(d), 0)
+        self.assertEqual(d.key_type, types.int64)
+        self.assertEqual(d.value_type, types.float64)
+        self.assertEqual(repr(d), "Dict({})")
+
+    def test_mapping(self):
+        # References are leaked on exception
+        self.disable_leak_check()
+
+        d = Dict.empty(types.int32, types.float64)
+        d[1] = 2.5
+        d[3] = 4
+        self.assertEqual(len(d), 2)
+        self.assertIn(1, d)
+        self.assertNotIn(2, d)
+        self.assertEqual(d[3], 4.0)
+        self.assertEqual(d.get(2, 'x'), 'x')
+        self.assertEqual(sorted(d.items()), [(1, 2.5), (3, 4.0)])
+        del d[1]
+        self.assertEqual(list(d), [3])
+        with self.assertRaises(KeyError):
+            d[1]
+        with self.assertRaises(KeyError):
+            del d[1]
+        c = d.copy()
+        c[5] = 6.0
+        self.assertEqual(len(d), 1)
+        self.assertEqual(len(c), 2)
+
+    def test_tuple_keys(self):
+        d = Dict.empty(types.UniTuple(types.int64, 2), types.int64)
+        for i in range(100):
+            d[i, i + 1] = i
+        self.assertEqual(d[10, 11], 10)
+        self.assertNotIn((10, 10), d)
+
+    def test_pass_by_reference(self):
+        d = Dict.empty(types.intp, types.float64)
+        njit(fill)(d, 10)
+        self.assertEqual(len(d), 10)
+        self.assertEqual(d[3], 6.0)
+        d[100] = 1.0
+        self.assertPreciseEqual(njit(sum_values)(d), 91.0)
+        # The same dict comes back
+        other = njit(identity)(d)
+        other[200] = 2.0
+        self.assertIn(200, d)
+
+    def test_update_conversions(self):
+        # Keys and values are converted to the dict's types
+        d = Dict.empty(types.int64, types.float64)
+        other = Dict.empty(types.int32, types.float32)
+        other[1] = 1.5
+        other[-2] = 2.5
+        njit(update)(d, other)
+        self.assertEqual(sorted(d.items()), [(-2, 2.5), (1, 1.5)])
+
+    def test_key_range(self):
+        # References are leaked on exception
+        self.disable_leak_check()
+
+        # Out of range keys aren't truncated
+        d = Dict.empty(types.int32, types.float64)
+        d[0] = 1.0
+        cfunc = njit(contains)
+        self.assertTrue(cfunc(d, 0))
+        self.assertFalse(cfunc(d, 2**32))
+        self.assertFalse(cfunc(d, np.uint64(2**64 - 1)))
+        u = Dict.empty(types.uint32, types.float64)
+        u[2**32 - 1] = 1.0
+        self.assertFalse(cfunc(u, -1))
+        with self.assertRaises(KeyError):
+            d[2**32]
+        self.assertEqual(d.get(2**32, 'x'), 'x')
+        with self.assertRaises(OverflowError):
+            d[2**32] = 2.0
+        self.assertEqual(dict(d), {0: 1.0})
+        # Including when updating from another dict
+        other = Dict.empty(types.int64, types.float64)
+        other[2**32] = 2.0
+        with self.assertRaises(OverflowError):
+            njit(update)(d, other)
+        self.assertEqual(dict(d), {0: 1.0})
+
+    def test_invalid_types(self):
+        with self.assertRaises(TypeError):
+            Dict.empty(types.float64[:], types.int64)
+        with self.assertRaises(TypeError) as raises:
+            Dict.empty(types.int64, types.float64[:])
+        self.assertIn("dict values cannot be reference-counted objects",
+                      str(raises.exception))
+        with self.assertRaises(TypeError) as raises:
+            Dict()
+        self.assertIn("Dict.empty()", str(raises.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+from __future__ import print_function
+
+import numpy as np
+
+from numba import njit, types
+from numba.typed import List
+import numba.unittest_support as unittest
+from .support import TestCase, MemoryLeakMixin
+
+
+def sum_items(l):
+    s = 0.0
+    for v in l:
+        s += v
+    return s
+
+def fill(l, n):
+    for i in range(n):
+        l.append(i * 2.0)
+
+def identity(l):
+    return l
+
+def slice_usecase(l):
+    return l[1:-1]
+
+def extend_usecase(l, a):
+    l.extend(a)
+    return len(l)
+
+
+class TestTypedList(MemoryLeakMixin, TestCase):
+
+    def test_empty(self):
+        l = List.empty(types.int64)
+        self.assertEqual(len(l), 0)
+        self.assertEqual(l.item_type, types.int64)
+        self.assertEqual(repr(l), "List([])")
+
+    def test_sequence(self):
+        l = List.empty(types.float64)
+        l.append(1)
+        l.extend([2.5, 3.5])
+        l.insert(0, 0.5)
+        self.assertEqual(list(l), [0.5, 1.0, 2.5, 3.5])
+        self.assertEqual(l[-1], 3.5)
+        self.assertIn(2.5, l)
+        self.assertNotIn(2.0, l)
+        l[1] = 4
+        self.assertEqual(l.pop(), 3.5)
+        self.assertEqual(l.pop(0), 0.5)
+        self.assertEqual(list(l), [4.0, 2.5])
+        l.extend([5.5, 6.5])
+        del l[0]
+        del l[1:]
+        self.assertEqual(list(l), [2.5])
+        c = l.copy()
+        c.append(7.5)
+        self.assertIsInstance(c, List)
+        self.assertEqual(list(l), [2.5])
+        self.assertEqual(list(c), [2.5, 7.5])
+        c.reverse()
+        self.assertEqual(list(c), [7.5, 2.5])
+        self.assertEqual(c.index(2.5), 1)
+
+    def test_index_error(self):
+        # References are leaked on exception
+        self.disable_leak_check()
+
+        l = List.empty(types.int32)
+        with self.assertRaises(IndexError):
+            l[0]
+        with self.assertRaises(IndexError):
+            l.pop()
+
+    def test_extend_array(self):
+        l = List.empty(types.float64)
+        a = np.arange(10)
+        l.extend(a)
+        l.extend(a[::-3])
+        self.assertEqual(list(l), list(a) + list(a[::-3]))
+        l.extend(np.arange(0))
+        self.assertEqual(len(l), 14)
+        # Extending in nopython mode
+        self.assertEqual(njit(extend_usecase)(l, np.ones(3)), 17)
+
+    def test_pass_by_reference(self):
+        l = List.empty(types.float64)
+        njit(fill)(l, 10)
+        self.assertEqual(len(l), 10)
+        self.assertEqual(l[3], 6.0)
+        l.append(1.0)
+        self.assertPreciseEqual(njit(sum_items)(l), 91.0)
+        # The same payload comes back
+        other = njit(identity)(l)
+        other.append(2.0)
+        self.assertEqual(len(l), 12)
+        self.assertEqual(l[-1], 2.0)
+
+    def test_slice(self):
+        l = List.empty(types.intp)
+        l.extend(range(5))
+        res = njit(slice_usecase)(l)
+        self.assertIsInstance(res, List)
+        self.assertEqual(list(res), [1, 2, 3])
+
+    def test_invalid_types(self):
+        with self.assertRaises(TypeError) as raises:
+            List.empty(types.float64[:])
+        self.assertIn("typed list items cannot be reference-counted objects",
+                      str(raises.exception))
+        with self.assertRaises(TypeError) as raises:
+            List()
+        self.assertIn("List.empty()", str(raises.exception))
+
+    def test_not_unified_with_list(self):
+        # A typed list is never silently converted to a reflected list
+        @njit
+        def choose(flag, l, m):
+            return l if flag else m
+
+        l = List.empty(types.intp)
+        with self.assertRaises(Exception):
+            choose(True, l, [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
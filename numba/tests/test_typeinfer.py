@@ -698,5 +698,52 @@ class TestMiscIssues(TestCase):
             self.assertEqual(res, pyfunc(v))
 
 
+def make_reverse_chain(n):
+    """
+    Make a function carrying a chain of *n* variables around a loop,
+    in reverse dataflow order.
+    """
+    lines = ["def f(x):"]
+    lines += ["    v%d = 0" % i for i in range(n)]
+    lines += ["    for i in range(3):"]
+    lines += ["        v%d = v%d + 1" % (i, i + 1) for i in range(n - 1)]
+    lines += ["        v%d = x" % (n - 1)]
+    lines += ["    return v0"]
+    ns = {}
+    exec("\n".join(lines), ns)
+    return ns['f']
+
+
+class TestPropagation(TestCase):
+    """
+    Test the worklist-driven propagation of constraints.
+    """
+
+    def test_reverse_chain(self):
+        n = 50
+        pyfunc = make_reverse_chain(n)
+        executions = []
+        orig_execute = typeinfer.ConstraintNetwork._execute
+
+        def execute(network, index, typeinfer):
+            executions.append(index)
+            return orig_execute(network, index, typeinfer)
+
+        typeinfer.ConstraintNetwork._execute = execute
+        try:
+            cres = compile_isolated(pyfunc, (types.float64,))
+        finally:
+            typeinfer.ConstraintNetwork._execute = orig_execute
+        self.assertEqual(cres.signature.return_type, types.float64)
+        for i in range(n):
+            self.assertEqual(cres.type_annotation.typemap['v%d' % i],
+                             types.float64)
+        self.assertEqual(cres.entry_point(1.5), pyfunc(1.5))
+        # A full sweep of the network per step of the chain would
+        # execute each constraint about n times
+        n_constraints = len(set(executions))
+        self.assertLess(len(executions), 4 * n_constraints)
+
+
 if __name__ == '__main__':
     unittest.main()
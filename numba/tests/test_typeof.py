@@ -6,6 +6,7 @@ from __future__ import print_function
 
 import array
 from collections import namedtuple
+import ctypes
 import enum
 import mmap
 import sys
@@ -161,6 +162,33 @@ class TestTypeof(ValueTypingTestBase, TestCase):
         self.assertEqual(ty, types.ByteArray(types.uint8, 1, "C"))
         self.assertTrue(ty.mutable)
 
+    @unittest.skipUnless(sys.version_info >= (3,),
+                         "mmap and ctypes don't support PEP 3118 on 2.7")
+    def test_buffer_arrays(self):
+        # Other buffer-providing objects are typed as arrays
+        m = mmap.mmap(-1, 16)
+        self.assertEqual(typeof(m), types.BufferArray(types.uint8, 1, "C"))
+        m.close()
+        ty = typeof((ctypes.c_double * 3)())
+        self.assertEqual(ty, types.BufferArray(types.float64, 1, "C"))
+        self.assertIsInstance(ty, types.Array)
+        ty = typeof(((ctypes.c_int32 * 3) * 2)())
+        self.assertEqual(ty, types.BufferArray(types.int32, 2, "C"))
+        ty = typeof((ctypes.c_bool * 2)())
+        self.assertEqual(ty, types.BufferArray(types.boolean, 1, "C"))
+
+        class Struct(ctypes.Structure):
+            _fields_ = [('a', ctypes.c_int8), ('b', ctypes.c_double)]
+
+        # The structure's padding is omitted from the ctypes format string
+        ty = typeof((Struct * 2)())
+        dtype = np.dtype([('a', np.int8), ('b', np.float64)], align=True)
+        self.assertEqual(ty.dtype, numpy_support.from_dtype(dtype))
+        # Non-native byte orders are not supported
+        dtype = np.dtype('i4').newbyteorder()
+        with self.assertRaises(ValueError):
+            typeof(memoryview(np.zeros(2, dtype)))
+
     @tag('important')
     def test_none(self):
         ty = typeof(None)
@@ -175,6 +203,12 @@ class TestTypeof(ValueTypingTestBase, TestCase):
         ty = typeof("abc")
         self.assertEqual(ty, types.string)
 
+    def test_fixed_width_strings(self):
+        self.assertEqual(typeof(np.bytes_(b"abc")), types.CharSeq(3))
+        self.assertEqual(typeof(np.str_(u"abcd")), types.UnicodeCharSeq(4))
+        self.assertEqual(typeof(np.zeros(2, dtype='U5')),
+                         types.Array(types.UnicodeCharSeq(5), 1, 'C'))
+
     @tag('important')
     def test_slices(self):
         for args in [(1,), (1, 2), (1, 2, 1), (1, 2, None)]:
@@ -394,6 +428,16 @@ class TestFingerprint(TestCase):
         distinct = set(compute_fingerprint(x) for x in (a, c, d))
         self.assertEqual(len(distinct), 3, distinct)
 
+    def test_fixed_width_strings(self):
+        # The width is part of the type
+        self.assertEqual(compute_fingerprint(np.bytes_(b'ab')),
+                         compute_fingerprint(np.bytes_(b'cd')))
+        distinct = DistinctChecker()
+        for x in (b'ab', np.bytes_(b'ab'), np.bytes_(b'abc'),
+                  np.str_(u'ab'), np.str_(u'abc'),
+                  np.zeros(2, dtype='S2'), np.zeros(2, dtype='S3')):
+            distinct.add(compute_fingerprint(x))
+
     def test_arrays(self):
         distinct = DistinctChecker()
 
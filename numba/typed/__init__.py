@@ -0,0 +1,8 @@
+"""
+Typed containers usable both from Python and from nopython mode.
+"""
+
+from __future__ import absolute_import
+
+from .typeddict import Dict
+from .typedlist import List
@@ -0,0 +1,169 @@
+"""
+Python interface to the native typed dicts.
+
+A Dict instance wraps the native dict's payload, which is shared with
+nopython code: passing a Dict to a jitted function doesn't convert or
+copy it, and changes made by either side are seen by the other.
+"""
+
+from __future__ import print_function, absolute_import
+
+import numpy as np
+
+from numba import types, six
+from numba.decorators import njit
+from numba.errors import TypingError
+from numba.extending import intrinsic
+from numba.jitclass import _box
+from numba.targets.imputils import impl_ret_new_ref
+from numba.typing.dictdecl import _check_value_type
+from numba.utils import collections_abc
+
+
+@njit
+def _length(d):
+    return len(d)
+
+@njit
+def _contains(d, key):
+    return key in d
+
+@njit
+def _getitem(d, key):
+    return d[key]
+
+@njit
+def _setitem(d, key, value):
+    d[key] = value
+
+@njit
+def _delitem(d, key):
+    del d[key]
+
+@njit
+def _keys(d):
+    keys = []
+    for k in d:
+        keys.append(k)
+    return keys
+
+@njit
+def _copy(d):
+    return d.copy()
+
+
+def _make_empty_constructor(dict_type):
+    from numba.targets.dictobj import DictInstance
+
+    @intrinsic
+    def new_dict(typingctx):
+        def codegen(context, builder, sig, args):
+            inst = DictInstance.allocate(context, builder, dict_type)
+            return impl_ret_new_ref(context, builder, dict_type, inst.value)
+
+        return dict_type(), codegen
+
+    @njit
+    def empty():
+        return new_dict()
+
+    return empty
+
+# { dict type: jitted function returning an empty dict of that type }
+_empty_constructors = {}
+
+
+def _box_dict(dict_type):
+    """
+    Return a new Dict instance for the native dict type *dict_type*.
+    The caller is responsible for setting the payload.
+    """
+    d = Dict.__new__(Dict)
+    d._numba_type_ = dict_type
+    return d
+
+
+class Dict(_box.Box, collections_abc.MutableMapping):
+    """
+    A typed dict usable both from Python and from nopython mode.
+    Keys and values are converted to the dict's key and value types
+    when stored.  Use Dict.empty() to create an instance.
+    """
+
+    def __init__(self, *args, **kwargs):
+        raise TypeError("use Dict.empty() to create a typed dict")
+
+    @classmethod
+    def empty(cls, key_type, value_type):
+        """
+        Create an empty dict with the given Numba key and value types.
+        """
+        if not isinstance(key_type, types.Hashable):
+            raise TypeError("unhashable dict key type: %s" % (key_type,))
+        dict_type = types.DictType(key_type, value_type)
+        if not dict_type.is_precise():
+            raise TypeError("invalid dict key or value type")
+        try:
+            _check_value_type(value_type)
+        except TypingError as e:
+            raise TypeError(str(e))
+        try:
+            ctor = _empty_constructors[dict_type]
+        except KeyError:
+            ctor = _empty_constructors[dict_type] = \
+                _make_empty_constructor(dict_type)
+        return ctor()
+
+    @property
+    def key_type(self):
+        return self._numba_type_.key_type
+
+    @property
+    def value_type(self):
+        return self._numba_type_.value_type
+
+    def _convert_key(self, key):
+        # Fixed-width string keys are boxed as plain str or bytes
+        # objects, which are not typed as fixed-width sequences.
+        # Convert them to Numpy scalars of the declared width (padded
+        # with NULs, as Numpy scalars are sized after their contents),
+        # so that all keys share a single specialization.
+        key_type = self._numba_type_.key_type
+        if isinstance(key_type, types.UnicodeCharSeq):
+            pytype, scalar_type, pad = six.text_type, np.str_, u'\0'
+        elif isinstance(key_type, types.CharSeq):
+            pytype, scalar_type, pad = six.binary_type, np.bytes_, b'\0'
+        else:
+            return key
+        if not isinstance(key, pytype):
+            raise TypeError("dict key must be %s, not %s"
+                            % (pytype.__name__, type(key).__name__))
+        if len(key) > key_type.count:
+            raise ValueError("dict key %r is longer than %d characters"
+                             % (key, key_type.count))
+        return scalar_type(key.ljust(key_type.count, pad))
+
+    def __len__(self):
+        return _length(self)
+
+    def __contains__(self, key):
+        return _contains(self, self._convert_key(key))
+
+    def __getitem__(self, key):
+        return _getitem(self, self._convert_key(key))
+
+    def __setitem__(self, key, value):
+        _setitem(self, self._convert_key(key), value)
+
+    def __delitem__(self, key):
+        _delitem(self, self._convert_key(key))
+
+    def __iter__(self):
+        return iter(_keys(self))
+
+    def copy(self):
+        return _copy(self)
+
+    def __repr__(self):
+        items = ', '.join('%r: %r' % item for item in self.items())
+        return '%s({%s})' % (type(self).__name__, items)
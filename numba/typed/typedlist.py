@@ -0,0 +1,210 @@
+"""
+Python interface to the native typed lists.
+
+A List instance wraps the native list's payload, which is shared with
+nopython code: passing a List to a jitted function doesn't convert or
+copy it (contrary to Python lists, which are converted and reflected
+item by item), and changes made by either side are seen by the other.
+"""
+
+from __future__ import print_function, absolute_import
+
+import numpy as np
+
+from numba import types
+from numba.datamodel import default_manager
+from numba.decorators import njit
+from numba.extending import intrinsic
+from numba.jitclass import _box
+from numba.targets.imputils import impl_ret_new_ref
+from numba.utils import collections_abc
+
+
+@njit
+def _length(l):
+    return len(l)
+
+@njit
+def _contains(l, item):
+    return item in l
+
+# Nopython lists don't check the bounds of integer indices
+
+@njit
+def _check_index(l, index):
+    if index < -len(l) or index >= len(l):
+        raise IndexError("list index out of range")
+
+@njit
+def _getitem(l, index):
+    _check_index(l, index)
+    return l[index]
+
+@njit
+def _getslice(l, index):
+    return l[index]
+
+@njit
+def _setitem(l, index, item):
+    _check_index(l, index)
+    l[index] = item
+
+@njit
+def _setslice(l, index, items):
+    l[index] = items
+
+@njit
+def _delslice(l, index):
+    del l[index]
+
+@njit
+def _append(l, item):
+    l.append(item)
+
+@njit
+def _extend(l, iterable):
+    l.extend(iterable)
+
+@njit
+def _insert(l, index, item):
+    l.insert(index, item)
+
+@njit
+def _pop(l, index):
+    return l.pop(index)
+
+@njit
+def _reverse(l):
+    l.reverse()
+
+@njit
+def _copy(l):
+    return l.copy()
+
+@njit
+def _to_list(l):
+    # A non-reflected list, boxed as a Python list
+    return list(l)
+
+
+def _make_empty_constructor(list_type):
+    from numba.targets.listobj import ListInstance
+
+    @intrinsic
+    def new_list(typingctx):
+        def codegen(context, builder, sig, args):
+            inst = ListInstance.allocate(context, builder, list_type, 0)
+            return impl_ret_new_ref(context, builder, list_type, inst.value)
+
+        return list_type(), codegen
+
+    @njit
+    def empty():
+        return new_list()
+
+    return empty
+
+# { list type: jitted function returning an empty list of that type }
+_empty_constructors = {}
+
+
+def _box_list(list_type):
+    """
+    Return a new List instance for the native list type *list_type*.
+    The caller is responsible for setting the payload.
+    """
+    l = List.__new__(List)
+    l._numba_type_ = list_type
+    return l
+
+
+class List(_box.Box, collections_abc.MutableSequence):
+    """
+    A typed list usable both from Python and from nopython mode.
+    Items are converted to the list's item type when stored.  Use
+    List.empty() to create an instance.
+    """
+
+    def __init__(self, *args, **kwargs):
+        raise TypeError("use List.empty() to create a typed list")
+
+    @classmethod
+    def empty(cls, item_type):
+        """
+        Create an empty list with the given Numba item type.
+        """
+        if not item_type.is_precise():
+            raise TypeError("invalid list item type: %s" % (item_type,))
+        if default_manager.lookup(item_type).contains_nrt_meminfo():
+            raise TypeError("typed list items cannot be reference-counted "
+                            "objects, got %s" % (item_type,))
+        list_type = types.ListType(item_type)
+        try:
+            ctor = _empty_constructors[list_type]
+        except KeyError:
+            ctor = _empty_constructors[list_type] = \
+                _make_empty_constructor(list_type)
+        return ctor()
+
+    @property
+    def item_type(self):
+        return self._numba_type_.dtype
+
+    def __len__(self):
+        return _length(self)
+
+    def __contains__(self, item):
+        return _contains(self, item)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _getslice(self, index)
+        return _getitem(self, index)
+
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            _setslice(self, index, item)
+        else:
+            _setitem(self, index, item)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            _delslice(self, index)
+        else:
+            _pop(self, index)
+
+    def __iter__(self):
+        return iter(_to_list(self))
+
+    def append(self, item):
+        _append(self, item)
+
+    def extend(self, iterable):
+        """
+        Append the items of *iterable*.  A 1d Numpy array is copied in
+        a single native operation.
+        """
+        if isinstance(iterable, List):
+            _extend(self, iterable)
+            return
+        if not isinstance(iterable, np.ndarray) or iterable.ndim != 1:
+            # Let a Python list of items be converted in one go
+            iterable = list(iterable)
+            if not iterable:
+                return
+        _extend(self, iterable)
+
+    def insert(self, index, item):
+        _insert(self, index, item)
+
+    def pop(self, index=-1):
+        return _pop(self, index)
+
+    def reverse(self):
+        _reverse(self)
+
+    def copy(self):
+        return _copy(self)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, list(self))
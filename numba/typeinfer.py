@@ -15,10 +15,11 @@ Constraints push types forward following the dataflow.
 from __future__ import print_function, division, absolute_import
 
 import contextlib
+import heapq
 import itertools
 from pprint import pprint
 import traceback
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
 from numba import ir, types, utils, config, six, typing
 from .errors import TypingError, UntypedAttributeError, new_error_context
@@ -104,39 +105,113 @@ class TypeVar(object):
 
 class ConstraintNetwork(object):
     """
-    TODO: It is possible to optimize constraint propagation to consider only
-          dirty type variables.
+    The constraints of a function, propagated with a worklist: after
+    a first execution of all constraints, a constraint is only executed
+    again once a type variable it has read changes.  Executions happen
+    in rounds following the constraints' order, as a full sweep of the
+    network would do.
     """
 
     def __init__(self):
         self.constraints = []
+        # { typevar name: set of indices of the constraints reading it }
+        self._readers = defaultdict(set)
+        # Indices of the constraints to execute in the next round
+        self._dirty = set()
+        # Indices of the constraints depending on untracked state,
+        # executed in every round after a change
+        self._volatile = set()
+        # { index: error raised by the last execution of the constraint }
+        self._errors = {}
+        # State of the current round
+        self._current = None
+        self._current_reads = None
+        self._queue = []
+        self._queued = set()
+        self._changed = False
 
     def append(self, constraint):
+        self._dirty.add(len(self.constraints))
         self.constraints.append(constraint)
 
+    def mark_changed(self, name):
+        """
+        Schedule the constraints which read the type variable *name*.
+        """
+        self._changed = True
+        if self._current is not None and name in self._current_reads:
+            # The executing constraint changed one of its own inputs
+            self._dirty.add(self._current)
+        for index in self._readers.get(name, ()):
+            if self._current is not None and index > self._current:
+                # Still to come in the current round
+                if index not in self._queued:
+                    heapq.heappush(self._queue, index)
+                    self._queued.add(index)
+            else:
+                self._dirty.add(index)
+
+    def mark_volatile(self):
+        """
+        Mark the executing constraint as depending on more than the type
+        variables it reads (e.g. the partial inference of a recursive
+        call).
+        """
+        if self._current is not None:
+            self._volatile.add(self._current)
+
     def propagate(self, typeinfer):
         """
-        Execute all constraints.  Errors are caught and returned as a list.
+        Execute constraints until the type variables stop changing.
+        Errors are caught and returned as a list.
         This allows progressing even though some constraints may fail
         due to lack of information (e.g. imprecise types such as List(undefined)).
         """
-        errors = []
-        for constraint in self.constraints:
-            loc = constraint.loc
-            with typeinfer.warnings.catch_warnings(filename=loc.filename,
-                                                   lineno=loc.line):
+        # Since the number of types are finite, the typesets will
+        # eventually stop growing.
+        typevars = typeinfer.typevars
+        while self._dirty:
+            typeinfer.debug.propagate_started()
+            self._queue = sorted(self._dirty)
+            self._queued = set(self._dirty)
+            self._dirty = set()
+            self._changed = False
+            while self._queue:
+                index = heapq.heappop(self._queue)
+                self._queued.discard(index)
+                self._current = index
+                typevars.reads = self._current_reads = reads = set()
                 try:
-                    constraint(typeinfer)
-                except TypingError as e:
-                    errors.append(e)
-                except Exception:
-                    msg = "Internal error at {con}:\n{sep}\n{err}{sep}\n"
-                    e = TypingError(msg.format(con=constraint,
-                                               err=traceback.format_exc(),
-                                               sep='--%<' +'-' * 65),
-                                    loc=constraint.loc)
-                    errors.append(e)
-        return errors
+                    self._execute(index, typeinfer)
+                finally:
+                    typevars.reads = self._current_reads = None
+                    self._current = None
+                for name in reads:
+                    self._readers[name].add(index)
+            if self._changed:
+                self._dirty.update(self._volatile)
+            typeinfer.debug.propagate_finished()
+        # Errors can appear when the type set is incomplete; only
+        # the errors of the last executions are relevant.
+        return [self._errors[index] for index in sorted(self._errors)]
+
+    def _execute(self, index, typeinfer):
+        constraint = self.constraints[index]
+        self._errors.pop(index, None)
+        loc = constraint.loc
+        with typeinfer.warnings.catch_warnings(filename=loc.filename,
+                                               lineno=loc.line):
+            try:
+                constraint(typeinfer)
+            except TypingError as e:
+                self._errors[index] = e
+            except Exception:
+                msg = "Internal error at {con}:\n{sep}\n{err}{sep}\n"
+                e = TypingError(msg.format(con=constraint,
+                                           err=traceback.format_exc(),
+                                           sep='--%<' +'-' * 65),
+                                loc=constraint.loc)
+                self._errors[index] = e
 
 
 class Propagate(object):
@@ -539,6 +614,11 @@ class SetItemConstraint(object):
             if _is_array_not_precise(targetty):
                 assert sig.args[0].is_precise()
                 typeinfer.add_type(self.target.name, sig.args[0], loc=self.loc)
+            # For dict setitem, refine imprecise key and value types
+            elif (isinstance(targetty, types.DictType) and
+                  not targetty.is_precise()):
+                assert sig.args[0].is_precise()
+                typeinfer.add_type(self.target.name, sig.args[0], loc=self.loc)
 
             self.signature = sig
 
@@ -570,6 +650,11 @@ class StaticSetItemConstraint(object):
             if sig is None:
                 raise TypingError("Cannot resolve setitem: %s[%r] = %s" %
                                   (targetty, self.index, valty), loc=self.loc)
+            # For dict setitem, refine imprecise key and value types
+            if (isinstance(targetty, types.DictType) and
+                not targetty.is_precise()):
+                assert sig.args[0].is_precise()
+                typeinfer.add_type(self.target.name, sig.args[0], loc=self.loc)
             self.signature = sig
 
     def get_call_signature(self):
@@ -654,12 +739,17 @@ class PrintConstraint(object):
 
 
 class TypeVarMap(dict):
+    # If not None, a set recording the names of the typevars looked up
+    reads = None
+
     def set_context(self, context):
         self.context = context
 
     def __getitem__(self, name):
         if name not in self:
             self[name] = TypeVar(self.context, name)
+        if self.reads is not None:
+            self.reads.add(name)
         return super(TypeVarMap, self).__getitem__(name)
 
     def __setitem__(self, name, value):
@@ -803,19 +893,7 @@ class TypeInferer(object):
         return cloned._unify_return_types(rettypes)
 
     def propagate(self, raise_errors=True):
-        newtoken = self.get_state_token()
-        oldtoken = None
-        # Since the number of types are finite, the typesets will eventually
-        # stop growing.
-
-        while newtoken != oldtoken:
-            self.debug.propagate_started()
-            oldtoken = newtoken
-            # Errors can appear when the type set is incomplete; only
-            # raise them when there is no progress anymore.
-            errors = self.constraints.propagate(self)
-            newtoken = self.get_state_token()
-            self.debug.propagate_finished()
+        errors = self.constraints.propagate(self)
         if errors:
             if raise_errors:
                 raise errors[0]
@@ -830,17 +908,23 @@ class TypeInferer(object):
         oldty = tv.type
         unified = tv.add_type(tp, loc=loc)
         if unified != oldty:
+            self.constraints.mark_changed(var)
             self.propagate_refined_type(var, unified)
 
     def add_calltype(self, inst, signature):
         self.calltypes[inst] = signature
 
     def copy_type(self, src_var, dest_var, loc):
-        unified = self.typevars[dest_var].union(self.typevars[src_var], loc=loc)
+        tv = self.typevars[dest_var]
+        oldty = tv.type
+        unified = tv.union(self.typevars[src_var], loc=loc)
+        if unified != oldty:
+            self.constraints.mark_changed(dest_var)
 
     def lock_type(self, var, tp, loc):
         tv = self.typevars[var]
         tv.lock(tp, loc=loc)
+        self.constraints.mark_changed(var)
 
     def propagate_refined_type(self, updated_var, updated_type):
         source_constraint = self.refine_map.get(updated_var)
@@ -1074,6 +1158,8 @@ class TypeInferer(object):
             fnid = frame.func_id
             fnty.overloads[args] = qualifying_prefix(fnid.modname,
                                                      fnid.unique_name)
+            # The result depends on the whole state of the parent frame
+            self.constraints.mark_volatile()
             # Resume propagation in parent frame
             return_type = frame.typeinfer.return_types_from_partial()
             # No known return type
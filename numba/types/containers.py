@@ -330,11 +330,12 @@ class List(MutableSequence):
         return List(dtype, reflected)
 
     def unify(self, typingctx, other):
-        if isinstance(other, List):
+        # Typed lists only unify with each other (see ListType)
+        if isinstance(other, List) and type(other) is type(self):
             dtype = typingctx.unify_pairs(self.dtype, other.dtype)
             reflected = self.reflected or other.reflected
             if dtype is not None:
-                return List(dtype, reflected)
+                return self.copy(dtype, reflected)
 
     @property
     def key(self):
@@ -348,6 +349,24 @@ class List(MutableSequence):
         return self.dtype.is_precise()
 
 
+class ListType(List):
+    """
+    Type class for the lists of numba.typed.List.  They are native lists
+    which are never reflected: the Python object wraps the native payload.
+    """
+
+    def __init__(self, dtype):
+        self.dtype = dtype
+        self.reflected = False
+        name = "typed list(%s)" % (self.dtype,)
+        super(List, self).__init__(name=name)
+
+    def copy(self, dtype=None, reflected=None):
+        if dtype is None:
+            dtype = self.dtype
+        return ListType(dtype)
+
+
 class ListIter(BaseContainerIterator):
     """
     Type class for list iterators.
@@ -409,16 +428,92 @@ class SetIter(BaseContainerIterator):
     container_class = Set
 
 
+class DictType(Container):
+    """
+    Type class for native typed dicts.  Iterating over a dict yields
+    its keys.
+    """
+    mutable = True
+
+    def __init__(self, key_type, value_type):
+        assert isinstance(key_type, (Hashable, Undefined))
+        self.key_type = key_type
+        self.value_type = value_type
+        self.dtype = key_type
+        name = "dict(%s, %s)" % (key_type, value_type)
+        super(DictType, self).__init__(name=name)
+
+    @property
+    def key(self):
+        return self.key_type, self.value_type
+
+    @property
+    def iterator_type(self):
+        return DictIter(self, 'keys')
+
+    def is_precise(self):
+        return self.key_type.is_precise() and self.value_type.is_precise()
+
+    def copy(self, key_type=None, value_type=None):
+        if key_type is None:
+            key_type = self.key_type
+        if value_type is None:
+            value_type = self.value_type
+        return DictType(key_type, value_type)
+
+    def unify(self, typingctx, other):
+        if isinstance(other, DictType):
+            key_type = typingctx.unify_pairs(self.key_type, other.key_type)
+            value_type = typingctx.unify_pairs(self.value_type,
+                                               other.value_type)
+            if key_type is not None and value_type is not None:
+                return DictType(key_type, value_type)
+
+
+class DictIter(SimpleIteratorType):
+    """
+    Type class for iterators over a dict's keys, values or items
+    (*kind*).
+    """
+
+    def __init__(self, container, kind):
+        assert isinstance(container, DictType), container
+        self.container = container
+        self.kind = kind
+        if kind == 'keys':
+            yield_type = container.key_type
+        elif kind == 'values':
+            yield_type = container.value_type
+        elif kind == 'items':
+            yield_type = Tuple((container.key_type, container.value_type))
+        else:
+            raise ValueError("invalid dict iterator kind: %r" % (kind,))
+        name = 'iter_%s(%s)' % (kind, container)
+        super(DictIter, self).__init__(name, yield_type)
+
+    def unify(self, typingctx, other):
+        if isinstance(other, DictIter) and other.kind == self.kind:
+            container = typingctx.unify_pairs(self.container, other.container)
+            if container is not None:
+                return DictIter(container, self.kind)
+
+    @property
+    def key(self):
+        return self.container, self.kind
+
+
 class SetPayload(BaseContainerPayload):
     """
-    Internal type class for the dynamically-allocated payload of a set.
+    Internal type class for the dynamically-allocated payload of a set
+    or a dict.
     """
-    container_class = Set
+    container_class = (Set, DictType)
 
 
 class SetEntry(Type):
     """
-    Internal type class for the entries of a Set's hash table.
+    Internal type class for the entries of a Set's or a DictType's
+    hash table.
     """
     def __init__(self, set_type):
         self.set_type = set_type
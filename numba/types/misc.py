@@ -418,3 +418,82 @@ class ClassDataType(Type):
         self.class_type = classtyp
         name = "data.{0}".format(self.class_type.name)
         super(ClassDataType, self).__init__(name)
+
+
+class ColumnarType(Sequence):
+    """
+    The type of a columnar container of jitclass instances: the values
+    of each field are stored in a separate 1d array.
+    """
+    mutable = True
+
+    def __init__(self, instance_type, container_class):
+        self.instance_type = instance_type
+        # The Python class of the container (not part of the type's key)
+        self.container_class = container_class
+        name = "columnar({0})".format(instance_type.classname)
+        super(ColumnarType, self).__init__(name)
+
+    @property
+    def key(self):
+        return self.instance_type
+
+    @property
+    def dtype(self):
+        return self.view_type
+
+    @property
+    def fields(self):
+        """
+        The {field name: field type} mapping of the instance type.
+        """
+        return self.instance_type.struct
+
+    def get_array_type(self, field):
+        from .npytypes import Array
+        return Array(self.fields[field], 1, 'C')
+
+    @property
+    def view_type(self):
+        return ColumnarViewType(self)
+
+    @property
+    def iterator_type(self):
+        return ColumnarIter(self)
+
+
+class ColumnarViewType(Type):
+    """
+    The type of an item of a columnar container: a (container, index)
+    pair giving access to the fields and methods of the item.
+    """
+    mutable = True
+
+    def __init__(self, container_type):
+        self.container_type = container_type
+        classname = container_type.instance_type.classname
+        name = "columnar_view({0})".format(classname)
+        super(ColumnarViewType, self).__init__(name)
+
+    @property
+    def key(self):
+        return self.container_type
+
+    @property
+    def instance_type(self):
+        return self.container_type.instance_type
+
+
+class ColumnarIter(SimpleIteratorType):
+    """
+    The type of iterators over a columnar container.
+    """
+
+    def __init__(self, container_type):
+        self.container_type = container_type
+        name = "iter({0})".format(container_type)
+        super(ColumnarIter, self).__init__(name, container_type.view_type)
+
+    @property
+    def key(self):
+        return self.container_type
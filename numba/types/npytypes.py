@@ -10,7 +10,25 @@ from ..typeconv import Conversion
 from .. import utils
 
 
-class CharSeq(Type):
+class _FixedWidthSeq(Hashable):
+    """
+    Base class for fixed-width character sequences.  Sequences of
+    different widths convert to each other by padding with nulls or
+    truncating, as in Numpy.
+    """
+
+    def can_convert_to(self, typingctx, other):
+        if type(other) is type(self):
+            if other.count >= self.count:
+                return Conversion.safe
+            return Conversion.unsafe
+
+    def unify(self, typingctx, other):
+        if type(other) is type(self):
+            return max(self, other, key=lambda t: t.count)
+
+
+class CharSeq(_FixedWidthSeq):
     """
     A fixed-length 8-bit character sequence.
     """
@@ -26,7 +44,7 @@ class CharSeq(Type):
         return self.count
 
 
-class UnicodeCharSeq(Type):
+class UnicodeCharSeq(_FixedWidthSeq):
     """
     A fixed-length unicode character sequence.
     """
@@ -342,6 +360,26 @@ class Array(Buffer):
         return self.dtype.is_precise()
 
 
+class BufferArray(Array):
+    """
+    Type class for Numpy array views of buffer-providing objects
+    (PEP 3118) which don't have a dedicated type, such as mmap objects
+    or ctypes arrays.  The data is used in place, without copying.
+    """
+
+    def __init__(self, dtype, ndim, layout, readonly=False, aligned=True):
+        type_name = "buffer array"
+        if readonly:
+            type_name = "readonly " + type_name
+        if (not aligned or
+            (isinstance(dtype, Record) and not dtype.aligned)):
+            type_name = "unaligned " + type_name
+        name = "%s(%s, %sd, %s)" % (type_name, dtype, ndim, layout)
+        super(BufferArray, self).__init__(dtype, ndim, layout,
+                                          readonly=readonly, name=name,
+                                          aligned=aligned)
+
+
 class SmartArrayType(Array):
 
     def __init__(self, dtype, ndim, layout, pyclass):
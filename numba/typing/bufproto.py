@@ -5,18 +5,28 @@ Typing support for the buffer protocol (PEP 3118).
 import array
 import sys
 
-from numba import types
+import numpy as np
+from numpy.core import _internal
+
+from numba import numpy_support, types
 
 
 _pep3118_int_types = set('bBhHiIlLqQnN')
 
 _pep3118_scalar_map = {
+    '?': types.boolean,
     'f': types.float32,
     'd': types.float64,
     'Zf': types.complex64,
     'Zd': types.complex128,
     }
 
+# Byte order prefixes meaning the native byte order
+_native_byteorders = '@=' + ('<' if sys.byteorder == 'little' else '>')
+
+# { (format string, itemsize): Numba type } for formats parsed by Numpy
+_format_cache = {}
+
 _type_map = {
     bytearray: types.ByteArray,
     array.array: types.PyArray,
@@ -32,20 +42,39 @@ def decode_pep3118_format(fmt, itemsize):
     Return the Numba type for an item with format string *fmt* and size
     *itemsize* (in bytes).
     """
-    # XXX reuse _dtype_from_pep3118() from np.core._internal?
-    if fmt in _pep3118_int_types:
+    # For the hard-coded types below, consider a native byte order prefix
+    # the same as none.  This is because Numpy sometimes adds "=" in front
+    # of the PEP 3118 format string, and ctypes adds "<" or ">".
+    code = fmt.lstrip(_native_byteorders)
+    if code in _pep3118_int_types:
         # Determine int width and signedness
         name = 'int%d' % (itemsize * 8,)
-        if fmt.isupper():
+        if code.isupper():
             name = 'u' + name
         return types.Integer(name)
     try:
-        # For the hard-coded types above, consider "=" the same as "@"
-        # (the default).  This is because Numpy sometimes adds "="
-        # in front of the PEP 3118 format string.
-        return _pep3118_scalar_map[fmt.lstrip('=')]
+        return _pep3118_scalar_map[code]
     except KeyError:
+        pass
+    # Other formats (e.g. structures) are parsed by Numpy
+    key = fmt, itemsize
+    try:
+        return _format_cache[key]
+    except KeyError:
+        pass
+    try:
+        dtype = _internal._dtype_from_pep3118(fmt)
+        if dtype.itemsize != itemsize and dtype.fields is not None:
+            # Some exporters (e.g. ctypes) omit the padding of aligned
+            # structures from the format string
+            dtype = np.dtype(dtype.descr, align=True)
+        if dtype.itemsize != itemsize:
+            raise ValueError
+        tp = numpy_support.from_dtype(dtype)
+    except (ValueError, NotImplementedError):
         raise ValueError("unsupported PEP 3118 format %r" % (fmt,))
+    _format_cache[key] = tp
+    return tp
 
 
 def get_type_class(typ):
@@ -56,8 +85,8 @@ def get_type_class(typ):
         # Look up special case.
         return _type_map[typ]
     except KeyError:
-        # Fall back on generic one.
-        return types.Buffer
+        # Fall back on Numpy-like views for other exporters.
+        return types.BufferArray
 
 
 def infer_layout(val):
@@ -0,0 +1,62 @@
+"""
+Typing declarations for fixed-width character sequences (the items of
+Numpy 'S' and 'U' arrays).
+"""
+
+from __future__ import absolute_import, print_function
+
+from .. import types
+from .templates import AbstractTemplate, Registry, signature
+
+
+registry = Registry()
+infer = registry.register
+infer_global = registry.register_global
+
+
+def _is_charseq(ty):
+    return isinstance(ty, (types.CharSeq, types.UnicodeCharSeq))
+
+
+class CharSeqCmpOp(AbstractTemplate):
+
+    def generic(self, args, kws):
+        # Sequences of the same kind are comparable whatever their widths
+        left, right = args
+        if _is_charseq(left) and type(left) is type(right):
+            return signature(types.boolean, left, right)
+
+
+@infer
+class CharSeqCmpEq(CharSeqCmpOp):
+    key = '=='
+
+@infer
+class CharSeqCmpNe(CharSeqCmpOp):
+    key = '!='
+
+@infer
+class CharSeqCmpLt(CharSeqCmpOp):
+    key = '<'
+
+@infer
+class CharSeqCmpLE(CharSeqCmpOp):
+    key = '<='
+
+@infer
+class CharSeqCmpGt(CharSeqCmpOp):
+    key = '>'
+
+@infer
+class CharSeqCmpGE(CharSeqCmpOp):
+    key = '>='
+
+
+@infer_global(len)
+class CharSeqLen(AbstractTemplate):
+
+    def generic(self, args, kws):
+        assert not kws
+        (val,) = args
+        if _is_charseq(val):
+            return signature(types.intp, val)
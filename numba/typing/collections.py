@@ -13,7 +13,9 @@ class InContainer(AbstractTemplate):
 
     def generic(self, args, kws):
         item, cont = args
-        if isinstance(cont, types.Container):
+        # Dicts check their keys are in range (see dictdecl.InDict)
+        if (isinstance(cont, types.Container) and
+            not isinstance(cont, types.DictType)):
             return signature(types.boolean, cont.dtype, cont)
 
 @infer_global(len)
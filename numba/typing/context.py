@@ -593,10 +593,13 @@ class BaseContext(object):
 class Context(BaseContext):
 
     def load_additional_registries(self):
-        from . import (cffi_utils, cmathdecl, enumdecl, listdecl, mathdecl,
-                       npydecl, operatordecl, randomdecl, setdecl)
+        from . import (cffi_utils, charseqdecl, cmathdecl, dictdecl, enumdecl,
+                       listdecl, mathdecl, npydecl, operatordecl, randomdecl,
+                       setdecl)
         self.install_registry(cffi_utils.registry)
+        self.install_registry(charseqdecl.registry)
         self.install_registry(cmathdecl.registry)
+        self.install_registry(dictdecl.registry)
         self.install_registry(enumdecl.registry)
         self.install_registry(listdecl.registry)
         self.install_registry(mathdecl.registry)
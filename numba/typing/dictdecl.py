@@ -0,0 +1,206 @@
+from __future__ import absolute_import, print_function
+
+from .. import types
+from ..errors import TypingError
+from ..typeconv import Conversion
+from .templates import (AbstractTemplate, AttributeTemplate, Registry,
+                        signature, bound_function)
+# Ensure dict is typed as a collection as well
+from . import collections
+
+
+registry = Registry()
+infer = registry.register
+infer_global = registry.register_global
+infer_getattr = registry.register_attr
+
+
+def _check_value_type(ty):
+    from numba.datamodel import default_manager
+    if (ty.is_precise() and
+        default_manager.lookup(ty).contains_nrt_meminfo()):
+        raise TypingError("dict values cannot be reference-counted "
+                          "objects, got %s" % (ty,))
+
+
+def _can_cast(context, fromty, toty):
+    """
+    Whether *fromty* values can be stored in a dict as *toty*.  Besides
+    safe conversions, conversions between integers and between floats
+    are allowed, so that e.g. Python ints can be used as int32 keys.
+    Keys keep their own type in signatures, so that the implementation
+    can check they are in range (see DictInstance.cast_key()).
+    """
+    conv = context.can_convert(fromty, toty)
+    if conv is None:
+        return False
+    return (conv <= Conversion.safe or
+            (isinstance(fromty, types.Integer) and
+             isinstance(toty, types.Integer)) or
+            (isinstance(fromty, types.Float) and
+             isinstance(toty, types.Float)))
+
+
+def _refine(context, dct, key, value):
+    """
+    Return the dict type resulting from storing *value* at *key* in a
+    *dct*, or None if impossible.  A new, imprecise dict gets its key
+    and value types from the first store.
+    """
+    if dct.is_precise():
+        if (_can_cast(context, key, dct.key_type) and
+            _can_cast(context, value, dct.value_type)):
+            return dct
+    else:
+        key = context.unify_pairs(dct.key_type, key)
+        value = context.unify_pairs(dct.value_type, value)
+        if key is not None and value is not None:
+            if not isinstance(key, types.Hashable):
+                raise TypingError("unhashable dict key type: %s" % (key,))
+            _check_value_type(value)
+            return dct.copy(key_type=key, value_type=value)
+
+
+@infer_global(dict)
+class DictBuiltin(AbstractTemplate):
+
+    def generic(self, args, kws):
+        assert not kws
+        if not args:
+            # dict(): the key and value types are inferred from the
+            # first insertion
+            return signature(types.DictType(types.undefined,
+                                            types.undefined))
+
+
+@infer
+class GetItemDict(AbstractTemplate):
+    key = "getitem"
+
+    def generic(self, args, kws):
+        dct, key = args
+        if (isinstance(dct, types.DictType) and
+            _can_cast(self.context, key, dct.key_type)):
+            return signature(dct.value_type, dct, key)
+
+
+@infer
+class InDict(AbstractTemplate):
+    key = "in"
+
+    def generic(self, args, kws):
+        key, dct = args
+        if (isinstance(dct, types.DictType) and
+            _can_cast(self.context, key, dct.key_type)):
+            return signature(types.boolean, key, dct)
+
+
+@infer
+class SetItemDict(AbstractTemplate):
+    key = "setitem"
+
+    def generic(self, args, kws):
+        dct, key, value = args
+        if isinstance(dct, types.DictType):
+            refined = _refine(self.context, dct, key, value)
+            if refined is not None:
+                return signature(types.none, refined, key,
+                                 refined.value_type)
+
+
+@infer
+class DelItemDict(AbstractTemplate):
+    key = "delitem"
+
+    def generic(self, args, kws):
+        dct, key = args
+        if (isinstance(dct, types.DictType) and
+            _can_cast(self.context, key, dct.key_type)):
+            return signature(types.none, dct, key)
+
+
+@infer_getattr
+class DictAttribute(AttributeTemplate):
+    key = types.DictType
+
+    def _resolve_with_default(self, dct, args, kws):
+        assert not kws
+        if not args or not _can_cast(self.context, args[0], dct.key_type):
+            return
+        key = args[0]
+        if len(args) == 1:
+            return signature(types.Optional(dct.value_type), key)
+        elif len(args) == 2:
+            default = args[1]
+            restype = self.context.unify_pairs(dct.value_type, default)
+            if restype is not None:
+                return signature(restype, key, default)
+
+    @bound_function("dict.get")
+    def resolve_get(self, dct, args, kws):
+        return self._resolve_with_default(dct, args, kws)
+
+    @bound_function("dict.pop")
+    def resolve_pop(self, dct, args, kws):
+        sig = self._resolve_with_default(dct, args, kws)
+        if sig is not None and len(args) == 1:
+            # pop(key) raises KeyError for a missing key
+            sig = signature(dct.value_type, args[0])
+        return sig
+
+    @bound_function("dict.setdefault")
+    def resolve_setdefault(self, dct, args, kws):
+        assert not kws
+        key, default = args
+        refined = _refine(self.context, dct, key, default)
+        if refined is not None:
+            sig = signature(refined.value_type, key, refined.value_type)
+            sig.recvr = refined
+            return sig
+
+    @bound_function("dict.popitem")
+    def resolve_popitem(self, dct, args, kws):
+        assert not kws
+        if not args:
+            return signature(types.Tuple((dct.key_type, dct.value_type)))
+
+    @bound_function("dict.clear")
+    def resolve_clear(self, dct, args, kws):
+        assert not kws
+        if not args:
+            return signature(types.none)
+
+    @bound_function("dict.copy")
+    def resolve_copy(self, dct, args, kws):
+        assert not kws
+        if not args:
+            return signature(dct)
+
+    @bound_function("dict.update")
+    def resolve_update(self, dct, args, kws):
+        assert not kws
+        other, = args
+        if isinstance(other, types.DictType):
+            refined = _refine(self.context, dct, other.key_type,
+                              other.value_type)
+            if refined is not None:
+                sig = signature(types.none, other)
+                sig.recvr = refined
+                return sig
+
+    def _resolve_iter(self, dct, args, kws, kind):
+        assert not kws
+        if not args:
+            return signature(types.DictIter(dct, kind))
+
+    @bound_function("dict.keys")
+    def resolve_keys(self, dct, args, kws):
+        return self._resolve_iter(dct, args, kws, 'keys')
+
+    @bound_function("dict.values")
+    def resolve_values(self, dct, args, kws):
+        return self._resolve_iter(dct, args, kws, 'values')
+
+    @bound_function("dict.items")
+    def resolve_items(self, dct, args, kws):
+        return self._resolve_iter(dct, args, kws, 'items')
@@ -11,7 +11,7 @@ from .templates import (AttributeTemplate, AbstractTemplate, CallableTemplate,
 from ..numpy_support import (ufunc_find_matching_loop,
                              supported_ufunc_loop, as_dtype,
                              from_dtype, as_dtype, resolve_output_type,
-                             carray, farray)
+                             carray, farray, columnarize, get_columns_class)
 from ..numpy_support import version as numpy_version
 from ..errors import TypingError
 from ..config import PerformanceWarning
@@ -1219,3 +1219,27 @@ class NumbaCArray(CallableTemplate):
 @infer_global(farray)
 class NumbaFArray(NumbaCArray):
     layout = 'F'
+
+
+@infer_global(columnarize)
+class NumbaColumnarize(CallableTemplate):
+
+    def generic(self):
+        def typer(arr):
+            if not (isinstance(arr, types.Array) and
+                    isinstance(arr.dtype, types.Record)):
+                raise TypingError("columnarize(): structured array expected, "
+                                "got '%s'" % (arr,))
+            rectype = arr.dtype
+            names = rectype.dtype.names
+            columns = []
+            for name in names:
+                dtype = rectype.typeof(name)
+                if isinstance(dtype, types.NestedArray):
+                    raise TypingError("columnarize(): unsupported subarray "
+                                    "field %r" % (name,))
+                columns.append(types.Array(dtype, arr.ndim, 'C'))
+            return types.BaseTuple.from_types(columns,
+                                              get_columns_class(names))
+
+        return typer
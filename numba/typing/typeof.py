@@ -125,6 +125,11 @@ def _typeof_numpy_scalar(val, c):
 def _typeof_str(val, c):
     return types.string
 
+@typeof_impl.register(np.str_)
+def _typeof_numpy_str(val, c):
+    # np.str_ derives from str, but is a fixed-width Numpy scalar
+    return _typeof_numpy_scalar(val, c)
+
 @typeof_impl.register(type(None))
 def _typeof_none(val, c):
     return types.none
@@ -28,6 +28,7 @@ IS_PY3 = PYVERSION >= (3, 0)
 
 if IS_PY3:
     import builtins
+    import collections.abc as collections_abc
     INT_TYPES = (int,)
     longint = int
     get_ident = threading.get_ident
@@ -46,6 +47,7 @@ if IS_PY3:
 else:
     import thread
     import __builtin__ as builtins
+    import collections as collections_abc
     INT_TYPES = (int, long)
     longint = long
     get_ident = thread.get_ident